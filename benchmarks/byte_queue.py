@@ -0,0 +1,88 @@
+#####################################################################
+# byte_queue.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Benchmark for streaming HSMS blocks through the receive ByteQueue.
+
+The data is appended in socket sized chunks and consumed the same way HsmsProtocol does, peeking the length and
+decoding each block straight from the queue.
+"""
+from __future__ import annotations
+
+import struct
+
+from secsgem.common import ByteQueue
+from secsgem.hsms import HsmsStreamFunctionHeader
+from secsgem.hsms.message import HsmsMessage
+
+from .helpers import measure
+
+CHUNK_SIZE = 64 * 1024
+
+
+def create_chunks(message_size: int, message_count: int) -> list[bytes]:
+    """Create encoded HSMS blocks, back to back and split into chunks as received from a socket."""
+    block = HsmsMessage(HsmsStreamFunctionHeader(1, 6, 11, True, 0), bytes(message_size)).blocks[0].encode()
+    stream = block * message_count
+
+    return [stream[index : index + CHUNK_SIZE] for index in range(0, len(stream), CHUNK_SIZE)]
+
+
+def consume(chunks: list[bytes], backlog: bool = False) -> int:
+    """Append the chunks and decode all blocks from the queue.
+
+    Args:
+        chunks: encoded blocks
+        backlog: append all chunks before consuming, like a receiver running ahead of the dispatcher
+
+    Returns:
+        number of decoded blocks
+
+    """
+    queue = ByteQueue()
+    blocks = 0
+
+    for index, chunk in enumerate(chunks):
+        queue.append(chunk)
+
+        if backlog and index + 1 < len(chunks):
+            continue
+
+        while len(queue) > 3:
+            length = struct.unpack(">L", queue.peek(4))[0] + 4
+            if len(queue) < length:
+                break
+
+            HsmsMessage.block_type.decode(queue.pop_view(length))
+            blocks += 1
+
+    return blocks
+
+
+def main():
+    """Run the benchmark."""
+    for label, message_size, message_count in [
+        ("100000 x 100 B", 100, 100000),
+        ("10000 x 10 KB", 10 * 1024, 10000),
+        ("5 x 10 MB", 10 * 1024 * 1024, 5),
+    ]:
+        chunks = create_chunks(message_size, message_count)
+        size = sum(len(chunk) for chunk in chunks)
+
+        measure(f"ByteQueue stream {label}", lambda chunks=chunks: consume(chunks), repeat=3, size=size)
+        measure(f"ByteQueue backlog {label}", lambda chunks=chunks: consume(chunks, backlog=True), repeat=3, size=size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#####################################################################
+# collection_event_report.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Benchmark for building the reports of a collection event with many status variables.
+
+The status variables use the callback, the number of provider calls is counted per report. The report plan encoding
+is compared with encoding the same values through the S6F11 function object.
+"""
+from __future__ import annotations
+
+import secsgem.gem
+import secsgem.hsms
+import secsgem.secs
+
+from .helpers import measure
+
+VARIABLE_COUNT = 500
+REPORT_COUNT = 200
+CEID = 10000
+
+
+class _Equipment(secsgem.gem.GemEquipmentHandler):
+    """Equipment counting the provider calls."""
+
+    def __init__(self, settings):
+        super().__init__(settings)
+
+        self.requests = 0
+
+    def on_sv_value_request(self, svid, status_variable):
+        self.requests += 1
+        return status_variable.value_type(status_variable.svid)
+
+
+class _BulkEquipment(_Equipment):
+    """Equipment providing the values with one call."""
+
+    def on_sv_values_request(self, status_variables):
+        self.requests += 1
+        return [status_variable.value_type(status_variable.svid) for status_variable in status_variables]
+
+
+def _send(handler, function):
+    header = secsgem.hsms.HsmsStreamFunctionHeader(0, function.stream, function.function, True, 0)
+    callback = getattr(handler, f"_on_s{function.stream:02d}f{function.function:02d}")
+    callback(handler, secsgem.hsms.HsmsMessage(header, function.encode()))
+
+
+def create_handler(handler_class: type[_Equipment]) -> _Equipment:
+    """Create an equipment handler with a collection event reporting all status variables."""
+    settings = secsgem.hsms.HsmsSettings(connect_mode=secsgem.hsms.HsmsConnectMode.PASSIVE)
+    handler = handler_class(settings)
+    vids = list(range(10000, 10000 + VARIABLE_COUNT))
+
+    for vid in vids:
+        handler.status_variables[vid] = secsgem.gem.StatusVariable(vid, f"sv{vid}", "", secsgem.secs.variables.U4)
+
+    handler.collection_events[CEID] = secsgem.gem.CollectionEvent(CEID, "event", [])
+
+    _send(handler, secsgem.secs.functions.SecsS02F33({"DATAID": 1, "DATA": [{"RPTID": 1, "VID": vids}]}))
+    _send(handler, secsgem.secs.functions.SecsS02F35({"DATAID": 1, "DATA": [{"CEID": CEID, "RPTID": [1]}]}))
+    _send(handler, secsgem.secs.functions.SecsS02F37({"CEED": True, "CEID": [CEID]}))
+
+    return handler
+
+
+def main():
+    """Run the benchmark."""
+    for name, handler_class in [("per variable", _Equipment), ("bulk", _BulkEquipment)]:
+        handler = create_handler(handler_class)
+        plan = handler._report_plans[CEID]  # pylint: disable=protected-access
+
+        def build(handler=handler, plan=plan):
+            for _ in range(REPORT_COUNT):
+                handler._encode_collection_event(plan)  # pylint: disable=protected-access
+
+        handler.requests = 0
+        best = measure(f"{REPORT_COUNT}x S6F11 {VARIABLE_COUNT} SV, {name}", build, repeat=3)
+        calls = handler.requests / 3 / REPORT_COUNT
+        print(f"{'per report':<40} {best / REPORT_COUNT * 1000:12.3f} ms, {calls:.0f} provider calls")
+
+    # the values passed through the function object, as the reports were built before the report plans
+    def build_function():
+        for _ in range(REPORT_COUNT):
+            values = handler._get_sv_values(plan.status_variables)  # pylint: disable=protected-access
+            handler.stream_function(6, 11)({"DATAID": 1, "CEID": CEID, "RPT": [{"RPTID": 1, "V": values}]}).encode()
+
+    best = measure(f"{REPORT_COUNT}x S6F11 {VARIABLE_COUNT} SV, function object", build_function, repeat=3)
+    print(f"{'per report':<40} {best / REPORT_COUNT * 1000:12.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#####################################################################
+# communication_log.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Benchmark for the cost of the communication log per received message.
+
+Received S6F11 messages are created once without any log call, once with the lazy log call of the protocol and once
+with an eager log call building the extra fields and the decoded message in place.
+With the communication log disabled the lazy log call should be as fast as no log call at all.
+"""
+from __future__ import annotations
+
+import io
+import logging
+
+import secsgem.common
+import secsgem.hsms
+
+from .function_decode import create_message
+from .helpers import measure
+
+MESSAGE_COUNT = 100000
+
+
+def main():
+    """Run the benchmark."""
+    settings = secsgem.hsms.HsmsSettings(connect_mode=secsgem.hsms.HsmsConnectMode.PASSIVE)
+    protocol = settings.create_protocol()
+    logger = logging.getLogger("communication")
+
+    data = create_message(1)
+    headers = [secsgem.hsms.HsmsStreamFunctionHeader(system, 6, 11, True, 0) for system in range(MESSAGE_COUNT)]
+
+    def no_log():
+        for header in headers:
+            secsgem.hsms.HsmsMessage(header, data)
+
+    def lazy_log(count=MESSAGE_COUNT):
+        for header in headers[:count]:
+            message = secsgem.hsms.HsmsMessage(header, data)
+            if logger.isEnabledFor(logging.INFO):
+                protocol._log_communication(  # pylint: disable=protected-access
+                    "< %s\n%s",
+                    message,
+                    secsgem.common.LazySml(message, settings.streams_functions),
+                )
+
+    def eager_log(count=MESSAGE_COUNT):
+        for header in headers[:count]:
+            message = secsgem.hsms.HsmsMessage(header, data)
+            logger.info(
+                "< %s\n%s",
+                message,
+                settings.streams_functions.decode(message),
+                extra=protocol._get_log_extra(),  # pylint: disable=protected-access
+            )
+
+    logger.setLevel(logging.WARNING)
+
+    measure(f"{MESSAGE_COUNT}x S6F11, no log calls", no_log)
+    measure(f"{MESSAGE_COUNT}x S6F11, lazy log disabled", lazy_log)
+    measure(f"{MESSAGE_COUNT}x S6F11, eager log disabled", eager_log, repeat=1)
+
+    handler = logging.StreamHandler(io.StringIO())
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    try:
+        measure(f"{MESSAGE_COUNT // 10}x S6F11, lazy log enabled", lambda: lazy_log(MESSAGE_COUNT // 10), repeat=1)
+        measure(f"{MESSAGE_COUNT // 10}x S6F11, eager log enabled", lambda: eager_log(MESSAGE_COUNT // 10), repeat=1)
+    finally:
+        logger.removeHandler(handler)
+        logger.propagate = True
+
+
+if __name__ == "__main__":
+    main()
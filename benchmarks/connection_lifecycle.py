@@ -0,0 +1,110 @@
+#####################################################################
+# connection_lifecycle.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Benchmark for enable/disable latency and idle CPU use of many TCP connections.
+
+TcpClientConnections connect to a local listener that accepts every connection. The time until all connections are
+established, the CPU time used while they are idle and the time to disable all of them are measured.
+"""
+from __future__ import annotations
+
+import argparse
+import socket
+import threading
+import time
+
+import secsgem.common
+import secsgem.hsms
+
+
+class Listener:
+    """Local listener accepting any number of connections."""
+
+    def __init__(self):
+        """Start listening and accepting."""
+        self._socket = socket.create_server(("127.0.0.1", 0), backlog=1024)
+        self._peers: list[socket.socket] = []
+        self._thread = threading.Thread(target=self._accept, daemon=True)
+        self._thread.start()
+
+    @property
+    def port(self) -> int:
+        """Port the listener is bound to."""
+        return self._socket.getsockname()[1]
+
+    def _accept(self):
+        while True:
+            try:
+                peer, _ = self._socket.accept()
+            except OSError:
+                return
+
+            self._peers.append(peer)
+
+    def close(self):
+        """Close the listener and all accepted connections."""
+        self._socket.close()
+
+        for peer in self._peers:
+            peer.close()
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--connections", type=int, default=100, help="number of connections")
+    parser.add_argument("--idle", type=float, default=2.0, help="seconds to measure idle CPU use")
+    args = parser.parse_args()
+
+    listener = Listener()
+
+    connected = threading.Semaphore(0)
+    connections = []
+    for _ in range(args.connections):
+        connection = secsgem.common.TcpClientConnection(secsgem.hsms.HsmsSettings(port=listener.port))
+        connection.on_connected.register(lambda _: connected.release())
+        connections.append(connection)
+
+    try:
+        start = time.perf_counter()
+        for connection in connections:
+            connection.enable()
+
+        for _ in connections:
+            connected.acquire()
+
+        enable_time = time.perf_counter() - start
+
+        cpu_start = time.process_time()
+        time.sleep(args.idle)
+        idle_cpu = (time.process_time() - cpu_start) / args.idle
+
+        start = time.perf_counter()
+        for connection in connections:
+            connection.disable()
+
+        disable_time = time.perf_counter() - start
+    finally:
+        listener.close()
+
+    print(f"{'connections':<30} {args.connections:12d}")
+    print(f"{'enable all':<30} {enable_time * 1000:12.3f} ms")
+    print(f"{'disable all':<30} {disable_time * 1000:12.3f} ms")
+    print(f"{'disable per connection':<30} {disable_time / args.connections * 1000:12.3f} ms")
+    print(f"{'idle CPU use':<30} {idle_cpu * 100:12.1f} %")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+#####################################################################
+# encode.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Benchmark for encoding item and stream/function trees of growing size.
+
+Encoding time should grow linearly with the message size.
+"""
+from __future__ import annotations
+
+from secsgem.secs import functions
+from secsgem.secs.items import ItemL, ItemU4
+
+from .function_decode import REPORT_COUNTS
+from .function_decode import create_message as create_function_message
+from .helpers import measure
+from .item_decode import SIZES, create_report
+
+
+def main():
+    """Run the benchmark."""
+    for label, size in SIZES.items():
+        report_count = max(1, size // len(create_report(0).encode()))
+        item = ItemL([ItemU4(1), ItemU4(1000), ItemL([create_report(index) for index in range(report_count)])])
+
+        measure(f"ItemL.encode {label}", item.encode, repeat=3, size=size)
+
+    for report_count in REPORT_COUNTS:
+        function = functions.SecsS06F11()
+        function.decode(create_function_message(report_count))
+
+        measure(f"SecsS06F11.encode {report_count} reports", function.encode, size=len(function.encode()))
+
+
+if __name__ == "__main__":
+    main()
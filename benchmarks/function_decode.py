@@ -0,0 +1,78 @@
+#####################################################################
+# function_decode.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Benchmark for decoding stream/function messages with the variables based decoder.
+
+Decoding time should grow linearly with the number of reports.
+"""
+from __future__ import annotations
+
+from secsgem.secs import functions, variables
+
+from .helpers import measure
+
+REPORT_COUNTS = [10, 100, 1000]
+
+
+def create_message(report_count: int) -> bytes:
+    """Create an encoded S6F11 with the requested number of reports.
+
+    Args:
+        report_count: number of reports in the event
+
+    Returns:
+        encoded message data
+
+    """
+    return functions.SecsS06F11(
+        {
+            "DATAID": 1,
+            "CEID": 1000,
+            "RPT": [
+                {
+                    "RPTID": index,
+                    "V": [
+                        variables.U4(index),
+                        variables.String(f"VALUE{index:08}"),
+                        variables.F8([float(index)] * 8),
+                        variables.Boolean([True, False] * 4),
+                    ],
+                }
+                for index in range(report_count)
+            ],
+        },
+    ).encode()
+
+
+def main():
+    """Run the benchmark."""
+
+    def construct():
+        for _ in range(1000):
+            functions.SecsS06F11()
+
+    measure("1000x SecsS06F11()", construct)
+
+    for report_count in REPORT_COUNTS:
+        data = create_message(report_count)
+
+        def decode(data=data):
+            functions.SecsS06F11().decode(data)
+
+        measure(f"SecsS06F11.decode {report_count} reports", decode, size=len(data))
+
+
+if __name__ == "__main__":
+    main()
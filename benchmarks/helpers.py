@@ -0,0 +1,56 @@
+#####################################################################
+# helpers.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Shared helpers for the benchmark scripts.
+
+Benchmarks are run directly from the repository root, e.g.::
+
+    python -m benchmarks.item_decode
+
+"""
+from __future__ import annotations
+
+import time
+import typing
+
+
+def measure(name: str, function: typing.Callable[[], typing.Any], repeat: int = 5, size: int | None = None) -> float:
+    """Run a function several times and print the best run time.
+
+    Args:
+        name: label printed with the result
+        function: function to measure
+        repeat: number of runs
+        size: number of bytes processed per run, adds throughput to the output
+
+    Returns:
+        best run time in seconds
+
+    """
+    best = float("inf")
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+
+    throughput = ""
+    if size is not None and best > 0:
+        throughput = f" ({size / best / 1024 / 1024:10.2f} MiB/s)"
+
+    print(f"{name:<40} {best * 1000:12.3f} ms{throughput}")
+
+    return best
+
@@ -0,0 +1,113 @@
+#####################################################################
+# hsms_server_load.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Load test for the multi-client HSMS server with loopback clients.
+
+An HsmsServer with GemEquipmentHandler sessions is started, asyncio clients connect to it, establish communication and
+send S1F1 requests concurrently. Connection setup time, request throughput and latency are printed.
+
+    python -m benchmarks.hsms_server_load --sessions 200 --requests 50
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import secsgem.hsms
+import secsgem.hsms.aio
+from secsgem.secs.functions import SecsS01F01, SecsS01F13
+
+
+async def run_client(settings: secsgem.hsms.HsmsSettings, requests: int, latencies: list[float]):
+    """Connect a client, establish communication and send requests.
+
+    Args:
+        settings: client settings
+        requests: number of S1F1 requests to send
+        latencies: list the request latencies are added to
+
+    """
+    client = await secsgem.hsms.aio.open_connection(settings)
+
+    try:
+        if not await client.wait_selected(settings.timeouts.t6):
+            raise ConnectionError("select failed")
+
+        if await client.send_and_waitfor_response(SecsS01F13()) is None:
+            raise ConnectionError("establish communication failed")
+
+        for _ in range(requests):
+            start = time.perf_counter()
+            if await client.send_and_waitfor_response(SecsS01F01()) is None:
+                raise ConnectionError("request timed out")
+            latencies.append(time.perf_counter() - start)
+    finally:
+        await client.close()
+
+
+async def run_clients(port: int, sessions: int, requests: int) -> list[float]:
+    """Run all clients concurrently.
+
+    Args:
+        port: port of the server
+        sessions: number of clients
+        requests: number of requests per client
+
+    Returns:
+        request latencies
+
+    """
+    settings = secsgem.hsms.HsmsSettings(port=port, t3=30, t6=30)
+    latencies: list[float] = []
+
+    await asyncio.gather(*(run_client(settings, requests, latencies) for _ in range(sessions)))
+
+    return latencies
+
+
+def main():
+    """Run the load test."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=200, help="number of concurrent client sessions")
+    parser.add_argument("--requests", type=int, default=50, help="number of S1F1 requests per session")
+    parser.add_argument("--workers", type=int, default=8, help="handler worker threads of the server")
+    args = parser.parse_args()
+
+    manager = secsgem.hsms.HsmsConnectionManager(max_workers=args.workers)
+    manager.start()
+
+    server = manager.create_server(port=0)
+    server.start()
+
+    try:
+        start = time.perf_counter()
+        latencies = asyncio.run(run_clients(server.port, args.sessions, args.requests))
+        duration = time.perf_counter() - start
+    finally:
+        manager.stop()
+
+    latencies.sort()
+    print(f"{'sessions':<30} {args.sessions:12d}")
+    print(f"{'requests':<30} {len(latencies):12d}")
+    print(f"{'total time':<30} {duration * 1000:12.3f} ms")
+    print(f"{'throughput':<30} {len(latencies) / duration:12.1f} requests/s")
+    print(f"{'latency median':<30} {statistics.median(latencies) * 1000:12.3f} ms")
+    print(f"{'latency 99th percentile':<30} {latencies[int(len(latencies) * 0.99)] * 1000:12.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#####################################################################
+# item_decode.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Benchmark for decoding nested item trees of growing size.
+
+Decoding time should grow linearly with the message size.
+"""
+from __future__ import annotations
+
+from secsgem.secs.items import Item, ItemA, ItemF8, ItemL, ItemU4
+
+from .helpers import measure
+
+SIZES = {
+    "1 KB": 1024,
+    "100 KB": 100 * 1024,
+    "10 MB": 10 * 1024 * 1024,
+}
+
+
+def create_report(report_id: int) -> ItemL:
+    """Create a report item with a few values of different types.
+
+    Args:
+        report_id: id of the report
+
+    Returns:
+        report item
+
+    """
+    return ItemL(
+        [
+            ItemU4(report_id),
+            ItemL(
+                [
+                    ItemU4(report_id * 10),
+                    ItemA(f"VALUE{report_id:08}"),
+                    ItemF8([float(report_id)] * 8),
+                    ItemL([ItemU4(index) for index in range(4)]),
+                ],
+            ),
+        ],
+    )
+
+
+def create_message(size: int) -> bytes:
+    """Create an encoded S6F11 like item tree of at least the requested size.
+
+    Args:
+        size: minimum size in bytes
+
+    Returns:
+        encoded item tree
+
+    """
+    report_size = len(create_report(0).encode())
+    report_count = max(1, size // report_size)
+
+    return ItemL([ItemU4(1), ItemU4(1000), ItemL([create_report(index) for index in range(report_count)])]).encode()
+
+
+def main():
+    """Run the benchmark."""
+    for label, size in SIZES.items():
+        data = create_message(size)
+        measure(f"Item.decode {label}", lambda data=data: Item.decode(data), repeat=3, size=len(data))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#####################################################################
+# limits_monitoring.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Benchmark for evaluating the limits of many monitored status variables.
+
+Each update passes new values for all variables to `update_status_variables`, the values follow a random walk through
+four limits per variable.
+"""
+from __future__ import annotations
+
+import random
+
+import secsgem.gem
+import secsgem.hsms
+import secsgem.secs
+
+from .helpers import measure
+
+VARIABLE_COUNT = 5000
+UPDATE_COUNT = 200
+LIMITS = {0: (20, 10), 1: (45, 35), 2: (70, 60), 3: (95, 85)}
+
+
+def main():
+    """Run the benchmark."""
+    settings = secsgem.hsms.HsmsSettings(connect_mode=secsgem.hsms.HsmsConnectMode.PASSIVE)
+    handler = secsgem.gem.GemEquipmentHandler(settings)
+    handler.collection_events[10000] = secsgem.gem.CollectionEvent(10000, "limit", [])
+
+    vids = range(10000, 10000 + VARIABLE_COUNT)
+
+    for vid in vids:
+        handler.status_variables[vid] = secsgem.gem.StatusVariable(
+            vid,
+            f"sv{vid}",
+            "",
+            secsgem.secs.variables.F8,
+            False,
+        )
+        handler.monitored_variables[vid] = secsgem.gem.MonitoredVariable(vid, 10000, 0, 100, 4)
+        handler.monitored_variables[vid].set_limits(LIMITS)
+
+    rng = random.Random(1)
+    values = {vid: 50.0 for vid in vids}
+    updates = []
+
+    for _ in range(UPDATE_COUNT):
+        values = {vid: min(100.0, max(0.0, value + rng.gauss(0, 1))) for vid, value in values.items()}
+        updates.append(values)
+
+    def update():
+        for values in updates:
+            handler.update_status_variables(values)
+
+    best = measure(f"{UPDATE_COUNT}x update {VARIABLE_COUNT} variables", update, repeat=3)
+    print(f"{'per variable':<40} {best / UPDATE_COUNT / VARIABLE_COUNT * 1000000:12.3f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#####################################################################
+# number_array.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Benchmark for encoding and decoding big numeric arrays."""
+from __future__ import annotations
+
+from secsgem.secs import variables
+from secsgem.secs.items import ItemF4, ItemF8, ItemU1, ItemU2
+
+from .helpers import measure
+
+COUNT = 100_000
+
+
+def main():
+    """Run the benchmark."""
+    int_values = [index % 256 for index in range(COUNT)]
+    float_values = [index / 8 for index in range(COUNT)]
+
+    for item_type, values in ((ItemU1, int_values), (ItemU2, int_values), (ItemF4, float_values), (ItemF8, float_values)):
+        item = item_type(values)
+        data = item.encode()
+
+        measure(f"{item_type.__name__}.encode {COUNT}", item.encode, size=len(data))
+        measure(f"{item_type.__name__}.decode {COUNT}", lambda item_type=item_type, data=data: item_type.decode(data), size=len(data))
+
+    for var_type, values in (
+        (variables.U1, int_values),
+        (variables.U2, int_values),
+        (variables.F4, float_values),
+        (variables.F8, float_values),
+    ):
+        var = var_type(values)
+        data = var.encode()
+
+        measure(f"variables.{var_type.__name__}.encode {COUNT}", var.encode, size=len(data))
+        measure(f"variables.{var_type.__name__}.decode {COUNT}", lambda var_type=var_type, data=data: var_type().decode(data), size=len(data))
+
+
+if __name__ == "__main__":
+    main()
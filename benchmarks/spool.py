@@ -0,0 +1,59 @@
+#####################################################################
+# spool.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Benchmark for spooling S6F11 messages to the segment log and reading them back."""
+from __future__ import annotations
+
+import tempfile
+
+import secsgem.common
+
+from .function_decode import create_message
+from .helpers import measure
+
+MESSAGE_COUNT = 100000
+
+
+def main():
+    """Run the benchmark."""
+    data = create_message(1)
+    size = MESSAGE_COUNT * len(data)
+
+    with tempfile.TemporaryDirectory() as directory:
+        log = secsgem.common.SegmentLog(directory, max_size=2 * size)
+
+        def append():
+            log.clear()
+            for _ in range(MESSAGE_COUNT):
+                log.append(data)
+
+        def read():
+            for _ in log.records():
+                pass
+
+        def consume():
+            for position, _ in log.records():
+                log.consume(position)
+
+        try:
+            measure(f"{MESSAGE_COUNT}x S6F11 append", append, size=size)
+            measure(f"{MESSAGE_COUNT}x S6F11 read", read, size=size)
+            measure(f"{MESSAGE_COUNT}x S6F11 read and consume", consume, repeat=1, size=size)
+        finally:
+            log.close()
+
+
+if __name__ == "__main__":
+    main()
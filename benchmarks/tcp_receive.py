@@ -0,0 +1,100 @@
+#####################################################################
+# tcp_receive.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Benchmark for TCP receive throughput against a local loopback peer.
+
+A plain socket peer sends a bulk payload to a TcpClientConnection, the time until all bytes were delivered to the
+connections on_data event is measured for several receive buffer sizes.
+"""
+from __future__ import annotations
+
+import socket
+import threading
+
+import secsgem.common
+import secsgem.hsms
+
+from .helpers import measure
+
+PAYLOAD_SIZE = 10 * 1024 * 1024
+
+BUFFER_SIZES = [1024, 64 * 1024, 1024 * 1024]
+
+
+class LoopbackReceiver:
+    """TcpClientConnection connected to a local socket peer."""
+
+    def __init__(self, receive_buffer_size: int):
+        """Initialize the peer and connect the client connection.
+
+        Args:
+            receive_buffer_size: receive buffer size of the client connection
+
+        """
+        self._listener = socket.create_server(("127.0.0.1", 0))
+        self._received = 0
+        self._expected = 0
+        self._done = threading.Event()
+
+        settings = secsgem.hsms.HsmsSettings(
+            port=self._listener.getsockname()[1],
+            receive_buffer_size=receive_buffer_size,
+        )
+
+        self._connection = secsgem.common.TcpClientConnection(settings)
+        self._connection.on_data.register(self._on_data)
+        self._connection.enable()
+
+        self._peer, _ = self._listener.accept()
+
+    def _on_data(self, data):
+        self._received += len(data["data"])
+        if self._received >= self._expected:
+            self._done.set()
+
+    def transfer(self, payload: bytes):
+        """Send the payload from the peer and wait until it was received completely."""
+        self._received = 0
+        self._expected = len(payload)
+        self._done.clear()
+
+        self._peer.sendall(payload)
+        self._done.wait()
+
+    def close(self):
+        """Close the peer and the client connection."""
+        self._peer.close()
+        self._connection.disable()
+        self._listener.close()
+
+
+def main():
+    """Run the benchmark."""
+    payload = bytes(PAYLOAD_SIZE)
+
+    for buffer_size in BUFFER_SIZES:
+        receiver = LoopbackReceiver(buffer_size)
+        try:
+            measure(
+                f"TCP receive 10 MB, buffer {buffer_size // 1024} KB",
+                lambda receiver=receiver: receiver.transfer(payload),
+                size=PAYLOAD_SIZE,
+            )
+        finally:
+            receiver.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#####################################################################
+# tcp_send.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Benchmark for the TCP send path against a local loopback peer.
+
+Compares writing many small S6F11 blocks one by one with writing them coalesced through scatter-gather I/O, and
+sending a single huge block.
+"""
+from __future__ import annotations
+
+import socket
+import threading
+
+import secsgem.common
+import secsgem.hsms
+from secsgem.hsms import HsmsStreamFunctionHeader
+from secsgem.hsms.message import HsmsMessage
+from secsgem.hsms.protocol import HsmsProtocol
+
+from .function_decode import create_message
+from .helpers import measure
+
+BLOCK_COUNT = 10000
+
+
+class LoopbackSender:
+    """TcpConnection connected to a local socket peer, which discards all received data."""
+
+    def __init__(self):
+        """Initialize the peer and the connection."""
+        local, self._peer = socket.socketpair()
+        local.setblocking(False)
+
+        self._received = 0
+        self._expected = 0
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+        self.connection = secsgem.common.TcpClientConnection(secsgem.hsms.HsmsSettings())
+        self.connection._sock = local  # pylint: disable=protected-access
+
+    def _drain(self):
+        while True:
+            data = self._peer.recv(1024 * 1024)
+            if not data:
+                return
+
+            self._received += len(data)
+            if self._received >= self._expected:
+                self._done.set()
+
+    def run(self, size: int, function):
+        """Call the send function and wait until the peer received `size` bytes."""
+        self._received = 0
+        self._expected = size
+        self._done.clear()
+
+        function()
+
+        self._done.wait()
+
+
+def main():
+    """Run the benchmark."""
+    sender = LoopbackSender()
+
+    small = HsmsMessage(HsmsStreamFunctionHeader(1, 6, 11, True, 0), create_message(10)).blocks[0]
+    small_buffers = [small.encode_buffers() for _ in range(BLOCK_COUNT)]
+    small_size = len(small.encode()) * BLOCK_COUNT
+
+    def _send_single():
+        for buffers in small_buffers:
+            sender.connection.send_data(b"".join(buffers))
+
+    def _send_coalesced():
+        batch: list[bytes] = []
+        batch_size = 0
+
+        for buffers in small_buffers:
+            batch += buffers
+            batch_size += sum(len(buffer) for buffer in buffers)
+
+            if batch_size >= HsmsProtocol.send_packet_size:
+                sender.connection.send_buffers(batch)
+                batch, batch_size = [], 0
+
+        sender.connection.send_buffers(batch)
+
+    measure(f"TCP send {BLOCK_COUNT} x S6F11 one by one", lambda: sender.run(small_size, _send_single), size=small_size)
+    measure(f"TCP send {BLOCK_COUNT} x S6F11 coalesced", lambda: sender.run(small_size, _send_coalesced), size=small_size)
+
+    huge = HsmsMessage(HsmsStreamFunctionHeader(1, 7, 3, True, 0), bytes(10 * 1024 * 1024)).blocks[0]
+    huge_size = len(huge.encode())
+
+    measure(
+        "TCP send 10 MB block, scatter-gather",
+        lambda: sender.run(huge_size, lambda: sender.connection.send_buffers(huge.encode_buffers())),
+        size=huge_size,
+    )
+
+
+if __name__ == "__main__":
+    main()
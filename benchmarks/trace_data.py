@@ -0,0 +1,109 @@
+#####################################################################
+# trace_data.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Benchmark for the sample timing of many concurrent traces.
+
+Traces are initialized with S2F23 on an equipment handler that isn't connected, so the reports are built but not
+transmitted. The sample times are recorded in the status variable provider, the jitter is the largest deviation
+of the interval between two samples of a trace from the trace period.
+"""
+from __future__ import annotations
+
+import argparse
+import collections
+import statistics
+import sys
+import time
+
+import secsgem.gem
+import secsgem.hsms
+import secsgem.secs
+
+
+class _Equipment(secsgem.gem.GemEquipmentHandler):
+    """Equipment recording the time of each sample."""
+
+    def __init__(self, settings):
+        super().__init__(settings)
+
+        self.sample_times: dict[int, list[float]] = collections.defaultdict(list)
+
+    def _get_sv_values(self, status_variables):
+        self.sample_times[id(status_variables)].append(time.monotonic())
+        return super()._get_sv_values(status_variables)
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--traces", type=int, default=50)
+    parser.add_argument("--svids", type=int, default=100)
+    parser.add_argument("--period", default="00000001", help="DSPER, hhmmsscc")
+    parser.add_argument("--samples", type=int, default=300)
+    parser.add_argument("--group", type=int, default=10)
+    parser.add_argument("--switch-interval", type=float, default=None, help="interpreter thread switch interval")
+    args = parser.parse_args()
+
+    if args.switch_interval is not None:
+        sys.setswitchinterval(args.switch_interval)
+
+    settings = secsgem.hsms.HsmsSettings(connect_mode=secsgem.hsms.HsmsConnectMode.PASSIVE)
+    handler = _Equipment(settings)
+
+    for svid in range(10000, 10000 + args.svids):
+        handler.status_variables[svid] = secsgem.gem.StatusVariable(
+            svid,
+            f"sv{svid}",
+            "",
+            secsgem.secs.variables.U4,
+            value=svid,
+        )
+
+    for trid in range(args.traces):
+        function = secsgem.secs.functions.SecsS02F23(
+            {
+                "TRID": trid,
+                "DSPER": args.period,
+                "TOTSMP": args.samples,
+                "REPGSZ": args.group,
+                "SVID": list(range(10000, 10000 + args.svids)),
+            },
+        )
+        header = secsgem.hsms.HsmsStreamFunctionHeader(trid, 2, 23, True, 0)
+        message = secsgem.hsms.HsmsMessage(header, function.encode())
+        handler._on_s02f23(handler, message)  # pylint: disable=protected-access
+
+    tasks = [trace.task for trace in handler.traces.values()]
+    period = tasks[0].period
+
+    while handler.traces:
+        time.sleep(0.1)
+
+    jitters = []
+    for times in handler.sample_times.values():
+        jitters.extend(abs(second - first - period) for first, second in zip(times, times[1:]))
+
+    samples = sum(len(times) for times in handler.sample_times.values())
+
+    print(f"{args.traces} traces x {args.svids} SVIDs, period {period * 1000:.0f} ms, {samples} samples")
+    print(f"jitter median {statistics.median(jitters) * 1000:8.3f} ms")
+    print(f"jitter p99    {sorted(jitters)[int(len(jitters) * 0.99)] * 1000:8.3f} ms")
+    print(f"jitter max    {max(jitters) * 1000:8.3f} ms")
+    print(f"lateness max  {max(task.max_lateness for task in tasks) * 1000:8.3f} ms")
+    print(f"overruns      {sum(task.overruns for task in tasks):8d}")
+
+
+if __name__ == "__main__":
+    main()
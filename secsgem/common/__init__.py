@@ -19,40 +19,74 @@ from .block_send_info import BlockSendInfo
 from .byte_queue import ByteQueue
 from .callbacks import CallbackHandler
 from .connection import Connection
+from .dispatch_metrics import DispatchMetrics
 from .events import EventProducer
 from .header import Header
 from .helpers import format_hex, function_name, indent_block, is_errorcode_ewouldblock, is_windows
+from .keyed_executor import KeyedExecutor
+from .lazy_log import LazyHex, LazySml
 from .message import Block, Message
+from .pending_transactions import PendingTransactions
+from .periodic_scheduler import PeriodicScheduler, PeriodicTask
+from .pooled_protocol_dispatcher import PooledProtocolDispatcher
 from .protocol import Protocol
 from .protocol_dispatcher import ProtocolDispatcher
+from .segment_log import SegmentLog
+from .selector_loop import SelectorLoop
+from .selector_tcp_accepted_connection import SelectorTcpAcceptedConnection
+from .selector_tcp_client_connection import SelectorTcpClientConnection
+from .send_queue import SendPriority, SendQueue, SendQueueFullError
 from .serial_connection import SerialConnection
-from .settings import DeviceType, Settings
+from .serial_executor import SerialExecutor
+from .settings import BackPressure, DeviceType, DispatchOrder, Settings
 from .state_machine import State, StateMachine, Transition, UnknownTransitionError, WrongSourceStateError
 from .tcp_client_connection import TcpClientConnection
 from .tcp_server_connection import TcpServerConnection
 from .timeouts import Timeouts
+from .timer_wheel import TimerWheel
+from .versioned_dict import VersionedDict
 
 __all__ = [
+    "BackPressure",
     "Block",
     "BlockSendInfo",
     "ByteQueue",
     "CallbackHandler",
     "Connection",
     "DeviceType",
+    "DispatchMetrics",
+    "DispatchOrder",
     "EventProducer",
     "Header",
+    "KeyedExecutor",
+    "LazyHex",
+    "LazySml",
     "Message",
+    "PendingTransactions",
+    "PeriodicScheduler",
+    "PeriodicTask",
+    "PooledProtocolDispatcher",
     "Protocol",
     "ProtocolDispatcher",
+    "SegmentLog",
+    "SelectorLoop",
+    "SelectorTcpAcceptedConnection",
+    "SelectorTcpClientConnection",
+    "SendPriority",
+    "SendQueue",
+    "SendQueueFullError",
     "SerialConnection",
+    "SerialExecutor",
     "Settings",
     "State",
     "StateMachine",
     "TcpClientConnection",
     "TcpServerConnection",
     "Timeouts",
+    "TimerWheel",
     "Transition",
     "UnknownTransitionError",
+    "VersionedDict",
     "WrongSourceStateError",
     "format_hex",
     "function_name",
@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import enum
 import threading
+import typing
 
 
 class BlockSendResult(enum.Enum):
@@ -32,22 +33,37 @@ class BlockSendResult(enum.Enum):
 class BlockSendInfo:
     """Container for sending block and waiting for result."""
 
-    def __init__(self, data: bytes):
+    def __init__(self, data: bytes | typing.Sequence[bytes]):
         """Initialize block send info object.
 
         Args:
-            data: data to send.
+            data: data to send, either as bytes or as list of buffers to send in sequence.
 
         """
-        self._data = data
+        self._buffers = [data] if isinstance(data, bytes) else list(data)
 
         self._result = BlockSendResult.NOT_SENT
         self._result_trigger = threading.Event()
 
+        # blocks of the same message, set when the blocks are queued together
+        self.message_blocks: typing.Sequence[BlockSendInfo] | None = None
+
     @property
     def data(self) -> bytes:
         """Get the data for sending."""
-        return self._data
+        if len(self._buffers) == 1:
+            return self._buffers[0]
+
+        return b"".join(self._buffers)
+
+    @property
+    def buffers(self) -> list[bytes]:
+        """Get the data for sending as list of buffers."""
+        return self._buffers
+
+    def __len__(self) -> int:
+        """Get the number of bytes to send."""
+        return sum(len(buffer) for buffer in self._buffers)
 
     def resolve(self, result: bool):
         """Resolve the send data with a result.
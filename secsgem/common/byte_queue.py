@@ -17,28 +17,96 @@
 
 from __future__ import annotations
 
+import collections
 import threading
 
 
 class ByteQueue:
-    """FIFO class for queuing and retrieving bytes."""
+    """FIFO class for queuing and retrieving bytes.
+
+    Received data is kept as immutable chunks, the first one together with a read offset.
+    Consuming data only moves the offset, so the remaining bytes are never moved in memory, and views handed out by
+    `peek` and `pop_view` stay valid while more data is appended.
+    Data requested across chunk boundaries is joined once and stays joined for subsequent calls.
+    """
 
     def __init__(self) -> None:
         """Initialize the queue."""
-        self._buffer = bytearray()
-        self._buffer_lock = threading.Condition()
+        self._head = b""
+        self._head_view = memoryview(self._head)
+        self._offset = 0
+        self._pending: collections.deque[bytes] = collections.deque()
+        self._length = 0
+
+        self._lock = threading.Lock()
+        self._buffer_lock = threading.Condition(self._lock)
 
-    def append(self, data: bytes):
+    def append(self, data: bytes | bytearray | memoryview):
         """Add bytes to the end of the queue.
 
         Args:
             data: bytes to add
 
         """
+        if not data:
+            return
+
+        if not isinstance(data, bytes):
+            data = bytes(data)
+
         with self._buffer_lock:
-            self._buffer.extend(data)
+            self._pending.append(data)
+            self._length += len(data)
             self._buffer_lock.notify_all()
 
+    def _fill_head(self, size: int) -> None:
+        """Make sure the head chunk contains `size` bytes after the offset.
+
+        Must be called with the lock held and at least `size` bytes available.
+        """
+        if self._offset == len(self._head):
+            self._head = self._pending.popleft()
+            self._head_view = memoryview(self._head)
+            self._offset = 0
+
+            if len(self._head) >= size:
+                return
+
+        parts = [self._head_view[self._offset :]]
+        collected = len(parts[0])
+
+        while collected < size:
+            chunk = self._pending.popleft()
+            parts.append(memoryview(chunk))
+            collected += len(chunk)
+
+        self._head = b"".join(parts)
+        self._head_view = memoryview(self._head)
+        self._offset = 0
+
+    def pop_view(self, size: int = 1) -> memoryview:
+        """Remove bytes from the beginning of queue and return them without copying.
+
+        Args:
+            size: number of bytes to remove
+
+        Returns:
+            read-only view of the removed bytes
+
+        """
+        with self._lock:
+            size = min(size, self._length)
+            end = self._offset + size
+
+            if end > len(self._head):
+                self._fill_head(size)
+                end = size
+
+            self._offset = end
+            self._length -= size
+
+            return self._head_view[end - size : end]
+
     def pop(self, size: int = 1) -> bytes:
         """Remove and return bytes from the beginning of queue.
 
@@ -49,10 +117,7 @@ class ByteQueue:
             removed bytes
 
         """
-        with self._buffer_lock:
-            data = self._buffer[:size]
-            del self._buffer[:size]
-            return data
+        return self.pop_view(size).tobytes()
 
     def pop_byte(self) -> int:
         """Remove and return single byte from the beginning of queue.
@@ -61,22 +126,41 @@ class ByteQueue:
             removed byte
 
         """
-        with self._buffer_lock:
-            data = self._buffer[0]
-            del self._buffer[0]
+        with self._lock:
+            if self._length == 0:
+                raise IndexError("pop from empty ByteQueue")
+
+            if self._offset == len(self._head):
+                self._fill_head(1)
+
+            data = self._head[self._offset]
+            self._offset += 1
+            self._length -= 1
+
             return data
 
-    def peek(self, size: int = 1) -> bytes:
+    def peek(self, size: int = 1) -> memoryview:
         """Get bytes from beginning of the queue without removing them.
 
         Args:
             size: number of bytes to peek
 
         Returns:
-            peek bytes
+            read-only view of the peeked bytes
 
         """
-        return self._buffer[:size]
+        # fast path, the head chunk is only replaced by the consuming side
+        head_view, offset = self._head_view, self._offset
+        if offset + size <= len(head_view):
+            return head_view[offset : offset + size]
+
+        with self._lock:
+            size = min(size, self._length)
+
+            if self._offset + size > len(self._head):
+                self._fill_head(size)
+
+            return self._head_view[self._offset : self._offset + size]
 
     def peek_byte(self, position: int = 0) -> int:
         """Get single byte in the buffer without removing.
@@ -88,12 +172,31 @@ class ByteQueue:
             peek bytes
 
         """
-        return self._buffer[position]
+        with self._lock:
+            if position >= self._length:
+                raise IndexError("ByteQueue index out of range")
+
+            position += self._offset
+            if position < len(self._head):
+                return self._head[position]
+
+            position -= len(self._head)
+            for chunk in self._pending:
+                if position < len(chunk):
+                    return chunk[position]
+
+                position -= len(chunk)
+
+            raise IndexError("ByteQueue index out of range")
 
     def clear(self):
         """Clear the bytes in the queue."""
-        with self._buffer_lock:
-            self._buffer.clear()
+        with self._lock:
+            self._head = b""
+            self._head_view = memoryview(self._head)
+            self._offset = 0
+            self._pending.clear()
+            self._length = 0
 
     def __len__(self) -> int:
         """Get the length of the queue.
@@ -102,9 +205,19 @@ class ByteQueue:
             queue length
 
         """
-        return len(self._buffer)
+        return self._length
 
-    def wait_for(self, size: int = 1, peek: bool = False) -> bytes:
+    def _wait_for_size(self, size: int):
+        """Block until at least `size` bytes are available."""
+
+        def min_size() -> bool:
+            return self._length >= size
+
+        if self._length < size:
+            with self._buffer_lock:
+                self._buffer_lock.wait_for(min_size)
+
+    def wait_for(self, size: int = 1, peek: bool = False) -> bytes | memoryview:
         """Wait until the requested number of bytes is available in the receive queue.
 
         Args:
@@ -112,22 +225,32 @@ class ByteQueue:
             peek: only look, don't remove the item from the queue.
 
         Returns:
-            Found bytes
+            Found bytes, a read-only view if peek is set
 
         """
-
-        def min_size() -> bool:
-            return len(self._buffer) >= size
-
-        if len(self._buffer) < size:
-            with self._buffer_lock:
-                self._buffer_lock.wait_for(min_size)
+        self._wait_for_size(size)
 
         if peek:
             return self.peek(size)
 
         return self.pop(size)
 
+    def wait_for_view(self, size: int = 1) -> memoryview:
+        """Wait until the requested number of bytes is available and remove them without copying.
+
+        This is used to decode blocks straight out of the receive buffer.
+
+        Args:
+            size: number of bytes
+
+        Returns:
+            read-only view of the removed bytes
+
+        """
+        self._wait_for_size(size)
+
+        return self.pop_view(size)
+
     def wait_for_byte(self, peek: bool = False) -> int:
         """Wait until one byte is available in the receive queue.
 
@@ -138,4 +261,9 @@ class ByteQueue:
             Found byte
 
         """
-        return self.wait_for(peek=peek)[0]
+        self._wait_for_size(1)
+
+        if peek:
+            return self.peek_byte()
+
+        return self.pop_byte()
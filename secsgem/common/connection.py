@@ -15,10 +15,15 @@
 #####################################################################
 """Connection base function."""
 
+from __future__ import annotations
+
 import abc
+import typing
 
 from .events import Event
-from .settings import Settings
+
+if typing.TYPE_CHECKING:
+    from .settings import Settings
 
 
 class Connection(abc.ABC):
@@ -34,6 +39,7 @@ class Connection(abc.ABC):
         self._on_data = Event()
         self._on_disconnecting = Event()
         self._on_disconnected = Event()
+        self._on_writable = Event()
 
         self._connected = False
         self._disconnecting = False
@@ -74,6 +80,15 @@ class Connection(abc.ABC):
         """
         return self._on_disconnected
 
+    @property
+    def on_writable(self) -> Event:
+        """Get the writable event.
+
+        Callbacks to this event are called, when a connection that wasn't :attr:`writable` accepts data again.
+
+        """
+        return self._on_writable
+
     @property
     def connected(self) -> bool:
         """Get the connected flag.
@@ -92,6 +107,16 @@ class Connection(abc.ABC):
         """
         return self._disconnecting
 
+    @property
+    def writable(self) -> bool:
+        """Get the writable flag.
+
+        This flag is False, while a connection buffering the sent data has more unsent data than it accepts.
+        Connections sending the data right away are always writable.
+
+        """
+        return True
+
     @abc.abstractmethod
     def enable(self):
         """Enable the connection.
@@ -108,6 +133,10 @@ class Connection(abc.ABC):
         """
         raise NotImplementedError("Connection.disable missing implementation")
 
+    def disconnect(self):
+        """Close the current connection, an enabled connection is reestablished."""
+        raise NotImplementedError("Connection.disconnect missing implementation")
+
     @abc.abstractmethod
     def send_data(self, data: bytes) -> bool:
         """Send data to the remote host.
@@ -120,3 +149,17 @@ class Connection(abc.ABC):
 
         """
         raise NotImplementedError("Connection.send_data missing implementation")
+
+    def send_buffers(self, buffers: typing.Sequence[bytes | memoryview]) -> bool:
+        """Send a sequence of buffers to the remote host.
+
+        Connections supporting scatter-gather I/O override this to avoid concatenating the buffers.
+
+        Args:
+            buffers: encoded data, sent in sequence
+
+        Returns:
+            True if succeeded, False if failed
+
+        """
+        return self.send_data(b"".join(buffers))
@@ -0,0 +1,133 @@
+#####################################################################
+# dispatch_metrics.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Metrics of a protocol dispatcher."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+
+class DispatchMetrics:  # pylint: disable=too-many-instance-attributes
+    """Queue depth and handler latency of a protocol dispatcher.
+
+    Wait time is the time a block spent in the queue, handler time the time its handler ran. Times are in seconds.
+
+    Example:
+        >>> metrics = DispatchMetrics()
+        >>> started = metrics.started(metrics.queued())
+        >>> metrics.finished(started)
+        >>> metrics.dispatched, metrics.queue_depth
+        (1, 0)
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize metrics."""
+        self._lock = threading.Lock()
+        self._queue_depth = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset the statistics, the current queue depth is kept."""
+        with self._lock:
+            self._max_queue_depth = self._queue_depth
+            self._dispatched = 0
+            self._total_wait_time = 0.0
+            self._max_wait_time = 0.0
+            self._total_handler_time = 0.0
+            self._max_handler_time = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of blocks waiting to be dispatched."""
+        return self._queue_depth
+
+    @property
+    def max_queue_depth(self) -> int:
+        """Highest number of blocks waiting to be dispatched."""
+        return self._max_queue_depth
+
+    @property
+    def dispatched(self) -> int:
+        """Number of dispatched blocks."""
+        return self._dispatched
+
+    @property
+    def average_wait_time(self) -> float:
+        """Average time a block waited for dispatch."""
+        return self._total_wait_time / self._dispatched if self._dispatched else 0.0
+
+    @property
+    def max_wait_time(self) -> float:
+        """Longest time a block waited for dispatch."""
+        return self._max_wait_time
+
+    @property
+    def average_handler_time(self) -> float:
+        """Average time a handler ran."""
+        return self._total_handler_time / self._dispatched if self._dispatched else 0.0
+
+    @property
+    def max_handler_time(self) -> float:
+        """Longest time a handler ran."""
+        return self._max_handler_time
+
+    def queued(self) -> float:
+        """Count a block added to the queue.
+
+        Returns:
+            time the block was queued
+
+        """
+        with self._lock:
+            self._queue_depth += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queue_depth)
+
+        return time.monotonic()
+
+    def started(self, queued_at: float) -> float:
+        """Count a block taken from the queue.
+
+        Args:
+            queued_at: time the block was queued
+
+        Returns:
+            time the handler was started
+
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            self._queue_depth -= 1
+            self._total_wait_time += now - queued_at
+            self._max_wait_time = max(self._max_wait_time, now - queued_at)
+
+        return now
+
+    def finished(self, started_at: float) -> None:
+        """Count a handler that finished.
+
+        Args:
+            started_at: time the handler was started
+
+        """
+        duration = time.monotonic() - started_at
+
+        with self._lock:
+            self._dispatched += 1
+            self._total_handler_time += duration
+            self._max_handler_time = max(self._max_handler_time, duration)
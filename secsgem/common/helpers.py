@@ -15,6 +15,8 @@
 #####################################################################
 """Contains helper functions."""
 
+from __future__ import annotations
+
 import errno
 import sys
 import types
@@ -97,7 +99,7 @@ def indent_block(block: str, spaces: int = 2) -> str:
     return "\n".join(indented_lines)
 
 
-def is_errorcode_ewouldblock(errorcode: int) -> bool:
+def is_errorcode_ewouldblock(errorcode: int | None) -> bool:
     """Check if the errorcode is a would-block error.
 
     Args:
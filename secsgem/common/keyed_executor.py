@@ -0,0 +1,90 @@
+#####################################################################
+# keyed_executor.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Concurrent execution of functions, ordered by key, on a shared executor."""
+
+from __future__ import annotations
+
+import collections
+import logging
+import threading
+import typing
+
+if typing.TYPE_CHECKING:
+    import concurrent.futures
+
+
+class KeyedExecutor:
+    """Calls submitted functions on a shared executor, functions with equal keys one after another.
+
+    Functions with different keys run concurrently, functions with the same key are called in submission order.
+    At most one worker of the executor is used per key at a time. After `max_batch` functions the worker is handed
+    back to the executor, so other keys are not starved.
+    """
+
+    max_batch = 16
+    """Maximum number of functions called for a key before the worker is handed back to the executor."""
+
+    def __init__(self, executor: concurrent.futures.Executor):
+        """Initialize keyed executor.
+
+        Args:
+            executor: executor to run the functions on
+
+        """
+        self._executor = executor
+        self._logger = logging.getLogger(self.__module__ + "." + self.__class__.__name__)
+
+        # functions waiting per key, a key is present while a worker is scheduled for it
+        self._lanes: dict[typing.Hashable, collections.deque[tuple[typing.Callable[..., None], tuple]]] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key: typing.Hashable, function: typing.Callable[..., None], *args) -> None:
+        """Queue a function for execution.
+
+        Args:
+            key: functions with equal keys are called one after another
+            function: function to call
+            args: arguments for the function
+
+        """
+        with self._lock:
+            lane = self._lanes.get(key)
+
+            if lane is not None:
+                lane.append((function, args))
+                return
+
+            self._lanes[key] = collections.deque([(function, args)])
+
+        self._executor.submit(self._run, key)
+
+    def _run(self, key: typing.Hashable) -> None:
+        for _ in range(self.max_batch):
+            with self._lock:
+                lane = self._lanes[key]
+
+                if not lane:
+                    del self._lanes[key]
+                    return
+
+                function, args = lane.popleft()
+
+            try:
+                function(*args)
+            except Exception:  # pylint: disable=broad-except
+                self._logger.exception("ignoring exception in executed function")
+
+        self._executor.submit(self._run, key)
@@ -0,0 +1,97 @@
+#####################################################################
+# lazy_log.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Log arguments formatted only when a log record is emitted."""
+
+from __future__ import annotations
+
+import typing
+
+from .helpers import format_hex
+
+if typing.TYPE_CHECKING:
+    from secsgem.secs.functions import StreamsFunctions
+    from secsgem.secs.functions.base import SecsStreamFunction
+
+    from .message import Message
+
+
+class LazyHex:
+    """Log argument formatting data as hex numbers.
+
+    Example:
+        >>> str(LazyHex([b"as", b"dfg"]))
+        '61:73:64:66:67'
+
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: bytes | typing.Sequence[bytes | memoryview]):
+        """Initialize the argument.
+
+        Args:
+            data: data to format, either as bytes or as list of bytes or memoryview buffers
+
+        """
+        self._data = data
+
+    def __str__(self) -> str:
+        """Format the data."""
+        data = self._data if isinstance(self._data, bytes) else b"".join(self._data)
+        return format_hex(data)
+
+
+class LazySml:
+    """Log argument rendering the SML text of a message or function.
+
+    The text of a received message is rendered once and kept with the message, the text of a function once per
+    argument.
+
+    Example:
+        >>> import secsgem.secs
+        >>>
+        >>> print(LazySml(secsgem.secs.functions.SecsS01F03([1, 2])))
+        S1F3 W
+          <L [2]
+            <U1 1 >
+            <U1 2 >
+          > .
+
+    """
+
+    __slots__ = ("_source", "_streams_functions", "_text")
+
+    def __init__(self, source: Message | SecsStreamFunction, streams_functions: StreamsFunctions | None = None):
+        """Initialize the argument.
+
+        Args:
+            source: message or function to render
+            streams_functions: functions to decode a message with
+
+        """
+        self._source = source
+        self._streams_functions = streams_functions
+        self._text: str | None = None
+
+    def __str__(self) -> str:
+        """Render the SML text."""
+        if self._text is None:
+            if self._streams_functions is None:
+                self._text = str(self._source)
+            else:
+                self._text = typing.cast("Message", self._source).sml(self._streams_functions)
+
+        return self._text
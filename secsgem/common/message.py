@@ -18,16 +18,29 @@
 from __future__ import annotations
 
 import abc
+import functools
 import struct
 import typing
 
+from .helpers import format_hex
+
 if typing.TYPE_CHECKING:
+    from secsgem.secs.functions import StreamsFunctions
+    from secsgem.secs.functions.base import SecsStreamFunction
+
     from .header import Header
 
 BlockHeaderT = typing.TypeVar("BlockHeaderT", bound="Header")
 BlockT = typing.TypeVar("BlockT", bound="Block")
 
 MessageT = typing.TypeVar("MessageT", bound="Message")
+FunctionT = typing.TypeVar("FunctionT", bound="SecsStreamFunction")
+
+
+@functools.lru_cache(maxsize=16)
+def _struct(format_string: str) -> struct.Struct:
+    """Get a precompiled struct for a format string."""
+    return struct.Struct(format_string)
 
 
 class Block(abc.ABC, typing.Generic[BlockHeaderT]):
@@ -64,38 +77,39 @@ class Block(abc.ABC, typing.Generic[BlockHeaderT]):
         if self.checksum_format == "":
             return 0
 
-        calculated_checksum = 0
+        return sum(self.header.encode()) + sum(self.data)
 
-        for data_byte in self.header.encode() + self.data:
-            calculated_checksum += data_byte
+    def encode_buffers(self) -> list[bytes]:
+        """Encode block data as separate buffers.
 
-        return calculated_checksum
-
-    def encode(self) -> bytes:
-        """Encode block data.
+        Length and header, data and checksum are returned separately, so they can be written using scatter-gather
+        I/O without concatenating the data first.
 
         Returns:
-            byte-encoded block
+            list of byte-encoded block parts
 
         """
-        data_length = len(self.data)
-
-        struct_args: tuple = (
-            self.header.length + data_length,
-            self.header.encode(),
+        buffers = [
+            _struct(f">{self.length_format}").pack(self.header.length + len(self.data)) + self.header.encode(),
             self.data,
-        )
+        ]
 
         if self.checksum_format != "":
-            struct_args += (self.checksum,)
+            buffers.append(_struct(f">{self.checksum_format}").pack(self.checksum))
 
-        return struct.pack(
-            f">{self.length_format}{self.header.length}s{data_length}s{self.checksum_format}",
-            *struct_args,
-        )
+        return buffers
+
+    def encode(self) -> bytes:
+        """Encode block data.
+
+        Returns:
+            byte-encoded block
+
+        """
+        return b"".join(self.encode_buffers())
 
     @classmethod
-    def decode(cls: type[BlockT], data: bytes) -> BlockT | None:
+    def decode(cls: type[BlockT], data: bytes | memoryview) -> BlockT | None:
         """Decode a byte array to Block object.
 
         Args:
@@ -105,18 +119,23 @@ class Block(abc.ABC, typing.Generic[BlockHeaderT]):
             received packet object
 
         """
-        data_length = struct.unpack_from(f">{cls.length_format}", data)[0] - cls.header_type.length
+        length_struct = _struct(f">{cls.length_format}")
+        checksum_struct = _struct(f">{cls.checksum_format}")
 
-        data_fields = struct.unpack(
-            f">{cls.length_format}{cls.header_type.length}s{data_length}s{cls.checksum_format}",
-            data,
-        )
+        header_start = length_struct.size
+        data_start = header_start + cls.header_type.length
+        data_end = header_start + length_struct.unpack_from(data)[0]
+
+        if len(data) != data_end + checksum_struct.size:
+            raise struct.error(f"block requires a buffer of {data_end + checksum_struct.size} bytes, got {len(data)}")
+
+        data = memoryview(data)
 
-        header = cls.header_type.decode(data_fields[1])
+        header = cls.header_type.decode(data[header_start:data_start])
 
-        obj = cls(header, data_fields[2])
+        obj = cls(header, data[data_start:data_end].tobytes())
 
-        if cls.checksum_format != "" and obj.checksum != data_fields[3]:
+        if cls.checksum_format != "" and obj.checksum != checksum_struct.unpack_from(data, data_end)[0]:
             return None
 
         return obj
@@ -138,6 +157,8 @@ class Message(abc.ABC, typing.Generic[BlockT]):
 
         """
         self._blocks: list[BlockT] = self._split_blocks(data, header, complete)
+        self._decoded_functions: dict[type, SecsStreamFunction] = {}
+        self._sml: str | None = None
 
     @classmethod
     def _split_blocks(cls, data: bytes, header: BlockHeaderT, complete: bool = True) -> list[BlockT]:
@@ -201,6 +222,58 @@ class Message(abc.ABC, typing.Generic[BlockT]):
         """Get the blocks."""
         return self._blocks
 
+    def decode_function(self, function_type: type[FunctionT]) -> FunctionT:
+        """Decode the message data using a stream function class.
+
+        The decoded function is cached on the message, so the data is decoded at most once per function class,
+        no matter how many consumers (communication log, handlers, ...) ask for it.
+        Incomplete messages are not cached, as more blocks might still be appended.
+
+        Args:
+            function_type: stream function class to decode the data with
+
+        Returns:
+            decoded stream function object
+
+        """
+        function = self._decoded_functions.get(function_type)
+        if function is not None:
+            return typing.cast(FunctionT, function)
+
+        decoded = function_type()
+        decoded.decode(self.data)
+
+        if self.complete:
+            self._decoded_functions[function_type] = decoded
+
+        return decoded
+
+    def sml(self, streams_functions: StreamsFunctions) -> str:
+        """Get the SML text of the message, as written to the communication log.
+
+        The text of a complete message is rendered once and cached.
+        Messages without a matching function are rendered as hex data.
+
+        Args:
+            streams_functions: functions to decode the message with
+
+        Returns:
+            SML text
+
+        """
+        if self._sml is not None:
+            return self._sml
+
+        try:
+            text = str(streams_functions.decode(self))
+        except ValueError:
+            text = f"S{self.header.stream}F{self.header.function} <undecoded {format_hex(self.data)}>"
+
+        if self.complete:
+            self._sml = text
+
+        return text
+
     def __str__(self) -> str:
         """Generate string representation for an object of this class."""
         return f"'header': {self.header} "
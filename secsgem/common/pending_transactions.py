@@ -0,0 +1,186 @@
+#####################################################################
+# pending_transactions.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Table of transactions waiting for a reply."""
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import contextlib
+import threading
+import time
+import typing
+
+if typing.TYPE_CHECKING:
+    from .message import Message
+    from .settings import Settings, TimerHandle
+
+
+class PendingTransactions:
+    """Futures of sent requests, by system bytes, resolved with the reply or None after a timeout.
+
+    All timeouts share a single timer, which is armed for the earliest deadline.
+    Requests with the same timeout expire in the order they were added, so they are kept in one deque per timeout
+    value and the earliest deadline is always at the head of a deque.
+
+    Example:
+        >>> import secsgem.hsms
+        >>>
+        >>> transactions = PendingTransactions(secsgem.hsms.HsmsSettings())
+        >>> future = transactions.add(1, 45)
+        >>> transactions.resolve(1, None)
+        True
+        >>> future.result(), len(transactions)
+        (None, 0)
+
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        """Initialize the table.
+
+        Args:
+            settings: settings used to schedule the timer
+
+        """
+        self._settings = settings
+
+        self._lock = threading.Lock()
+        self._futures: dict[int, concurrent.futures.Future[Message | None]] = {}
+        self._deadlines: dict[float, collections.deque[tuple[float, int, concurrent.futures.Future]]] = {}
+
+        self._timer: TimerHandle | None = None
+        self._timer_deadline: float | None = None
+
+    def __len__(self) -> int:
+        """Get the number of transactions waiting for a reply."""
+        return len(self._futures)
+
+    def __contains__(self, system: int) -> bool:
+        """Check if a transaction is waiting for a reply.
+
+        Args:
+            system: system bytes of the transaction
+
+        """
+        return system in self._futures
+
+    def add(self, system: int, timeout: float) -> concurrent.futures.Future[Message | None]:
+        """Add a transaction waiting for a reply.
+
+        Args:
+            system: system bytes of the request
+            timeout: seconds to wait for the reply
+
+        Returns:
+            future resolved with the reply, or None if no reply was received within the timeout
+
+        """
+        future: concurrent.futures.Future[Message | None] = concurrent.futures.Future()
+        deadline = time.monotonic() + timeout
+
+        with self._lock:
+            self._futures[system] = future
+
+            lane = self._deadlines.setdefault(timeout, collections.deque())
+
+            # drop replied transactions from the head, so the deque only grows with unanswered requests
+            while lane and lane[0][2].done():
+                lane.popleft()
+
+            lane.append((deadline, system, future))
+
+            if self._timer_deadline is None or deadline < self._timer_deadline:
+                self._arm(deadline)
+
+        return future
+
+    def resolve(self, system: int, message: Message | None) -> bool:
+        """Resolve a waiting transaction.
+
+        Callbacks added to the future are called in the calling thread.
+
+        Args:
+            system: system bytes of the transaction
+            message: reply to resolve the transaction with
+
+        Returns:
+            True if a transaction was waiting for the reply
+
+        """
+        with self._lock:
+            future = self._futures.pop(system, None)
+
+        if future is None:
+            return False
+
+        self._set_result(future, message)
+        return True
+
+    def clear(self) -> None:
+        """Resolve all waiting transactions with None."""
+        with self._lock:
+            futures = list(self._futures.values())
+            self._futures.clear()
+            self._deadlines.clear()
+
+            if self._timer is not None:
+                self._timer.cancel()
+
+            self._timer = None
+            self._timer_deadline = None
+
+        for future in futures:
+            self._set_result(future, None)
+
+    @staticmethod
+    def _set_result(future: concurrent.futures.Future[Message | None], message: Message | None) -> None:
+        """Resolve a future, unless the caller already cancelled it."""
+        with contextlib.suppress(concurrent.futures.InvalidStateError):
+            future.set_result(message)
+
+    def _arm(self, deadline: float) -> None:
+        """Start the timer for a deadline, replacing a running timer, called with the lock held."""
+        if self._timer is not None:
+            self._timer.cancel()
+
+        self._timer_deadline = deadline
+        self._timer = self._settings.call_later(max(deadline - time.monotonic(), 0), self._expire)
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        expired = []
+
+        with self._lock:
+            self._timer = None
+            self._timer_deadline = None
+            next_deadline = None
+
+            for lane in self._deadlines.values():
+                while lane and (lane[0][0] <= now or lane[0][2].done()):
+                    _, system, future = lane.popleft()
+
+                    if self._futures.get(system) is future:
+                        del self._futures[system]
+                        expired.append(future)
+
+                if lane and (next_deadline is None or lane[0][0] < next_deadline):
+                    next_deadline = lane[0][0]
+
+            if next_deadline is not None:
+                self._arm(next_deadline)
+
+        for future in expired:
+            self._set_result(future, None)
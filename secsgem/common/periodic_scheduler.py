@@ -0,0 +1,248 @@
+#####################################################################
+# periodic_scheduler.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Single thread calling periodic tasks at fixed rates."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import math
+import threading
+import time
+import typing
+
+
+class PeriodicTask:
+    """Handle of a task scheduled on a :class:`PeriodicScheduler`."""
+
+    __slots__ = ("_args", "_cancelled", "_function", "count", "deadline", "max_lateness", "overruns", "period")
+
+    def __init__(self, deadline: float, period: float, function: typing.Callable[..., None], args: tuple):
+        """Initialize a task.
+
+        Args:
+            deadline: monotonic time of the first call
+            period: seconds between two calls
+            function: function to call
+            args: arguments for the function
+
+        """
+        self.deadline = deadline
+        self.period = period
+        self._function = function
+        self._args = args
+        self._cancelled = False
+
+        self.count = 0
+        self.max_lateness = 0.0
+        self.overruns = 0
+
+    @property
+    def cancelled(self) -> bool:
+        """Task was cancelled."""
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """Stop calling the task, a call already running is finished."""
+        self._cancelled = True
+
+    def run(self) -> None:
+        """Call the function of the task."""
+        self._function(*self._args)
+
+
+class PeriodicScheduler:
+    """Thread calling any number of periodic tasks at fixed rates.
+
+    The calls of a task are scheduled at multiples of its period, so the delays of single calls don't add up.
+    Deadlines are aligned to the period on the monotonic clock, tasks with the same period are called together
+    with one wakeup. Calls that were missed because the thread was busy are skipped and counted as overruns.
+    The thread sleeps until the next deadline and busy waits the last `spin` seconds, as sleeping is not precise
+    enough for short periods. The functions are called in the scheduler thread and must not block.
+    It is separate from :class:`secsgem.common.TimerWheel`, as the ticks of the wheel are too coarse for periods of
+    a few milliseconds, and busy waiting in the wheel thread would delay all other timers.
+
+    Example:
+        >>> import threading
+        >>>
+        >>> scheduler = PeriodicScheduler()
+        >>> called = threading.Semaphore(0)
+        >>> task = scheduler.schedule(0.01, called.release)
+        >>> all(called.acquire(timeout=1) for _ in range(3))
+        True
+        >>> task.cancel()
+        >>> scheduler.stop()
+
+    """
+
+    _shared: PeriodicScheduler | None = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, spin: float = 0.0005, name: str = "secsgem_periodicScheduler"):
+        """Initialize a scheduler.
+
+        Args:
+            spin: seconds before a deadline the thread stops sleeping and busy waits
+            name: name of the thread
+
+        """
+        self._spin = spin
+        self._name = name
+
+        self._logger = logging.getLogger(self.__module__ + "." + self.__class__.__name__)
+
+        self._tasks: list[tuple[float, int, PeriodicTask]] = []
+        self._counter = itertools.count()
+
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._running = False
+
+    @classmethod
+    def shared(cls) -> PeriodicScheduler:
+        """Get the scheduler shared by all handlers."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+
+            return cls._shared
+
+    def __len__(self) -> int:
+        """Get the number of scheduled tasks, including cancelled ones not yet removed."""
+        return len(self._tasks)
+
+    def schedule(
+        self,
+        period: float,
+        function: typing.Callable[..., None],
+        *args,
+        delay: float | None = None,
+    ) -> PeriodicTask:
+        """Call a function periodically.
+
+        Args:
+            period: seconds between two calls
+            function: function to call
+            args: arguments for the function
+            delay: seconds until the first call, the next multiple of the period if None
+
+        Returns:
+            handle to cancel the task
+
+        """
+        if period <= 0:
+            raise ValueError(f"Invalid period {period}")
+
+        now = time.monotonic()
+        deadline = math.floor(now / period + 1) * period if delay is None else now + delay
+
+        task = PeriodicTask(deadline, period, function, args)
+
+        with self._condition:
+            heapq.heappush(self._tasks, (task.deadline, next(self._counter), task))
+
+            if not self._running:
+                self._start()
+
+            self._condition.notify()
+
+        return task
+
+    def stop(self) -> None:
+        """Stop the thread, scheduled tasks are dropped."""
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+
+            thread = self._thread
+            self._thread = None
+
+            self._tasks.clear()
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _start(self) -> None:
+        """Start the thread, called with the lock held."""
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+
+    def _next(self) -> list[PeriodicTask] | None:
+        """Wait for the next due tasks, returns None if the scheduler was stopped."""
+        with self._condition:
+            while self._running:
+                if not self._tasks:
+                    self._condition.wait()
+                    continue
+
+                timeout = self._tasks[0][0] - self._spin - time.monotonic()
+                if timeout > 0:
+                    self._condition.wait(timeout)
+                    continue
+
+                # tasks with the same period share their deadlines, take all of them at once
+                due = []
+                limit = time.monotonic() + self._spin
+                while self._tasks and self._tasks[0][0] <= limit:
+                    _, _, task = heapq.heappop(self._tasks)
+                    if not task.cancelled:
+                        due.append(task)
+
+                if due:
+                    return due
+
+        return None
+
+    def _reschedule(self, task: PeriodicTask, now: float) -> None:
+        """Schedule the next call of a task, skipping the calls that were missed."""
+        deadline = task.deadline + task.period
+
+        if deadline <= now:
+            missed = int((now - deadline) / task.period) + 1
+            task.overruns += missed
+            deadline += missed * task.period
+
+        task.deadline = deadline
+
+        with self._condition:
+            if self._running:
+                heapq.heappush(self._tasks, (deadline, next(self._counter), task))
+
+    def _run(self) -> None:
+        while True:
+            tasks = self._next()
+            if tasks is None:
+                return
+
+            for task in tasks:
+                # yield the interpreter lock while waiting for the deadline
+                while time.monotonic() < task.deadline:
+                    time.sleep(0)
+
+                task.max_lateness = max(task.max_lateness, time.monotonic() - task.deadline)
+                task.count += 1
+
+                try:
+                    task.run()
+                except Exception:  # pylint: disable=broad-except
+                    self._logger.exception("ignoring exception in periodic task")
+
+            now = time.monotonic()
+            for task in tasks:
+                if not task.cancelled:
+                    self._reschedule(task, now)
@@ -0,0 +1,120 @@
+#####################################################################
+# pooled_protocol_dispatcher.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Protocol dispatcher running on a shared worker pool."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import typing
+
+from .keyed_executor import KeyedExecutor
+from .protocol_dispatcher import ProtocolDispatcher
+
+if typing.TYPE_CHECKING:
+    import concurrent.futures
+
+    from .settings import Settings
+
+
+class PooledProtocolDispatcher(ProtocolDispatcher):
+    """Dispatcher calling the protocol receiver and message handlers on shared executors instead of own threads.
+
+    Triggers of the receiver are coalesced, it runs at most once at a time.
+    Blocks are dispatched in the order they were queued, one at a time.
+    If `dispatch_workers` is configured in the settings, only blocks with the same `dispatch_order` key are dispatched
+    in order, the others concurrently on the dispatcher executor.
+
+    Handlers wait for the receiver to send their messages, so the receiver must not run on the same executor.
+    """
+
+    def __init__(
+        self,
+        receiver_target: typing.Callable,
+        dispatcher_target: typing.Callable,
+        settings: Settings,
+        receiver_executor: concurrent.futures.Executor,
+        dispatcher_executor: concurrent.futures.Executor,
+    ) -> None:
+        """Initialize dispatcher object.
+
+        Args:
+            receiver_target: function to call when receiver triggered
+            dispatcher_target: function to call when message available for dispatch
+            settings: communication/protocol settings
+            receiver_executor: executor to run the receiver on
+            dispatcher_executor: executor to run the dispatcher on
+
+        """
+        self._receiver_executor = receiver_executor
+        self._dispatcher_executor = dispatcher_executor
+
+        super().__init__(receiver_target, dispatcher_target, settings)
+
+        self._receiver_lock = threading.Condition()
+        self._receiver_running = False
+        self._receiver_scheduled = False
+        self._receiver_triggered = False
+
+    def _create_dispatch_pool(self) -> KeyedExecutor:
+        return KeyedExecutor(self._dispatcher_executor)
+
+    def start(self):
+        """Start calling the receiver."""
+        with self._receiver_lock:
+            self._receiver_running = True
+
+            if not self._receiver_triggered or self._receiver_scheduled:
+                return
+
+            self._receiver_scheduled = True
+
+        self._receiver_executor.submit(self._run_receiver)
+
+    def stop(self):
+        """Stop calling the receiver and wait for a running receiver to finish."""
+        with self._receiver_lock:
+            self._receiver_running = False
+
+            while self._receiver_scheduled:
+                self._receiver_lock.wait()
+
+    def trigger_receiver(self):
+        """Schedule a call of the receiver, triggers before start are kept."""
+        with self._receiver_lock:
+            self._receiver_triggered = True
+
+            if not self._receiver_running or self._receiver_scheduled:
+                return
+
+            self._receiver_scheduled = True
+
+        self._receiver_executor.submit(self._run_receiver)
+
+    def _run_receiver(self):
+        while True:
+            with self._receiver_lock:
+                if not self._receiver_triggered or not self._receiver_running:
+                    self._receiver_scheduled = False
+                    self._receiver_lock.notify_all()
+                    return
+
+                self._receiver_triggered = False
+
+            try:
+                self._receiver_target()
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                logging.warning("Exception in receiver callback, ignoring", exc_info=exc)
@@ -18,20 +18,23 @@
 from __future__ import annotations
 
 import abc
+import concurrent.futures
 import logging
-import queue
 import random
 import typing
 
 from .block_send_info import BlockSendInfo
 from .byte_queue import ByteQueue
 from .events import EventProducer
-from .protocol_dispatcher import ProtocolDispatcher
+from .lazy_log import LazySml
+from .pending_transactions import PendingTransactions
+from .send_queue import SendPriority, SendQueue, SendQueueFullError
 
 if typing.TYPE_CHECKING:
     from secsgem.secs.functions.base import SecsStreamFunction
 
     from .connection import Connection
+    from .dispatch_metrics import DispatchMetrics
     from .message import Block, Message
     from .settings import Settings
 
@@ -65,17 +68,13 @@ class Protocol(abc.ABC, typing.Generic[MessageT, BlockT]):  # pylint: disable=to
 
         self.__connection: Connection | None = None
 
-        self._response_queues: dict[int, queue.Queue[MessageT]] = {}
+        self._pending_transactions = PendingTransactions(settings)
 
         self._receive_buffer = ByteQueue()
-        self._send_queue: queue.Queue[BlockSendInfo] = queue.Queue()
+        self._send_queue = SendQueue(settings.send_queue_limit, settings.send_back_pressure)
         self._incomplete_messages: dict[int, MessageT] = {}
 
-        self._thread = ProtocolDispatcher(
-            self._process_data,
-            self._dispatch_block,
-            self._settings,
-        )
+        self._thread = self._settings.create_dispatcher(self._process_data, self._dispatch_block)
 
     @property
     def _connection(self) -> Connection:
@@ -93,6 +92,7 @@ class Protocol(abc.ABC, typing.Generic[MessageT, BlockT]):  # pylint: disable=to
             self.__connection.on_data.register(self._on_connection_data_received)
             self.__connection.on_disconnecting.register(self._on_disconnecting)
             self.__connection.on_disconnected.register(self._on_disconnected)
+            self.__connection.on_writable.register(self._on_connection_writable)
 
         return self.__connection
 
@@ -140,6 +140,15 @@ class Protocol(abc.ABC, typing.Generic[MessageT, BlockT]):  # pylint: disable=to
         self._receive_buffer.append(data["data"])
         self._thread.trigger_receiver()
 
+    def _on_connection_writable(self, _: dict[str, typing.Any]):
+        """Continue sending the queued blocks after the connection accepts data again.
+
+        The arguemnt is a dictionary with the following keys
+        - source: connection object that triggered the event
+
+        """
+        self._thread.trigger_receiver()
+
     def _process_data(self):
         """Process input and output data.
 
@@ -181,6 +190,16 @@ class Protocol(abc.ABC, typing.Generic[MessageT, BlockT]):  # pylint: disable=to
         """Property for event handling."""
         return self._event_producer
 
+    @property
+    def dispatch_metrics(self) -> DispatchMetrics:
+        """Queue depth and handler latency of received messages."""
+        return self._thread.metrics
+
+    @property
+    def send_queue(self) -> SendQueue:
+        """Queue of blocks waiting to be sent, with its size and back pressure statistics."""
+        return self._send_queue
+
     def get_next_system_counter(self) -> int:
         """Return the next System.
 
@@ -224,27 +243,17 @@ class Protocol(abc.ABC, typing.Generic[MessageT, BlockT]):  # pylint: disable=to
         """
         raise NotImplementedError("Protocol._on_connection_message_received missing implementation")
 
-    def _get_queue_for_system(self, system_id: int) -> queue.Queue:
-        """Create a new queue to receive responses for a certain system.
+    def _resolve_response(self, message: MessageT) -> bool:
+        """Pass a received message to the request waiting for it.
 
         Args:
-            system_id: system id to watch
+            message: received message
 
         Returns:
-            queue to receive responses with
-
-        """
-        self._response_queues[system_id] = queue.Queue()
-        return self._response_queues[system_id]
-
-    def _remove_queue(self, system_id: int):
-        """Remove queue for system id from list.
-
-        Args:
-            system_id: system id to remove
+            True if a request was waiting for the message
 
         """
-        del self._response_queues[system_id]
+        return self._pending_transactions.resolve(message.header.system, message)
 
     def _add_message_block(self, block: BlockT) -> MessageT | None:
         """Add a block, and get completed message if available.
@@ -287,57 +296,110 @@ class Protocol(abc.ABC, typing.Generic[MessageT, BlockT]):  # pylint: disable=to
         """
         raise NotImplementedError("Protocol._create_message_for_function missing implementation")
 
-    def send_message(self, message: Message) -> bool:
+    def _send_priority(self, message: Message) -> SendPriority:
+        """Get the priority of a message in the send queue.
+
+        S9Fx and S1F1/S1F2 are sent like control messages, other replies before primary messages.
+
+        Args:
+            message: message to send
+
+        Returns:
+            priority of the message
+
+        """
+        if (message.header.stream, message.header.function) in ((1, 1), (1, 2)) or message.header.stream == 9:
+            return SendPriority.CONTROL
+
+        if message.header.function % 2 == 0:
+            return SendPriority.REPLY
+
+        return SendPriority.PRIMARY
+
+    def send_message(self, message: Message, priority: SendPriority | None = None) -> bool:
         """Send a message to the remote host.
 
+        All blocks of the message are queued at once, the call returns when they were sent.
+
         Args:
             message: message to be transmitted
+            priority: priority in the send queue, derived from the message if None
 
         Returns:
             True if sending was successful
 
+        Raises:
+            SendQueueFullError: if the send queue is full and the back pressure is `BackPressure.RAISE`
+
         """
-        for block in message.blocks:
-            block_send_info = BlockSendInfo(block.encode())
-            self._send_queue.put(block_send_info)
-            self._thread.trigger_receiver()
+        if priority is None:
+            priority = self._send_priority(message)
 
-            if not block_send_info.wait():
-                return False
+        block_infos = [BlockSendInfo(block.encode_buffers()) for block in message.blocks]
 
-        return True
+        # all blocks are queued or none, so a message is never sent partially
+        if not self._send_queue.put_all(block_infos, priority):
+            return False
 
-    def send_and_waitfor_response(self, function: SecsStreamFunction) -> Message | None:
-        """Send the message and wait for the response.
+        self._thread.trigger_receiver()
+
+        # wait for all blocks, as queued blocks can't be taken back
+        results = [block_info.wait() for block_info in block_infos]
+
+        return all(results)
+
+    def send_request(self, function: SecsStreamFunction) -> concurrent.futures.Future[Message | None]:
+        """Send the message without waiting for the response.
+
+        Many requests can be outstanding at the same time.
+        The returned future is resolved with the response, or with None if sending failed or no response was received
+        within T3. Callbacks added to the future are called by the thread receiving the response.
 
         Args:
             function: message to be sent
 
         Returns:
-            Message that was received
+            future for the response
 
         """
         system_id = self.get_next_system_counter()
 
-        response_queue = self._get_queue_for_system(system_id)
+        future = self._pending_transactions.add(system_id, self._settings.timeouts.t3)
 
         out_message = self._create_message_for_function(function, system_id)
 
-        self._communication_logger.info("> %s\n%s", out_message, function, extra=self._get_log_extra())
+        if self._communication_logger.isEnabledFor(logging.INFO):
+            self._log_communication("> %s\n%s", out_message, LazySml(function))
 
-        if not self.send_message(out_message):
+        try:
+            sent = self.send_message(out_message)
+        except SendQueueFullError:
+            self._pending_transactions.resolve(system_id, None)
+            raise
+
+        if not sent:
             self._logger.error("Sending message failed")
-            self._remove_queue(system_id)
-            return None
+            self._pending_transactions.resolve(system_id, None)
 
-        try:
-            response = response_queue.get(True, self._settings.timeouts.t3)
-        except queue.Empty:
-            response = None
+        return future
+
+    def send_and_waitfor_response(self, function: SecsStreamFunction) -> Message | None:
+        """Send the message and wait for the response.
 
-        self._remove_queue(system_id)
+        Args:
+            function: message to be sent
+
+        Returns:
+            Message that was received, None if no response was received within T3
 
-        return response
+        """
+        future = self.send_request(function)
+
+        # the future is resolved after T3, the timeout only guards against it never being resolved
+        try:
+            return future.result(self._settings.timeouts.t3)
+        except concurrent.futures.TimeoutError:
+            return None
 
     def send_response(self, function: SecsStreamFunction, system: int) -> bool:
         """Send response function for system.
@@ -352,7 +414,8 @@ class Protocol(abc.ABC, typing.Generic[MessageT, BlockT]):  # pylint: disable=to
         """
         out_message = self._create_message_for_function(function, system)
 
-        self._communication_logger.info("> %s\n%s", out_message, function, extra=self._get_log_extra())
+        if self._communication_logger.isEnabledFor(logging.INFO):
+            self._log_communication("> %s\n%s", out_message, LazySml(function))
 
         return self.send_message(out_message)
 
@@ -368,7 +431,8 @@ class Protocol(abc.ABC, typing.Generic[MessageT, BlockT]):  # pylint: disable=to
         """
         out_message = self._create_message_for_function(function, self.get_next_system_counter())
 
-        self._communication_logger.info("> %s\n%s", out_message, function, extra=self._get_log_extra())
+        if self._communication_logger.isEnabledFor(logging.INFO):
+            self._log_communication("> %s\n%s", out_message, LazySml(function))
 
         return self.send_message(out_message)
 
@@ -380,3 +444,17 @@ class Protocol(abc.ABC, typing.Generic[MessageT, BlockT]):  # pylint: disable=to
     def _get_log_extra(self) -> dict[str, typing.Any]:
         """Get extra fields for logging."""
         raise NotImplementedError("Protocol._get_log_extra missing implementation")
+
+    def _log_communication(self, msg: str, *args: typing.Any) -> None:
+        """Write to the communication log.
+
+        The extra fields are only built if the log is enabled, the arguments are only formatted if the record is
+        emitted. Guard calls for every data message with `isEnabledFor`, so not even the arguments are created.
+
+        Args:
+            msg: log message format
+            args: arguments for the format, use :class:`LazySml` for functions and messages
+
+        """
+        if self._communication_logger.isEnabledFor(logging.INFO):
+            self._communication_logger.info(msg, *args, extra=self._get_log_extra(), stacklevel=2)
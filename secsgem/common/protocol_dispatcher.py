@@ -17,18 +17,25 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import logging
 import queue
 import threading
 import typing
 
+from .dispatch_metrics import DispatchMetrics
+from .keyed_executor import KeyedExecutor
+
 if typing.TYPE_CHECKING:
     from .message import Block
     from .settings import Settings
 
 
 class ProtocolDispatcher:  # pylint: disable=too-many-instance-attributes
-    """Thread that calls a target function when a trigger was raised."""
+    """Thread that calls a target function when a trigger was raised.
+
+    Blocks are dispatched from one thread, or by a pool of `dispatch_workers` threads if configured in the settings.
+    """
 
     def __init__(
         self,
@@ -54,11 +61,32 @@ class ProtocolDispatcher:  # pylint: disable=too-many-instance-attributes
         self._receiver_thread_trigger = threading.Event()
         self._dispatcher_thread_trigger = threading.Event()
 
-        self._dispatch_queue: queue.Queue[tuple[object, Block]] = queue.Queue()
+        self._dispatch_queue: queue.Queue[tuple[object, Block, float]] = queue.Queue()
 
         self._stop_receiver_thread = False
         self._stop_dispatcher_thread = False
 
+        self._metrics = DispatchMetrics()
+        self._pool_executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self._dispatch_pool = self._create_dispatch_pool()
+
+    @property
+    def metrics(self) -> DispatchMetrics:
+        """Queue depth and handler latency of the dispatcher."""
+        return self._metrics
+
+    def _create_dispatch_pool(self) -> KeyedExecutor | None:
+        """Create the pool dispatching blocks concurrently, None if dispatching from the dispatcher thread."""
+        if self._settings.dispatch_workers == 0:
+            return None
+
+        self._pool_executor = concurrent.futures.ThreadPoolExecutor(
+            self._settings.dispatch_workers,
+            thread_name_prefix=self._settings.generate_thread_name("protocol_dispatch_pool"),
+        )
+
+        return KeyedExecutor(self._pool_executor)
+
     def start(self):
         """Start the thread."""
         self._stop_receiver_thread = False
@@ -78,8 +106,14 @@ class ProtocolDispatcher:  # pylint: disable=too-many-instance-attributes
             daemon=True,
         )
 
+        if self._dispatch_pool is not None and self._pool_executor is None:
+            # the pool was shut down by stop
+            self._dispatch_pool = self._create_dispatch_pool()
+
         self._receiver_thread.start()
-        self._dispatcher_thread.start()
+
+        if self._dispatch_pool is None:
+            self._dispatcher_thread.start()
 
     def stop(self):
         """Stop the thread."""
@@ -91,6 +125,11 @@ class ProtocolDispatcher:  # pylint: disable=too-many-instance-attributes
 
         self._receiver_thread.join()
 
+        if self._pool_executor is not None:
+            # stop may be called from a dispatched handler, so don't wait for the running handlers
+            self._pool_executor.shutdown(wait=False)
+            self._pool_executor = None
+
     def trigger_receiver(self):
         """Trigger the thread to call target function."""
         self._receiver_thread_trigger.set()
@@ -103,9 +142,29 @@ class ProtocolDispatcher:  # pylint: disable=too-many-instance-attributes
             block: new block
 
         """
-        self._dispatch_queue.put((source, block))
+        if self._dispatch_pool is not None:
+            self._dispatch_pool.submit(
+                self._settings.dispatch_key(block) if self._settings.dispatch_workers > 0 else None,
+                self._dispatch,
+                source,
+                block,
+                self._metrics.queued(),
+            )
+            return
+
+        self._dispatch_queue.put((source, block, self._metrics.queued()))
         self._dispatcher_thread_trigger.set()
 
+    def _dispatch(self, source: object, block: Block, queued_at: float):
+        started_at = self._metrics.started(queued_at)
+
+        try:
+            self._dispatcher_target(source, block)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logging.warning("Exception in dispatcher callback, ignoring", exc_info=exc)
+        finally:
+            self._metrics.finished(started_at)
+
     def _receiver_thread_function(self):
         while not self._stop_receiver_thread:
             self._receiver_thread_trigger.wait()
@@ -130,11 +189,6 @@ class ProtocolDispatcher:  # pylint: disable=too-many-instance-attributes
                 continue
 
             while self._dispatch_queue.qsize() > 0:
-                data = self._dispatch_queue.get()
-
-                try:
-                    self._dispatcher_target(*data)
-                except Exception as exc:  # pylint: disable=broad-exception-caught
-                    logging.warning("Exception in dispatcher callback, ignoring", exc_info=exc)
+                self._dispatch(*self._dispatch_queue.get())
 
         self._stop_dispatcher_thread = False
@@ -0,0 +1,336 @@
+#####################################################################
+# segment_log.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Append-only record log in memory-mapped segment files."""
+
+from __future__ import annotations
+
+import mmap
+import pathlib
+import struct
+import threading
+import typing
+
+# record header: payload length, flags
+_RECORD_HEADER = struct.Struct(">IB")
+
+_FLAG_CONSUMED = 0x01
+
+
+class _Segment:
+    """Segment file of a :class:`SegmentLog`."""
+
+    def __init__(self, path: pathlib.Path, size: int):
+        self.path = path
+
+        if not path.exists() or path.stat().st_size < size:
+            with path.open("ab") as file:
+                file.truncate(size)
+
+        with path.open("r+b") as file:
+            self.map = mmap.mmap(file.fileno(), 0)
+
+        self.size = len(self.map)
+        self.offset = 0
+        self.records = 0
+        self.consumed = 0
+
+        # restore the records of an existing segment, the zero filled rest of the file ends the records
+        while self.offset + _RECORD_HEADER.size <= self.size:
+            length, flags = _RECORD_HEADER.unpack_from(self.map, self.offset)
+            if length == 0:
+                break
+
+            self.records += 1
+            if flags & _FLAG_CONSUMED:
+                self.consumed += 1
+
+            self.offset += _RECORD_HEADER.size + length
+
+    @property
+    def pending(self) -> int:
+        """Number of records not consumed yet."""
+        return self.records - self.consumed
+
+    def fits(self, length: int) -> bool:
+        """Check if a record with a payload of length bytes fits into the segment."""
+        return self.offset + _RECORD_HEADER.size + length <= self.size
+
+    def append(self, payload: bytes) -> int:
+        """Write a record, returns its offset."""
+        offset = self.offset
+        _RECORD_HEADER.pack_into(self.map, offset, len(payload), 0)
+        self.map[offset + _RECORD_HEADER.size : offset + _RECORD_HEADER.size + len(payload)] = payload
+
+        self.offset += _RECORD_HEADER.size + len(payload)
+        self.records += 1
+
+        return offset
+
+    def close(self, delete: bool = False) -> None:
+        """Unmap the segment and optionally delete the file."""
+        self.map.close()
+
+        if delete:
+            self.path.unlink(missing_ok=True)
+
+
+class SegmentLog:  # pylint: disable=too-many-instance-attributes
+    """Append-only log of records, stored in memory-mapped segment files.
+
+    Records are appended to the newest segment, a new segment is started when a record doesn't fit anymore.
+    Consumed records are only flagged, a segment file is deleted once all its records are consumed.
+    The log is restored from the segment files in the directory when it is opened again.
+
+    The total size of the segment files is limited to `max_size`. If a new segment doesn't fit, either the oldest
+    segment is overwritten, dropping its records, or the new record is dropped.
+
+    Example:
+        >>> import tempfile
+        >>>
+        >>> with tempfile.TemporaryDirectory() as directory:
+        ...     log = SegmentLog(directory, segment_size=4096)
+        ...     log.append(b"first")
+        ...     log.append(b"second")
+        ...     records = list(log.records())
+        ...     log.consume(records[0][0])
+        ...     [payload for _, payload in log.records()], len(log)
+        ...     log.close()
+        True
+        True
+        ([b'second'], 1)
+
+    """
+
+    def __init__(
+        self,
+        directory: str | pathlib.Path,
+        segment_size: int = 1024 * 1024,
+        max_size: int = 16 * 1024 * 1024,
+        overwrite: bool = True,
+    ):
+        """Open a log, existing segments in the directory are restored.
+
+        Args:
+            directory: directory for the segment files, created if missing
+            segment_size: size of a segment file in bytes, larger records get a segment of their own
+            max_size: maximum total size of the segment files in bytes
+            overwrite: overwrite the oldest segment if the log is full, otherwise drop new records
+
+        """
+        self._directory = pathlib.Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+        self._segment_size = segment_size
+        self._max_size = max_size
+        self._overwrite = overwrite
+
+        self._lock = threading.Lock()
+        self._segments: dict[int, _Segment] = {}
+        self._next_index = 0
+
+        self._dropped = 0
+        self._overwritten = 0
+
+        for path in sorted(self._directory.glob("*.seg")):
+            index = int(path.stem)
+            self._next_index = index + 1
+
+            if path.stat().st_size == 0:
+                path.unlink()
+                continue
+
+            segment = _Segment(path, 0)
+            if segment.pending == 0:
+                segment.close(delete=True)
+            else:
+                self._segments[index] = segment
+
+    def __len__(self) -> int:
+        """Get the number of records not consumed yet."""
+        return sum(segment.pending for segment in self._segments.values())
+
+    @property
+    def size(self) -> int:
+        """Total size of the segment files in bytes."""
+        return sum(segment.size for segment in self._segments.values())
+
+    @property
+    def max_size(self) -> int:
+        """Maximum total size of the segment files in bytes."""
+        return self._max_size
+
+    @property
+    def overwrite(self) -> bool:
+        """The oldest segment is overwritten if the log is full."""
+        return self._overwrite
+
+    @property
+    def dropped(self) -> int:
+        """Number of records dropped because the log was full."""
+        return self._dropped
+
+    @property
+    def overwritten(self) -> int:
+        """Number of records lost by overwriting the oldest segment."""
+        return self._overwritten
+
+    def append(self, payload: bytes) -> bool:
+        """Append a record.
+
+        Args:
+            payload: data of the record, must not be empty
+
+        Returns:
+            False if the log was full and the record was dropped
+
+        Raises:
+            ValueError: if the payload is empty, as a zero length marks the end of the records of a segment
+
+        """
+        if not payload:
+            raise ValueError(f"{self.__class__.__name__} can't append empty records")
+
+        with self._lock:
+            segment = self._segments.get(self._next_index - 1)
+
+            if segment is None or not segment.fits(len(payload)):
+                size = max(self._segment_size, _RECORD_HEADER.size + len(payload))
+
+                if not self._make_room(size):
+                    self._dropped += 1
+                    return False
+
+                segment = self._create_segment(size)
+
+            segment.append(payload)
+
+        return True
+
+    def records(self) -> typing.Iterator[tuple[tuple[int, int], bytes]]:
+        """Iterate the records not consumed yet, including records appended while iterating.
+
+        Only one record is held in memory at a time.
+
+        Yields:
+            position of the record, to pass to :meth:`consume`, and payload
+
+        """
+        index, offset = -1, 0
+
+        while True:
+            with self._lock:
+                record = self._next_record(index, offset)
+
+            if record is None:
+                return
+
+            index, offset, payload = record
+            yield (index, offset), payload
+
+            offset += _RECORD_HEADER.size + len(payload)
+
+    def consume(self, position: tuple[int, int]) -> None:
+        """Flag a record as consumed, it is not returned by :meth:`records` anymore.
+
+        Args:
+            position: position of the record
+
+        """
+        index, offset = position
+
+        with self._lock:
+            segment = self._segments.get(index)
+            if segment is None:
+                return
+
+            _, flags = _RECORD_HEADER.unpack_from(segment.map, offset)
+            if flags & _FLAG_CONSUMED:
+                return
+
+            segment.map[offset + _RECORD_HEADER.size - 1] = flags | _FLAG_CONSUMED
+            segment.consumed += 1
+
+            # the newest segment is kept for further records
+            if segment.pending == 0 and index != self._next_index - 1:
+                del self._segments[index]
+                segment.close(delete=True)
+
+    def clear(self) -> None:
+        """Delete all records."""
+        with self._lock:
+            for segment in self._segments.values():
+                segment.close(delete=True)
+
+            self._segments.clear()
+
+    def flush(self) -> None:
+        """Write the segments to disk."""
+        with self._lock:
+            for segment in self._segments.values():
+                segment.map.flush()
+
+    def close(self) -> None:
+        """Close the segment files, the records are kept for the next time the log is opened."""
+        with self._lock:
+            for segment in self._segments.values():
+                segment.close()
+
+            self._segments.clear()
+
+    def _next_record(self, index: int, offset: int) -> tuple[int, int, bytes] | None:
+        """Find the next record not consumed, starting at a position, called with the lock held."""
+        for segment_index in sorted(self._segments):
+            if segment_index < index:
+                continue
+
+            if segment_index > index:
+                index, offset = segment_index, 0
+
+            segment = self._segments[segment_index]
+
+            while offset < segment.offset:
+                length, flags = _RECORD_HEADER.unpack_from(segment.map, offset)
+                start = offset + _RECORD_HEADER.size
+
+                if not flags & _FLAG_CONSUMED:
+                    return index, offset, segment.map[start : start + length]
+
+                offset = start + length
+
+        return None
+
+    def _make_room(self, size: int) -> bool:
+        """Make room for a new segment, called with the lock held."""
+        while self._segments and self.size + size > self._max_size:
+            if not self._overwrite:
+                return False
+
+            index = min(self._segments)
+            segment = self._segments.pop(index)
+            self._overwritten += segment.pending
+            segment.close(delete=True)
+
+        return True
+
+    def _create_segment(self, size: int) -> _Segment:
+        """Start a new segment, called with the lock held."""
+        index = self._next_index
+        self._next_index += 1
+
+        segment = _Segment(self._directory / f"{index:010d}.seg", size)
+        self._segments[index] = segment
+
+        return segment
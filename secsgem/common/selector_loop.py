@@ -0,0 +1,262 @@
+#####################################################################
+# selector_loop.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Single thread multiplexing socket I/O and timers."""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import logging
+import selectors
+import socket
+import threading
+import typing
+
+from .timer_wheel import TimerWheel
+
+
+class LoopTimerHandle:
+    """Handle for a callback scheduled with :meth:`SelectorLoop.call_later`."""
+
+    def __init__(self, loop: SelectorLoop, delay: float, callback: typing.Callable[..., None], args: tuple):
+        """Initialize and start a timer.
+
+        Args:
+            loop: loop to call the callback from
+            delay: seconds to wait
+            callback: function to call
+            args: arguments for the function
+
+        """
+        self._callback = callback
+        self._args = args
+        self._cancelled = False
+
+        # the shared timer wheel keeps the time, the callback is handed to the loop thread when it is due
+        self._timer = TimerWheel.shared().call_later(delay, loop.call_soon, self.run, blocking=False)
+
+    @property
+    def cancelled(self) -> bool:
+        """Check if the timer was cancelled."""
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """Stop the timer, if it didn't fire yet."""
+        self._cancelled = True
+        self._timer.cancel()
+
+    def run(self) -> None:
+        """Call the callback unless cancelled."""
+        if not self._cancelled:
+            self._callback(*self._args)
+
+
+class SelectorLoop:
+    """Thread waiting for socket events and timers, calling the registered callbacks.
+
+    Callbacks are called from the loop thread and must not block.
+    Timers are kept by :meth:`TimerWheel.shared`, which hands the due callbacks to the loop thread.
+    Sockets can only be (un)registered from the loop thread, use :meth:`call_soon` from other threads.
+    """
+
+    def __init__(self, name: str = "secsgem_selectorLoop"):
+        """Initialize the loop.
+
+        Args:
+            name: name of the loop thread
+
+        """
+        self._name = name
+        self._logger = logging.getLogger(self.__module__ + "." + self.__class__.__name__)
+
+        self._calls: collections.deque[tuple[typing.Callable[..., None], tuple]] = collections.deque()
+
+        self._open()
+
+        self._thread: threading.Thread | None = None
+        self._stop = False
+
+    def _open(self) -> None:
+        """Create the selector and the wakeup sockets."""
+        self._selector = selectors.DefaultSelector()
+
+        self._wakeup_receive, self._wakeup_send = socket.socketpair()
+        self._wakeup_receive.setblocking(False)
+        self._wakeup_send.setblocking(False)
+        self._selector.register(self._wakeup_receive, selectors.EVENT_READ, {selectors.EVENT_READ: self._on_wakeup})
+        self._closed = False
+
+    def _close(self) -> None:
+        """Close the selector and the wakeup sockets, called when the loop thread exits."""
+        self._closed = True
+
+        self._selector.close()
+        self._wakeup_receive.close()
+        self._wakeup_send.close()
+
+    @property
+    def running(self) -> bool:
+        """Check if the loop thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def in_loop_thread(self) -> bool:
+        """Check if the caller runs in the loop thread."""
+        return threading.current_thread() is self._thread
+
+    def start(self) -> None:
+        """Start the loop thread."""
+        if self.running:
+            return
+
+        if self._closed:
+            self._open()
+
+        self._stop = False
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the loop thread and wait for it to finish.
+
+        The selector and wakeup sockets are closed when the thread exits, they are created again on :meth:`start`.
+        """
+        if not self.running:
+            return
+
+        self._stop = True
+        self._wakeup()
+
+        if not self.in_loop_thread():
+            typing.cast(threading.Thread, self._thread).join()
+
+    def call_soon(self, callback: typing.Callable[..., None], *args) -> None:
+        """Call a function from the loop thread, can be called from any thread.
+
+        Args:
+            callback: function to call
+            args: arguments for the function
+
+        """
+        self._calls.append((callback, args))
+        self._wakeup()
+
+    def call_later(self, delay: float, callback: typing.Callable[..., None], *args) -> LoopTimerHandle:
+        """Call a function from the loop thread after a delay, can be called from any thread.
+
+        Args:
+            delay: seconds to wait
+            callback: function to call
+            args: arguments for the function
+
+        Returns:
+            handle to cancel the call
+
+        """
+        return LoopTimerHandle(self, delay, callback, args)
+
+    def add_reader(self, sock: socket.socket, callback: typing.Callable[[], None]) -> None:
+        """Call a function whenever the socket is readable, only from the loop thread.
+
+        Args:
+            sock: socket to watch
+            callback: function to call
+
+        """
+        self._modify(sock, selectors.EVENT_READ, callback)
+
+    def remove_reader(self, sock: socket.socket) -> None:
+        """Stop watching the socket for reading, only from the loop thread.
+
+        Args:
+            sock: socket to stop watching
+
+        """
+        self._modify(sock, selectors.EVENT_READ, None)
+
+    def add_writer(self, sock: socket.socket, callback: typing.Callable[[], None]) -> None:
+        """Call a function whenever the socket is writable, only from the loop thread.
+
+        Args:
+            sock: socket to watch
+            callback: function to call
+
+        """
+        self._modify(sock, selectors.EVENT_WRITE, callback)
+
+    def remove_writer(self, sock: socket.socket) -> None:
+        """Stop watching the socket for writing, only from the loop thread.
+
+        Args:
+            sock: socket to stop watching
+
+        """
+        self._modify(sock, selectors.EVENT_WRITE, None)
+
+    def _modify(self, sock: socket.socket, event: int, callback: typing.Callable[[], None] | None) -> None:
+        try:
+            key = self._selector.get_key(sock)
+        except KeyError:
+            key = None
+
+        callbacks = {} if key is None else dict(key.data)
+
+        if callback is None:
+            callbacks.pop(event, None)
+        else:
+            callbacks[event] = callback
+
+        events = 0
+        for registered_event in callbacks:
+            events |= registered_event
+
+        if key is None:
+            if events:
+                self._selector.register(sock, events, callbacks)
+        elif events:
+            self._selector.modify(sock, events, callbacks)
+        else:
+            self._selector.unregister(sock)
+
+    def _wakeup(self) -> None:
+        # buffer full, the loop will wake up anyways
+        with contextlib.suppress(OSError):
+            self._wakeup_send.send(b"\0")
+
+    def _on_wakeup(self) -> None:
+        try:
+            while self._wakeup_receive.recv(4096):
+                pass
+        except OSError:
+            pass
+
+    def _call(self, callback: typing.Callable[..., None], args: tuple) -> None:
+        try:
+            callback(*args)
+        except Exception:  # pylint: disable=broad-except
+            self._logger.exception("ignoring exception in selector loop callback")
+
+    def _run(self) -> None:
+        try:
+            while not self._stop:
+                for key, mask in self._selector.select():
+                    for event, callback in list(key.data.items()):
+                        if mask & event:
+                            self._call(callback, ())
+
+                for _ in range(len(self._calls)):
+                    self._call(*self._calls.popleft())
+        finally:
+            self._close()
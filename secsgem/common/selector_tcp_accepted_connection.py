@@ -0,0 +1,83 @@
+#####################################################################
+# selector_tcp_accepted_connection.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""TCP connection accepted by a listener, served by a shared selector loop."""
+
+from __future__ import annotations
+
+import typing
+
+from .selector_tcp_connection import SelectorTcpConnection
+
+if typing.TYPE_CHECKING:
+    import concurrent.futures
+    import socket
+
+    from .selector_loop import SelectorLoop
+    from .settings import Settings
+
+
+class SelectorTcpAcceptedConnection(SelectorTcpConnection):
+    """Connection using a socket accepted by a listener.
+
+    The connection is established when enabled, it is not reestablished after it was closed.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        sock: socket.socket,
+        loop: SelectorLoop,
+        executor: concurrent.futures.Executor,
+    ):
+        """Initialize an accepted selector TCP connection.
+
+        Args:
+            settings: protocol and communication settings
+            sock: accepted socket
+            loop: selector loop doing the I/O
+            executor: executor calling the connection events
+
+        """
+        super().__init__(settings, loop, executor)
+
+        self._accepted_sock: socket.socket | None = sock
+        self._enabled = False
+
+    def enable(self):
+        """Enable the connection.
+
+        Starts receiving from the accepted socket.
+        """
+        if self._enabled or self._accepted_sock is None:
+            return
+
+        self._enabled = True
+        self._loop.call_soon(self._attach, self._accepted_sock)
+
+        # the socket is owned by the connection now, it is closed on disconnect
+        self._accepted_sock = None
+
+    def disable(self):
+        """Disable the connection.
+
+        Closes the connection.
+        """
+        if not self._enabled:
+            return
+
+        self._enabled = False
+
+        self.disconnect()
@@ -0,0 +1,146 @@
+#####################################################################
+# selector_tcp_client_connection.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""TCP client connection served by a shared selector loop."""
+
+from __future__ import annotations
+
+import errno
+import socket
+import typing
+
+from .helpers import is_errorcode_ewouldblock
+from .selector_tcp_connection import SelectorTcpConnection
+
+if typing.TYPE_CHECKING:
+    import concurrent.futures
+
+    from .selector_loop import LoopTimerHandle, SelectorLoop
+    from .settings import Settings
+
+
+class SelectorTcpClientConnection(SelectorTcpConnection):
+    """Client connection, connecting without blocking a thread and reconnecting after T5."""
+
+    def __init__(self, settings: Settings, loop: SelectorLoop, executor: concurrent.futures.Executor):
+        """Initialize a selector TCP client connection.
+
+        Args:
+            settings: protocol and communication settings
+            loop: selector loop doing the I/O
+            executor: executor calling the connection events
+
+        """
+        super().__init__(settings, loop, executor)
+
+        # initially not enabled
+        self._enabled = False
+
+        self._connecting_sock: socket.socket | None = None
+        self._connect_timer: LoopTimerHandle | None = None
+
+    @property
+    def enabled(self) -> bool:
+        """Check if the connection is enabled."""
+        return self._enabled
+
+    def enable(self):
+        """Enable the connection.
+
+        Starts the client connection process to the remote.
+        """
+        if self._enabled:
+            return
+
+        self._enabled = True
+        self._loop.call_soon(self._connect)
+
+    def disable(self):
+        """Disable the connection.
+
+        Stops all connection attempts, and closes the connection
+        """
+        if not self._enabled:
+            return
+
+        self._enabled = False
+        self._loop.call_soon(self._cancel_connect)
+
+        self.disconnect()
+
+    def _connect(self):
+        """Start connecting to the remote, called in the loop thread."""
+        self._connect_timer = None
+
+        if not self._enabled or self._connecting_sock is not None or self._sock is not None:
+            return
+
+        self._logger.debug("connecting to %s:%d", self._settings.address, self._settings.port)
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setblocking(False)
+
+        try:
+            result = sock.connect_ex((self._settings.address, self._settings.port))
+        except OSError:
+            # address could not be resolved
+            self._connect_failed(sock)
+            return
+
+        if result not in (0, errno.EINPROGRESS) and not is_errorcode_ewouldblock(result):
+            self._connect_failed(sock)
+            return
+
+        # connection is established when the socket becomes writable
+        self._connecting_sock = sock
+        self._loop.add_writer(sock, self._on_connect_writable)
+
+    def _on_connect_writable(self):
+        sock = typing.cast(socket.socket, self._connecting_sock)
+        self._connecting_sock = None
+
+        self._loop.remove_writer(sock)
+
+        if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) != 0:
+            self._connect_failed(sock)
+            return
+
+        self._attach(sock)
+
+    def _connect_failed(self, sock: socket.socket):
+        self._logger.debug("connecting to %s:%d failed", self._settings.address, self._settings.port)
+
+        sock.close()
+        self._schedule_connect()
+
+    def _schedule_connect(self):
+        if self._enabled:
+            self._connect_timer = self._loop.call_later(self._settings.timeouts.t5, self._connect)
+
+    def _cancel_connect(self):
+        if self._connect_timer is not None:
+            self._connect_timer.cancel()
+            self._connect_timer = None
+
+        if self._connecting_sock is not None:
+            self._loop.remove_writer(self._connecting_sock)
+            self._connecting_sock.close()
+            self._connecting_sock = None
+
+    def _on_closed(self):
+        super()._on_closed()
+
+        # reconnect if the connection is still enabled
+        self._schedule_connect()
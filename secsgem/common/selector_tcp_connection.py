@@ -0,0 +1,305 @@
+#####################################################################
+# selector_tcp_connection.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""TCP connection served by a shared selector loop."""
+
+from __future__ import annotations
+
+import collections
+import logging
+import socket
+import threading
+import typing
+
+from .helpers import is_errorcode_ewouldblock
+from .lazy_log import LazyHex
+from .serial_executor import SerialExecutor
+from .tcp_connection import TcpConnection
+
+if typing.TYPE_CHECKING:
+    import concurrent.futures
+
+    from .selector_loop import SelectorLoop
+    from .settings import Settings
+
+
+class SelectorTcpConnection(TcpConnection):
+    """Base class for TCP connections reading from a shared :class:`SelectorLoop` instead of an own thread.
+
+    Data is read and passed to `on_data` in the loop thread.
+    The connection events are called in order on the executor, reading starts after `on_connected` was handled.
+
+    Sending never blocks: data the socket doesn't take right away is buffered and written by the loop thread when the
+    socket becomes writable. The connection isn't :attr:`writable` while more than :attr:`write_buffer_limit` bytes are
+    buffered, `on_writable` is called from the loop thread when the buffer drained below the limit.
+    """
+
+    write_buffer_limit = 1024 * 1024
+    """Number of buffered unsent bytes above which the connection isn't writable."""
+
+    def __init__(self, settings: Settings, loop: SelectorLoop, executor: concurrent.futures.Executor):
+        """Initialize a selector TCP connection.
+
+        Args:
+            settings: protocol and communication settings
+            loop: selector loop doing the I/O
+            executor: executor calling the connection events
+
+        """
+        super().__init__(settings)
+
+        self._loop = loop
+        self._events = SerialExecutor(executor)
+
+        self._receive_view: memoryview | None = None
+
+        # unsent data, written from the loop thread while the writer is registered
+        self._write_lock = threading.Lock()
+        self._write_pending: collections.deque[memoryview] = collections.deque()
+        self._write_pending_bytes = 0
+        self._write_open = False
+        self._writing = False
+
+        self._closing = False
+        self._close_waiters: list[threading.Event] = []
+
+    @property
+    def writable(self) -> bool:
+        """Check if the connection accepts more data.
+
+        While closing data is always accepted, it is written once more before the socket is closed.
+        """
+        return self._closing or self._write_pending_bytes <= self.write_buffer_limit
+
+    def send_buffers(self, buffers: typing.Sequence[bytes | memoryview]) -> bool:
+        """Send a sequence of buffers to the remote host without blocking.
+
+        The data is written right away as far as the socket takes it, the rest is written from the loop thread.
+
+        Args:
+            buffers: encoded data, sent in sequence
+
+        Returns:
+            True if the data was sent or buffered, False if the connection is closed or writing failed
+
+        """
+        if self._bytestream_logger.isEnabledFor(logging.DEBUG):
+            self._bytestream_logger.debug("> %s", LazyHex(buffers))
+
+        with self._write_lock:
+            if not self._write_open:
+                return False
+
+            for buffer in buffers:
+                if len(buffer) > 0:
+                    view = memoryview(buffer).cast("B")
+                    self._write_pending.append(view)
+                    self._write_pending_bytes += len(view)
+
+            # the loop thread writes until the buffer is empty, keep the order
+            if self._writing:
+                return True
+
+            result = self._flush()
+
+            if result and self._write_pending:
+                self._writing = True
+                self._loop.call_soon(self._start_writing, self._sock)
+
+        if not result:
+            self._loop.call_soon(self._close)
+
+        return result
+
+    def _flush(self) -> bool:
+        """Write buffered data until the socket doesn't take more, called with the write lock held.
+
+        Returns:
+            False if writing failed, the buffered data is dropped then
+
+        """
+        while self._write_pending:
+            try:
+                sent = self._write(self._write_pending)
+            except OSError as exc:
+                if is_errorcode_ewouldblock(exc.errno):
+                    return True
+
+                self._logger.debug("send failed", exc_info=exc)
+                self._write_pending.clear()
+                self._write_pending_bytes = 0
+                return False
+
+            self._write_pending_bytes -= sent
+            self._drop_sent(self._write_pending, sent)
+
+        return True
+
+    def _start_writing(self, sock: socket.socket | None):
+        """Write the buffered data when the socket becomes writable, called in the loop thread."""
+        if self._sock is sock and sock is not None and not self._closing:
+            self._loop.add_writer(sock, self._on_socket_writable)
+
+    def _on_socket_writable(self):
+        with self._write_lock:
+            was_writable = self.writable
+            result = self._write_open and self._flush()
+
+            if not result or not self._write_pending:
+                self._writing = False
+                self._loop.remove_writer(self._socket)
+
+            notify = not was_writable and self.writable
+
+        if not result:
+            self._close()
+            return
+
+        if notify:
+            self.on_writable({"source": self})
+
+    def disconnect(self):
+        """Close connection and wait until it was closed."""
+        if not self._loop.running or self._loop.in_loop_thread():
+            return
+
+        waiter = threading.Event()
+        self._loop.call_soon(self._close, waiter)
+        waiter.wait()
+
+    def _attach(self, sock: socket.socket):
+        """Use a connected socket for this connection, called in the loop thread.
+
+        Args:
+            sock: connected socket
+
+        """
+        # setup socket
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        sock.setblocking(False)
+
+        self._sock = sock
+        self._connected = True
+
+        with self._write_lock:
+            self._write_open = True
+
+        # preallocated buffer, reused for every read
+        self._receive_view = memoryview(bytearray(self._settings.receive_buffer_size))
+
+        self._events.submit(self._notify_connected, sock)
+
+    def _notify_connected(self, sock: socket.socket):
+        try:
+            self.on_connected({"source": self})
+        except Exception:  # pylint: disable=broad-except
+            self._logger.exception("ignoring exception for on_connected handler")
+
+        self._loop.call_soon(self._start_reading, sock)
+
+    def _start_reading(self, sock: socket.socket):
+        if self._sock is sock and not self._closing:
+            self._loop.add_reader(sock, self._on_readable)
+
+    def _on_readable(self):
+        try:
+            length = self._socket.recv_into(typing.cast(memoryview, self._receive_view))
+        except OSError as exc:
+            if is_errorcode_ewouldblock(exc.errno):
+                return
+
+            self._logger.debug("receive failed", exc_info=exc)
+            length = 0
+
+        # check if socket was closed
+        if length == 0:
+            self._close()
+            return
+
+        recv_data = bytes(typing.cast(memoryview, self._receive_view)[:length])
+
+        if self._bytestream_logger.isEnabledFor(logging.DEBUG):
+            self._bytestream_logger.debug("< %s", LazyHex(recv_data))
+
+        self.on_data({"source": self, "data": recv_data})
+
+    def _close(self, waiter: threading.Event | None = None):
+        """Start closing the connection, called in the loop thread.
+
+        Args:
+            waiter: event set after the connection was closed
+
+        """
+        if self._sock is None:
+            if waiter is not None:
+                waiter.set()
+            return
+
+        if waiter is not None:
+            self._close_waiters.append(waiter)
+
+        if self._closing:
+            return
+
+        # set disconnecting flag to avoid another select
+        self._closing = True
+        self._disconnecting = True
+
+        self._loop.remove_reader(self._sock)
+        self._loop.remove_writer(self._sock)
+        self._events.submit(self._shutdown, self._sock)
+
+    def _shutdown(self, sock: socket.socket):
+        # notify listeners of disconnection
+        try:
+            self.on_disconnecting({"source": self})
+        except Exception:  # pylint: disable=broad-except
+            self._logger.exception("ignoring exception for on_connection_before_closed handler")
+
+        # write the remaining data once, including messages sent while disconnecting, and close the socket
+        with self._write_lock:
+            if self._write_open:
+                self._flush()
+
+            self._write_open = False
+            self._writing = False
+            self._write_pending.clear()
+            self._write_pending_bytes = 0
+
+            sock.close()
+
+        self._connected = False
+
+        # notify listeners of disconnection
+        try:
+            self.on_disconnected({"source": self})
+        except Exception:  # pylint: disable=broad-except
+            self._logger.exception("ignoring exception for on_connection_closed handler")
+
+        self._loop.call_soon(self._on_closed)
+
+    def _on_closed(self):
+        """Reset the connection after it was closed, called in the loop thread."""
+        self._sock = None
+        self._receive_view = None
+
+        # clear disconnecting flag, no selects coming any more
+        self._closing = False
+        self._disconnecting = False
+
+        for waiter in self._close_waiters:
+            waiter.set()
+
+        self._close_waiters.clear()
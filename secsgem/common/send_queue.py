@@ -0,0 +1,268 @@
+#####################################################################
+# send_queue.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Priority queue for blocks waiting to be sent."""
+
+from __future__ import annotations
+
+import collections
+import enum
+import threading
+import typing
+
+from .settings import BackPressure
+
+if typing.TYPE_CHECKING:
+    from .block_send_info import BlockSendInfo
+
+
+class SendPriority(enum.IntEnum):
+    """Priority of a queued block, lower values are sent first."""
+
+    # control messages, like linktest, select and S9Fx
+    CONTROL = 0
+
+    # replies to requests of the remote
+    REPLY = 1
+
+    # primary messages
+    PRIMARY = 2
+
+
+class SendQueueFullError(Exception):
+    """Block was not queued, the send queue is full and the back pressure is :attr:`BackPressure.RAISE`."""
+
+
+class SendQueue:  # pylint: disable=too-many-instance-attributes
+    """Queue of blocks waiting to be sent, ordered by priority and then by queue order.
+
+    The size of queued reply and primary blocks is limited to `limit` bytes, control blocks are always queued.
+    A block is always queued if the queue is empty, even if it exceeds the limit. The blocks of a message are queued
+    together with :meth:`put_all`, so either all of them are sent or none.
+    If the limit is reached, `back_pressure` decides if the sender waits, the block is dropped or an exception is
+    raised.
+
+    Example:
+        >>> import secsgem.common
+        >>>
+        >>> queue = SendQueue(limit=4, back_pressure=secsgem.common.BackPressure.DROP)
+        >>> queue.put(secsgem.common.BlockSendInfo(b"data"))
+        True
+        >>> queue.put(secsgem.common.BlockSendInfo(b"more"))
+        False
+        >>> queue.put(secsgem.common.BlockSendInfo(b"link"), SendPriority.CONTROL)
+        True
+        >>> queue.get().data, queue.queued_bytes, queue.dropped
+        (b'link', 4, 1)
+
+    """
+
+    def __init__(self, limit: int = 0, back_pressure: BackPressure = BackPressure.BLOCK):
+        """Initialize the queue.
+
+        Args:
+            limit: maximum number of queued bytes, 0 for no limit
+            back_pressure: behavior if the limit is reached
+
+        """
+        self._limit = limit
+        self._back_pressure = back_pressure
+
+        self._queues: list[collections.deque[BlockSendInfo]] = [collections.deque() for _ in SendPriority]
+        self._condition = threading.Condition()
+        self._closed = False
+
+        self._queued_blocks = 0
+        self._queued_bytes = 0
+        self._max_queued_bytes = 0
+        self._blocked = 0
+        self._dropped = 0
+
+    def __len__(self) -> int:
+        """Get the number of queued blocks."""
+        return self._queued_blocks
+
+    @property
+    def queued_bytes(self) -> int:
+        """Number of queued bytes."""
+        return self._queued_bytes
+
+    @property
+    def max_queued_bytes(self) -> int:
+        """Highest number of queued bytes."""
+        return self._max_queued_bytes
+
+    @property
+    def blocked(self) -> int:
+        """Number of blocks that waited for space in the queue."""
+        return self._blocked
+
+    @property
+    def dropped(self) -> int:
+        """Number of blocks dropped because the queue was full."""
+        return self._dropped
+
+    def open(self) -> None:
+        """Accept blocks again after the queue was closed."""
+        with self._condition:
+            self._closed = False
+
+    def close(self) -> None:
+        """Resolve all queued blocks as not sent, blocks queued until the queue is opened again are not sent either."""
+        with self._condition:
+            self._closed = True
+
+            block_infos = [block_info for queue in self._queues for block_info in queue]
+            for queue in self._queues:
+                queue.clear()
+
+            self._queued_blocks = 0
+            self._queued_bytes = 0
+            self._condition.notify_all()
+
+        for block_info in block_infos:
+            block_info.resolve(False)
+
+    def empty(self) -> bool:
+        """Check if no block is queued."""
+        return self._queued_blocks == 0
+
+    def put(self, block_info: BlockSendInfo, priority: SendPriority = SendPriority.PRIMARY) -> bool:
+        """Queue a block.
+
+        Args:
+            block_info: block to queue
+            priority: priority of the block
+
+        Returns:
+            False if the block was dropped or the queue is closed, it is resolved as not sent then
+
+        Raises:
+            SendQueueFullError: if the queue is full and the back pressure is `BackPressure.RAISE`
+
+        """
+        return self.put_all([block_info], priority)
+
+    def put_all(
+        self,
+        block_infos: typing.Sequence[BlockSendInfo],
+        priority: SendPriority = SendPriority.PRIMARY,
+    ) -> bool:
+        """Queue the blocks of a message, either all of them or none.
+
+        The space for all blocks is reserved at once, so a message is never sent partially because the queue was full.
+
+        Args:
+            block_infos: blocks to queue, in send order
+            priority: priority of the blocks
+
+        Returns:
+            False if the blocks were dropped or the queue is closed, they are resolved as not sent then
+
+        Raises:
+            SendQueueFullError: if the queue is full and the back pressure is `BackPressure.RAISE`
+
+        """
+        size = sum(len(block_info) for block_info in block_infos)
+
+        with self._condition:
+            if self._closed:
+                self._resolve_not_sent(block_infos)
+                return False
+
+            if priority != SendPriority.CONTROL and self._full(size):
+                if self._back_pressure == BackPressure.DROP:
+                    self._dropped += len(block_infos)
+                    self._resolve_not_sent(block_infos)
+                    return False
+
+                if self._back_pressure == BackPressure.RAISE:
+                    raise SendQueueFullError(f"send queue full, {self._queued_bytes} bytes queued")
+
+                self._blocked += len(block_infos)
+                while self._full(size) and not self._closed:
+                    self._condition.wait()
+
+                if self._closed:
+                    self._resolve_not_sent(block_infos)
+                    return False
+
+            for block_info in block_infos:
+                block_info.message_blocks = block_infos
+
+            self._queues[priority].extend(block_infos)
+            self._queued_blocks += len(block_infos)
+            self._queued_bytes += size
+            self._max_queued_bytes = max(self._max_queued_bytes, self._queued_bytes)
+
+        return True
+
+    def get(self) -> BlockSendInfo:
+        """Take the next block to send.
+
+        Returns:
+            block with the highest priority, queued first
+
+        Raises:
+            IndexError: if the queue is empty
+
+        """
+        with self._condition:
+            for queue in self._queues:
+                if queue:
+                    block_info = queue.popleft()
+                    break
+            else:
+                raise IndexError("get from an empty send queue")
+
+            self._queued_blocks -= 1
+            self._queued_bytes -= len(block_info)
+            self._condition.notify_all()
+
+        return block_info
+
+    def discard_message(self, block_info: BlockSendInfo) -> None:
+        """Resolve the queued blocks of the message of a block as not sent, after the block failed.
+
+        Args:
+            block_info: block taken from the queue
+
+        """
+        message_blocks = block_info.message_blocks
+        if message_blocks is None:
+            return
+
+        discarded = []
+
+        with self._condition:
+            # the rest of a message is at the head of its queue, as it was queued at once
+            for queue in self._queues:
+                while queue and queue[0].message_blocks is message_blocks:
+                    discarded.append(queue.popleft())
+
+            self._queued_blocks -= len(discarded)
+            self._queued_bytes -= sum(len(discarded_block) for discarded_block in discarded)
+            self._condition.notify_all()
+
+        self._resolve_not_sent(discarded)
+
+    @staticmethod
+    def _resolve_not_sent(block_infos: typing.Sequence[BlockSendInfo]) -> None:
+        for block_info in block_infos:
+            block_info.resolve(False)
+
+    def _full(self, size: int) -> bool:
+        """Check if a block doesn't fit into the queue, called with the lock held."""
+        return self._limit > 0 and self._queued_bytes > 0 and self._queued_bytes + size > self._limit
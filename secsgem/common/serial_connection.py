@@ -19,13 +19,12 @@ from __future__ import annotations
 
 import logging
 import threading
-import time
 import typing
 
 import serial
 
 from .connection import Connection
-from .helpers import format_hex
+from .lazy_log import LazyHex
 
 if typing.TYPE_CHECKING:
     from .settings import Settings
@@ -81,10 +80,12 @@ class SerialConnection(Connection):  # pylint: disable=too-many-instance-attribu
 
         # mark connection as enabled
         self._enabled = True
+        self._stop_receiver_thread = False
 
         self.__port = serial.Serial(self._settings.port, self._settings.speed, timeout=self._receiver_timeout)
 
         # start data receiving thread
+        self._receiver_thread_running = True
         self._receiver_thread = threading.Thread(
             target=self._receiver_thread_function,
             args=(),
@@ -98,10 +99,6 @@ class SerialConnection(Connection):  # pylint: disable=too-many-instance-attribu
         except Exception:  # pylint: disable=broad-except
             self._logger.exception("ignoring exception for on_connected handler")
 
-        # wait until thread is running
-        while not self._receiver_thread_running:
-            pass
-
     def disable(self):
         """Disable the connection.
 
@@ -116,9 +113,14 @@ class SerialConnection(Connection):  # pylint: disable=too-many-instance-attribu
 
         self._stop_receiver_thread = True
 
-        # wait for connection thread to stop
-        while self._stop_receiver_thread:
-            time.sleep(0.2)
+        # wake up a waiting read, the receiver checks the stop flag afterwards
+        if hasattr(self._port, "cancel_read"):
+            self._port.cancel_read()
+
+        # wait for receiver thread to stop
+        thread = self._receiver_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
 
     def _receiver_thread_function(self):
         """Thread for receiving incoming data and sending it to the protocol handler."""
@@ -147,7 +149,6 @@ class SerialConnection(Connection):  # pylint: disable=too-many-instance-attribu
         # reset all flags
         self._connected = False
         self._receiver_thread_running = False
-        self._stop_receiver_thread = False
 
     def _receiver_loop(self):
         # check if shutdown requested
@@ -155,7 +156,9 @@ class SerialConnection(Connection):  # pylint: disable=too-many-instance-attribu
             data = self._port.read(self._port.in_waiting) if self._port.in_waiting > 0 else self._port.read()
 
             if len(data) > 0:
-                self._bytestream_logger.debug("< %s", format_hex(data))
+                if self._bytestream_logger.isEnabledFor(logging.DEBUG):
+                    self._bytestream_logger.debug("< %s", LazyHex(data))
+
                 self.on_data({"source": self, "data": data})
 
     def send_data(self, data: bytes) -> bool:
@@ -168,7 +171,8 @@ class SerialConnection(Connection):  # pylint: disable=too-many-instance-attribu
             True if succeeded, False if failed
 
         """
-        self._bytestream_logger.debug("> %s", format_hex(data))
+        if self._bytestream_logger.isEnabledFor(logging.DEBUG):
+            self._bytestream_logger.debug("> %s", LazyHex(data))
         self._port.write(data)
 
         return True
@@ -0,0 +1,51 @@
+#####################################################################
+# serial_executor.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Ordered execution of functions on a shared executor."""
+
+from __future__ import annotations
+
+import typing
+
+from .keyed_executor import KeyedExecutor
+
+if typing.TYPE_CHECKING:
+    import concurrent.futures
+
+
+class SerialExecutor:
+    """Calls submitted functions one after another, in submission order, on a shared executor.
+
+    At most one worker of the executor is used at a time.
+    """
+
+    def __init__(self, executor: concurrent.futures.Executor):
+        """Initialize serial executor.
+
+        Args:
+            executor: executor to run the functions on
+
+        """
+        self._executor = KeyedExecutor(executor)
+
+    def submit(self, function: typing.Callable[..., None], *args) -> None:
+        """Queue a function for execution.
+
+        Args:
+            function: function to call
+            args: arguments for the function
+
+        """
+        self._executor.submit(None, function, *args)
@@ -19,16 +19,27 @@ from __future__ import annotations
 
 import abc
 import enum
+import logging
 import typing
 
 from .timeouts import Timeouts
+from .timer_wheel import TimerWheel
 
 if typing.TYPE_CHECKING:
     from secsgem.secs.data_items.data_items import DataItems
     from secsgem.secs.functions import StreamsFunctions
 
     from .connection import Connection
+    from .message import Block
     from .protocol import Protocol
+    from .protocol_dispatcher import ProtocolDispatcher
+
+
+class TimerHandle(typing.Protocol):
+    """Handle of a timer started with :meth:`Settings.start_timer`."""
+
+    def cancel(self) -> None:
+        """Stop the timer, if it didn't fire yet."""
 
 
 class DeviceType(enum.Enum):
@@ -49,6 +60,48 @@ class DeviceType(enum.Enum):
         return "Equipment" if self == self.EQUIPMENT else "Host"
 
 
+class DispatchOrder(enum.Enum):
+    """Order of concurrently dispatched blocks.
+
+    Blocks with the same key are handled one after another in receive order, other blocks concurrently.
+    """
+
+    # blocks of the same stream are handled in order
+    STREAM = 0
+
+    # blocks of the same transaction (system bytes) are handled in order
+    TRANSACTION = 1
+
+    def __repr__(self) -> str:
+        """String representation of object."""
+        return "Stream" if self == self.STREAM else "Transaction"
+
+    def __str__(self) -> str:
+        """String representation of object."""
+        return "Stream" if self == self.STREAM else "Transaction"
+
+
+class BackPressure(enum.Enum):
+    """Behavior when sending a message to a full send queue."""
+
+    # wait until the queue has space
+    BLOCK = 0
+
+    # drop the message, sending fails
+    DROP = 1
+
+    # raise SendQueueFullError
+    RAISE = 2
+
+    def __repr__(self) -> str:
+        """String representation of object."""
+        return self.name.capitalize()
+
+    def __str__(self) -> str:
+        """String representation of object."""
+        return self.name.capitalize()
+
+
 class Settings(abc.ABC):
     r"""Settings base class.
 
@@ -65,6 +118,10 @@ class Settings(abc.ABC):
         self._streams_functions = kwargs.get("streams_functions", StreamsFunctions())
         self._device_id = kwargs.get("device_id", 0)
         self._establish_communication_timeout = kwargs.get("establish_communication_timeout", 10)
+        self._dispatch_workers = kwargs.get("dispatch_workers", 0)
+        self._dispatch_order = kwargs.get("dispatch_order", DispatchOrder.STREAM)
+        self._send_queue_limit = kwargs.get("send_queue_limit", 64 * 1024 * 1024)
+        self._send_back_pressure = kwargs.get("send_back_pressure", BackPressure.BLOCK)
 
     @classmethod
     @abc.abstractmethod
@@ -76,6 +133,10 @@ class Settings(abc.ABC):
             "streams_functions",
             "device_id",
             "establish_communication_timeout",
+            "dispatch_workers",
+            "dispatch_order",
+            "send_queue_limit",
+            "send_back_pressure",
         ]
 
     def _validate_args(self, kwargs: dict[str, typing.Any]):
@@ -135,6 +196,63 @@ class Settings(abc.ABC):
         """Set time to wait between CA requests."""
         self._establish_communication_timeout = value
 
+    @property
+    def dispatch_workers(self) -> int:
+        """Number of threads calling the handlers of received messages.
+
+        With 0 all handlers are called from one thread in receive order.
+        Otherwise handlers run concurrently, only blocks with the same `dispatch_order` key are handled in order.
+
+        Default: 0
+        """
+        return self._dispatch_workers
+
+    @property
+    def dispatch_order(self) -> DispatchOrder | typing.Callable[[Block], typing.Hashable]:
+        """Order of concurrently dispatched blocks.
+
+        Either a :class:`DispatchOrder` or a function returning the key for a block.
+
+        Default: DispatchOrder.STREAM
+        """
+        return self._dispatch_order
+
+    @property
+    def send_queue_limit(self) -> int:
+        """Maximum number of bytes of queued replies and primary messages, 0 for no limit.
+
+        Control messages are always queued.
+
+        Default: 64 MiB
+        """
+        return self._send_queue_limit
+
+    @property
+    def send_back_pressure(self) -> BackPressure:
+        """Behavior when sending a message to a full send queue.
+
+        Default: BackPressure.BLOCK
+        """
+        return self._send_back_pressure
+
+    def dispatch_key(self, block: Block) -> typing.Hashable:
+        """Get the key of a block, blocks with the same key are dispatched in order.
+
+        Args:
+            block: received block
+
+        Returns:
+            key for the block
+
+        """
+        if self._dispatch_order == DispatchOrder.STREAM:
+            return block.header.stream
+
+        if self._dispatch_order == DispatchOrder.TRANSACTION:
+            return block.header.system
+
+        return self._dispatch_order(block)
+
     @abc.abstractmethod
     def create_protocol(self) -> Protocol:
         """Protocol class for this configuration."""
@@ -145,6 +263,65 @@ class Settings(abc.ABC):
         """Connection class for this configuration."""
         raise NotImplementedError(f"function 'create_connection' is not implemented for '{self.__class__.__name__}'")
 
+    def create_dispatcher(
+        self,
+        receiver_target: typing.Callable,
+        dispatcher_target: typing.Callable,
+    ) -> ProtocolDispatcher:
+        """Dispatcher running the protocol receiver and the message handlers for this configuration.
+
+        Args:
+            receiver_target: function to call when receiver triggered
+            dispatcher_target: function to call when message available for dispatch
+
+        Returns:
+            dispatcher object
+
+        """
+        from .protocol_dispatcher import ProtocolDispatcher  # pylint: disable=import-outside-toplevel
+
+        return ProtocolDispatcher(receiver_target, dispatcher_target, self)
+
+    def start_timer(self, interval: float, function: typing.Callable[[], None], functionality: str) -> TimerHandle:
+        """Call a function once after an interval.
+
+        The function may block, it is not called from a thread handling I/O.
+        Timers of all connections share the threads of :meth:`TimerWheel.shared`.
+
+        Args:
+            interval: seconds to wait before calling the function
+            function: function to call
+            functionality: name of the functionality, used for logging
+
+        Returns:
+            handle to cancel the timer
+
+        """
+        return TimerWheel.shared().call_later(interval, self._run_timer, function, functionality)
+
+    @staticmethod
+    def _run_timer(function: typing.Callable[[], None], functionality: str) -> None:
+        try:
+            function()
+        except Exception:  # pylint: disable=broad-except
+            logging.getLogger(__name__).exception("ignoring exception in timer %s", functionality)
+
+    def call_later(self, interval: float, function: typing.Callable[[], None]) -> TimerHandle:
+        """Call a function that doesn't block once after an interval.
+
+        The function is called directly by the timer thread, it must return quickly.
+        Used for timeouts, that must fire even if all threads of :meth:`start_timer` are busy.
+
+        Args:
+            interval: seconds to wait before calling the function
+            function: function to call
+
+        Returns:
+            handle to cancel the timer
+
+        """
+        return TimerWheel.shared().call_later(interval, function, blocking=False)
+
     @property
     @abc.abstractmethod
     def name(self) -> str:
@@ -19,7 +19,6 @@ from __future__ import annotations
 
 import socket
 import threading
-import time
 import typing
 
 from .tcp_connection import TcpConnection
@@ -44,9 +43,9 @@ class TcpClientConnection(TcpConnection):
         # initially not enabled
         self.enabled = False
 
-        # reconnect thread required for client connection
-        self.connection_thread = None
-        self.stop_connection_thread = False
+        # reconnect thread required for client connection, waits for the stop event between attempts
+        self.connection_thread: threading.Thread | None = None
+        self._stop_connection_thread = threading.Event()
 
         # flag if this is the first connection since enable
         self.first_connection = True
@@ -71,6 +70,8 @@ class TcpClientConnection(TcpConnection):
             # reset first connection to eliminate reconnection timeout
             self.first_connection = True
 
+            self._stop_connection_thread.clear()
+
             # mark connection as enabled
             self.enabled = True
 
@@ -87,13 +88,12 @@ class TcpClientConnection(TcpConnection):
             # mark connection as disabled
             self.enabled = False
 
-            # stop connection thread if it is running
-            if self.connection_thread and self.connection_thread.is_alive():
-                self.stop_connection_thread = True
+            # stop connection thread if it is running, and wait for it to stop
+            self._stop_connection_thread.set()
 
-            # wait for connection thread to stop
-            while self.stop_connection_thread:
-                time.sleep(0.2)
+            thread = self.connection_thread
+            if thread is not None and thread is not threading.current_thread():
+                thread.join()
 
             # disconnect super class
             self.disconnect()
@@ -108,15 +108,7 @@ class TcpClientConnection(TcpConnection):
                 False if thread was stopped
 
         """
-        for _ in range(int(timeout) * 5):
-            time.sleep(0.2)
-
-            # check if connection was disabled
-            if self.stop_connection_thread:
-                self.stop_connection_thread = False
-                return False
-
-        return True
+        return not self._stop_connection_thread.wait(timeout)
 
     def __start_connect_thread(self):
         self.connection_thread = threading.Thread(
@@ -17,27 +17,45 @@
 
 from __future__ import annotations
 
+import collections
+import contextlib
+import itertools
 import logging
 import select
+import socket
 import threading
-import time
 import typing
 
 from .connection import Connection
-from .helpers import format_hex, is_errorcode_ewouldblock
+from .helpers import is_errorcode_ewouldblock
+from .lazy_log import LazyHex
 
 if typing.TYPE_CHECKING:
-    import socket
-
     from .settings import Settings
 
+    class _TcpSettings(Settings):
+        """Settings of TCP connections, implemented by the HSMS and SECS-I over TCP settings."""
+
+        connect_mode: typing.Any
+        address: str
+        port: int
+        receive_buffer_size: int
+
+
+_HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+
 
 class TcpConnection(Connection):
     """Base connection class used for TCP connection types."""
 
+    _settings: _TcpSettings
+
     select_timeout = 0.5
     """Timeout for select calls ."""
 
+    max_send_buffers = 512
+    """Maximum number of buffers passed to a single sendmsg call (must not exceed IOV_MAX)."""
+
     def __init__(self, settings: Settings):
         """Initialize a TCP connection.
 
@@ -53,9 +71,11 @@ class TcpConnection(Connection):
         # connection socket
         self._sock: socket.socket | None = None
 
-        # receiving thread flags
+        # receiving thread, woken up by writing to the wakeup socket when it should stop
+        self._receiver_thread: threading.Thread | None = None
         self._thread_running = False
         self._stop_thread = False
+        self._wakeup_sockets: tuple[socket.socket, socket.socket] | None = None
 
     @property
     def _socket(self) -> socket.socket:
@@ -92,36 +112,51 @@ class TcpConnection(Connection):
 
         Will also do the initial Select and Linktest requests.
         """
+        self._wakeup_sockets = socket.socketpair()
+        self._wakeup_sockets[0].setblocking(False)
+        self._thread_running = True
+
         # start data receiving thread
-        threading.Thread(
+        self._receiver_thread = threading.Thread(
             target=self.__receiver_thread,
             args=(),
             name=f"secsgem_tcpConnection_receiver_{self._settings.address}:{self._settings.port}",
-        ).start()
-
-        # wait until thread is running
-        while not self._thread_running:
-            pass
+        )
+        self._receiver_thread.start()
 
     def disconnect(self):
-        """Close connection."""
+        """Close connection.
+
+        Returns after the connection was closed and the disconnect events were handled, unless called from the
+        receiver thread itself.
+        """
         # return if thread isn't running
-        if not self._thread_running:
+        thread = self._receiver_thread
+        if not self._thread_running or thread is None:
             return
 
         # set disconnecting flag to avoid another select
         self._disconnecting = True
 
-        # set flag to stop the thread
+        # set flag to stop the thread and wake it up
         self._stop_thread = True
+        self._wakeup_receiver()
 
         # wait until thread stopped
-        while self._thread_running:
-            pass
+        if thread is not threading.current_thread():
+            thread.join()
 
         # clear disconnecting flag, no selects coming any more
         self._disconnecting = False
 
+    def _wakeup_receiver(self):
+        wakeup_sockets = self._wakeup_sockets
+        if wakeup_sockets is None:
+            return
+
+        with contextlib.suppress(OSError):
+            wakeup_sockets[1].send(b"\0")
+
     def send_data(self, data: bytes) -> bool:
         """Send data to the remote host.
 
@@ -132,53 +167,109 @@ class TcpConnection(Connection):
             True if succeeded, False if failed
 
         """
-        retry = True
+        return self.send_buffers([data])
+
+    def send_buffers(self, buffers: typing.Sequence[bytes | memoryview]) -> bool:
+        """Send a sequence of buffers to the remote host.
+
+        The buffers are written with scatter-gather I/O where available, partial writes continue at the first unsent
+        byte.
+
+        Args:
+            buffers: encoded data, sent in sequence
+
+        Returns:
+            True if succeeded, False if failed
+
+        """
+        if self._bytestream_logger.isEnabledFor(logging.DEBUG):
+            self._bytestream_logger.debug("> %s", LazyHex(buffers))
 
-        # not sent yet, retry
-        while retry:
+        pending = collections.deque(memoryview(buffer).cast("B") for buffer in buffers if len(buffer) > 0)
+
+        while pending:
             # wait until socket is writable
             while not select.select([], [self._socket], [], self.select_timeout)[1]:
                 pass
 
             try:
-                # send message
-                self._socket.send(data)
-
-                # retry will be cleared if send succeeded
-                retry = False
+                sent = self._write(pending)
             except OSError as exc:
                 if not is_errorcode_ewouldblock(exc.errno):
                     # raise if not EWOULDBLOCK
                     return False
                 # it is EWOULDBLOCK, so retry sending
+                continue
 
-            self._bytestream_logger.debug("> %s", format_hex(data))
+            self._drop_sent(pending, sent)
 
         return True
 
+    @staticmethod
+    def _drop_sent(pending: collections.deque[memoryview], sent: int) -> None:
+        """Remove written data from the pending buffers.
+
+        Completely sent buffers are dropped, a partially sent buffer continues at the first unsent byte.
+
+        Args:
+            pending: buffers to write
+            sent: number of bytes written
+
+        """
+        while sent > 0:
+            if sent < len(pending[0]):
+                pending[0] = pending[0][sent:]
+                return
+
+            sent -= len(pending.popleft())
+
+    def _write(self, pending: collections.deque[memoryview]) -> int:
+        """Write as much of the pending buffers as the socket accepts.
+
+        Args:
+            pending: buffers to write
+
+        Returns:
+            number of bytes written
+
+        """
+        if _HAS_SENDMSG:
+            return self._socket.sendmsg(itertools.islice(pending, self.max_send_buffers))
+
+        return self._socket.send(pending[0])
+
     def __receiver_thread_read_data(self):
+        # preallocated buffer, reused for every read
+        receive_buffer = bytearray(self._settings.receive_buffer_size)
+        receive_view = memoryview(receive_buffer)
+
+        wakeup_socket = self._wakeup_sockets[0] if self._wakeup_sockets is not None else None
+        readers = [self._socket] if wakeup_socket is None else [self._socket, wakeup_socket]
+
         # check if shutdown requested
         while not self._stop_thread:
-            # check if data available
-            select_result = select.select([self._socket], [], [self._socket], self.select_timeout)
+            # wait until data is available or the thread is woken up
+            select_result = select.select(readers, [], [self._socket])
 
             # check if disconnection was started
             if self._disconnecting:
-                time.sleep(0.2)
-                continue
+                break
 
-            if select_result[0]:
+            if self._socket in select_result[0]:
                 try:
                     # get data from socket
-                    recv_data = self._socket.recv(1024)
+                    length = self._socket.recv_into(receive_view)
 
                     # check if socket was closed
-                    if len(recv_data) == 0:
+                    if length == 0:
                         self._connected = False
                         self._stop_thread = True
                         continue
 
-                    self._bytestream_logger.debug("< %s", format_hex(recv_data))
+                    recv_data = bytes(receive_view[:length])
+
+                    if self._bytestream_logger.isEnabledFor(logging.DEBUG):
+                        self._bytestream_logger.debug("< %s", LazyHex(recv_data))
 
                     # add received data to input buffer
                     self.on_data({"source": self, "data": recv_data})
@@ -210,6 +301,12 @@ class TcpConnection(Connection):
         except Exception:  # pylint: disable=broad-except
             self._logger.exception("ignoring exception for on_connection_closed handler")
 
+        if self._wakeup_sockets is not None:
+            for wakeup_socket in self._wakeup_sockets:
+                wakeup_socket.close()
+
+            self._wakeup_sockets = None
+
         # reset all flags
         self._connected = False
         self._thread_running = False
@@ -17,10 +17,10 @@
 
 from __future__ import annotations
 
+import contextlib
 import select
 import socket
 import threading
-import time
 import typing
 
 from .helpers import is_windows
@@ -50,10 +50,11 @@ class TcpServerConnection(TcpConnection):
         # initially not enabled
         self._enabled = False
 
-        # reconnect thread required for server
-        self._server_thread = None
+        # reconnect thread required for server, woken up by writing to the wakeup socket when it should stop
+        self._server_thread: threading.Thread | None = None
         self._stop_server_thread = False
-        self._server_sock = None
+        self._server_sock: socket.socket | None = None
+        self._server_wakeup_sockets: tuple[socket.socket, socket.socket] | None = None
 
         self.on_disconnected.register(self._disconnected)
 
@@ -89,51 +90,74 @@ class TcpServerConnection(TcpConnection):
             # mark connection as disabled
             self._enabled = False
 
-            # stop connection thread if it is running
-            if self._server_thread and self._server_thread.is_alive():
+            # stop connection thread if it is running, and wait for it to stop
+            thread = self._server_thread
+            if thread is not None and thread.is_alive():
                 self._stop_server_thread = True
 
-                if self._server_sock:
-                    self._server_sock.close()
+                wakeup_sockets = self._server_wakeup_sockets
+                if wakeup_sockets is not None:
+                    with contextlib.suppress(OSError):
+                        wakeup_sockets[1].send(b"\0")
 
-                # wait for connection thread to stop
-                while self._stop_server_thread:
-                    time.sleep(0.2)
+                if thread is not threading.current_thread():
+                    thread.join()
 
             # disconnect super class
             self.disconnect()
 
     def __start_server_thread(self):
+        self._stop_server_thread = False
+        self._server_wakeup_sockets = socket.socketpair()
+
         self._server_thread = threading.Thread(
             target=self.__server_thread,
+            args=(self._server_wakeup_sockets,),
             name=f"secsgem_tcpServerConnection_serverThread_{self._settings.address}",
         )
         self._server_thread.start()
 
-    def __server_thread(self):
+    def __server_thread(self, wakeup_sockets: tuple[socket.socket, socket.socket]):
         """Thread function to wait for incoming tcp connections.
 
         .. warning:: Do not call this directly, for internal use only.
         """
-        self._server_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server_sock = server_sock
+
+        try:
+            if not is_windows():
+                server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+
+            server_sock.bind((self._settings.address, self._settings.port))
+            server_sock.listen(1)
 
-        if not is_windows():
-            self._server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self.__accept_connection(server_sock, wakeup_sockets[0])
+        finally:
+            server_sock.close()
 
-        self._server_sock.bind((self._settings.address, self._settings.port))
-        self._server_sock.listen(1)
+            for wakeup_socket in wakeup_sockets:
+                wakeup_socket.close()
 
+            # a new server thread may already be running after a quick disconnect
+            if self._server_wakeup_sockets is wakeup_sockets:
+                self._server_sock = None
+                self._server_wakeup_sockets = None
+
+    def __accept_connection(self, server_sock: socket.socket, wakeup_socket: socket.socket):
+        """Wait for the remote to connect, until the thread is stopped."""
         while not self._stop_server_thread:
             try:
-                select_result = select.select([self._server_sock], [], [], self.select_timeout)
+                select_result = select.select([server_sock, wakeup_socket], [], [])
             except Exception as exc:  # pylint: disable=broad-except
                 self._logger.debug("select exception", exc_info=exc)
+                return
 
-            if not select_result[0]:
-                # select timed out
+            if server_sock not in select_result[0]:
+                # woken up to stop
                 continue
 
-            accept_result = self._server_sock.accept()
+            accept_result = server_sock.accept()
             if accept_result is None:
                 continue
 
@@ -143,7 +167,7 @@ class TcpServerConnection(TcpConnection):
             self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
 
             # make socket nonblocking
-            self._socket.setblocking(0)
+            self._socket.setblocking(False)
 
             # mark connection as connected
             self._connected = True
@@ -157,9 +181,4 @@ class TcpServerConnection(TcpConnection):
             except Exception:  # pylint: disable=broad-except
                 self._logger.exception("ignoring exception for on_connection_established handler")
 
-            self._server_sock.shutdown(socket.SHUT_RDWR)
-            self._server_sock.close()
-
             return
-
-        self._stop_server_thread = False
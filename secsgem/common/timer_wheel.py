@@ -0,0 +1,340 @@
+#####################################################################
+# timer_wheel.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Hierarchical timer wheel shared by the protocol timers."""
+
+from __future__ import annotations
+
+import collections
+import logging
+import math
+import threading
+import time
+import typing
+
+
+class WheelTimer:
+    """Handle of a timer scheduled on a :class:`TimerWheel`."""
+
+    __slots__ = ("_args", "_blocking", "_cancelled", "_function", "expires")
+
+    def __init__(self, expires: int, function: typing.Callable[..., None], args: tuple, blocking: bool):
+        """Initialize a timer.
+
+        Args:
+            expires: tick the timer expires at
+            function: function to call
+            args: arguments for the function
+            blocking: call the function on a worker thread
+
+        """
+        self.expires = expires
+        self._function = function
+        self._args = args
+        self._blocking = blocking
+        self._cancelled = False
+
+    @property
+    def blocking(self) -> bool:
+        """Function may block and is called on a worker thread."""
+        return self._blocking
+
+    @property
+    def cancelled(self) -> bool:
+        """Timer was cancelled."""
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """Cancel the timer, nothing happens if it already ran."""
+        self._cancelled = True
+
+    def run(self) -> None:
+        """Call the function of the timer."""
+        self._function(*self._args)
+
+
+class TimerWheel:  # pylint: disable=too-many-instance-attributes
+    """Hierarchical timer wheel, running any number of timers with one thread.
+
+    Timers are sorted into slots of `slots` ticks per level, each level covering `slots` times the range of the
+    level below. Scheduling and cancelling are O(1), timers of higher levels are moved down when the lower level
+    wraps around. The thread sleeps until the next occupied slot, idle wheels do not wake up.
+
+    Functions that may block run on a bounded set of worker threads, functions that don't block (like resolving a
+    future) run directly in the wheel thread.
+
+    Example:
+        >>> import threading
+        >>>
+        >>> wheel = TimerWheel()
+        >>> fired = threading.Event()
+        >>> timer = wheel.call_later(0.01, fired.set)
+        >>> fired.wait(1)
+        True
+        >>> wheel.stop()
+
+    """
+
+    _shared: TimerWheel | None = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        resolution: float = 0.01,
+        slots: int = 256,
+        levels: int = 4,
+        max_workers: int = 16,
+        name: str = "secsgem_timerWheel",
+    ):
+        """Initialize a timer wheel.
+
+        Args:
+            resolution: seconds per tick
+            slots: number of slots per level
+            levels: number of levels
+            max_workers: maximum number of threads calling blocking functions
+            name: name of the threads
+
+        """
+        self._resolution = resolution
+        self._slots = slots
+        self._levels = levels
+        self._max_workers = max_workers
+        self._name = name
+
+        self._logger = logging.getLogger(self.__module__ + "." + self.__class__.__name__)
+
+        self._wheels: list[list[list[WheelTimer]]] = [[[] for _ in range(slots)] for _ in range(levels)]
+        self._count = 0
+
+        self._origin = time.monotonic()
+        self._tick = 0  # next tick to process
+
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._running = False
+
+        self._work: collections.deque[WheelTimer | None] = collections.deque()
+        self._work_condition = threading.Condition()
+        self._workers: list[threading.Thread] = []
+        self._idle_workers = 0  # workers waiting for work
+
+    @classmethod
+    def shared(cls) -> TimerWheel:
+        """Get the timer wheel shared by all connections."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+
+            return cls._shared
+
+    def __len__(self) -> int:
+        """Get the number of scheduled timers, including cancelled ones not yet removed."""
+        return self._count
+
+    def call_later(
+        self,
+        delay: float,
+        function: typing.Callable[..., None],
+        *args,
+        blocking: bool = True,
+    ) -> WheelTimer:
+        """Call a function after a delay.
+
+        Args:
+            delay: seconds to wait before calling the function
+            function: function to call
+            args: arguments for the function
+            blocking: function may block and is called on a worker thread, otherwise in the wheel thread
+
+        Returns:
+            handle to cancel the timer
+
+        """
+        expires = math.ceil((time.monotonic() + delay - self._origin) / self._resolution)
+
+        with self._condition:
+            # an empty wheel is not ticking, skip the ticks that passed since
+            if self._count == 0:
+                self._tick = max(self._tick, int((time.monotonic() - self._origin) / self._resolution))
+
+            timer = WheelTimer(expires, function, args, blocking)
+
+            self._add(timer)
+            self._count += 1
+
+            if not self._running:
+                self._start()
+
+            self._condition.notify()
+
+        return timer
+
+    def stop(self) -> None:
+        """Stop the threads, scheduled timers are dropped."""
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+
+            thread = self._thread
+            self._thread = None
+
+            for level in self._wheels:
+                for slot in level:
+                    slot.clear()
+
+            self._count = 0
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+        with self._work_condition:
+            self._work.extend(None for _ in self._workers)
+            self._workers = []
+            self._work_condition.notify_all()
+
+    def _start(self) -> None:
+        """Start the wheel thread, called with the lock held."""
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+
+    def _add(self, timer: WheelTimer) -> None:
+        """Sort a timer into its slot, called with the lock held."""
+        expires = max(timer.expires, self._tick)
+        delta = expires - self._tick
+
+        level = 0
+        span = self._slots
+        while delta >= span and level < self._levels - 1:
+            level += 1
+            span *= self._slots
+
+        # timers beyond the range of the wheel are moved down again when the top level wraps around
+        shift = self._slots**level
+        self._wheels[level][(expires // shift) % self._slots].append(timer)
+
+    def _cascade(self, level: int) -> int:
+        """Move the timers of the current slot of a level to the lower levels, called with the lock held."""
+        index = (self._tick // self._slots**level) % self._slots
+
+        timers = self._wheels[level][index]
+        self._wheels[level][index] = []
+
+        for timer in timers:
+            if timer.cancelled:
+                self._count -= 1
+            else:
+                self._add(timer)
+
+        return index
+
+    def _expire(self) -> list[WheelTimer]:
+        """Process all ticks up to now, called with the lock held."""
+        now = int((time.monotonic() - self._origin) / self._resolution)
+        expired: list[WheelTimer] = []
+
+        while self._tick <= now:
+            index = self._tick % self._slots
+
+            if index == 0:
+                level = 1
+                while level < self._levels and self._cascade(level) == 0:
+                    level += 1
+
+            timers = self._wheels[0][index]
+            self._wheels[0][index] = []
+            self._count -= len(timers)
+            expired.extend(timer for timer in timers if not timer.cancelled)
+
+            self._tick += 1
+
+        return expired
+
+    def _timeout(self) -> float | None:
+        """Seconds until the next occupied slot or the next cascade, called with the lock held."""
+        if self._count == 0:
+            return None
+
+        index = self._tick % self._slots
+        ticks = self._slots - index
+
+        for offset in range(self._slots - index):
+            if self._wheels[0][index + offset]:
+                ticks = offset
+                break
+
+        return max((self._tick + ticks) * self._resolution + self._origin - time.monotonic(), 0)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._running:
+                    return
+
+                expired = self._expire()
+
+                if not expired:
+                    self._condition.wait(self._timeout())
+                    continue
+
+            for timer in expired:
+                if timer.cancelled:
+                    continue
+
+                if timer.blocking:
+                    self._submit(timer)
+                else:
+                    self._call(timer)
+
+    def _call(self, timer: WheelTimer) -> None:
+        try:
+            timer.run()
+        except Exception:  # pylint: disable=broad-except
+            self._logger.exception("ignoring exception in timer")
+
+    def _submit(self, timer: WheelTimer) -> None:
+        with self._work_condition:
+            self._work.append(timer)
+
+            # a waiting worker is left for every queued timer, otherwise start another one if allowed
+            if len(self._work) <= self._idle_workers:
+                self._work_condition.notify()
+                return
+
+            if len(self._workers) >= self._max_workers:
+                return
+
+            worker = threading.Thread(target=self._run_worker, name=f"{self._name}_worker", daemon=True)
+            self._workers.append(worker)
+
+        worker.start()
+
+    def _run_worker(self) -> None:
+        while True:
+            with self._work_condition:
+                # only workers actually waiting are counted as idle
+                while not self._work:
+                    self._idle_workers += 1
+                    self._work_condition.wait()
+                    self._idle_workers -= 1
+
+                timer = self._work.popleft()
+
+            if timer is None:
+                return
+
+            if not timer.cancelled:
+                self._call(timer)
@@ -0,0 +1,90 @@
+#####################################################################
+# versioned_dict.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Dictionary counting its changes."""
+
+from __future__ import annotations
+
+import typing
+
+_KT = typing.TypeVar("_KT")
+_VT = typing.TypeVar("_VT")
+
+
+class VersionedDict(dict[_KT, _VT]):
+    """Dictionary with a version, that is incremented whenever an item is added, replaced or removed.
+
+    Data compiled from the items stays valid as long as the version didn't change, without comparing the items.
+
+    Example:
+        >>> items = VersionedDict({1: "a"})
+        >>> version = items.version
+        >>> items[2] = "b"
+        >>> items.version == version
+        False
+
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the dictionary, taking the same arguments as :class:`dict`."""
+        super().__init__(*args, **kwargs)
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Get the number of changes of the items."""
+        return self._version
+
+    def __setitem__(self, key: _KT, value: _VT) -> None:
+        """Add or replace an item."""
+        super().__setitem__(key, value)
+        self._version += 1
+
+    def __delitem__(self, key: _KT) -> None:
+        """Remove an item."""
+        super().__delitem__(key)
+        self._version += 1
+
+    def __ior__(self, other) -> VersionedDict[_KT, _VT]:  # type: ignore[override,misc]
+        """Add or replace the items of another mapping."""
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs) -> None:  # pylint: disable=arguments-differ
+        """Add or replace items, taking the same arguments as :meth:`dict.update`."""
+        super().update(*args, **kwargs)
+        self._version += 1
+
+    def setdefault(self, key: _KT, default: _VT = None) -> _VT:  # type: ignore[assignment]
+        """Get an item, adding it with the default value if it doesn't exist."""
+        if key not in self:
+            self._version += 1
+
+        return super().setdefault(key, default)
+
+    def pop(self, key: _KT, *args) -> _VT:  # type: ignore[override]
+        """Remove an item and return its value."""
+        self._version += 1
+        return super().pop(key, *args)
+
+    def popitem(self) -> tuple[_KT, _VT]:
+        """Remove the last item and return it."""
+        self._version += 1
+        return super().popitem()
+
+    def clear(self) -> None:
+        """Remove all items."""
+        super().clear()
+        self._version += 1
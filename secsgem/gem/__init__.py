@@ -19,13 +19,15 @@ from .alarm import Alarm
 from .collection_event import CollectionEvent, CollectionEventId
 from .collection_event_link import CollectionEventLink
 from .collection_event_report import CollectionEventReport
-from .data_value import DataValue
+from .data_value import DataValue, DataValueId
 from .equipment_constant import EquipmentConstant, EquipmentConstantId
 from .equipmenthandler import GemEquipmentHandler
 from .handler import GemHandler
 from .hosthandler import GemHostHandler
+from .monitored_variable import LimitTransition, MonitoredVariable
 from .remote_command import RemoteCommand, RemoteCommandId
 from .status_variable import StatusVariable, StatusVariableId
+from .trace import Trace
 
 __all__ = [
     "Alarm",
@@ -34,13 +36,17 @@ __all__ = [
     "CollectionEventLink",
     "CollectionEventReport",
     "DataValue",
+    "DataValueId",
     "EquipmentConstant",
     "EquipmentConstantId",
     "GemEquipmentHandler",
     "GemHandler",
     "GemHostHandler",
+    "LimitTransition",
+    "MonitoredVariable",
     "RemoteCommand",
     "RemoteCommandId",
     "StatusVariable",
     "StatusVariableId",
+    "Trace",
 ]
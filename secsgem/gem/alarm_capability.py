@@ -65,7 +65,7 @@ class AlarmCapability(GemHandler, Capability):
             return
 
         if self.alarms[alid].enabled:
-            self.send_and_waitfor_response(
+            self._send_spoolable(
                 self.stream_function(5, 1)(
                     {
                         "ALCD": self.alarms[alid].code | self.settings.data_items.ALCD.ALARM_SET,
@@ -93,7 +93,7 @@ class AlarmCapability(GemHandler, Capability):
             return
 
         if self.alarms[alid].enabled:
-            self.send_and_waitfor_response(
+            self._send_spoolable(
                 self.stream_function(5, 1)(
                     {"ALCD": self.alarms[alid].code, "ALID": alid, "ALTX": self.alarms[alid].text},
                 ),
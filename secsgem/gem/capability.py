@@ -21,6 +21,7 @@ import abc
 import typing
 
 if typing.TYPE_CHECKING:
+    import secsgem.common
     import secsgem.secs
 
     from .alarm import Alarm
@@ -49,12 +50,12 @@ class Capability(abc.ABC):  # pylint: disable=too-few-public-methods
 
     @property
     @abc.abstractmethod
-    def _status_variables(self) -> dict[int | str, StatusVariable]:
+    def _status_variables(self) -> secsgem.common.VersionedDict[int | str, StatusVariable]:
         raise NotImplementedError
 
     @property
     @abc.abstractmethod
-    def _data_values(self) -> dict[int | str, DataValue]:
+    def _data_values(self) -> secsgem.common.VersionedDict[int | str, DataValue]:
         raise NotImplementedError
 
     @property
@@ -71,10 +72,18 @@ class Capability(abc.ABC):  # pylint: disable=too-few-public-methods
     def _get_sv_value(self, status_variable: StatusVariable) -> secsgem.secs.variables.Base:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def _get_sv_values(self, status_variables: list[StatusVariable]) -> list[secsgem.secs.variables.Base]:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def _get_dv_value(self, data_value: DataValue) -> secsgem.secs.variables.Base:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def _get_dv_values(self, data_values: list[DataValue]) -> list[secsgem.secs.variables.Base]:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def _get_control_state_id(self) -> int:
         raise NotImplementedError
@@ -96,11 +105,33 @@ class Capability(abc.ABC):  # pylint: disable=too-few-public-methods
         raise NotImplementedError
 
     @abc.abstractmethod
-    def trigger_collection_events(self, ceids: list[int | str | CollectionEventId]):
+    def _send_spoolable(self, function: secsgem.secs.SecsStreamFunction) -> secsgem.common.Message | None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def trigger_collection_events(
+        self,
+        ceids: list[int | str | CollectionEventId],
+        data_values: dict[int | str, typing.Any] | None = None,
+    ):
         """Triggers the supplied collection events.
 
         Args:
             ceids: List of collection events
+            data_values: values of data values reported with the events, overriding their configured values
+
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _trigger_collection_events(
+        self,
+        events: list[tuple[int | str | CollectionEventId, dict[int | str, typing.Any] | None]],
+    ):
+        """Send the reports of collection events with their own data values.
+
+        Args:
+            events: List of collection events and the data values reported with them
 
         """
         raise NotImplementedError
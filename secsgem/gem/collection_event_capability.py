@@ -17,7 +17,9 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import threading
+import typing
 
 import secsgem.common
 import secsgem.secs
@@ -26,7 +28,9 @@ from .capability import Capability
 from .collection_event import CollectionEvent, CollectionEventId
 from .collection_event_link import CollectionEventLink
 from .collection_event_report import CollectionEventReport
+from .encoded_function import EncodedFunction
 from .handler import GemHandler
+from .report_plan import ReportPlan
 
 
 class CollectionEventCapability(GemHandler, Capability):
@@ -62,6 +66,24 @@ class CollectionEventCapability(GemHandler, Capability):
 
         self._registered_reports: dict[int | str, CollectionEventReport] = {}
         self._registered_collection_events: dict[int | str, CollectionEventLink] = {}
+        self._report_plans: dict[int | str, ReportPlan] = {}
+        # versions of the status variables and data values the report plans were compiled with
+        self._report_plans_version: tuple[int, int] | None = None
+
+        self._ce_sender: concurrent.futures.ThreadPoolExecutor | None = None
+        self._ce_sender_lock = threading.Lock()
+
+    def disable(self) -> None:
+        """Disable the connection, the thread sending collection event reports is stopped."""
+        with self._ce_sender_lock:
+            ce_sender = self._ce_sender
+            self._ce_sender = None
+
+        # reports already queued are still sent, without waiting for them
+        if ce_sender is not None:
+            ce_sender.shutdown(wait=False)
+
+        super().disable()
 
     @property
     def collection_events(self) -> dict[int | str | CollectionEventId, CollectionEvent]:
@@ -108,27 +130,70 @@ class CollectionEventCapability(GemHandler, Capability):
 
         return enabled_ceid
 
-    def trigger_collection_events(self, ceids: list[int | str | CollectionEventId]):
+    def trigger_collection_events(
+        self,
+        ceids: list[int | str | CollectionEventId],
+        data_values: dict[int | str, typing.Any] | None = None,
+    ):
         """Triggers the supplied collection events.
 
         Args:
             ceids: List of collection events
+            data_values: values of data values reported with the events, overriding their configured values
 
         """
+        self._trigger_collection_events([(ceid, data_values) for ceid in ceids])
 
-        def _ce_sender():
-            for ceid in ceids:
-                if isinstance(ceid, CollectionEventId):
-                    ceid = ceid.value
+    def _trigger_collection_events(
+        self,
+        events: list[tuple[int | str | CollectionEventId, dict[int | str, typing.Any] | None]],
+    ):
+        """Send the reports of collection events with their own data values from a separate thread.
+
+        The reports are sent by one thread per handler, in the order the events were triggered.
+
+        Args:
+            events: List of collection events and the data values reported with them
 
-                if ceid in self._registered_collection_events and self._registered_collection_events[ceid].enabled:
-                    reports = self._build_collection_event(ceid)
+        """
+        with self._ce_sender_lock:
+            if self._ce_sender is None:
+                self._ce_sender = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix=self.settings.generate_thread_name("ce_sender"),
+                )
 
-                    self.send_and_waitfor_response(
-                        self.stream_function(6, 11)({"DATAID": 1, "CEID": ceid, "RPT": reports}),
-                    )
+            self._ce_sender.submit(self._send_collection_events, events)
 
-        threading.Thread(target=_ce_sender, daemon=True).start()
+    def _send_collection_events(
+        self,
+        events: list[tuple[int | str | CollectionEventId, dict[int | str, typing.Any] | None]],
+    ):
+        """Send the reports of collection events, called from the sender thread.
+
+        Args:
+            events: List of collection events and the data values reported with them
+
+        """
+        for ceid, data_values in events:
+            if isinstance(ceid, CollectionEventId):
+                ceid = ceid.value
+
+            plan = self._get_report_plan(ceid)
+            if plan is None:
+                continue
+
+            try:
+                function = EncodedFunction(
+                    6,
+                    11,
+                    True,
+                    self._encode_collection_event(plan, data_values),
+                    self.settings.streams_functions,
+                )
+                self._send_spoolable(typing.cast(secsgem.secs.SecsStreamFunction, function))
+            except Exception:  # pylint: disable=broad-except
+                self._logger.exception("sending collection event %s failed", ceid)
 
     def _on_s02f33(  # pylint: disable=too-many-branches  # noqa: C901
         self,
@@ -164,6 +229,7 @@ class CollectionEventCapability(GemHandler, Capability):
         if not function.DATA:
             self._registered_collection_events.clear()
             self._registered_reports.clear()
+            self._update_report_plans()
 
             return result
 
@@ -184,6 +250,8 @@ class CollectionEventCapability(GemHandler, Capability):
                 # add report
                 self._registered_reports[report.RPTID] = CollectionEventReport(report.RPTID, report.VID)
 
+        self._update_report_plans()
+
         return result
 
     def _on_s02f35(  # pylint: disable=too-many-branches  # noqa: C901
@@ -232,6 +300,8 @@ class CollectionEventCapability(GemHandler, Capability):
                             event.RPTID.get(),
                         )
 
+            self._update_report_plans()
+
         return self.stream_function(2, 36)(lrack)
 
     def _on_s02f37(
@@ -253,6 +323,8 @@ class CollectionEventCapability(GemHandler, Capability):
         if not self._set_ce_state(function.CEED.get(), function.CEID.get()):
             erack = secsgem.secs.data_items.ERACK.CEID_UNKNOWN
 
+        self._update_report_plans()
+
         return self.stream_function(2, 38)(erack)
 
     def _on_s06f15(
@@ -271,12 +343,14 @@ class CollectionEventCapability(GemHandler, Capability):
 
         ceid = function.get()
 
-        reports = []
-
-        if ceid in self._registered_collection_events and self._registered_collection_events[ceid].enabled:
-            reports = self._build_collection_event(ceid)
+        plan = self._get_report_plan(ceid)
+        if plan is None:
+            return self.stream_function(6, 16)({"DATAID": 1, "CEID": ceid, "RPT": []})
 
-        return self.stream_function(6, 16)({"DATAID": 1, "CEID": ceid, "RPT": reports})
+        return typing.cast(
+            secsgem.secs.SecsStreamFunction,
+            EncodedFunction(6, 16, False, self._encode_collection_event(plan), self.settings.streams_functions),
+        )
 
     def _set_ce_state(self, ceed: bool, ceids: list[int | str]) -> bool:
         """En-/Disable event reports for the supplied ceids (or all, if ceid is an empty list).
@@ -302,32 +376,89 @@ class CollectionEventCapability(GemHandler, Capability):
 
         return result
 
-    def _build_collection_event(self, ceid: int | str):
-        """Build reports for a collection event.
+    def _update_report_plans(self):
+        """Compile the reports of the enabled collection events, after the report definitions or variables changed."""
+        version = (self._status_variables.version, self._data_values.version)
+
+        self._report_plans = {
+            ceid: self._create_report_plan(ceid, collection_event)
+            for ceid, collection_event in self._registered_collection_events.items()
+            if collection_event.enabled
+        }
+        self._report_plans_version = version
+
+    def _create_report_plan(self, ceid: int | str, collection_event: CollectionEventLink) -> ReportPlan:
+        """Compile the reports of a collection event.
 
         Args:
-            ceid: collection event to build
+            ceid: ID of the collection event
+            collection_event: linked reports of the collection event
 
         Returns:
-            collection event data
+            compiled reports
 
         """
-        reports = []
-
-        for rptid in self._registered_collection_events[ceid].reports:
-            report = self._registered_reports[rptid]
-            variables = []
-            for var in report.vars:
-                if var in self._status_variables:
-                    value = self._get_sv_value(self._status_variables[var])
-                    variables.append(value)
-                elif var in self._data_values:
-                    value = self._get_dv_value(self._data_values[var])
-                    variables.append(value)
-
-            reports.append({"RPTID": rptid, "V": variables})
-
-        return reports
+        return ReportPlan(
+            ceid,
+            [(rptid, self._registered_reports[rptid].vars) for rptid in collection_event.reports],
+            self._status_variables,
+            self._data_values,
+            self.settings.data_items,
+        )
+
+    def _get_report_plan(self, ceid: int | str) -> ReportPlan | None:
+        """Get the compiled reports of an enabled collection event.
+
+        The plans are compiled again if status variables or data values were added, replaced or removed since.
+
+        Args:
+            ceid: ID of the collection event
+
+        Returns:
+            compiled reports, None if the collection event is not enabled
+
+        """
+        if self._report_plans_version != (self._status_variables.version, self._data_values.version):
+            self._update_report_plans()
+
+        return self._report_plans.get(ceid)
+
+    def _encode_collection_event(
+        self,
+        plan: ReportPlan,
+        data_values: dict[int | str, typing.Any] | None = None,
+    ) -> bytes:
+        """Get the values of a collection event and encode its reports.
+
+        Args:
+            plan: compiled reports of the collection event
+            data_values: values of data values, overriding their configured values
+
+        Returns:
+            encoded collection event data
+
+        """
+        status_variable_values = self._get_sv_values(plan.status_variables)
+
+        if not data_values:
+            return plan.encode(status_variable_values, self._get_dv_values(plan.data_values))
+
+        requested_values = iter(
+            self._get_dv_values([data_value for data_value in plan.data_values if data_value.dvid not in data_values]),
+        )
+        data_value_values = []
+
+        for data_value in plan.data_values:
+            if data_value.dvid not in data_values:
+                data_value_values.append(next(requested_values))
+                continue
+
+            value = data_values[data_value.dvid]
+            if not isinstance(value, secsgem.secs.variables.Base):
+                value = data_value.value_type(value)
+            data_value_values.append(value)
+
+        return plan.encode(status_variable_values, data_value_values)
 
     def get_ceid_name(self, ceid: int | str) -> str:
         """Get the name of a collection event.
@@ -18,10 +18,13 @@
 from __future__ import annotations
 
 import enum
-import threading
+import typing
 
 import secsgem.common
 
+if typing.TYPE_CHECKING:
+    from secsgem.common.settings import TimerHandle
+
 
 class CommunicationState(enum.Enum):
     """States for connection state machine."""
@@ -121,8 +124,8 @@ class CommunicationStateMachine(secsgem.common.StateMachine):  # pylint: disable
             ),  # 14
         ]
 
-        self._wait_cra_timer: threading.Timer | None = None
-        self._comm_delay_timer: threading.Timer | None = None
+        self._wait_cra_timer: TimerHandle | None = None
+        self._comm_delay_timer: TimerHandle | None = None
 
         self.wait_cra.events.enter.register(self._on_state_wait_cra)
         self.wait_delay.events.enter.register(self._on_state_wait_delay)
@@ -136,8 +139,11 @@ class CommunicationStateMachine(secsgem.common.StateMachine):  # pylint: disable
             data: event attributes
 
         """
-        self._wait_cra_timer = threading.Timer(self._settings.timeouts.t3, self._on_wait_cra_timeout)
-        self._wait_cra_timer.start()
+        self._wait_cra_timer = self._settings.start_timer(
+            self._settings.timeouts.t3,
+            self._on_wait_cra_timeout,
+            "communicationState_waitCraTimer",
+        )
 
     def _on_state_wait_delay(self, _data: dict):
         """Connection state model changed to state WAIT_DELAY.
@@ -146,11 +152,11 @@ class CommunicationStateMachine(secsgem.common.StateMachine):  # pylint: disable
             data: event attributes
 
         """
-        self._comm_delay_timer = threading.Timer(
+        self._comm_delay_timer = self._settings.start_timer(
             self._settings.establish_communication_timeout,
             self._on_wait_comm_delay_timeout,
+            "communicationState_commDelayTimer",
         )
-        self._comm_delay_timer.start()
 
     def _on_state_leave_wait_cra(self, _data: dict):
         """Connection state model changed to state WAIT_CRA.
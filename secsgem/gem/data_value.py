@@ -17,15 +17,25 @@
 
 from __future__ import annotations
 
+import enum
+
 import secsgem.secs
 
 
+class DataValueId(enum.Enum):
+    """Default IDs for data values."""
+
+    LIMIT_VARIABLE = 2001
+    EVENT_LIMIT = 2002
+    TRANSITION_TYPE = 2003
+
+
 class DataValue:
     """Data value definition."""
 
     def __init__(
         self,
-        dvid: int | str,
+        dvid: int | str | DataValueId,
         name: str,
         value_type: type[secsgem.secs.variables.Base],
         use_callback: bool = True,
@@ -49,7 +59,7 @@ class DataValue:
             **kwargs: additional attributes for object
 
         """
-        self._dvid = dvid
+        self._dvid = dvid if not isinstance(dvid, DataValueId) else dvid.value
         self._name = name
         self._value_type = value_type
         self._use_callback = use_callback
@@ -17,16 +17,13 @@
 
 from __future__ import annotations
 
-import typing
+import secsgem.common
+import secsgem.secs
 
 from .capability import Capability
+from .data_value import DataValue, DataValueId
 from .handler import GemHandler
 
-if typing.TYPE_CHECKING:
-    import secsgem.secs
-
-    from .data_value import DataValue
-
 
 class DataValueCapability(GemHandler, Capability):
     """Data Value capability on GEM equipment."""
@@ -35,10 +32,32 @@ class DataValueCapability(GemHandler, Capability):
         """Initialize capability."""
         super().__init__(*args, **kwargs)
 
-        self.__data_values: dict[int | str, DataValue] = {}
+        # versioned, so compiled report plans notice data values being added or replaced
+        self.__data_values: secsgem.common.VersionedDict[int | str, DataValue] = secsgem.common.VersionedDict(
+            {
+                DataValueId.LIMIT_VARIABLE.value: DataValue(
+                    DataValueId.LIMIT_VARIABLE,
+                    "LimitVariable",
+                    secsgem.secs.variables.U4,
+                    False,
+                ),
+                DataValueId.EVENT_LIMIT.value: DataValue(
+                    DataValueId.EVENT_LIMIT,
+                    "EventLimit",
+                    secsgem.secs.variables.Binary,
+                    False,
+                ),
+                DataValueId.TRANSITION_TYPE.value: DataValue(
+                    DataValueId.TRANSITION_TYPE,
+                    "TransitionType",
+                    secsgem.secs.variables.Binary,
+                    False,
+                ),
+            },
+        )
 
     @property
-    def _data_values(self) -> dict[int | str, DataValue]:
+    def _data_values(self) -> secsgem.common.VersionedDict[int | str, DataValue]:
         """Get list of the data values.
 
         Returns:
@@ -76,6 +95,22 @@ class DataValueCapability(GemHandler, Capability):
         """
         return data_value.value_type(data_value.value)
 
+    def on_dv_values_request(self, data_values: list[DataValue]) -> list[secsgem.secs.variables.Base]:
+        """Get the values of several data values with one request.
+
+        Called with all data values using the callback that are needed for a report. Override in inherited class to
+        fetch the values from the equipment with one request, by default :meth:`on_dv_value_request` is called for
+        each data value.
+
+        Args:
+            data_values: The data values requested
+
+        Returns:
+            The values encoded in the corresponding types, in the order of the data values
+
+        """
+        return [self.on_dv_value_request(data_value.id_type(data_value.dvid), data_value) for data_value in data_values]
+
     def _get_dv_value(self, data_value: DataValue) -> secsgem.secs.variables.Base:
         """Get the data value depending on its configuation.
 
@@ -90,3 +125,35 @@ class DataValueCapability(GemHandler, Capability):
             return self.on_dv_value_request(data_value.id_type(data_value.dvid), data_value)
 
         return data_value.value_type(data_value.value)
+
+    def _get_dv_values(self, data_values: list[DataValue]) -> list[secsgem.secs.variables.Base]:
+        """Get the values of several data values at once.
+
+        The data values using the callback are requested with one call to :meth:`on_dv_values_request`.
+
+        Args:
+            data_values: The data values requested
+
+        Returns:
+            The values encoded in the corresponding types, in the order of the data values
+
+        Raises:
+            ValueError: if :meth:`on_dv_values_request` didn't return one value per data value
+
+        """
+        requested = [data_value for data_value in data_values if data_value.use_callback]
+        if not requested:
+            return [data_value.value_type(data_value.value) for data_value in data_values]
+
+        returned_values = self.on_dv_values_request(requested)
+        if len(returned_values) != len(requested):
+            raise ValueError(
+                f"on_dv_values_request returned {len(returned_values)} values for {len(requested)} data values",
+            )
+
+        requested_values = iter(returned_values)
+
+        return [
+            next(requested_values) if data_value.use_callback else data_value.value_type(data_value.value)
+            for data_value in data_values
+        ]
@@ -0,0 +1,72 @@
+#####################################################################
+# encoded_function.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Stream function with already encoded data."""
+
+from __future__ import annotations
+
+import typing
+
+if typing.TYPE_CHECKING:
+    import secsgem.secs
+
+
+class EncodedFunction:
+    """Primary message sent with data that was encoded before.
+
+    Used in place of a :class:`secsgem.secs.SecsStreamFunction` for messages that are encoded without creating the
+    function object first, the data is only decoded if the message is logged.
+    """
+
+    __slots__ = ("_data", "_streams_functions", "function", "is_reply_required", "stream")
+
+    def __init__(
+        self,
+        stream: int,
+        function: int,
+        is_reply_required: bool,
+        data: bytes,
+        streams_functions: secsgem.secs.functions.StreamsFunctions,
+    ):
+        """Initialize an encoded function.
+
+        Args:
+            stream: stream of the message
+            function: function of the message
+            is_reply_required: the message requires a reply
+            data: encoded data
+            streams_functions: functions to decode the data with for the communication log
+
+        """
+        self.stream = stream
+        self.function = function
+        self.is_reply_required = is_reply_required
+        self._data = data
+        self._streams_functions = streams_functions
+
+    def encode(self) -> bytes:
+        """Get the encoded data."""
+        return self._data
+
+    def __repr__(self) -> str:
+        """Generate textual representation for an object of this class."""
+        function_class = self._streams_functions.function(self.stream, self.function)
+        if function_class is not None:
+            function = function_class()
+            function.decode(self._data)
+            return repr(function)
+
+        reply = " W" if self.is_reply_required else ""
+        return f"S{self.stream}F{self.function}{reply} <encoded {len(self._data)} bytes>"
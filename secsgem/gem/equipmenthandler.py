@@ -28,9 +28,12 @@ from .control_state_machine import ControlState
 from .data_value_capability import DataValueCapability
 from .equipment_constants_capability import EquipmentConstantsCapability
 from .handler import GemHandler
+from .limits_monitoring_capability import LimitsMonitoringCapability
 from .remote_control_capability import RemoteControlCapability
+from .spooling_capability import SpoolingCapability
 from .state_models_capability import StateModelsCapability
 from .status_data_collection_capability import StatusDataCollectionCapability
+from .trace_data_capability import TraceDataCapability
 
 if typing.TYPE_CHECKING:
     import secsgem.secs.variables
@@ -45,6 +48,9 @@ class GemEquipmentHandler(  # pylint: disable=too-many-ancestors
     StateModelsCapability,
     CollectionEventCapability,
     StatusDataCollectionCapability,
+    TraceDataCapability,
+    LimitsMonitoringCapability,
+    SpoolingCapability,
     GemHandler,
 ):
     """Baseclass for creating equipment models. Inherit from this class and override required functions."""
@@ -88,6 +88,66 @@ class GemHostHandler(GemHandler):
         # enable collection event
         self.send_and_waitfor_response(self.stream_function(2, 37)({"CEED": True, "CEID": [ceid]}))
 
+    def subscribe_collection_events(
+        self,
+        events: dict[int | str, list[int | str]],
+        chunk_size: int | None = None,
+        window: int | None = None,
+    ):
+        """Subscribe to many collection events at once.
+
+        The report definitions, links and enables are combined into one S2F33, S2F35 and S2F37 each.
+        Each collection event gets its own report, with an automatically numbered report id.
+
+        Args:
+            events: DV IDs to add by ID of the collection event
+            chunk_size: optional - maximum number of collection events per message, all in one message if None
+            window: maximum number of messages waiting for a response, defaults to `request_window`
+
+        """
+        self._logger.info("Subscribing to %d collection events", len(events))
+
+        subscriptions = []
+        for ceid, dvs in events.items():
+            report_id = self._report_id_counter
+            self._report_id_counter += 1
+
+            # note subscribed reports
+            self.report_subscriptions[report_id] = dvs
+
+            subscriptions.append((ceid, report_id, dvs))
+
+        step = chunk_size if chunk_size else max(len(subscriptions), 1)
+        chunks = [subscriptions[index : index + step] for index in range(0, len(subscriptions), step)]
+
+        # create reports
+        self.send_requests(
+            [
+                self.stream_function(2, 33)(
+                    {"DATAID": 0, "DATA": [{"RPTID": report_id, "VID": dvs} for _, report_id, dvs in chunk]},
+                )
+                for chunk in chunks
+            ],
+            window,
+        )
+
+        # link event reports to collection events
+        self.send_requests(
+            [
+                self.stream_function(2, 35)(
+                    {"DATAID": 0, "DATA": [{"CEID": ceid, "RPTID": [report_id]} for ceid, report_id, _ in chunk]},
+                )
+                for chunk in chunks
+            ],
+            window,
+        )
+
+        # enable collection events
+        self.send_requests(
+            [self.stream_function(2, 37)({"CEED": True, "CEID": [ceid for ceid, _, _ in chunk]}) for chunk in chunks],
+            window,
+        )
+
     def send_remote_command(self, rcmd: int | str, params: list[str]) -> secsgem.secs.SecsStreamFunction:
         """Send a remote command.
 
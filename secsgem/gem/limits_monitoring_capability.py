@@ -0,0 +1,304 @@
+#####################################################################
+# limits_monitoring_capability.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Limits Monitoring capability."""
+
+from __future__ import annotations
+
+import threading
+import typing
+
+import secsgem.common
+import secsgem.secs
+
+from .capability import Capability
+from .data_value import DataValueId
+from .handler import GemHandler
+
+if typing.TYPE_CHECKING:
+    from .collection_event import CollectionEventId
+    from .monitored_variable import MonitoredVariable
+
+
+class LimitsMonitoringCapability(GemHandler, Capability):
+    """Limits Monitoring capability on GEM equipment.
+
+    The status variables in :attr:`monitored_variables` can get limits defined by the host with S2F45. New values are
+    passed to :meth:`update_status_variables`, a limit zone transition triggers the collection event of the monitored
+    variable with the data values LimitVariable, EventLimit and TransitionType.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize capability."""
+        super().__init__(*args, **kwargs)
+
+        self._monitored_variables: dict[int | str, MonitoredVariable] = {}
+        self._limits_lock = threading.Lock()
+
+    @property
+    def monitored_variables(self) -> dict[int | str, MonitoredVariable]:
+        """Get the status variables with limits monitoring.
+
+        Returns:
+            Monitored variables by status variable id
+
+        """
+        return self._monitored_variables
+
+    def update_status_variables(self, values: dict[int | str, typing.Any]):
+        """Set the values of status variables and evaluate their limits.
+
+        The values are stored in the status variables, they are reported if the status variable doesn't use the
+        callback. The collection events of all limit zone transitions are sent together, after the events of earlier
+        calls.
+
+        Args:
+            values: new values by status variable id
+
+        Raises:
+            ValueError: if a status variable id is unknown, no value is stored then
+
+        """
+        status_variables = self._status_variables
+        monitored_variables = self._monitored_variables
+        events: list[tuple[int | str | CollectionEventId, dict[int | str, typing.Any] | None]] = []
+
+        with self._limits_lock:
+            for vid in values:
+                if vid not in status_variables:
+                    raise ValueError(f"Unknown status variable id {vid}")
+
+            for vid, value in values.items():
+                status_variable = status_variables[vid]
+                status_variable.value = value
+
+                monitored_variable = monitored_variables.get(vid)
+                if monitored_variable is None:
+                    continue
+
+                for limitid, transition in monitored_variable.evaluate(value):
+                    events.append(
+                        (
+                            monitored_variable.ceid,
+                            {
+                                DataValueId.LIMIT_VARIABLE.value: status_variable.id_type(vid),
+                                DataValueId.EVENT_LIMIT.value: limitid,
+                                DataValueId.TRANSITION_TYPE.value: transition,
+                            },
+                        ),
+                    )
+
+        if events:
+            self._trigger_collection_events(events)
+
+    def _check_limit(
+        self,
+        monitored_variable: MonitoredVariable,
+        upper: typing.Any,
+        lower: typing.Any,
+    ) -> int:
+        """Check the deadbands of a limit definition.
+
+        Args:
+            monitored_variable: variable the limit is defined for
+            upper: UPPERDB of the limit
+            lower: LOWERDB of the limit
+
+        Returns:
+            LIMITACK for the limit
+
+        """
+        try:
+            upper_value = float(upper)
+            lower_value = float(lower)
+        except (TypeError, ValueError):
+            if isinstance(upper, str) or isinstance(lower, str):
+                return self.settings.data_items.LIMITACK.ASCII_ILLEGAL
+
+            return self.settings.data_items.LIMITACK.ILLEGAL_FORMAT
+
+        if upper_value > monitored_variable.limit_max:
+            return self.settings.data_items.LIMITACK.UPPERDB_MORE_LIMITMAX
+
+        if lower_value < monitored_variable.limit_min:
+            return self.settings.data_items.LIMITACK.LOWERDB_LESS_LIMITMIN
+
+        if upper_value < lower_value:
+            return self.settings.data_items.LIMITACK.UPPERDB_LESS_LOWERDB
+
+        return self.settings.data_items.LIMITACK.OK
+
+    def _check_limits(self, vid: int | str, limits: list[dict]) -> tuple[int, int, int]:
+        """Check the limit definitions of a variable.
+
+        Args:
+            vid: id of the variable
+            limits: limit definitions from S2F45
+
+        Returns:
+            LVACK, LIMITID and LIMITACK of the first error
+
+        """
+        monitored_variable = self._monitored_variables.get(vid)
+
+        if vid not in self._status_variables:
+            return self.settings.data_items.LVACK.VARIABLE_UNKNOWN, 0, 0
+
+        if monitored_variable is None:
+            return self.settings.data_items.LVACK.NO_LIMITS, 0, 0
+
+        limitids = set()
+
+        for limit in limits:
+            limitid = limit["LIMITID"]
+            upper = limit["DATA"]["UPPERDB"]
+            lower = limit["DATA"]["LOWERDB"]
+
+            if limitid in limitids:
+                limitack = self.settings.data_items.LIMITACK.DUPLICATE
+            elif limitid >= monitored_variable.limit_count:
+                limitack = self.settings.data_items.LIMITACK.LIMITID_UNKNOWN
+            elif upper is None and lower is None:
+                limitack = self.settings.data_items.LIMITACK.OK
+            else:
+                limitack = self._check_limit(monitored_variable, upper, lower)
+
+            if limitack != self.settings.data_items.LIMITACK.OK:
+                return self.settings.data_items.LVACK.LIMIT_ERROR, limitid, limitack
+
+            limitids.add(limitid)
+
+        return self.settings.data_items.LVACK.OK, 0, 0
+
+    def _define_limits(self, monitored_variable: MonitoredVariable, limits: list[dict]):
+        """Apply checked limit definitions to a variable.
+
+        An empty list deletes all limits of the variable, a limit without deadbands is deleted.
+
+        Args:
+            monitored_variable: variable the limits are defined for
+            limits: limit definitions from S2F45
+
+        """
+        defined_limits = dict(monitored_variable.limits) if limits else {}
+
+        for limit in limits:
+            upper = limit["DATA"]["UPPERDB"]
+            lower = limit["DATA"]["LOWERDB"]
+
+            if upper is None and lower is None:
+                defined_limits.pop(limit["LIMITID"], None)
+            else:
+                defined_limits[limit["LIMITID"]] = (upper, lower)
+
+        monitored_variable.set_limits(defined_limits)
+
+        # the zones of variables with internal value are known right away
+        status_variable = self._status_variables[monitored_variable.vid]
+        if not status_variable.use_callback:
+            monitored_variable.evaluate(status_variable.value)
+
+    def _on_s02f45(
+        self,
+        _handler: secsgem.secs.SecsHandler,
+        message: secsgem.common.Message,
+    ) -> secsgem.secs.SecsStreamFunction | None:
+        """Handle Stream 2, Function 45, Define Variable Limit Attributes.
+
+        Args:
+            handler: handler the message was received on
+            message: complete message received
+
+        """
+        function = self.settings.streams_functions.decode(message)
+
+        variables = function.DATA.get()
+        vids = set()
+        errors = []
+
+        for variable in variables:
+            vid = variable["VID"]
+
+            if vid in vids:
+                lvack, limitid, limitack = self.settings.data_items.LVACK.DUPLICATE_VARIABLE, 0, 0
+            else:
+                lvack, limitid, limitack = self._check_limits(vid, variable["DATA"])
+
+            if lvack != self.settings.data_items.LVACK.OK:
+                errors.append({"VID": vid, "LVACK": lvack, "DATA": {"LIMITID": limitid, "LIMITACK": limitack}})
+
+            vids.add(vid)
+
+        if errors:
+            return self.stream_function(2, 46)(
+                {"VLAACK": self.settings.data_items.VLAACK.LIMIT_DEF_ERROR, "DATA": errors},
+            )
+
+        with self._limits_lock:
+            for variable in variables:
+                self._define_limits(self._monitored_variables[variable["VID"]], variable["DATA"])
+
+        return self.stream_function(2, 46)({"VLAACK": self.settings.data_items.VLAACK.ACK, "DATA": []})
+
+    def _on_s02f47(
+        self,
+        _handler: secsgem.secs.SecsHandler,
+        message: secsgem.common.Message,
+    ) -> secsgem.secs.SecsStreamFunction | None:
+        """Handle Stream 2, Function 47, Variable Limit Attribute Request.
+
+        Args:
+            handler: handler the message was received on
+            message: complete message received
+
+        """
+        function = self.settings.streams_functions.decode(message)
+
+        vids = function.get() or list(self._monitored_variables)
+        result = []
+
+        for vid in vids:
+            monitored_variable = self._monitored_variables.get(vid)
+
+            if monitored_variable is None or vid not in self._status_variables:
+                result.append(
+                    {
+                        "VID": vid,
+                        "DATA": {
+                            "UNITS": "",
+                            "LIMITMIN": secsgem.secs.variables.String(""),
+                            "LIMITMAX": secsgem.secs.variables.String(""),
+                            "DATA": [],
+                        },
+                    },
+                )
+                continue
+
+            result.append(
+                {
+                    "VID": vid,
+                    "DATA": {
+                        "UNITS": self._status_variables[vid].unit,
+                        "LIMITMIN": monitored_variable.limit_min,
+                        "LIMITMAX": monitored_variable.limit_max,
+                        "DATA": [
+                            {"LIMITID": limitid, "UPPERDB": upper, "LOWERDB": lower}
+                            for limitid, (upper, lower) in sorted(monitored_variable.limits.items())
+                        ],
+                    },
+                },
+            )
+
+        return self.stream_function(2, 48)(result)
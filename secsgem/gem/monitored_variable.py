@@ -0,0 +1,179 @@
+#####################################################################
+# monitored_variable.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Wrapper for GEM limits monitored variable."""
+
+from __future__ import annotations
+
+import enum
+import math
+import typing
+
+import secsgem.secs
+
+
+class LimitTransition(enum.Enum):
+    """Transition types reported with a limit collection event."""
+
+    LOWER_TO_UPPER = 0
+    UPPER_TO_LOWER = 1
+
+
+_NO_TRANSITIONS: list[tuple[int, int]] = []
+
+
+class MonitoredVariable:  # pylint: disable=too-many-instance-attributes
+    """Definition of a status variable with limits monitoring.
+
+    Each limit defined by the host splits the value range into an upper and a lower zone, with a deadband between
+    UPPERDB and LOWERDB. The value enters the upper zone if it rises above UPPERDB and the lower zone if it falls below
+    LOWERDB.
+
+    The limit boundaries are sorted when the limits are defined. The value range in which no limit changes its zone is
+    kept between updates, so a value inside that range is evaluated with two comparisons, independent of the number of
+    limits.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        vid: int | str,
+        ceid: int | str,
+        limit_min: typing.Any,
+        limit_max: typing.Any,
+        limit_count: int = 8,
+        **kwargs,
+    ):
+        """Initialize a monitored variable.
+
+        You can manually set the secs-type of the id with the 'id_type' keyword argument.
+
+        Args:
+            vid: ID of the monitored status variable
+            ceid: collection event triggered on limit zone transitions
+            limit_min: minimum allowed for LOWERDB
+            limit_max: maximum allowed for UPPERDB
+            limit_count: number of limits, the host can use the limit ids below this number
+            **kwargs: additional attributes for object
+
+        """
+        self.vid = vid
+        self.ceid = ceid
+        self.limit_min = limit_min
+        self.limit_max = limit_max
+        self.limit_count = limit_count
+
+        self.id_type: type[secsgem.secs.variables.Base]
+
+        if isinstance(self.vid, int):
+            self.id_type = secsgem.secs.variables.U4
+        else:
+            self.id_type = secsgem.secs.variables.String
+
+        self._limits: dict[int, tuple[typing.Any, typing.Any]] = {}
+        self._uppers: list[tuple[float, int]] = []
+        self._lowers: list[tuple[float, int]] = []
+        self._above: dict[int, bool] | None = None
+        self._low = math.inf
+        self._high = -math.inf
+
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    @property
+    def limits(self) -> dict[int, tuple[typing.Any, typing.Any]]:
+        """Get the defined limits, UPPERDB and LOWERDB by limit id."""
+        return self._limits
+
+    def set_limits(self, limits: dict[int, tuple[typing.Any, typing.Any]]):
+        """Replace the limits.
+
+        The zones are reset, they are initialized with the next evaluated value without transitions.
+
+        Args:
+            limits: UPPERDB and LOWERDB by limit id
+
+        """
+        self._limits = dict(limits)
+        self._uppers = sorted((float(upper), limitid) for limitid, (upper, _) in self._limits.items())
+        self._lowers = sorted(
+            ((float(lower), limitid) for limitid, (_, lower) in self._limits.items()),
+            reverse=True,
+        )
+        self._above = None
+        self._low = math.inf
+        self._high = -math.inf
+
+    def zone_above(self, limitid: int) -> bool | None:
+        """Check if the value is in the upper zone of a limit.
+
+        Args:
+            limitid: id of the limit
+
+        Returns:
+            True for the upper zone, False for the lower zone, None if the zone isn't known yet
+
+        """
+        if self._above is None:
+            return None
+
+        return self._above.get(limitid)
+
+    def evaluate(self, value: typing.Any) -> list[tuple[int, int]]:
+        """Evaluate a new value of the variable.
+
+        Args:
+            value: the new value
+
+        Returns:
+            limit id and :class:`LimitTransition` value of the limits that changed their zone
+
+        """
+        if self._low <= value <= self._high:
+            return _NO_TRANSITIONS
+
+        above = self._above
+        if above is None:
+            self._above = {limitid: value > upper for upper, limitid in self._uppers}
+            self._update_bounds()
+            return _NO_TRANSITIONS
+
+        transitions = []
+
+        if value > self._high:
+            for upper, limitid in self._uppers:
+                if upper >= value:
+                    break
+
+                if not above[limitid]:
+                    above[limitid] = True
+                    transitions.append((limitid, LimitTransition.LOWER_TO_UPPER.value))
+        else:
+            for lower, limitid in self._lowers:
+                if lower <= value:
+                    break
+
+                if above[limitid]:
+                    above[limitid] = False
+                    transitions.append((limitid, LimitTransition.UPPER_TO_LOWER.value))
+
+        self._update_bounds()
+        return transitions
+
+    def _update_bounds(self):
+        """Update the value range without zone transitions."""
+        above = typing.cast(dict[int, bool], self._above)
+
+        self._high = next((upper for upper, limitid in self._uppers if not above[limitid]), math.inf)
+        self._low = next((lower for lower, limitid in self._lowers if above[limitid]), -math.inf)
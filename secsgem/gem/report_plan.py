@@ -0,0 +1,128 @@
+#####################################################################
+# report_plan.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Precompiled reports of a collection event."""
+
+from __future__ import annotations
+
+import typing
+
+import secsgem.secs
+
+if typing.TYPE_CHECKING:
+    from secsgem.secs.data_items.data_items import DataItems
+
+    from .data_value import DataValue
+    from .status_variable import StatusVariable
+
+# used to encode list headers
+_LIST = secsgem.secs.variables.List([])
+
+
+class ReportPlan:
+    """Reports of a linked collection event, compiled when the report definitions change.
+
+    The variables of all reports are resolved to their status variable or data value when the plan is compiled, each
+    variable is listed once. The parts of the S6F11 data that don't depend on the variable values (DATAID, CEID, list
+    headers and RPTID) are encoded in advance, so the event data is written by appending the encoded values.
+    The plan must be compiled again if status variables or data values are added or replaced afterwards.
+    """
+
+    __slots__ = ("_header", "_reports", "ceid", "data_values", "status_variables")
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        ceid: int | str,
+        reports: list[tuple[int | str, list[int | str]]],
+        status_variables: dict[int | str, StatusVariable],
+        data_values: dict[int | str, DataValue],
+        data_items: DataItems,
+        dataid: int = 1,
+    ):
+        """Compile the reports of a collection event.
+
+        Args:
+            ceid: ID of the collection event
+            reports: report ids and their variable ids, in the order they are linked
+            status_variables: status variables of the equipment
+            data_values: data values of the equipment
+            data_items: data items to encode the static parts with
+            dataid: DATAID sent with the event
+
+        """
+        self.ceid = ceid
+        self.status_variables: list[StatusVariable] = []
+        self.data_values: list[DataValue] = []
+
+        status_variable_slots: dict[int | str, int] = {}
+        data_value_slots: dict[int | str, int] = {}
+        report_slots: list[tuple[bytes, list[tuple[bool, int]]]] = []
+
+        for rptid, vids in reports:
+            slots = []
+
+            for vid in vids:
+                if vid in status_variables:
+                    if vid not in status_variable_slots:
+                        status_variable_slots[vid] = len(self.status_variables)
+                        self.status_variables.append(status_variables[vid])
+                    slots.append((False, status_variable_slots[vid]))
+                elif vid in data_values:
+                    if vid not in data_value_slots:
+                        data_value_slots[vid] = len(self.data_values)
+                        self.data_values.append(data_values[vid])
+                    slots.append((True, data_value_slots[vid]))
+
+            header = bytearray(_LIST.encode_item_header(2))
+            typing.cast("secsgem.secs.variables.Base", data_items.RPTID(rptid)).encode_into(header)
+            header += _LIST.encode_item_header(len(slots))
+            report_slots.append((bytes(header), slots))
+
+        # data values follow the status variables in the values passed to encode
+        self._reports = [
+            (header, [index + len(self.status_variables) if is_data_value else index for is_data_value, index in slots])
+            for header, slots in report_slots
+        ]
+
+        header = bytearray(_LIST.encode_item_header(3))
+        typing.cast("secsgem.secs.variables.Base", data_items.DATAID(dataid)).encode_into(header)
+        typing.cast("secsgem.secs.variables.Base", data_items.CEID(ceid)).encode_into(header)
+        header += _LIST.encode_item_header(len(reports))
+        self._header = bytes(header)
+
+    def encode(
+        self,
+        status_variable_values: list[secsgem.secs.variables.Base],
+        data_value_values: list[secsgem.secs.variables.Base],
+    ) -> bytes:
+        """Encode the event data.
+
+        Args:
+            status_variable_values: values in the order of :attr:`status_variables`
+            data_value_values: values in the order of :attr:`data_values`
+
+        Returns:
+            encoded S6F11/S6F16 data
+
+        """
+        values = status_variable_values + data_value_values
+        data = bytearray(self._header)
+
+        for header, slots in self._reports:
+            data += header
+            for slot in slots:
+                values[slot].encode_into(data)
+
+        return bytes(data)
@@ -0,0 +1,295 @@
+#####################################################################
+# spooling_capability.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Spooling capability."""
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import struct
+import threading
+import typing
+
+import secsgem.common
+import secsgem.secs
+
+from .capability import Capability
+from .communication_state_machine import CommunicationState
+from .encoded_function import EncodedFunction
+from .handler import GemHandler
+
+if typing.TYPE_CHECKING:
+    import pathlib
+
+# spooled record header: stream, function, reply required
+_SPOOL_HEADER = struct.Struct(">BBB")
+
+
+class SpoolingCapability(GemHandler, Capability):
+    """Spooling capability on GEM equipment.
+
+    Primary messages of the streams and functions selected by the host with S2F43 are written to a
+    :class:`secsgem.common.SegmentLog` if the host is not communicating or the message couldn't be delivered.
+    The host requests the spooled messages with S6F23, they are sent with many requests in flight, holding only the
+    messages in flight in memory.
+    Spooling is disabled until it is configured with :meth:`configure_spooling`.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize capability."""
+        super().__init__(*args, **kwargs)
+
+        self._spool: secsgem.common.SegmentLog | None = None
+        self._spooled_functions: dict[int, list[int]] = {}
+        self._spool_transmit_lock = threading.Lock()
+
+    @property
+    def spool(self) -> secsgem.common.SegmentLog | None:
+        """Get the spool, None if spooling is not configured."""
+        return self._spool
+
+    @property
+    def spooled_functions(self) -> dict[int, list[int]]:
+        """Get the spooled functions by stream, an empty list spools all primary functions of the stream."""
+        return self._spooled_functions
+
+    def configure_spooling(
+        self,
+        directory: str | pathlib.Path | None,
+        max_size: int = 16 * 1024 * 1024,
+        segment_size: int = 1024 * 1024,
+        overwrite: bool = True,
+    ):
+        """Configure the spool, messages spooled before are restored from the directory.
+
+        Waits until a running transmission of the spool finished.
+
+        Args:
+            directory: directory for the spool segment files, None to disable spooling
+            max_size: maximum size of the spool in bytes
+            segment_size: size of a spool segment file in bytes
+            overwrite: overwrite the oldest messages if the spool is full, otherwise discard new messages
+
+        """
+        # the transmission reads from the spool, it must not be closed underneath
+        with self._spool_transmit_lock:
+            if self._spool is not None:
+                self._spool.close()
+                self._spool = None
+
+            if directory is not None:
+                self._spool = secsgem.common.SegmentLog(directory, segment_size, max_size, overwrite)
+
+    def _is_spooled(self, function: secsgem.secs.SecsStreamFunction) -> bool:
+        """Check if a function is spooled."""
+        functions = self._spooled_functions.get(function.stream)
+        if functions is None:
+            return False
+
+        return not functions or function.function in functions
+
+    def _send_spoolable(self, function: secsgem.secs.SecsStreamFunction) -> secsgem.common.Message | None:
+        """Send a primary message, spooling it if it can't be delivered.
+
+        Messages that are not spooled are discarded while the host is not communicating.
+        Spooled messages are spooled until the spool was transmitted or purged, so they are sent in order.
+
+        Args:
+            function: function to send
+
+        Returns:
+            response, None if there was no response or the message was spooled or discarded
+
+        """
+        spool = self._spool if self._is_spooled(function) else None
+        spooled = spool is not None
+        communicating = self._communication_state.current == CommunicationState.COMMUNICATING
+
+        if spool is not None and (not communicating or len(spool) > 0):
+            self._spool_function(function)
+            return None
+
+        if not communicating:
+            return None
+
+        if not function.is_reply_required:
+            if not self.send_stream_function(function) and spooled:
+                self._spool_function(function)
+
+            return None
+
+        response = self.send_and_waitfor_response(function)
+        if response is None and spooled:
+            self._spool_function(function)
+
+        return response
+
+    def _spool_function(self, function: secsgem.secs.SecsStreamFunction):
+        """Write a function to the spool."""
+        if self._spool is None:
+            return
+
+        record = _SPOOL_HEADER.pack(function.stream, function.function, function.is_reply_required) + function.encode()
+
+        if not self._spool.append(record):
+            self._logger.warning("spool full, discarding S%dF%d", function.stream, function.function)
+
+    def _on_s02f43(
+        self,
+        _handler: secsgem.secs.SecsHandler,
+        message: secsgem.common.Message,
+    ) -> secsgem.secs.SecsStreamFunction | None:
+        """Handle Stream 2, Function 43, Reset Spooling Streams and Functions.
+
+        Args:
+            handler: handler the message was received on
+            message: complete message received
+
+        """
+        function = self.settings.streams_functions.decode(message)
+
+        spooled_functions: dict[int, list[int]] = {}
+        errors = []
+
+        for stream in function.get():
+            strid = stream["STRID"]
+            fcnids = stream["FCNID"]
+
+            strack = None
+            invalid_fcnids = []
+
+            if strid == 1:
+                strack = self.settings.data_items.STRACK.NOT_ALLOWED
+            elif not self.settings.streams_functions.stream(strid):
+                strack = self.settings.data_items.STRACK.STREAM_UNKNOWN
+            else:
+                for fcnid in fcnids:
+                    if fcnid % 2 == 0:
+                        strack = self.settings.data_items.STRACK.SECONDARY
+                        invalid_fcnids.append(fcnid)
+                    elif self.settings.streams_functions.function(strid, fcnid) is None:
+                        strack = self.settings.data_items.STRACK.FUNCTION_UNKNOWN
+                        invalid_fcnids.append(fcnid)
+
+            if strack is not None:
+                errors.append({"STRID": strid, "STRACK": strack, "FCNID": invalid_fcnids})
+            else:
+                spooled_functions[strid] = list(fcnids)
+
+        if errors:
+            return self.stream_function(2, 44)({"RSPACK": self.settings.data_items.RSPACK.REJECTED, "DATA": errors})
+
+        self._spooled_functions = spooled_functions
+
+        return self.stream_function(2, 44)({"RSPACK": self.settings.data_items.RSPACK.ACK, "DATA": []})
+
+    def _on_s06f23(
+        self,
+        _handler: secsgem.secs.SecsHandler,
+        message: secsgem.common.Message,
+    ) -> secsgem.secs.SecsStreamFunction | None:
+        """Handle Stream 6, Function 23, Request Spooled Data.
+
+        Args:
+            handler: handler the message was received on
+            message: complete message received
+
+        """
+        function = self.settings.streams_functions.decode(message)
+
+        if not self._spool_transmit_lock.acquire(blocking=False):
+            return self.stream_function(6, 24)(self.settings.data_items.RSDA.DENIED_BUSY)
+
+        # read with the lock held, the spool can't be reconfigured until the transmission finished
+        spool = self._spool
+
+        if spool is None or len(spool) == 0:
+            self._spool_transmit_lock.release()
+            return self.stream_function(6, 24)(self.settings.data_items.RSDA.DENIED_NO_DATA)
+
+        if function.get() == self.settings.data_items.RSDC.PURGE:
+            try:
+                spool.clear()
+            finally:
+                self._spool_transmit_lock.release()
+        else:
+            threading.Thread(
+                target=self._transmit_spool,
+                args=(spool,),
+                name=self.settings.generate_thread_name("spool_transmit"),
+                daemon=True,
+            ).start()
+
+        return self.stream_function(6, 24)(self.settings.data_items.RSDA.ACK)
+
+    def _transmit_spool(self, spool: secsgem.common.SegmentLog):
+        """Send the spooled messages, keeping `request_window` requests in flight.
+
+        A message is removed from the spool when it was delivered, the transmission stops at the first message that
+        wasn't delivered.
+        """
+        in_flight: collections.deque[tuple[tuple[int, int], concurrent.futures.Future]] = collections.deque()
+        delivered = True
+
+        try:
+            for position, payload in spool.records():
+                if len(in_flight) >= self.request_window:
+                    delivered = self._finish_spooled(spool, *in_flight.popleft())
+                    if not delivered:
+                        break
+
+                in_flight.append((position, self._send_spooled(payload)))
+
+            for position, future in in_flight:
+                delivered = self._finish_spooled(spool, position, future) and delivered
+        finally:
+            self._spool_transmit_lock.release()
+
+        if not delivered:
+            self._logger.warning("transmitting spool failed, %d messages left", len(spool))
+
+    def _send_spooled(self, payload: bytes) -> concurrent.futures.Future:
+        """Send a spooled message, the future is resolved with None if it wasn't delivered."""
+        stream, function_id, reply_required = _SPOOL_HEADER.unpack_from(payload)
+        function = EncodedFunction(
+            stream,
+            function_id,
+            bool(reply_required),
+            payload[_SPOOL_HEADER.size :],
+            self.settings.streams_functions,
+        )
+
+        if function.is_reply_required:
+            return self.protocol.send_request(typing.cast(secsgem.secs.SecsStreamFunction, function))
+
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        future.set_result(
+            True if self.send_stream_function(typing.cast(secsgem.secs.SecsStreamFunction, function)) else None,
+        )
+        return future
+
+    @staticmethod
+    def _finish_spooled(
+        spool: secsgem.common.SegmentLog,
+        position: tuple[int, int],
+        future: concurrent.futures.Future,
+    ) -> bool:
+        """Wait for a spooled message, removing it from the spool if it was delivered."""
+        if future.result() is None:
+            return False
+
+        spool.consume(position)
+        return True
@@ -17,6 +17,9 @@
 
 from __future__ import annotations
 
+import typing
+
+import secsgem.common
 import secsgem.secs
 
 from .capability import Capability
@@ -31,41 +34,62 @@ class StatusDataCollectionCapability(GemHandler, Capability):
         """Initialize capability."""
         super().__init__(*args, **kwargs)
 
-        self.__status_variables: dict[int | str, StatusVariable] = {
-            StatusVariableId.CLOCK.value: StatusVariable(
-                StatusVariableId.CLOCK,
-                "Clock",
-                "",
-                secsgem.secs.variables.String,
-            ),
-            StatusVariableId.CONTROL_STATE.value: StatusVariable(
-                StatusVariableId.CONTROL_STATE,
-                "ControlState",
-                "",
-                secsgem.secs.variables.Binary,
+        # versioned, so compiled report plans notice status variables being added or replaced
+        self.__status_variables: secsgem.common.VersionedDict[int | str, StatusVariable] = secsgem.common.VersionedDict(
+            {
+                StatusVariableId.CLOCK.value: StatusVariable(
+                    StatusVariableId.CLOCK,
+                    "Clock",
+                    "",
+                    secsgem.secs.variables.String,
+                ),
+                StatusVariableId.CONTROL_STATE.value: StatusVariable(
+                    StatusVariableId.CONTROL_STATE,
+                    "ControlState",
+                    "",
+                    secsgem.secs.variables.Binary,
+                ),
+                StatusVariableId.EVENTS_ENABLED.value: StatusVariable(
+                    StatusVariableId.EVENTS_ENABLED,
+                    "EventsEnabled",
+                    "",
+                    secsgem.secs.variables.Array,
+                ),
+                StatusVariableId.ALARMS_ENABLED.value: StatusVariable(
+                    StatusVariableId.ALARMS_ENABLED,
+                    "AlarmsEnabled",
+                    "",
+                    secsgem.secs.variables.Array,
+                ),
+                StatusVariableId.ALARMS_SET.value: StatusVariable(
+                    StatusVariableId.ALARMS_SET,
+                    "AlarmsSet",
+                    "",
+                    secsgem.secs.variables.Array,
+                ),
+            },
+        )
+
+        # values of the default status variables, looked up by svid
+        self.__default_sv_values: dict[int | str, typing.Callable[[StatusVariable], secsgem.secs.variables.Base]] = {
+            StatusVariableId.CLOCK.value: lambda sv: sv.value_type(self._get_clock()),
+            StatusVariableId.CONTROL_STATE.value: lambda sv: sv.value_type(self._get_control_state_id()),
+            StatusVariableId.EVENTS_ENABLED.value: lambda sv: sv.value_type(
+                self.settings.data_items.SV,
+                self._get_events_enabled(),
             ),
-            StatusVariableId.EVENTS_ENABLED.value: StatusVariable(
-                StatusVariableId.EVENTS_ENABLED,
-                "EventsEnabled",
-                "",
-                secsgem.secs.variables.Array,
+            StatusVariableId.ALARMS_ENABLED.value: lambda sv: sv.value_type(
+                self.settings.data_items.SV,
+                self._get_alarms_enabled(),
             ),
-            StatusVariableId.ALARMS_ENABLED.value: StatusVariable(
-                StatusVariableId.ALARMS_ENABLED,
-                "AlarmsEnabled",
-                "",
-                secsgem.secs.variables.Array,
-            ),
-            StatusVariableId.ALARMS_SET.value: StatusVariable(
-                StatusVariableId.ALARMS_SET,
-                "AlarmsSet",
-                "",
-                secsgem.secs.variables.Array,
+            StatusVariableId.ALARMS_SET.value: lambda sv: sv.value_type(
+                self.settings.data_items.SV,
+                self._get_alarms_set(),
             ),
         }
 
     @property
-    def _status_variables(self) -> dict[int | str, StatusVariable]:
+    def _status_variables(self) -> secsgem.common.VersionedDict[int | str, StatusVariable]:
         return self.__status_variables
 
     @property
@@ -97,6 +121,28 @@ class StatusDataCollectionCapability(GemHandler, Capability):
         """
         return status_variable.value_type(status_variable.value)
 
+    def on_sv_values_request(
+        self,
+        status_variables: list[StatusVariable],
+    ) -> list[secsgem.secs.variables.Base]:
+        """Get the values of several status variables with one request.
+
+        Called with all status variables using the callback that are needed for a report, a status request or a trace
+        sample. Override in inherited class to fetch the values from the equipment with one request, by default
+        :meth:`on_sv_value_request` is called for each status variable.
+
+        Args:
+            status_variables: The status variables requested
+
+        Returns:
+            The values encoded in the corresponding types, in the order of the status variables
+
+        """
+        return [
+            self.on_sv_value_request(status_variable.id_type(status_variable.svid), status_variable)
+            for status_variable in status_variables
+        ]
+
     def _get_sv_value(self, status_variable: StatusVariable) -> secsgem.secs.variables.Base:
         """Get the status variable value depending on its configuation.
 
@@ -107,26 +153,53 @@ class StatusDataCollectionCapability(GemHandler, Capability):
             The value encoded in the corresponding type
 
         """
-        if status_variable.svid == StatusVariableId.CLOCK.value:
-            result = status_variable.value_type(self._get_clock())
-        elif status_variable.svid == StatusVariableId.CONTROL_STATE.value:
-            result = status_variable.value_type(self._get_control_state_id())
-        elif status_variable.svid == StatusVariableId.EVENTS_ENABLED.value:
-            events = self._get_events_enabled()
-            result = status_variable.value_type(self.settings.data_items.SV, events)
-        elif status_variable.svid == StatusVariableId.ALARMS_ENABLED.value:
-            alarms = self._get_alarms_enabled()
-            result = status_variable.value_type(self.settings.data_items.SV, alarms)
-        elif status_variable.svid == StatusVariableId.ALARMS_SET.value:
-            alarms = self._get_alarms_set()
-            result = status_variable.value_type(self.settings.data_items.SV, alarms)
-        else:
-            if status_variable.use_callback:
-                result = self.on_sv_value_request(status_variable.id_type(status_variable.svid), status_variable)
-            else:
-                result = status_variable.value_type(status_variable.value)
+        default_value = self.__default_sv_values.get(status_variable.svid)
+        if default_value is not None:
+            return default_value(status_variable)
 
-        return result
+        if status_variable.use_callback:
+            return self.on_sv_value_request(status_variable.id_type(status_variable.svid), status_variable)
+
+        return status_variable.value_type(status_variable.value)
+
+    def _get_sv_values(self, status_variables: list[StatusVariable]) -> list[secsgem.secs.variables.Base]:
+        """Get the values of several status variables at once.
+
+        The status variables using the callback are requested with one call to :meth:`on_sv_values_request`.
+
+        Args:
+            status_variables: The status variables requested
+
+        Returns:
+            The values encoded in the corresponding types, in the order of the status variables
+
+        Raises:
+            ValueError: if :meth:`on_sv_values_request` didn't return one value per status variable
+
+        """
+        default_values = self.__default_sv_values
+        requested = [
+            status_variable
+            for status_variable in status_variables
+            if status_variable.use_callback and status_variable.svid not in default_values
+        ]
+
+        returned_values = self.on_sv_values_request(requested) if requested else []
+        if len(returned_values) != len(requested):
+            raise ValueError(
+                f"on_sv_values_request returned {len(returned_values)} values for {len(requested)} status variables",
+            )
+
+        requested_values = iter(returned_values)
+
+        return [
+            default_values[status_variable.svid](status_variable)
+            if status_variable.svid in default_values
+            else next(requested_values)
+            if status_variable.use_callback
+            else status_variable.value_type(status_variable.value)
+            for status_variable in status_variables
+        ]
 
     def _on_s01f03(
         self,
@@ -141,18 +214,28 @@ class StatusDataCollectionCapability(GemHandler, Capability):
 
         """
         function = self.settings.streams_functions.decode(message)
+        status_variable_ids = function.get()
 
         responses = []
 
-        if len(function) == 0:
-            responses = [self._get_sv_value(status_variable) for status_variable in self._status_variables.values()]
+        if len(status_variable_ids) == 0:
+            responses = self._get_sv_values(list(self._status_variables.values()))
         else:
-            for status_variable_id in function:
+            values = iter(
+                self._get_sv_values(
+                    [
+                        self._status_variables[status_variable_id]
+                        for status_variable_id in status_variable_ids
+                        if status_variable_id in self._status_variables
+                    ],
+                ),
+            )
+
+            for status_variable_id in status_variable_ids:
                 if status_variable_id not in self._status_variables:
                     responses.append(secsgem.secs.variables.Array(self.settings.data_items.SV, []))
                 else:
-                    status_variable = self._status_variables[status_variable_id]
-                    responses.append(self._get_sv_value(status_variable))
+                    responses.append(next(values))
 
         return self.stream_function(1, 4)(responses)
 
@@ -0,0 +1,88 @@
+#####################################################################
+# trace.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Wrapper for GEM trace."""
+
+from __future__ import annotations
+
+import typing
+
+if typing.TYPE_CHECKING:
+    import secsgem.common
+    import secsgem.secs
+
+    from .status_variable import StatusVariable
+
+
+class Trace:
+    """Representation for a trace initialized by the host."""
+
+    def __init__(
+        self,
+        trid: int | str,
+        period: float,
+        total_samples: int,
+        group_size: int,
+        status_variables: list[StatusVariable],
+    ):
+        """Initialize a trace.
+
+        Args:
+            trid: ID of the trace
+            period: seconds between two samples
+            total_samples: number of samples to take
+            group_size: number of samples sent in one report
+            status_variables: sampled status variables
+
+        """
+        self._trid = trid
+        self._period = period
+        self._total_samples = total_samples
+        self._group_size = group_size
+        self._status_variables = status_variables
+
+        self.sample_number = 0
+        self.values: list[secsgem.secs.variables.Base] = []
+        self.task: secsgem.common.PeriodicTask | None = None
+
+    @property
+    def trid(self) -> int | str:
+        """Get the ID of the trace."""
+        return self._trid
+
+    @property
+    def period(self) -> float:
+        """Get the seconds between two samples."""
+        return self._period
+
+    @property
+    def total_samples(self) -> int:
+        """Get the number of samples to take."""
+        return self._total_samples
+
+    @property
+    def group_size(self) -> int:
+        """Get the number of samples sent in one report."""
+        return self._group_size
+
+    @property
+    def status_variables(self) -> list[StatusVariable]:
+        """Get the sampled status variables."""
+        return self._status_variables
+
+    @property
+    def complete(self) -> bool:
+        """Check if all samples were taken."""
+        return self.sample_number >= self._total_samples
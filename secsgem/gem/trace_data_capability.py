@@ -0,0 +1,229 @@
+#####################################################################
+# trace_data_capability.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Trace Data Collection capability."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import re
+import threading
+import typing
+
+import secsgem.common
+import secsgem.secs
+
+from .capability import Capability
+from .encoded_function import EncodedFunction
+from .handler import GemHandler
+from .trace import Trace
+
+# DSPER formats hhmmss and hhmmsscc
+_DSPER_PATTERN = re.compile(r"^(\d\d)(\d\d)(\d\d)(\d\d)?$")
+
+# used to encode list headers
+_LIST = secsgem.secs.variables.List([])
+
+
+class TraceDataCapability(GemHandler, Capability):
+    """Trace Data Collection capability on GEM equipment.
+
+    Traces initialized by the host with S2F23 are sampled by :meth:`secsgem.common.PeriodicScheduler.shared`, one
+    thread for the traces of all handlers. The status variables of a sample are fetched with one call, the samples of a
+    group are sent with one S6F1 from a separate thread, so sending doesn't delay the sampling.
+    """
+
+    max_traces = 64
+    """Maximum number of traces running at the same time."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize capability."""
+        super().__init__(*args, **kwargs)
+
+        self._traces: dict[int | str, Trace] = {}
+        self._traces_lock = threading.Lock()
+        self._trace_sender: concurrent.futures.ThreadPoolExecutor | None = None
+
+    @property
+    def traces(self) -> dict[int | str, Trace]:
+        """Get the running traces."""
+        return self._traces
+
+    def disable(self) -> None:
+        """Disable the connection, running traces are stopped."""
+        self.stop_traces()
+
+        super().disable()
+
+    def stop_traces(self) -> None:
+        """Stop all running traces and the thread sending their reports."""
+        with self._traces_lock:
+            for trace in self._traces.values():
+                if trace.task is not None:
+                    trace.task.cancel()
+
+            self._traces.clear()
+
+            trace_sender = self._trace_sender
+            self._trace_sender = None
+
+        # reports already queued are still sent, without waiting for them
+        if trace_sender is not None:
+            trace_sender.shutdown(wait=False)
+
+    @staticmethod
+    def _parse_period(dsper: str) -> float | None:
+        """Convert a DSPER to seconds, None if it is invalid."""
+        match = _DSPER_PATTERN.match(dsper)
+        if match is None:
+            return None
+
+        hours, minutes, seconds, centiseconds = match.groups()
+        period = int(hours) * 3600 + int(minutes) * 60 + int(seconds) + int(centiseconds or 0) / 100
+
+        return period if period > 0 else None
+
+    def _start_trace(self, trace: Trace) -> None:
+        """Start sampling a trace, replacing a running trace with the same ID."""
+        with self._traces_lock:
+            previous = self._traces.get(trace.trid)
+            if previous is not None and previous.task is not None:
+                previous.task.cancel()
+
+            self._traces[trace.trid] = trace
+            trace.task = secsgem.common.PeriodicScheduler.shared().schedule(trace.period, self._sample_trace, trace)
+
+    def _stop_trace(self, trace: Trace) -> None:
+        """Stop sampling a trace."""
+        with self._traces_lock:
+            if trace.task is not None:
+                trace.task.cancel()
+
+            if self._traces.get(trace.trid) is trace:
+                del self._traces[trace.trid]
+
+    def _sample_trace(self, trace: Trace) -> None:
+        """Take a sample of a trace, called from the scheduler thread."""
+        try:
+            trace.values.extend(self._get_sv_values(trace.status_variables))
+        except Exception:  # pylint: disable=broad-except
+            self._logger.exception("sampling trace %s failed, stopping trace", trace.trid)
+            self._stop_trace(trace)
+            return
+
+        trace.sample_number += 1
+
+        if trace.sample_number % trace.group_size != 0 and not trace.complete:
+            return
+
+        values = trace.values
+        trace.values = []
+
+        if trace.complete:
+            self._stop_trace(trace)
+
+        sample_time = self._get_clock()
+
+        with self._traces_lock:
+            # trace was stopped while it was sampled
+            if trace.task is not None and trace.task.cancelled and not trace.complete:
+                return
+
+            if self._trace_sender is None:
+                self._trace_sender = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix=self.settings.generate_thread_name("trace_sender"),
+                )
+
+            self._trace_sender.submit(self._send_trace_report, trace.trid, trace.sample_number, sample_time, values)
+
+    def _send_trace_report(
+        self,
+        trid: int | str,
+        sample_number: int,
+        sample_time: str,
+        values: list[secsgem.secs.variables.Base],
+    ) -> None:
+        """Send the samples of a trace group.
+
+        The S6F1 is encoded directly from the sampled values, without building and validating the function first.
+        """
+        try:
+            data = bytearray(_LIST.encode_item_header(4))
+
+            # data items are variables of their configured type
+            for item in (
+                self.settings.data_items.TRID(trid),
+                self.settings.data_items.SMPLN(sample_number),
+                self.settings.data_items.STIME(sample_time),
+            ):
+                typing.cast("secsgem.secs.variables.Base", item).encode_into(data)
+
+            data += _LIST.encode_item_header(len(values))
+
+            for value in values:
+                value.encode_into(data)
+
+            function = EncodedFunction(6, 1, False, bytes(data), self.settings.streams_functions)
+            self._send_spoolable(typing.cast(secsgem.secs.SecsStreamFunction, function))
+        except Exception:  # pylint: disable=broad-except
+            self._logger.exception("sending trace report %s failed", trid)
+
+    def _on_s02f23(
+        self,
+        _handler: secsgem.secs.SecsHandler,
+        message: secsgem.common.Message,
+    ) -> secsgem.secs.SecsStreamFunction | None:
+        """Handle Stream 2, Function 23, Trace Initialize Send.
+
+        Args:
+            handler: handler the message was received on
+            message: complete message received
+
+        """
+        function = self.settings.streams_functions.decode(message)
+
+        trid = function.TRID.get()
+        period = self._parse_period(function.DSPER.get())
+        svids = function.SVID.get()
+
+        try:
+            total_samples = int(function.TOTSMP.get())
+            group_size = int(function.REPGSZ.get())
+        except ValueError:
+            return self.stream_function(2, 24)(self.settings.data_items.TIAACK.REPGSZ_INVALID)
+
+        # zero samples terminate the trace
+        if total_samples == 0:
+            trace = self._traces.get(trid)
+            if trace is not None:
+                self._stop_trace(trace)
+
+            return self.stream_function(2, 24)(self.settings.data_items.TIAACK.OK)
+
+        if period is None:
+            tiaack = self.settings.data_items.TIAACK.INVALID_PERIOD
+        elif group_size < 1 or group_size > total_samples:
+            tiaack = self.settings.data_items.TIAACK.REPGSZ_INVALID
+        elif not svids or any(svid not in self._status_variables for svid in svids):
+            tiaack = self.settings.data_items.TIAACK.SVID_UNKNOWN
+        elif trid not in self._traces and len(self._traces) >= self.max_traces:
+            tiaack = self.settings.data_items.TIAACK.TRACES_DENIED
+        else:
+            status_variables = [self._status_variables[svid] for svid in svids]
+            self._start_trace(Trace(trid, period, total_samples, group_size, status_variables))
+            tiaack = self.settings.data_items.TIAACK.OK
+
+        return self.stream_function(2, 24)(tiaack)
@@ -17,6 +17,7 @@
 
 from secsgem.common.settings import DeviceType
 
+from .connection_manager import HsmsConnectionManager
 from .deselect_req_header import HsmsDeselectReqHeader
 from .deselect_rsp_header import HsmsDeselectRspHeader
 from .header import HsmsHeader, HsmsSType
@@ -28,13 +29,15 @@ from .reject_req_header import HsmsRejectReqHeader
 from .select_req_header import HsmsSelectReqHeader
 from .select_rsp_header import HsmsSelectRspHeader
 from .separate_req_header import HsmsSeparateReqHeader
-from .settings import HsmsConnectMode, HsmsSettings
+from .server import HsmsServer
+from .settings import HsmsConnectMode, HsmsSessionSettings, HsmsSettings
 from .stream_function_header import HsmsStreamFunctionHeader
 
 __all__ = [
     "DeviceType",
     "HsmsBlock",
     "HsmsConnectMode",
+    "HsmsConnectionManager",
     "HsmsDeselectReqHeader",
     "HsmsDeselectRspHeader",
     "HsmsHeader",
@@ -47,6 +50,8 @@ __all__ = [
     "HsmsSelectReqHeader",
     "HsmsSelectRspHeader",
     "HsmsSeparateReqHeader",
+    "HsmsServer",
+    "HsmsSessionSettings",
     "HsmsSettings",
     "HsmsStreamFunctionHeader",
 ]
@@ -0,0 +1,694 @@
+#####################################################################
+# aio.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Asyncio implementation of the HSMS protocol.
+
+In contrast to :class:`secsgem.hsms.HsmsProtocol` no threads are used, all connections are driven by the running event
+loop. Replies are correlated to their requests by the system bytes using futures.
+
+Example:
+    import asyncio
+
+    import secsgem.hsms
+    import secsgem.hsms.aio
+
+    async def main():
+        settings = secsgem.hsms.HsmsSettings(address="10.211.55.33", port=5000)
+
+        protocol = await secsgem.hsms.aio.open_connection(settings)
+        await protocol.wait_selected()
+
+        response = await protocol.send_and_waitfor_response(settings.streams_functions.function(1, 1)())
+        print(settings.streams_functions.decode(response))
+
+        await protocol.close()
+
+    asyncio.run(main())
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import struct
+import typing
+
+import secsgem.common
+
+from .connection_state_machine import ConnectionState, ConnectionStateMachine
+from .deselect_req_header import HsmsDeselectReqHeader
+from .deselect_rsp_header import HsmsDeselectRspHeader
+from .header import HsmsSType
+from .linktest_req_header import HsmsLinktestReqHeader
+from .linktest_rsp_header import HsmsLinktestRspHeader
+from .message import HsmsBlock, HsmsMessage
+from .reject_req_header import HsmsRejectReqHeader
+from .select_req_header import HsmsSelectReqHeader
+from .select_rsp_header import HsmsSelectRspHeader
+from .separate_req_header import HsmsSeparateReqHeader
+from .stream_function_header import HsmsStreamFunctionHeader
+
+if typing.TYPE_CHECKING:
+    from secsgem.secs.functions.base import SecsStreamFunction
+
+    from .settings import HsmsSettings
+
+
+class HsmsAioProtocol(asyncio.Protocol):  # pylint: disable=too-many-instance-attributes,too-many-public-methods
+    """HSMS protocol running on an asyncio event loop.
+
+    The events `connected`, `communicating`, `disconnected` and `message_received` are fired like for
+    :class:`secsgem.hsms.HsmsProtocol`. Event handlers are called from the event loop, so they must not block.
+
+    Like :class:`secsgem.hsms.HsmsProtocol` the connection is closed if it isn't selected within T7, linktests are
+    sent every :attr:`secsgem.hsms.HsmsSettings.linktest_interval` seconds and a linktest without response within T6
+    closes the connection.
+    """
+
+    def __init__(self, settings: HsmsSettings):
+        """Initialize protocol.
+
+        Args:
+            settings: protocol and communication settings
+
+        """
+        super().__init__()
+
+        self._settings = settings
+
+        self._logger = logging.getLogger(self.__module__ + "." + self.__class__.__name__)
+        self._communication_logger = logging.getLogger("communication")
+
+        self._event_producer = secsgem.common.EventProducer()
+        self._event_producer.targets += self
+
+        self._system_counter = random.randint(0, (2**32) - 1)  # noqa: S311
+
+        self._transport: asyncio.Transport | None = None
+        self._receive_buffer = secsgem.common.ByteQueue()
+        self._pending_replies: dict[int, asyncio.Future[HsmsMessage | None]] = {}
+
+        self._connection_state = ConnectionStateMachine()
+        self._connection_state.connected_selected.events.enter.register(self._on_state_select)
+
+        self._hsms_message_handlers: dict[HsmsSType, typing.Callable[[HsmsMessage], None]] = {
+            HsmsSType.SELECT_REQ: self._on_select_req,
+            HsmsSType.SELECT_RSP: self._on_select_rsp,
+            HsmsSType.DESELECT_REQ: self._on_deselect_req,
+            HsmsSType.DESELECT_RSP: self._on_deselect_rsp,
+            HsmsSType.LINKTEST_REQ: self._on_linktest_req,
+            HsmsSType.SEPARATE_REQ: self._on_separate_req,
+        }
+
+        self._selected: asyncio.Event | None = None
+        self._closed: asyncio.Future[None] | None = None
+        self._linktest_handle: asyncio.TimerHandle | None = None
+        self._t7_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def settings(self) -> HsmsSettings:
+        """Get the settings."""
+        return self._settings
+
+    @property
+    def events(self) -> secsgem.common.EventProducer:
+        """Property for event handling."""
+        return self._event_producer
+
+    @property
+    def connection_state(self) -> ConnectionStateMachine:
+        """Property for connection state."""
+        return self._connection_state
+
+    @property
+    def connected(self) -> bool:
+        """Check if the transport is connected."""
+        return self._transport is not None and not self._transport.is_closing()
+
+    @property
+    def selected(self) -> bool:
+        """Check if the connection is selected."""
+        return self._connection_state.current == ConnectionState.CONNECTED_SELECTED
+
+    def get_next_system_counter(self) -> int:
+        """Return the next System.
+
+        Returns:
+            System for the next command
+
+        """
+        self._system_counter += 1
+
+        if self._system_counter > ((2**32) - 1):
+            self._system_counter = 0
+
+        return self._system_counter
+
+    # asyncio.Protocol interface
+
+    def connection_made(self, transport: asyncio.BaseTransport):
+        """Handle connection was established.
+
+        Args:
+            transport: transport of the new connection
+
+        """
+        self._transport = typing.cast(asyncio.Transport, transport)
+        self._selected = asyncio.Event()
+        self._closed = asyncio.get_running_loop().create_future()
+
+        self._connection_state.connect()
+        self._start_linktest_timer()
+        self._t7_handle = asyncio.get_running_loop().call_later(self._settings.timeouts.t7, self._on_t7_timer)
+
+        self.events.fire("connected", {"connection": self})
+
+        if self._settings.is_active:
+            self._start_task(self._initial_select())
+
+    def connection_lost(self, exc: Exception | None):
+        """Handle connection was closed.
+
+        Args:
+            exc: exception that caused the disconnect, None on regular close
+
+        """
+        if exc is not None:
+            self._logger.info("connection lost: %s", exc)
+
+        if self._linktest_handle is not None:
+            self._linktest_handle.cancel()
+            self._linktest_handle = None
+
+        self._cancel_t7_timer()
+
+        for task in list(self._tasks):
+            task.cancel()
+
+        # nobody will answer anymore
+        for future in self._pending_replies.values():
+            if not future.done():
+                future.set_result(None)
+
+        self._pending_replies.clear()
+        self._receive_buffer.clear()
+        self._transport = None
+
+        if self._selected is not None:
+            self._selected.clear()
+
+        if self._connection_state.current != ConnectionState.NOT_CONNECTED:
+            self._connection_state.disconnect()
+
+        if self._closed is not None and not self._closed.done():
+            self._closed.set_result(None)
+
+        self.events.fire("disconnected", {"connection": self})
+
+    def data_received(self, data: bytes):
+        """Handle data received from the transport.
+
+        Args:
+            data: received bytes
+
+        """
+        self._receive_buffer.append(data)
+
+        while len(self._receive_buffer) > 3:
+            length = struct.unpack(">L", self._receive_buffer.peek(4))[0] + 4
+            if len(self._receive_buffer) < length:
+                return
+
+            block = HsmsBlock.decode(self._receive_buffer.pop_view(length))
+            if block is None:
+                continue
+
+            try:
+                self._on_message_received(HsmsMessage.from_block(block))
+            except Exception:  # pylint: disable=broad-except
+                self._logger.exception("ignoring exception for message handler")
+
+    # internal helpers
+
+    def _start_task(self, coroutine: typing.Coroutine) -> asyncio.Task:
+        """Run a coroutine in background, keeping a reference until it is done."""
+        task = asyncio.get_running_loop().create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def _start_linktest_timer(self):
+        """Start the linktest timer."""
+        self._linktest_handle = asyncio.get_running_loop().call_later(
+            self._settings.linktest_interval,
+            self._on_linktest_timer,
+        )
+
+    def _on_linktest_timer(self):
+        """Linktest time timed out, so send linktest request and restart the timer."""
+        self._start_task(self._linktest())
+        self._start_linktest_timer()
+
+    async def _linktest(self):
+        """Send a linktest request, close the connection if it isn't answered."""
+        if await self.send_linktest_req() is None and self.connected:
+            self._logger.warning("linktest failed, disconnecting")
+            typing.cast(asyncio.Transport, self._transport).close()
+
+    def _cancel_t7_timer(self):
+        if self._t7_handle is not None:
+            self._t7_handle.cancel()
+
+        self._t7_handle = None
+
+    def _on_t7_timer(self):
+        """Connection was not selected within T7, so close it."""
+        self._t7_handle = None
+
+        if self._connection_state.current != ConnectionState.CONNECTED_NOT_SELECTED or not self.connected:
+            return
+
+        self._logger.warning("connection not selected within T7, disconnecting")
+        typing.cast(asyncio.Transport, self._transport).close()
+
+    async def _initial_select(self):
+        """Send select request for active connections."""
+        if await self.send_select_req() is None:
+            self._logger.warning("select request failed")
+
+    def _on_state_select(self, _: dict[str, typing.Any]):
+        """Handle connection state model got event select."""
+        self._cancel_t7_timer()
+
+        if self._selected is not None:
+            self._selected.set()
+
+        self.events.fire("communicating", {"connection": self})
+
+    def _resolve_reply(self, message: HsmsMessage) -> bool:
+        """Pass a message to the request waiting for it.
+
+        Args:
+            message: received message
+
+        Returns:
+            True if someone was waiting for the message
+
+        """
+        future = self._pending_replies.pop(message.header.system, None)
+        if future is None:
+            return False
+
+        if not future.done():
+            future.set_result(message)
+
+        return True
+
+    def _on_message_received(self, message: HsmsMessage):
+        """Handle a received message.
+
+        Args:
+            message: received message
+
+        """
+        if message.header.s_type.value > 0:
+            self._on_hsms_message_received(message)
+            return
+
+        if self._communication_logger.isEnabledFor(logging.INFO):
+            self._log_communication(
+                "< %s\n%s",
+                message,
+                secsgem.common.LazySml(message, self._settings.streams_functions),
+            )
+
+        if not self.selected:
+            self._logger.warning("received message when not selected")
+            self._send_control(HsmsRejectReqHeader(message.header.system, message.header.s_type, 4))
+            return
+
+        if not self._resolve_reply(message):
+            self.events.fire("message_received", {"connection": self, "message": message})
+
+    def _on_hsms_message_received(self, message: HsmsMessage):
+        """Handle HSMS control messages.
+
+        Args:
+            message: received message
+
+        """
+        self._log_communication("< %s\n  %s", message, message.header.s_type.text)
+
+        handler = self._hsms_message_handlers.get(message.header.s_type, self._resolve_reply)
+        handler(message)
+
+    def _on_select_req(self, message: HsmsMessage):
+        """Handle HSMS Select Request.
+
+        Args:
+            message: received message
+
+        """
+        self._send_control(HsmsSelectRspHeader(message.header.system))
+
+        if self._connection_state.current == ConnectionState.CONNECTED_NOT_SELECTED:
+            self._connection_state.select()
+
+    def _on_select_rsp(self, message: HsmsMessage):
+        """Handle HSMS Select Response.
+
+        Args:
+            message: received message
+
+        """
+        if self._connection_state.current == ConnectionState.CONNECTED_NOT_SELECTED:
+            self._connection_state.select()
+
+        self._resolve_reply(message)
+
+    def _on_deselect_req(self, message: HsmsMessage):
+        """Handle HSMS Deselect Request.
+
+        Args:
+            message: received message
+
+        """
+        self._send_control(HsmsDeselectRspHeader(message.header.system))
+
+        if self.selected:
+            self._connection_state.deselect()
+
+    def _on_deselect_rsp(self, message: HsmsMessage):
+        """Handle HSMS Deselect Response.
+
+        Args:
+            message: received message
+
+        """
+        if self.selected:
+            self._connection_state.deselect()
+
+        self._resolve_reply(message)
+
+    def _on_linktest_req(self, message: HsmsMessage):
+        """Handle HSMS Linktest Request.
+
+        Args:
+            message: received message
+
+        """
+        self._send_control(HsmsLinktestRspHeader(message.header.system))
+
+    def _on_separate_req(self, _message: HsmsMessage):
+        """Handle HSMS Separate Request."""
+        if self._transport is not None:
+            self._transport.close()
+
+    def _send_control(self, header: secsgem.common.Header) -> HsmsMessage | None:
+        """Send a HSMS control message.
+
+        Args:
+            header: header of the control message
+
+        Returns:
+            sent message or None if sending failed
+
+        """
+        message = HsmsMessage(header, b"")
+        self._log_communication("> %s\n  %s", message, message.header.s_type.text)
+
+        if not self.send_message(message):
+            return None
+
+        return message
+
+    async def _request(self, system_id: int, send: typing.Callable[[], bool], timeout: float) -> HsmsMessage | None:
+        """Send a request and wait for the reply with the same system.
+
+        Args:
+            system_id: system of the request
+            send: function sending the request, returns False if sending failed
+            timeout: seconds to wait for the reply
+
+        Returns:
+            received reply or None if sending failed, on timeout or disconnect
+
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending_replies[system_id] = future
+
+        try:
+            if not send():
+                return None
+
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self._pending_replies.pop(system_id, None)
+
+    def _get_log_extra(self) -> dict[str, typing.Any]:
+        """Get extra fields for logging."""
+        return {
+            "address": self._settings.address,
+            "port": self._settings.port,
+            "device_id": self._settings.device_id,
+            "remoteName": self._settings.name,
+        }
+
+    def _log_communication(self, msg: str, *args: typing.Any) -> None:
+        """Write to the communication log, nothing is evaluated if the log is disabled."""
+        if self._communication_logger.isEnabledFor(logging.INFO):
+            self._communication_logger.info(msg, *args, extra=self._get_log_extra(), stacklevel=2)
+
+    # public interface
+
+    def send_message(self, message: HsmsMessage) -> bool:
+        """Write a message to the transport.
+
+        Args:
+            message: message to be transmitted
+
+        Returns:
+            False if not connected
+
+        """
+        if not self.connected:
+            return False
+
+        transport = typing.cast(asyncio.Transport, self._transport)
+        for block in message.blocks:
+            transport.writelines(block.encode_buffers())
+
+        return True
+
+    def send_stream_function(self, function: SecsStreamFunction) -> bool:
+        """Send a stream function without waiting for a reply.
+
+        Args:
+            function: function to be sent
+
+        Returns:
+            False if sending failed
+
+        """
+        return self._send_function(function, self.get_next_system_counter())
+
+    def send_response(self, function: SecsStreamFunction, system: int) -> bool:
+        """Send the response for a received function.
+
+        Args:
+            function: reply function
+            system: system of the request
+
+        Returns:
+            False if sending failed
+
+        """
+        return self._send_function(function, system)
+
+    def _send_function(self, function: SecsStreamFunction, system: int) -> bool:
+        message = HsmsMessage(
+            HsmsStreamFunctionHeader(
+                system,
+                function.stream,
+                function.function,
+                function.is_reply_required,
+                self._settings.device_id,
+            ),
+            function.encode(),
+        )
+        if self._communication_logger.isEnabledFor(logging.INFO):
+            self._log_communication("> %s\n%s", message, secsgem.common.LazySml(function))
+
+        return self.send_message(message)
+
+    async def send_and_waitfor_response(self, function: SecsStreamFunction) -> HsmsMessage | None:
+        """Send a stream function and wait for the reply.
+
+        Args:
+            function: function to be sent
+
+        Returns:
+            received reply or None if sending failed, on T3 timeout or disconnect
+
+        """
+        system_id = self.get_next_system_counter()
+
+        return await self._request(
+            system_id,
+            lambda: self._send_function(function, system_id),
+            self._settings.timeouts.t3,
+        )
+
+    async def send_select_req(self) -> HsmsMessage | None:
+        """Send a Select Request to the remote host.
+
+        Returns:
+            received response or None if sending failed, on T6 timeout or disconnect
+
+        """
+        return await self._control_request(HsmsSelectReqHeader)
+
+    async def send_linktest_req(self) -> HsmsMessage | None:
+        """Send a Linktest Request to the remote host.
+
+        Returns:
+            received response or None if sending failed, on T6 timeout or disconnect
+
+        """
+        return await self._control_request(HsmsLinktestReqHeader)
+
+    async def send_deselect_req(self) -> HsmsMessage | None:
+        """Send a Deselect Request to the remote host.
+
+        Returns:
+            received response or None if sending failed, on T6 timeout or disconnect
+
+        """
+        return await self._control_request(HsmsDeselectReqHeader)
+
+    async def _control_request(
+        self,
+        header_class: type[HsmsSelectReqHeader | HsmsLinktestReqHeader | HsmsDeselectReqHeader],
+    ) -> HsmsMessage | None:
+        system_id = self.get_next_system_counter()
+
+        return await self._request(
+            system_id,
+            lambda: self._send_control(header_class(system_id)) is not None,
+            self._settings.timeouts.t6,
+        )
+
+    def send_separate_req(self) -> int | None:
+        """Send a Separate Request to the remote host.
+
+        Returns:
+            system id of the request or None if sending failed
+
+        """
+        system_id = self.get_next_system_counter()
+
+        if self._send_control(HsmsSeparateReqHeader(system_id)) is None:
+            return None
+
+        return system_id
+
+    async def wait_selected(self, timeout: float | None = None) -> bool:
+        """Wait until the connection is selected.
+
+        Args:
+            timeout: seconds to wait, None to wait forever
+
+        Returns:
+            False on timeout or if not connected
+
+        """
+        if self._selected is None:
+            return False
+
+        try:
+            await asyncio.wait_for(self._selected.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+
+        return True
+
+    async def close(self):
+        """Send a separate request and close the connection."""
+        if not self.connected:
+            return
+
+        self.send_separate_req()
+
+        typing.cast(asyncio.Transport, self._transport).close()
+
+        if self._closed is not None:
+            await self._closed
+
+
+async def open_connection(
+    settings: HsmsSettings,
+    protocol_class: type[HsmsAioProtocol] = HsmsAioProtocol,
+) -> HsmsAioProtocol:
+    """Open an active HSMS connection on the running event loop.
+
+    The connection is not reestablished automatically after it was closed.
+
+    Args:
+        settings: protocol and communication settings
+        protocol_class: protocol class to create
+
+    Returns:
+        connected protocol, select is started automatically for active connections
+
+    """
+    loop = asyncio.get_running_loop()
+
+    _, protocol = await loop.create_connection(lambda: protocol_class(settings), settings.address, settings.port)
+
+    return protocol
+
+
+async def start_server(
+    settings: HsmsSettings,
+    on_connection: typing.Callable[[HsmsAioProtocol], None] | None = None,
+    protocol_class: type[HsmsAioProtocol] = HsmsAioProtocol,
+) -> asyncio.AbstractServer:
+    """Start a passive HSMS server on the running event loop.
+
+    Args:
+        settings: protocol and communication settings
+        on_connection: called with the protocol of each new connection, before it is connected
+        protocol_class: protocol class to create
+
+    Returns:
+        started server
+
+    """
+    loop = asyncio.get_running_loop()
+
+    def _create_protocol() -> HsmsAioProtocol:
+        protocol = protocol_class(settings)
+
+        if on_connection is not None:
+            on_connection(protocol)
+
+        return protocol
+
+    return await loop.create_server(_create_protocol, settings.address, settings.port)
@@ -0,0 +1,255 @@
+#####################################################################
+# connection_manager.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Manager running many HSMS connections on shared threads."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import typing
+
+import secsgem.common
+from secsgem.common.pooled_protocol_dispatcher import PooledProtocolDispatcher
+from secsgem.common.selector_loop import SelectorLoop
+from secsgem.common.selector_tcp_accepted_connection import SelectorTcpAcceptedConnection
+from secsgem.common.selector_tcp_client_connection import SelectorTcpClientConnection
+
+from .server import HsmsServer
+from .settings import HsmsConnectMode, HsmsSettings
+
+if typing.TYPE_CHECKING:
+    from secsgem.common.settings import TimerHandle
+    from secsgem.secs import SecsHandler
+
+    from .settings import HsmsSessionSettings
+
+HandlerT = typing.TypeVar("HandlerT", bound="SecsHandler")
+
+
+class HsmsConnectionManager:
+    """Runs many HSMS connections on one selector loop and a bounded pool of worker threads.
+
+    All active connections do their socket I/O in a single thread.
+    Message handlers and connection events are called by `max_workers` threads, messages of a connection are still
+    handled one after another in the order they were received.
+    Received blocks are decoded and queued blocks are sent by `max_io_workers` threads.
+    Timers (linktest, select, communication establishment) are called by `max_timer_workers` threads.
+    The pools are separate, as handlers and timers wait for their messages to be sent and their replies to be received.
+
+    Connections are attached to the manager with the `connection_manager` setting, passive connections still wait for
+    the remote in an own thread.
+    Passive endpoints accepting many remotes on one port are created with :meth:`create_server`.
+
+    Example:
+        >>> import secsgem.hsms
+        >>>
+        >>> manager = secsgem.hsms.HsmsConnectionManager(max_workers=4)
+        >>> manager.start()
+        >>> handler = manager.create_handler(address="127.0.0.1", port=5000, device_id=0)
+        >>> len(manager.handlers)
+        1
+        >>> manager.stop()
+
+    """
+
+    def __init__(self, max_workers: int = 8, max_io_workers: int = 2, max_timer_workers: int = 4):
+        """Initialize connection manager.
+
+        Args:
+            max_workers: number of threads calling handlers
+            max_io_workers: number of threads processing received and sent data
+            max_timer_workers: number of threads calling timers
+
+        """
+        self._logger = logging.getLogger(self.__module__ + "." + self.__class__.__name__)
+
+        self._loop = SelectorLoop("secsgem_hsmsConnectionManager_loop")
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers,
+            thread_name_prefix="secsgem_hsmsConnectionManager_worker",
+        )
+        self._io_executor = concurrent.futures.ThreadPoolExecutor(
+            max_io_workers,
+            thread_name_prefix="secsgem_hsmsConnectionManager_io",
+        )
+        self._timer_executor = concurrent.futures.ThreadPoolExecutor(
+            max_timer_workers,
+            thread_name_prefix="secsgem_hsmsConnectionManager_timer",
+        )
+
+        self._connections: list[secsgem.common.Connection] = []
+        self._handlers: list[SecsHandler] = []
+        self._servers: list[HsmsServer] = []
+
+    @property
+    def loop(self) -> SelectorLoop:
+        """Loop doing the socket I/O."""
+        return self._loop
+
+    @property
+    def executor(self) -> concurrent.futures.Executor:
+        """Executor calling handlers."""
+        return self._executor
+
+    @property
+    def handlers(self) -> list[SecsHandler]:
+        """Handlers created by this manager."""
+        return self._handlers
+
+    @property
+    def connections(self) -> list[secsgem.common.Connection]:
+        """Connections created by this manager."""
+        return self._connections
+
+    def start(self) -> None:
+        """Start the I/O thread, required before enabling connections."""
+        self._loop.start()
+
+    @property
+    def servers(self) -> list[HsmsServer]:
+        """Servers created by this manager."""
+        return self._servers
+
+    def stop(self) -> None:
+        """Stop all servers, disable all connections and stop the threads."""
+        for server in self._servers:
+            server.stop()
+
+        for connection in self._connections:
+            connection.disable()
+
+        self._loop.stop()
+
+        self._executor.shutdown(wait=True)
+        self._io_executor.shutdown(wait=True)
+        self._timer_executor.shutdown(wait=True)
+
+    def create_handler(self, handler_class: type[HandlerT] | None = None, **kwargs) -> HandlerT:
+        """Create a handler for a connection run by this manager.
+
+        Args:
+            handler_class: handler class to create, defaults to :class:`secsgem.gem.GemHostHandler`
+            kwargs: arguments for :class:`HsmsSettings`
+
+        Returns:
+            created handler
+
+        """
+        if handler_class is None:
+            from secsgem.gem import GemHostHandler  # pylint: disable=import-outside-toplevel
+
+            handler_class = typing.cast("type[HandlerT]", GemHostHandler)
+
+        handler = handler_class(HsmsSettings(connection_manager=self, **kwargs))
+        self._handlers.append(handler)
+
+        return handler
+
+    def create_server(self, handler_class: type[SecsHandler] | None = None, **kwargs) -> HsmsServer:
+        """Create a passive endpoint accepting any number of connections, run by this manager.
+
+        Args:
+            handler_class: handler class created for each session, defaults to :class:`secsgem.gem.GemEquipmentHandler`
+            kwargs: arguments for :class:`HsmsServer` and the sessions :class:`HsmsSettings`
+
+        Returns:
+            created server, call :meth:`HsmsServer.start` to start listening
+
+        """
+        server = HsmsServer(self, handler_class, **kwargs)
+        self._servers.append(server)
+
+        return server
+
+    def create_connection(self, settings: HsmsSettings) -> secsgem.common.Connection:
+        """Create a connection run by this manager.
+
+        Args:
+            settings: settings of the connection
+
+        Returns:
+            created connection
+
+        """
+        connection: secsgem.common.Connection
+        if settings.connect_mode == HsmsConnectMode.ACTIVE:
+            connection = SelectorTcpClientConnection(settings, self._loop, self._executor)
+        else:
+            connection = secsgem.common.TcpServerConnection(settings)
+
+        self._connections.append(connection)
+
+        return connection
+
+    def create_session_connection(self, settings: HsmsSessionSettings) -> secsgem.common.Connection:
+        """Create a connection for a socket accepted by a server of this manager.
+
+        Args:
+            settings: settings of the session
+
+        Returns:
+            created connection
+
+        """
+        return SelectorTcpAcceptedConnection(settings, settings.session_socket, self._loop, self._executor)
+
+    def create_dispatcher(
+        self,
+        receiver_target: typing.Callable,
+        dispatcher_target: typing.Callable,
+        settings: HsmsSettings,
+    ) -> PooledProtocolDispatcher:
+        """Create a dispatcher running on the worker and I/O threads of this manager.
+
+        Args:
+            receiver_target: function to call when receiver triggered
+            dispatcher_target: function to call when message available for dispatch
+            settings: settings of the connection
+
+        Returns:
+            created dispatcher
+
+        """
+        return PooledProtocolDispatcher(
+            receiver_target,
+            dispatcher_target,
+            settings,
+            self._io_executor,
+            self._executor,
+        )
+
+    def start_timer(self, interval: float, function: typing.Callable[[], None], functionality: str) -> TimerHandle:
+        """Call a function on a timer thread of this manager after an interval.
+
+        Args:
+            interval: seconds to wait before calling the function
+            function: function to call
+            functionality: name of the functionality, used for logging
+
+        Returns:
+            handle to cancel the timer
+
+        """
+        return self._loop.call_later(interval, self._submit_timer, function, functionality)
+
+    def _submit_timer(self, function: typing.Callable[[], None], functionality: str) -> None:
+        self._timer_executor.submit(self._run_timer, function, functionality)
+
+    def _run_timer(self, function: typing.Callable[[], None], functionality: str) -> None:
+        try:
+            function()
+        except Exception:  # pylint: disable=broad-except
+            self._logger.exception("ignoring exception in timer %s", functionality)
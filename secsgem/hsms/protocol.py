@@ -17,9 +17,10 @@
 
 from __future__ import annotations
 
-import queue
+import concurrent.futures
+import logging
 import struct
-import threading
+import time
 import typing
 
 import secsgem.common
@@ -27,7 +28,7 @@ import secsgem.common
 from .connection_state_machine import ConnectionState, ConnectionStateMachine
 from .deselect_req_header import HsmsDeselectReqHeader
 from .deselect_rsp_header import HsmsDeselectRspHeader
-from .header import HsmsSType
+from .header import HsmsHeader, HsmsSType
 from .linktest_req_header import HsmsLinktestReqHeader
 from .linktest_rsp_header import HsmsLinktestRspHeader
 from .message import HsmsBlock, HsmsMessage
@@ -39,6 +40,7 @@ from .stream_function_header import HsmsStreamFunctionHeader
 
 if typing.TYPE_CHECKING:
     from secsgem.common.protocol import Protocol
+    from secsgem.common.settings import TimerHandle
     from secsgem.secs.functions.base import SecsStreamFunction
 
     from .settings import HsmsSettings
@@ -52,7 +54,7 @@ class HsmsProtocol(secsgem.common.Protocol[HsmsMessage, HsmsBlock]):  # pylint:
     """
 
     send_packet_size = 1024 * 1024
-    """ Block size for outbound data ."""
+    """ Maximum number of bytes coalesced from queued blocks into one write ."""
 
     message_type = HsmsMessage
 
@@ -90,11 +92,13 @@ class HsmsProtocol(secsgem.common.Protocol[HsmsMessage, HsmsBlock]):  # pylint:
         self._connected = False
 
         # repeating linktest variables
-        self._linktest_timer = None
-        self._linktest_timeout = 30
+        self._linktest_timer: TimerHandle | None = None
+        self._linktest_timeout = settings.linktest_interval
 
-        # select request thread for active connections, to avoid blocking state changes
-        self._select_req_thread: threading.Thread | None = None
+        # not selected (T7) and network intercharacter (T8) timers
+        self._t7_timer: TimerHandle | None = None
+        self._t8_timer: TimerHandle | None = None
+        self._last_data_received = 0.0
 
         # hsms connection state fsm
         self._connection_state = ConnectionStateMachine()
@@ -109,20 +113,31 @@ class HsmsProtocol(secsgem.common.Protocol[HsmsMessage, HsmsBlock]):  # pylint:
         return self._connection_state
 
     def _send_select_req_thread(self):
-        """Send select request thread function."""
+        """Send select request, the response is handled without waiting for it."""
+        # the connection was closed before the timer thread got here
+        if self._connection_state.current != ConnectionState.CONNECTED_NOT_SELECTED:
+            return
+
         try:
-            response = self.send_select_req()
-            if response is None:
-                self._logger.warning("select request failed")
+            future = self._request_control(HsmsMessage(HsmsSelectReqHeader(self.get_next_system_counter()), b""))
         except Exception as exc:  # pylint: disable=broad-exception-caught
             self._logger.warning("exception in _send_select_req_thread", exc_info=exc)
+            return
+
+        future.add_done_callback(self._on_select_rsp)
+
+    def _on_select_rsp(self, future: concurrent.futures.Future[secsgem.common.Message | None]):
+        """Handle the response of a select request sent by the select timer."""
+        if future.result() is None:
+            self._logger.warning("select request failed")
 
     def _start_linktest_timer(self):
         """Start the linktest timer."""
-        self._linktest_timer = threading.Timer(self._linktest_timeout, self._on_linktest_timer)
-        self._linktest_timer.daemon = True  # kill thread automatically on main program termination
-        self._linktest_timer.name = "secsgem_hsmsProtocol_linktestTimer"
-        self._linktest_timer.start()
+        self._linktest_timer = self._settings.start_timer(
+            self._linktest_timeout,
+            self._on_linktest_timer,
+            "hsmsProtocol_linktestTimer",
+        )
 
     def _on_state_connect(self, _: dict[str, typing.Any]):
         """Handle connection state model got event connect.
@@ -134,14 +149,12 @@ class HsmsProtocol(secsgem.common.Protocol[HsmsMessage, HsmsBlock]):  # pylint:
         # start linktest timer
         self._start_linktest_timer()
 
-        # start select process if connection is active
+        # close the connection if it is not selected in time, checked without occupying a timer thread
+        self._t7_timer = self._settings.call_later(self._settings.timeouts.t7, self._on_t7_timer)
+
+        # start select process if connection is active, in background to avoid blocking state changes
         if self._settings.is_active:
-            self._select_req_thread = threading.Thread(
-                target=self._send_select_req_thread,
-                name="secsgem_hsmsProtocol_sendSelectReqThread",
-            )
-            self._select_req_thread.daemon = True  # kill thread automatically on main program termination
-            self._select_req_thread.start()
+            self._settings.start_timer(0, self._send_select_req_thread, "hsmsProtocol_sendSelectReqThread")
 
     def _on_state_disconnect(self, _: dict[str, typing.Any]):
         """Handle connection state model got event disconnect.
@@ -156,6 +169,12 @@ class HsmsProtocol(secsgem.common.Protocol[HsmsMessage, HsmsBlock]):  # pylint:
 
         self._linktest_timer = None
 
+        self._cancel_t7_timer()
+
+        if self._t8_timer is not None:
+            self._t8_timer.cancel()
+            self._t8_timer = None
+
     def _on_state_select(self, _: dict[str, typing.Any]):
         """Handle connection state model got event select.
 
@@ -163,15 +182,58 @@ class HsmsProtocol(secsgem.common.Protocol[HsmsMessage, HsmsBlock]):  # pylint:
             data: event attributes
 
         """
+        self._cancel_t7_timer()
+
         # send event
         self.events.fire("communicating", {"connection": self})
 
+    def _cancel_t7_timer(self):
+        if self._t7_timer is not None:
+            self._t7_timer.cancel()
+
+        self._t7_timer = None
+
+    def _on_t7_timer(self):
+        """Connection was not selected within T7, so close it."""
+        self._t7_timer = None
+
+        if self._connection_state.current != ConnectionState.CONNECTED_NOT_SELECTED:
+            return
+
+        self._logger.warning("connection not selected within T7, disconnecting")
+        self._disconnect_later()
+
+    def _on_t8_timer(self):
+        """Check if the rest of an incomplete block was received within T8, close the connection otherwise."""
+        self._t8_timer = None
+
+        if len(self._receive_buffer) == 0 or not self._connected:
+            return
+
+        remaining = self._last_data_received + self._settings.timeouts.t8 - time.monotonic()
+        if remaining > 0:
+            self._t8_timer = self._settings.call_later(remaining, self._on_t8_timer)
+            return
+
+        self._logger.warning("incomplete block not received within T8, disconnecting")
+        self._disconnect_later()
+
+    def _disconnect_later(self):
+        """Close the connection from a timer thread, the T7 and T8 timers must not block."""
+        self._settings.start_timer(0, self._connection.disconnect, "hsmsProtocol_disconnect")
+
     def _on_linktest_timer(self):
         """Linktest time timed out, so send linktest request."""
-        # send linktest request and wait for response
-        self.send_linktest_req()
+        # restart the timer when the response was received, without waiting for it
+        future = self._request_control(HsmsMessage(HsmsLinktestReqHeader(self.get_next_system_counter()), b""))
+        future.add_done_callback(self._on_linktest_rsp)
+
+    def _on_linktest_rsp(self, _: concurrent.futures.Future[secsgem.common.Message | None]):
+        """Handle the response of a linktest request sent by the linktest timer."""
+        # timer was stopped on disconnect
+        if self._linktest_timer is None:
+            return
 
-        # restart the timer
         self._start_linktest_timer()
 
     def _on_connected(self, _: dict[str, typing.Any]):
@@ -183,6 +245,7 @@ class HsmsProtocol(secsgem.common.Protocol[HsmsMessage, HsmsBlock]):  # pylint:
         """
         self._connected = True
 
+        self._send_queue.open()
         self._thread.start()
 
         # update connection state
@@ -214,6 +277,10 @@ class HsmsProtocol(secsgem.common.Protocol[HsmsMessage, HsmsBlock]):  # pylint:
         self._thread.stop()
         self._receive_buffer.clear()
 
+        # nobody sends the queued blocks or answers the open requests anymore
+        self._send_queue.close()
+        self._pending_transactions.clear()
+
         self.events.fire("disconnected", {"connection": self})
 
     def __handle_hsms_requests_select_req(self, message: HsmsMessage):
@@ -239,8 +306,7 @@ class HsmsProtocol(secsgem.common.Protocol[HsmsMessage, HsmsBlock]):  # pylint:
         """
         self._connection_state.select()
 
-        if message.header.system in self._response_queues:
-            self._response_queues[message.header.system].put_nowait(message)
+        self._resolve_response(message)
 
     def __handle_hsms_requests_deselect_req(self, message: HsmsMessage):
         """Handle HSMS Deselect Request.
@@ -265,8 +331,7 @@ class HsmsProtocol(secsgem.common.Protocol[HsmsMessage, HsmsBlock]):  # pylint:
         """
         self._connection_state.deselect()
 
-        if message.header.system in self._response_queues:
-            self._response_queues[message.header.system].put_nowait(message)
+        self._resolve_response(message)
 
     def __handle_hsms_requests_linktest_req(self, message: HsmsMessage):
         """Handle HSMS Linktest Request.
@@ -287,7 +352,7 @@ class HsmsProtocol(secsgem.common.Protocol[HsmsMessage, HsmsBlock]):  # pylint:
             message: received message
 
         """
-        self._communication_logger.info("< %s\n  %s", message, message.header.s_type.text, extra=self._get_log_extra())
+        self._log_communication("< %s\n  %s", message, message.header.s_type.text)
 
         if message.header.s_type == HsmsSType.SELECT_REQ:
             self.__handle_hsms_requests_select_req(message)
@@ -300,25 +365,41 @@ class HsmsProtocol(secsgem.common.Protocol[HsmsMessage, HsmsBlock]):  # pylint:
         elif message.header.s_type == HsmsSType.LINKTEST_REQ:
             self.__handle_hsms_requests_linktest_req(message)
         else:
-            if message.header.system in self._response_queues:
-                self._response_queues[message.header.system].put_nowait(message)
+            self._resolve_response(message)
+
+    def _on_connection_data_received(self, data: dict[str, typing.Any]):
+        """Method called when data is received by connection.
+
+        Args:
+            data: received data
+
+        """
+        self._last_data_received = time.monotonic()
+
+        super()._on_connection_data_received(data)
 
     def _process_received_data(self):
         """Process the received data from communication queue."""
-        if len(self._receive_buffer) < 4:
-            return
-
         while len(self._receive_buffer) > 3:
-            length_data = self._receive_buffer.wait_for(4, peek=True)
+            length_data = self._receive_buffer.peek(4)
             length = struct.unpack(">L", length_data)[0] + 4
 
-            data = self._receive_buffer.wait_for(length)
+            # block incomplete, processing continues when more data is received
+            if len(self._receive_buffer) < length:
+                break
+
+            # decode straight from the receive buffer, without copying the block first
+            data = self._receive_buffer.pop_view(length)
 
             # decode received message
             response = HsmsBlock.decode(data)
 
             self._thread.queue_block(self, response)
 
+        # the rest of an incomplete block must follow within T8, checked by one timer per block
+        if len(self._receive_buffer) > 0 and self._t8_timer is None:
+            self._t8_timer = self._settings.call_later(self._settings.timeouts.t8, self._on_t8_timer)
+
     def _on_connection_message_received(self, _: Protocol, message: HsmsMessage):
         """Message received by connection.
 
@@ -330,29 +411,24 @@ class HsmsProtocol(secsgem.common.Protocol[HsmsMessage, HsmsBlock]):  # pylint:
         if message.header.s_type.value > 0:
             self.__handle_hsms_requests(message)
         else:
-            decoded_message = self._settings.streams_functions.decode(message)
-            self._communication_logger.info("< %s\n%s", message, decoded_message, extra=self._get_log_extra())
+            if self._communication_logger.isEnabledFor(logging.INFO):
+                self._log_communication(
+                    "< %s\n%s",
+                    message,
+                    secsgem.common.LazySml(message, self._settings.streams_functions),
+                )
 
             if self._connection_state.current != ConnectionState.CONNECTED_SELECTED:
                 self._logger.warning("received message when not selected")
 
                 out_message = HsmsMessage(HsmsRejectReqHeader(message.header.system, message.header.s_type, 4), b"")
-                self._communication_logger.info(
-                    "> %s\n  %s",
-                    out_message,
-                    out_message.header.s_type.text,
-                    extra=self._get_log_extra(),
-                )
+                self._log_communication("> %s\n  %s", out_message, out_message.header.s_type.text)
                 self.send_message(out_message)
 
                 return
 
-            # someone is waiting for this message
-            if message.header.system in self._response_queues:
-                # send message to request sender
-                self._response_queues[message.header.system].put_nowait(message)
-            # just log if nobody is interested
-            else:
+            # pass to the request sender if someone is waiting for this message
+            if not self._resolve_response(message):
                 self.events.fire("message_received", {"connection": self, "message": message})
 
     def serialize_data(self) -> dict[str, typing.Any]:
@@ -372,24 +448,52 @@ class HsmsProtocol(secsgem.common.Protocol[HsmsMessage, HsmsBlock]):  # pylint:
         }
 
     def _process_send_queue(self):
-        """Process the send to communication queue."""
-        if self._send_queue.empty():
-            return
+        """Process the send to communication queue.
+
+        Queued blocks are coalesced, up to `send_packet_size` bytes are written with one call to the connection.
+        Blocks stay queued while the connection isn't writable, sending continues when it becomes writable again.
+        """
+        while not self._send_queue.empty() and self._connection.writable:
+            block_infos = [self._send_queue.get()]
+            size = len(block_infos[0])
+
+            while size < self.send_packet_size and not self._send_queue.empty():
+                block_infos.append(self._send_queue.get())
+                size += len(block_infos[-1])
+
+            result = False
+
+            try:
+                result = self._connection.send_buffers([buffer for info in block_infos for buffer in info.buffers])
+            finally:
+                # also resolved if the connection was closed while sending, the senders wait for the result
+                for block_info in block_infos:
+                    block_info.resolve(result)
+
+                if not result:
+                    # blocks of a message are queued together, fail the rest instead of leaving the senders waiting
+                    while not self._send_queue.empty():
+                        self._send_queue.get().resolve(False)
+
+            if not result:
+                return
 
-        while not self._send_queue.empty():
-            block_info = self._send_queue.get()
+    def _send_priority(self, message: secsgem.common.Message) -> secsgem.common.SendPriority:
+        """Get the priority of a message in the send queue.
 
-            packets = [
-                block_info.data[i : i + self.send_packet_size]
-                for i in range(0, len(block_info.data), self.send_packet_size)
-            ]
+        HSMS control messages are sent before data messages.
 
-            for packet in packets:
-                if not self._connection.send_data(packet):
-                    block_info.resolve(False)
-                    return
+        Args:
+            message: message to send
+
+        Returns:
+            priority of the message
 
-            block_info.resolve(True)
+        """
+        if isinstance(message.header, HsmsHeader) and message.header.s_type.value > 0:
+            return secsgem.common.SendPriority.CONTROL
+
+        return super()._send_priority(message)
 
     def _create_message_for_function(
         self,
@@ -417,32 +521,51 @@ class HsmsProtocol(secsgem.common.Protocol[HsmsMessage, HsmsBlock]):  # pylint:
             function.encode(),
         )
 
-    def send_select_req(self) -> HsmsMessage | None:
-        """Send a Select Request to the remote host.
+    def _request_control(self, message: HsmsMessage) -> concurrent.futures.Future[secsgem.common.Message | None]:
+        """Send a control message without waiting for the response.
+
+        Args:
+            message: control message to send
 
         Returns:
-            received message or None
+            future resolved with the received message or None if sending failed or no response was received within T6
 
         """
-        system_id = self.get_next_system_counter()
-
-        response_queue = self._get_queue_for_system(system_id)
+        future = self._pending_transactions.add(message.header.system, self._settings.timeouts.t6)
 
-        message = HsmsMessage(HsmsSelectReqHeader(system_id), b"")
-        self._communication_logger.info("> %s\n  %s", message, message.header.s_type.text, extra=self._get_log_extra())
+        self._log_communication("> %s\n  %s", message, message.header.s_type.text)
 
         if not self.send_message(message):
-            self._remove_queue(system_id)
-            return None
+            self._pending_transactions.resolve(message.header.system, None)
+
+        return future
+
+    def _send_control_request(self, message: HsmsMessage) -> HsmsMessage | None:
+        """Send a control message and wait for the response.
+
+        Args:
+            message: control message to send
+
+        Returns:
+            received message or None if sending failed or no response was received within T6
+
+        """
+        future = self._request_control(message)
 
+        # the future is resolved after T6, the timeout only guards against it never being resolved
         try:
-            response = response_queue.get(True, self._settings.timeouts.t6)
-        except queue.Empty:
-            response = None
+            return typing.cast("HsmsMessage | None", future.result(self._settings.timeouts.t6))
+        except concurrent.futures.TimeoutError:
+            return None
+
+    def send_select_req(self) -> HsmsMessage | None:
+        """Send a Select Request to the remote host.
 
-        self._remove_queue(system_id)
+        Returns:
+            received message or None
 
-        return response
+        """
+        return self._send_control_request(HsmsMessage(HsmsSelectReqHeader(self.get_next_system_counter()), b""))
 
     def send_select_rsp(self, system_id: int) -> bool:
         """Send a Select Response to the remote host.
@@ -455,7 +578,7 @@ class HsmsProtocol(secsgem.common.Protocol[HsmsMessage, HsmsBlock]):  # pylint:
 
         """
         message = HsmsMessage(HsmsSelectRspHeader(system_id), b"")
-        self._communication_logger.info("> %s\n  %s", message, message.header.s_type.text, extra=self._get_log_extra())
+        self._log_communication("> %s\n  %s", message, message.header.s_type.text)
         return self.send_message(message)
 
     def send_linktest_req(self) -> HsmsMessage | None:
@@ -465,25 +588,7 @@ class HsmsProtocol(secsgem.common.Protocol[HsmsMessage, HsmsBlock]):  # pylint:
             received message or None
 
         """
-        system_id = self.get_next_system_counter()
-
-        response_queue = self._get_queue_for_system(system_id)
-
-        message = HsmsMessage(HsmsLinktestReqHeader(system_id), b"")
-        self._communication_logger.info("> %s\n  %s", message, message.header.s_type.text, extra=self._get_log_extra())
-
-        if not self.send_message(message):
-            self._remove_queue(system_id)
-            return None
-
-        try:
-            response = response_queue.get(True, self._settings.timeouts.t6)
-        except queue.Empty:
-            response = None
-
-        self._remove_queue(system_id)
-
-        return response
+        return self._send_control_request(HsmsMessage(HsmsLinktestReqHeader(self.get_next_system_counter()), b""))
 
     def send_linktest_rsp(self, system_id: int) -> bool:
         """Send a Linktest Response to the remote host.
@@ -496,7 +601,7 @@ class HsmsProtocol(secsgem.common.Protocol[HsmsMessage, HsmsBlock]):  # pylint:
 
         """
         message = HsmsMessage(HsmsLinktestRspHeader(system_id), b"")
-        self._communication_logger.info("> %s\n  %s", message, message.header.s_type.text, extra=self._get_log_extra())
+        self._log_communication("> %s\n  %s", message, message.header.s_type.text)
         return self.send_message(message)
 
     def send_deselect_req(self) -> HsmsMessage | None:
@@ -506,25 +611,7 @@ class HsmsProtocol(secsgem.common.Protocol[HsmsMessage, HsmsBlock]):  # pylint:
             received message or None
 
         """
-        system_id = self.get_next_system_counter()
-
-        response_queue = self._get_queue_for_system(system_id)
-
-        message = HsmsMessage(HsmsDeselectReqHeader(system_id), b"")
-        self._communication_logger.info("> %s\n  %s", message, message.header.s_type.text, extra=self._get_log_extra())
-
-        if not self.send_message(message):
-            self._remove_queue(system_id)
-            return None
-
-        try:
-            response = response_queue.get(True, self._settings.timeouts.t6)
-        except queue.Empty:
-            response = None
-
-        self._remove_queue(system_id)
-
-        return response
+        return self._send_control_request(HsmsMessage(HsmsDeselectReqHeader(self.get_next_system_counter()), b""))
 
     def send_deselect_rsp(self, system_id: int) -> bool:
         """Send a Deselect Response to the remote host.
@@ -537,7 +624,7 @@ class HsmsProtocol(secsgem.common.Protocol[HsmsMessage, HsmsBlock]):  # pylint:
 
         """
         message = HsmsMessage(HsmsDeselectRspHeader(system_id), b"")
-        self._communication_logger.info("> %s\n  %s", message, message.header.s_type.text, extra=self._get_log_extra())
+        self._log_communication("> %s\n  %s", message, message.header.s_type.text)
         return self.send_message(message)
 
     def send_reject_rsp(self, system_id: int, s_type: HsmsSType, reason: int) -> bool:
@@ -553,7 +640,7 @@ class HsmsProtocol(secsgem.common.Protocol[HsmsMessage, HsmsBlock]):  # pylint:
 
         """
         message = HsmsMessage(HsmsRejectReqHeader(system_id, s_type, reason), b"")
-        self._communication_logger.info("> %s\n  %s", message, message.header.s_type.text, extra=self._get_log_extra())
+        self._log_communication("> %s\n  %s", message, message.header.s_type.text)
         return self.send_message(message)
 
     def send_separate_req(self) -> int | None:
@@ -566,7 +653,7 @@ class HsmsProtocol(secsgem.common.Protocol[HsmsMessage, HsmsBlock]):  # pylint:
         system_id = self.get_next_system_counter()
 
         message = HsmsMessage(HsmsSeparateReqHeader(system_id), b"")
-        self._communication_logger.info("> %s\n  %s", message, message.header.s_type.text, extra=self._get_log_extra())
+        self._log_communication("> %s\n  %s", message, message.header.s_type.text)
 
         if not self.send_message(message):
             return None
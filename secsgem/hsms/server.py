@@ -0,0 +1,243 @@
+#####################################################################
+# server.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Passive HSMS endpoint accepting many connections on one port."""
+
+from __future__ import annotations
+
+import logging
+import socket
+import threading
+import typing
+
+import secsgem.common
+
+from .settings import HsmsConnectMode, HsmsSessionSettings, HsmsSettings
+
+if typing.TYPE_CHECKING:
+    from secsgem.secs import SecsHandler
+
+    from .connection_manager import HsmsConnectionManager
+
+
+class HsmsServer:  # pylint: disable=too-many-instance-attributes
+    """Passive HSMS endpoint, accepting any number of remotes on one port.
+
+    The listening socket stays open, every accepted connection becomes a session with its own handler.
+    Sessions use the settings passed to the server, the `peers` argument overrides settings (like the device id) for
+    specific remote addresses.
+    Sessions end when the remote disconnects.
+    The events `session_opened` and `session_closed` are fired with the `server` and the sessions `handler`.
+
+    Servers are created with :meth:`secsgem.hsms.HsmsConnectionManager.create_server`.
+
+    Example:
+        >>> import secsgem.hsms
+        >>>
+        >>> manager = secsgem.hsms.HsmsConnectionManager()
+        >>> manager.start()
+        >>> server = manager.create_server(port=0, peers={"10.0.0.1": {"device_id": 1}})
+        >>> server.start()
+        >>> server.port > 0
+        True
+        >>> manager.stop()
+
+    """
+
+    backlog = 128
+    """Number of connections waiting to be accepted."""
+
+    def __init__(
+        self,
+        manager: HsmsConnectionManager,
+        handler_class: type[SecsHandler] | None = None,
+        peers: dict[str, dict[str, typing.Any]] | None = None,
+        accept_unknown_peers: bool = True,
+        **kwargs,
+    ):
+        """Initialize a server.
+
+        Args:
+            manager: connection manager running the sessions
+            handler_class: handler class created for each session, defaults to :class:`secsgem.gem.GemEquipmentHandler`
+            peers: settings overrides for sessions by remote address
+            accept_unknown_peers: accept remotes not listed in `peers`
+            kwargs: arguments for the sessions :class:`HsmsSettings`
+
+        """
+        self._manager = manager
+        self._handler_class = handler_class
+        self._peers = peers if peers is not None else {}
+        self._accept_unknown_peers = accept_unknown_peers
+
+        self._settings_kwargs = {**kwargs, "connect_mode": HsmsConnectMode.PASSIVE}
+        self._settings = HsmsSettings(**self._settings_kwargs)
+
+        self._logger = logging.getLogger(self.__module__ + "." + self.__class__.__name__)
+        self._events = secsgem.common.EventProducer()
+
+        self._listener: socket.socket | None = None
+
+        self._sessions: list[SecsHandler] = []
+        self._sessions_lock = threading.Lock()
+
+    @property
+    def settings(self) -> HsmsSettings:
+        """Settings of the listening endpoint."""
+        return self._settings
+
+    @property
+    def events(self) -> secsgem.common.EventProducer:
+        """Event producer of the server."""
+        return self._events
+
+    @property
+    def port(self) -> int:
+        """Port the server listens on, the assigned port if started with port 0."""
+        if self._listener is None:
+            return self._settings.port
+
+        return self._listener.getsockname()[1]
+
+    @property
+    def sessions(self) -> list[SecsHandler]:
+        """Handlers of the open sessions."""
+        with self._sessions_lock:
+            return list(self._sessions)
+
+    def start(self) -> None:
+        """Start listening for connections."""
+        if self._listener is not None:
+            return
+
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+
+        if not secsgem.common.is_windows():
+            listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+
+        listener.bind((self._settings.address, self._settings.port))
+        listener.listen(self.backlog)
+        listener.setblocking(False)
+
+        self._listener = listener
+        self._manager.loop.call_soon(self._add_listener, listener)
+
+    def stop(self) -> None:
+        """Stop listening and close all sessions, can be called from any thread, including the loop thread."""
+        listener = self._listener
+        self._listener = None
+
+        if listener is not None:
+            loop = self._manager.loop
+
+            if not loop.running:
+                # the selector is closed or the listener isn't registered yet, no loop thread uses the socket
+                listener.close()
+            elif loop.in_loop_thread():
+                self._close_listener(listener)
+            else:
+                closed = threading.Event()
+                loop.call_soon(self._close_listener, listener, closed)
+                closed.wait()
+
+        for handler in self.sessions:
+            self._close_session(handler)
+
+    def session_settings(self, address: str) -> dict[str, typing.Any] | None:
+        """Get the settings overrides for a remote.
+
+        Args:
+            address: address of the remote
+
+        Returns:
+            settings overrides, None if the remote is not accepted
+
+        """
+        if address in self._peers:
+            return self._peers[address]
+
+        return {} if self._accept_unknown_peers else None
+
+    def _add_listener(self, listener: socket.socket):
+        """Watch the listening socket, called in the loop thread."""
+        # the server was stopped before the loop got here
+        if listener is not self._listener:
+            return
+
+        self._manager.loop.add_reader(listener, self._on_accept)
+
+    def _close_listener(self, listener: socket.socket, closed: threading.Event | None = None):
+        """Stop watching and close the listening socket, called in the loop thread."""
+        self._manager.loop.remove_reader(listener)
+        listener.close()
+
+        if closed is not None:
+            closed.set()
+
+    def _on_accept(self):
+        """Accept all waiting connections, called in the loop thread."""
+        while self._listener is not None:
+            try:
+                sock, peer = self._listener.accept()
+            except OSError:
+                return
+
+            self._manager.executor.submit(self._open_session, sock, peer)
+
+    def _open_session(self, sock: socket.socket, peer: tuple[str, int]):
+        overrides = self.session_settings(peer[0])
+        if overrides is None:
+            self._logger.info("rejecting connection from %s:%d", *peer)
+            sock.close()
+            return
+
+        handler_class = self._handler_class
+        if handler_class is None:
+            from secsgem.gem import GemEquipmentHandler  # pylint: disable=import-outside-toplevel
+
+            handler_class = GemEquipmentHandler
+
+        try:
+            settings = HsmsSessionSettings(
+                **{**self._settings_kwargs, "address": peer[0], "port": peer[1], **overrides},
+                session_socket=sock,
+                connection_manager=self._manager,
+            )
+
+            handler = handler_class(settings)
+        except Exception:  # pylint: disable=broad-except
+            self._logger.exception("creating session for %s:%d failed", *peer)
+            sock.close()
+            return
+
+        handler.protocol.events.disconnected += lambda _: self._manager.executor.submit(self._close_session, handler)
+
+        with self._sessions_lock:
+            self._sessions.append(handler)
+
+        self._events.fire("session_opened", {"server": self, "handler": handler})
+
+        handler.enable()
+
+    def _close_session(self, handler: SecsHandler):
+        with self._sessions_lock:
+            if handler not in self._sessions:
+                return
+
+            self._sessions.remove(handler)
+
+        handler.disable()
+
+        self._events.fire("session_closed", {"server": self, "handler": handler})
@@ -18,9 +18,17 @@
 from __future__ import annotations
 
 import enum
+import typing
 
 import secsgem.common
 
+if typing.TYPE_CHECKING:
+    import socket
+
+    from secsgem.common.settings import TimerHandle
+
+    from .connection_manager import HsmsConnectionManager
+
 
 class HsmsConnectMode(enum.Enum):
     """Hsms connect mode (active or passive)."""
@@ -60,12 +68,25 @@ class HsmsSettings(secsgem.common.Settings):
         self._connect_mode = kwargs.get("connect_mode", HsmsConnectMode.ACTIVE)
         self._address = kwargs.get("address", "127.0.0.1")
         self._port = kwargs.get("port", 5000)
+        self._receive_buffer_size = kwargs.get("receive_buffer_size", 65536)
+        if self._receive_buffer_size < 1:
+            raise ValueError(f"{self.__class__.__name__} receive_buffer_size must be at least 1")
+        self._linktest_interval = kwargs.get("linktest_interval", 30.0)
+        self._connection_manager = kwargs.get("connection_manager")
 
         self._validate_args(kwargs)
 
     @classmethod
     def _args(cls) -> list[str]:
-        return [*super()._args(), "connect_mode", "address", "port"]
+        return [
+            *super()._args(),
+            "connect_mode",
+            "address",
+            "port",
+            "receive_buffer_size",
+            "linktest_interval",
+            "connection_manager",
+        ]
 
     @property
     def connect_mode(self) -> HsmsConnectMode:
@@ -91,6 +112,34 @@ class HsmsSettings(secsgem.common.Settings):
         """
         return self._port
 
+    @property
+    def receive_buffer_size(self) -> int:
+        """Number of bytes read from the socket at once.
+
+        Larger buffers reduce the number of system calls for bulk transfers.
+
+        Default: 65536
+        """
+        return self._receive_buffer_size
+
+    @property
+    def linktest_interval(self) -> float:
+        """Seconds between linktest requests on a connection.
+
+        Default: 30.0
+        """
+        return self._linktest_interval
+
+    @property
+    def connection_manager(self) -> HsmsConnectionManager | None:
+        """Manager running the connection on shared threads.
+
+        If not set, the connection uses own threads.
+
+        Default: None
+        """
+        return self._connection_manager
+
     def create_protocol(self) -> secsgem.common.Protocol:
         """Protocol class for this configuration."""
         from .protocol import HsmsProtocol  # pylint: disable=import-outside-toplevel
@@ -99,10 +148,66 @@ class HsmsSettings(secsgem.common.Settings):
 
     def create_connection(self) -> secsgem.common.Connection:
         """Connection class for this configuration."""
+        if self.connection_manager is not None:
+            return self.connection_manager.create_connection(self)
+
         if self.connect_mode == HsmsConnectMode.ACTIVE:
             return secsgem.common.TcpClientConnection(self)
         return secsgem.common.TcpServerConnection(self)
 
+    def create_dispatcher(
+        self,
+        receiver_target: typing.Callable,
+        dispatcher_target: typing.Callable,
+    ) -> secsgem.common.ProtocolDispatcher:
+        """Dispatcher running the protocol receiver and the message handlers for this configuration.
+
+        Args:
+            receiver_target: function to call when receiver triggered
+            dispatcher_target: function to call when message available for dispatch
+
+        Returns:
+            dispatcher object
+
+        """
+        if self.connection_manager is not None:
+            return self.connection_manager.create_dispatcher(receiver_target, dispatcher_target, self)
+
+        return super().create_dispatcher(receiver_target, dispatcher_target)
+
+    def start_timer(self, interval: float, function: typing.Callable[[], None], functionality: str) -> TimerHandle:
+        """Call a function once after an interval.
+
+        Args:
+            interval: seconds to wait before calling the function
+            function: function to call
+            functionality: name of the functionality, used for logging
+
+        Returns:
+            handle to cancel the timer
+
+        """
+        if self.connection_manager is not None:
+            return self.connection_manager.start_timer(interval, function, functionality)
+
+        return super().start_timer(interval, function, functionality)
+
+    def call_later(self, interval: float, function: typing.Callable[[], None]) -> TimerHandle:
+        """Call a function that doesn't block once after an interval.
+
+        Args:
+            interval: seconds to wait before calling the function
+            function: function to call
+
+        Returns:
+            handle to cancel the timer
+
+        """
+        if self.connection_manager is not None:
+            return self.connection_manager.loop.call_later(interval, function)
+
+        return super().call_later(interval, function)
+
     @property
     def name(self) -> str:
         """Name of this configuration."""
@@ -165,3 +270,40 @@ class ExistingProtocolSettings(HsmsSettings):
     def name(self) -> str:
         """Name of this configuration."""
         return f"HSMS-{self.connect_mode}_{self.address}:{self.port}"
+
+
+class HsmsSessionSettings(HsmsSettings):
+    """Settings for a connection accepted by :class:`secsgem.hsms.HsmsServer`.
+
+    These attributes can be initialized in the constructor and accessed as property.
+    The connection uses the accepted `session_socket` and is run by the `connection_manager`.
+
+    """
+
+    def __init__(self, **kwargs) -> None:
+        """Initialize settings."""
+        super().__init__(**kwargs)
+
+        self._session_socket = kwargs.get("session_socket")
+
+    @classmethod
+    def _args(cls) -> list[str]:
+        return [*super()._args(), "session_socket"]
+
+    @property
+    def session_socket(self) -> socket.socket:
+        """Accepted socket of the session.
+
+        Default: None
+        """
+        if self._session_socket is None:
+            raise ValueError("Session socket not set")
+
+        return self._session_socket
+
+    def create_connection(self) -> secsgem.common.Connection:
+        """Connection class for this configuration."""
+        if self.connection_manager is None:
+            raise ValueError("Connection manager not set")
+
+        return self.connection_manager.create_session_connection(self)
@@ -46,6 +46,7 @@ class DataItemBase(metaclass=DataItemMeta):
     It provides type and output handling.
     """
 
+    name: str  # set by each data item class, used to look it up by name
     __type__: type[variables.Base] | None = None
     __allowedtypes__: list[type[variables.Base]] | None = None
     __count__ = -1
@@ -63,6 +64,15 @@ class DataItemBase(metaclass=DataItemMeta):
         else:
             self.__type__.__init__(self, value, self.__count__)
 
+    def clone(self) -> DataItemBase:
+        """Create a new data item of the same type, without a value.
+
+        Returns:
+            new data item
+
+        """
+        return self.__class__()
+
     @property
     def typ(self) -> type[variables.Base] | None:
         """Get the configured type."""
@@ -37,6 +37,7 @@ class DataItems:
             data_items = secs_data_items.copy()
 
         self._data_items = data_items
+        self._data_item_index = {data_item.name: data_item for data_item in reversed(self._data_items)}
 
     def item(self, name: str) -> type[DataItemBase] | None:
         """Get a specific data item.
@@ -48,11 +49,7 @@ class DataItems:
             data item class
 
         """
-        for data_item in self._data_items:
-            if data_item.name == name:
-                return data_item
-
-        return None
+        return self._data_item_index.get(name)
 
     def __getattr__(self, name: str) -> type[DataItemBase]:
         """Get a specific data item.
@@ -85,3 +82,4 @@ class DataItems:
                 self._data_items.remove(item)
 
         self._data_items.append(data_item)
+        self._data_item_index[data_item.name] = data_item
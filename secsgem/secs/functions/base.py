@@ -23,6 +23,9 @@ import secsgem.common
 from secsgem.secs.data_items import DataItemBase
 from secsgem.secs.variables import functions
 
+if typing.TYPE_CHECKING:
+    from secsgem.secs import variables
+
 DataItemRecursive = typing.Union[type[DataItemBase], typing.Iterable["DataItemRecursive"]]
 
 
@@ -60,6 +63,8 @@ class SecsStreamFunction(metaclass=StructureDisplayingMeta):  # pylint: disable=
 
     _is_multi_block = False
 
+    _data_prototype: variables.Base | None
+
     def __init__(self, value=None):
         """Initialize a stream function object.
 
@@ -91,7 +96,7 @@ class SecsStreamFunction(metaclass=StructureDisplayingMeta):  # pylint: disable=
                 ]
 
         """
-        self.data = functions.generate(self._data_format)
+        self.data = self._create_data()
 
         self.data_format = self._data_format
         self.to_host = self._to_host
@@ -107,6 +112,24 @@ class SecsStreamFunction(metaclass=StructureDisplayingMeta):  # pylint: disable=
 
         self._object_intitialized = True
 
+    @classmethod
+    def _create_data(cls):
+        """Create the variable tree for the data format of this function.
+
+        The tree is generated from the data format once per class, further instances are cloned from it.
+
+        Returns:
+            new variable tree or None for header only functions
+
+        """
+        if "_data_prototype" not in cls.__dict__:
+            cls._data_prototype = functions.generate(cls._data_format)
+
+        if cls._data_prototype is None:
+            return None
+
+        return cls._data_prototype.clone()
+
     def __repr__(self):
         """Generate textual representation for an object of this class."""
         function = f"S{self.stream}F{self.function}"
@@ -166,15 +189,27 @@ class SecsStreamFunction(metaclass=StructureDisplayingMeta):  # pylint: disable=
 
         return self.data.encode()
 
+    def encode_into(self, buffer: bytearray) -> None:
+        """Append the encoded hsms data of the stream/function parameter to a buffer.
+
+        Args:
+            buffer: buffer to append the encoded data to
+
+        """
+        if self.data is not None:
+            self.data.encode_into(buffer)
+
     def decode(self, data):
         """Update stream/function parameter data from the passed data.
 
+        The data is wrapped in a memoryview, so decoding the variables only reads the buffer in place.
+
         Args:
             data: encoded data
 
         """
         if self.data is not None:
-            self.data.decode(data)
+            self.data.decode(memoryview(data))
 
     def set(self, value):
         """Update the value of the stream/function parameter.
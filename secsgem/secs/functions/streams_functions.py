@@ -43,6 +43,32 @@ class StreamsFunctions:
         self._functions = functions
         self._data_items = data_items if data_items is not None else DataItems()
 
+        self._function_index: dict[tuple[int, int], list[type[SecsStreamFunction]]] = {}
+        self._stream_index: dict[int, list[type[SecsStreamFunction]]] = {}
+
+        for func in self._functions:
+            self._add_to_index(func)
+
+    def _add_to_index(self, function: type[SecsStreamFunction]):
+        """Add a function to the lookup indices.
+
+        Args:
+            function: function class to add
+
+        """
+        self._function_index.setdefault((function.stream, function.function), []).append(function)
+        self._stream_index.setdefault(function.stream, []).append(function)
+
+    def _remove_from_index(self, function: type[SecsStreamFunction]):
+        """Remove a function from the lookup indices.
+
+        Args:
+            function: function class to remove
+
+        """
+        self._function_index[(function.stream, function.function)].remove(function)
+        self._stream_index[function.stream].remove(function)
+
     def stream(self, stream: int) -> list[type[SecsStreamFunction]]:
         """Get all functions for a stream.
 
@@ -53,7 +79,7 @@ class StreamsFunctions:
             list of function classes for this stream
 
         """
-        return [function for function in self._functions if function.stream == stream]
+        return list(self._stream_index.get(stream, []))
 
     def function(self, stream: int, function: int) -> type[SecsStreamFunction] | None:
         """Get a specific function.
@@ -66,9 +92,9 @@ class StreamsFunctions:
             function class
 
         """
-        functions = [func for func in self._functions if func.stream == stream and func.function == function]
+        functions = self._function_index.get((stream, function))
 
-        if len(functions) == 0:
+        if not functions:
             return None
         if len(functions) > 1:
             raise ValueError(f"More than one function found for S{stream:02}F{function:02}: {functions}")
@@ -95,22 +121,16 @@ class StreamsFunctions:
         if isinstance(message.data, SecsStreamFunction):
             return message.data
 
-        function = func()
-        function.decode(message.data)
-
-        return function
+        return message.decode_function(func)
 
     def update(self, function: type[SecsStreamFunction]):
         """Add or update a function descriptor."""
-        functions = [
-            func for func in self._functions if func.stream == function.stream and func.function == function.function
-        ]
-
-        if functions:
-            for func in functions:
-                self._functions.remove(func)
+        for func in list(self._function_index.get((function.stream, function.function), [])):
+            self._functions.remove(func)
+            self._remove_from_index(func)
 
         self._functions.append(function)
+        self._add_to_index(function)
 
     @property
     def data_items(self) -> DataItems:
@@ -17,6 +17,7 @@
 
 from __future__ import annotations
 
+import collections
 import logging
 import typing
 
@@ -24,6 +25,8 @@ import secsgem.common
 import secsgem.hsms
 
 if typing.TYPE_CHECKING:
+    import concurrent.futures
+
     from .data_items.data_items import DataItems
     from .functions.base import SecsStreamFunction
 
@@ -34,6 +37,9 @@ class SecsHandler:  # pylint: disable=too-many-instance-attributes,too-many-publ
     Inherit from this class and override required functions.
     """
 
+    request_window = 16
+    """Maximum number of requests waiting for a response in the batch functions."""
+
     def __init__(self, settings: secsgem.common.Settings):
         """Initialize a secs handler.
 
@@ -81,6 +87,50 @@ class SecsHandler:  # pylint: disable=too-many-instance-attributes,too-many-publ
         """Wrapper for connections send_and_waitfor_response function."""
         return self.protocol.send_and_waitfor_response(function)
 
+    def send_request(self, function: SecsStreamFunction) -> concurrent.futures.Future[secsgem.common.Message | None]:
+        """Wrapper for connections send_request function."""
+        return self.protocol.send_request(function)
+
+    def send_requests(
+        self,
+        functions: typing.Iterable[SecsStreamFunction],
+        window: int | None = None,
+    ) -> list[secsgem.common.Message | None]:
+        """Send requests, keeping many of them in flight at the same time.
+
+        Args:
+            functions: requests to send
+            window: maximum number of requests waiting for a response, defaults to `request_window`
+
+        Returns:
+            responses in the order of the requests, None for requests without response
+
+        """
+        if window is None:
+            window = self.request_window
+
+        if window < 1:
+            raise ValueError(f"{self.__class__.__name__} request window must be at least 1, got {window}")
+
+        responses: list[secsgem.common.Message | None] = []
+        in_flight: collections.deque[concurrent.futures.Future[secsgem.common.Message | None]] = collections.deque()
+
+        for function in functions:
+            if len(in_flight) >= window:
+                responses.append(in_flight.popleft().result())
+
+            in_flight.append(self.send_request(function))
+
+        responses.extend(future.result() for future in in_flight)
+
+        return responses
+
+    def _decode_responses(self, responses: list[secsgem.common.Message | None]) -> list[SecsStreamFunction | None]:
+        """Decode responses of a batch, keeping None for missing responses."""
+        return [
+            None if response is None else self.settings.streams_functions.decode(response) for response in responses
+        ]
+
     def send_stream_function(self, function: SecsStreamFunction) -> bool:
         """Wrapper for connections send_stream_function function."""
         return self.protocol.send_stream_function(function)
@@ -201,6 +251,27 @@ class SecsHandler:  # pylint: disable=too-many-instance-attributes,too-many-publ
 
         return self.settings.streams_functions.decode(self.send_and_waitfor_response(self.stream_function(1, 3)(svs)))
 
+    def request_svs_batch(
+        self,
+        requests: list[list[str | int]],
+        window: int | None = None,
+    ) -> list[SecsStreamFunction | None]:
+        """Request contents of Service Variables with many requests in flight.
+
+        Args:
+            requests: Service Variables to request, one list per request
+            window: maximum number of requests waiting for a response, defaults to `request_window`
+
+        Returns:
+            values of requested Service Variables for each request, None for requests without response
+
+        """
+        self.logger.info("Get value of service variables in %d requests", len(requests))
+
+        functions = (self.stream_function(1, 3)(svs) for svs in requests)
+
+        return self._decode_responses(self.send_requests(functions, window))
+
     def request_sv(self, sv_id: int | str) -> int | str | None:
         """Request contents of one Service Variable.
 
@@ -251,6 +322,27 @@ class SecsHandler:  # pylint: disable=too-many-instance-attributes,too-many-publ
 
         return self.settings.streams_functions.decode(self.send_and_waitfor_response(self.stream_function(2, 13)(ecs)))
 
+    def request_ecs_batch(
+        self,
+        requests: list[list[int | str]],
+        window: int | None = None,
+    ) -> list[SecsStreamFunction | None]:
+        """Request contents of Equipment Constants with many requests in flight.
+
+        Args:
+            requests: Equipment Constants to request, one list per request
+            window: maximum number of requests waiting for a response, defaults to `request_window`
+
+        Returns:
+            values of requested Equipment Constants for each request, None for requests without response
+
+        """
+        self.logger.info("Get value of equipment constants in %d requests", len(requests))
+
+        functions = (self.stream_function(2, 13)(ecs) for ecs in requests)
+
+        return self._decode_responses(self.send_requests(functions, window))
+
     def request_ec(self, ec_id: int | str) -> SecsStreamFunction | None:
         """Request contents of one Equipment Constant.
 
@@ -278,6 +370,28 @@ class SecsHandler:  # pylint: disable=too-many-instance-attributes,too-many-publ
             self.send_and_waitfor_response(self.stream_function(2, 15)(ecs)),
         ).get()
 
+    def set_ecs_batch(
+        self,
+        requests: list[list[list[str | int | float]]],
+        window: int | None = None,
+    ) -> list[int | str | float | bytes | None]:
+        """Set contents of Equipment Constants with many requests in flight.
+
+        Args:
+            requests: list containing list of id / value pairs, one list per request
+            window: maximum number of requests waiting for a response, defaults to `request_window`
+
+        Returns:
+            acknowledge code for each request, None for requests without response
+
+        """
+        self.logger.info("Set value of equipment constants in %d requests", len(requests))
+
+        functions = (self.stream_function(2, 15)(ecs) for ecs in requests)
+        responses = self._decode_responses(self.send_requests(functions, window))
+
+        return [None if response is None else response.get() for response in responses]
+
     def set_ec(self, ec_id: int | str, value: int | str | float) -> int | str | float | bytes | None:
         """Set contents of one Equipment Constant.
 
@@ -326,6 +326,18 @@ class Item(abc.ABC):
         """
         raise NotImplementedError
 
+    def encode_into(self, buffer: bytearray) -> None:
+        """Encode the data value and append it to a buffer.
+
+        Container items write their children directly into the same buffer,
+        so a complete item tree is serialized without intermediate copies.
+
+        Args:
+            buffer: buffer to append the encoded data to
+
+        """
+        buffer += self.encode()
+
     @classmethod
     def _decode_peek_item_type(cls, data: PacketData):
         return (data.peek() & 0b11111100) >> 2
@@ -339,16 +351,15 @@ class Item(abc.ABC):
         length_bytes = format_byte & 0b00000011
 
         # read 1-3 length bytes
-        length = 0
-        for _ in range(length_bytes):
-            length <<= 8
-            length += data.get_one()
+        length_data = data.get_view(length_bytes)
+        if len(length_data) != length_bytes:
+            raise ValueError(f"Not enough data for item header with {length_bytes} length bytes")
 
-        return format_code, length
+        return format_code, int.from_bytes(length_data, "big")
 
     @classmethod
     @abc.abstractmethod
-    def decode(cls, data: PacketData | bytes) -> Item:
+    def decode(cls, data: PacketData | bytes | bytearray | memoryview) -> Item:
         """Create a new data object by decoding a secs packet.
 
         Args:
@@ -358,7 +369,7 @@ class Item(abc.ABC):
             new data object
 
         """
-        if isinstance(data, bytes):
+        if not isinstance(data, PacketData):
             data = PacketData(data)
 
         cls._import_inherited()
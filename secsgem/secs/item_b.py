@@ -135,7 +135,7 @@ class ItemB(Item):
         return result
 
     @classmethod
-    def decode(cls, data: PacketData | bytes) -> Item:
+    def decode(cls, data: PacketData | bytes | bytearray | memoryview) -> Item:
         """Create a new data object by decoding a secs packet.
 
         Args:
@@ -145,7 +145,7 @@ class ItemB(Item):
             new data object
 
         """
-        if isinstance(data, bytes):
+        if not isinstance(data, PacketData):
             data = PacketData(data)
 
         _, length = cls._decode_item_header(data)
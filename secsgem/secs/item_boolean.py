@@ -133,7 +133,7 @@ class ItemBOOLEAN(Item):
         return result
 
     @classmethod
-    def decode(cls, data: PacketData | bytes) -> Item:
+    def decode(cls, data: PacketData | bytes | bytearray | memoryview) -> Item:
         """Create a new data object by decoding a secs packet.
 
         Args:
@@ -143,7 +143,7 @@ class ItemBOOLEAN(Item):
             new data object
 
         """
-        if isinstance(data, bytes):
+        if not isinstance(data, PacketData):
             data = PacketData(data)
 
         _, length = cls._decode_item_header(data)
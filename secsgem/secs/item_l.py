@@ -91,15 +91,25 @@ class ItemL(Item):
             byte array of data
 
         """
-        result = self.encode_item_header(len(self._value))
+        buffer = bytearray()
+        self.encode_into(buffer)
 
-        for item in self._value:
-            result += item.encode()
+        return bytes(buffer)
+
+    def encode_into(self, buffer: bytearray) -> None:
+        """Encode the data value and append it to a buffer.
+
+        Args:
+            buffer: buffer to append the encoded data to
 
-        return result
+        """
+        buffer += self.encode_item_header(len(self._value))
+
+        for item in self._value:
+            item.encode_into(buffer)
 
     @classmethod
-    def decode(cls, data: PacketData | bytes) -> Item:
+    def decode(cls, data: PacketData | bytes | bytearray | memoryview) -> Item:
         """Create a new data object by decoding a secs packet.
 
         Args:
@@ -109,7 +119,7 @@ class ItemL(Item):
             new data object
 
         """
-        if isinstance(data, bytes):
+        if not isinstance(data, PacketData):
             data = PacketData(data)
 
         (_, length) = cls._decode_item_header(data)
@@ -17,10 +17,10 @@
 
 from __future__ import annotations
 
-import struct
 import typing
 
 from .item import Item, PacketData
+from .packet_data import array_struct
 
 if typing.TYPE_CHECKING:
     from .sml import SMLParser
@@ -109,16 +109,23 @@ class ItemNumber(Item):
             byte array of data
 
         """
-        result = self.encode_item_header(len(self._value) * self._bytes)
+        return self.encode_item_header(len(self._value) * self._bytes) + array_struct(
+            self._struct_code,
+            len(self._value),
+        ).pack(*self._value)
 
-        for counter, _ in enumerate(self._value):
-            value = self._value[counter]
-            result += struct.pack(f">{self._struct_code}", value)
+    def encode_into(self, buffer: bytearray) -> None:
+        """Encode the data value and append it to a buffer.
 
-        return result
+        Args:
+            buffer: buffer to append the encoded data to
+
+        """
+        buffer += self.encode_item_header(len(self._value) * self._bytes)
+        buffer += array_struct(self._struct_code, len(self._value)).pack(*self._value)
 
     @classmethod
-    def decode(cls, data: PacketData | bytes) -> Item:
+    def decode(cls, data: PacketData | bytes | bytearray | memoryview) -> Item:
         """Create a new data object by decoding a secs packet.
 
         Args:
@@ -128,21 +135,25 @@ class ItemNumber(Item):
             new data object
 
         """
-        if isinstance(data, bytes):
+        if not isinstance(data, PacketData):
             data = PacketData(data)
 
         _, length = cls._decode_item_header(data)
-        result = []
 
-        for _ in range(length // cls._bytes):
-            result_text = data.get(cls._bytes)
+        if data.remaining < length - (length % cls._bytes):
+            raise ValueError(f"No enough data found for {cls.__name__} with length {length}")
 
-            if len(result_text) != cls._bytes:
-                raise ValueError(f"No enough data found for {cls.__name__} with length {length}")
+        values = list(data.unpack(array_struct(cls._struct_code, length // cls._bytes)))
 
-            result.append(struct.unpack(f">{cls._struct_code}", result_text)[0])
+        # unpacked integers are always within the bounds of the type, floats may be out of bounds (inf/nan).
+        # the normal validation is only used to raise the error for invalid values.
+        if cls._type is float and not all(cls._minimum_value <= value <= cls._maximum_value for value in values):
+            return cls(values)
 
-        return cls(result)
+        # the values are known to be valid, they are not validated again
+        item = cls.__new__(cls)
+        item._value = values  # noqa: SLF001 # pylint: disable=protected-access
+        return item
 
 
 class ItemI8(ItemNumber):
@@ -17,10 +17,32 @@
 
 from __future__ import annotations
 
+import functools
+import struct
+import typing
+
+
+@functools.lru_cache(maxsize=256)
+def array_struct(struct_code: str, count: int) -> struct.Struct:
+    """Get a precompiled struct for packing or unpacking a complete numeric array at once.
+
+    Args:
+        struct_code: struct format character of a single element
+        count: number of elements in the array
+
+    Returns:
+        big endian struct for the array
+
+    """
+    return struct.Struct(f">{count}{struct_code}")
+
 
 class PacketData:
     r"""Wrapper for packet data that allows iterating over the data bytes.
 
+    The data is wrapped in a :class:`memoryview` and read through an offset cursor,
+    so consuming bytes never copies the remaining packet.
+
     Example:
         >>> from secsgem.secs.packet_data import PacketData
         >>>
@@ -31,19 +53,34 @@ class PacketData:
         1
         >>> packet_data.get(2)
         b'\x02\x03'
+        >>> packet_data.position
+        3
+        >>> packet_data.remaining
+        1
         >>> packet_data.get()
         b'\x04'
 
     """
 
-    def __init__(self, data: bytes):
+    def __init__(self, data: bytes | bytearray | memoryview):
         """Initialize packet data.
 
         Args:
             data: packet raw data
 
         """
-        self._data = data
+        self._data = memoryview(data).cast("B")
+        self._position = 0
+
+    @property
+    def position(self) -> int:
+        """Get the current read position in the packet."""
+        return self._position
+
+    @property
+    def remaining(self) -> int:
+        """Get the number of bytes not yet read."""
+        return len(self._data) - self._position
 
     def peek(self) -> int:
         """Get the next packet byte without incrementing the pointer.
@@ -52,7 +89,7 @@ class PacketData:
             requested data
 
         """
-        return self._data[0]
+        return self._data[self._position]
 
     def get_one(self) -> int:
         """Get one packet byte.
@@ -61,9 +98,25 @@ class PacketData:
             single packet byte
 
         """
-        result = self._data[0]
+        result = self._data[self._position]
+
+        self._position += 1
+
+        return result
+
+    def get_view(self, length: int = 1) -> memoryview:
+        """Get the next packet bytes as view into the packet, without copying.
+
+        Args:
+            length: number of bytes
+
+        Returns:
+            view on the requested data
+
+        """
+        result = self._data[self._position : self._position + length]
 
-        self._data = self._data[1:]
+        self._position += len(result)
 
         return result
 
@@ -77,8 +130,23 @@ class PacketData:
             requested data
 
         """
-        result = self._data[:length]
+        return self.get_view(length).tobytes()
+
+    def unpack(self, fmt: struct.Struct) -> tuple[typing.Any, ...]:
+        """Unpack the next packet bytes with a precompiled struct.
+
+        Args:
+            fmt: struct to unpack with
+
+        Returns:
+            unpacked values
+
+        """
+        if self.remaining < fmt.size:
+            raise ValueError(f"Not enough data to unpack {fmt.size} bytes, only {self.remaining} available")
+
+        result = fmt.unpack_from(self._data, self._position)
 
-        self._data = self._data[length:]
+        self._position += fmt.size
 
         return result
@@ -15,6 +15,8 @@
 #####################################################################
 """SECS array variable type."""
 
+from __future__ import annotations
+
 import secsgem.common
 
 from .base import Base
@@ -60,6 +62,7 @@ class Array(Base):
         self.item_decriptor = data_format
         self.count = count
         self.data = []
+        self._item_prototype: Base | None = None
         if isinstance(data_format, list):
             self.name = List.get_name_from_format(data_format)
         elif hasattr(data_format, "__name__"):
@@ -98,6 +101,34 @@ class Array(Base):
             f"{array_name}[\n" f"{secsgem.common.indent_block(data_format.get_format(not showname), 4)}\n" f"    ...\n]"
         )
 
+    def clone(self) -> Array:
+        """Create a new variable of the same type and format, without a value.
+
+        Returns:
+            new variable
+
+        """
+        result = Array(self.item_decriptor, count=self.count)
+        result._item_prototype = self._item_prototype  # noqa: SLF001 # pylint: disable=protected-access
+
+        return result
+
+    def _create_item(self) -> Base:
+        """Create a new list item.
+
+        The item format is only generated once, further items are cloned from it.
+
+        Returns:
+            new list item
+
+        """
+        if self._item_prototype is None:
+            from .functions import generate  # pylint: disable=import-outside-toplevel,cyclic-import
+
+            self._item_prototype = generate(self.item_decriptor)
+
+        return self._item_prototype.clone()
+
     def __repr__(self):
         """Generate textual representation for an object of this class."""
         if len(self.data) == 0:
@@ -137,9 +168,7 @@ class Array(Base):
         Args:
             data: list item to add
         """
-        from .functions import generate  # pylint: disable=import-outside-toplevel,cyclic-import
-
-        new_object = generate(self.item_decriptor)
+        new_object = self._create_item()
         new_object.set(data)
         self.data.append(new_object)
 
@@ -158,9 +187,7 @@ class Array(Base):
         self.data = []
 
         for item in value:
-            from .functions import generate  # pylint: disable=import-outside-toplevel,cyclic-import
-
-            new_object = generate(self.item_decriptor)
+            new_object = self._create_item()
             new_object.set(item)
             self.data.append(new_object)
 
@@ -178,12 +205,22 @@ class Array(Base):
         Returns:
             encoded data bytes
         """
-        result = self.encode_item_header(len(self.data))
+        buffer = bytearray()
+        self.encode_into(buffer)
 
-        for item in self.data:
-            result += item.encode()
+        return bytes(buffer)
 
-        return result
+    def encode_into(self, buffer: bytearray) -> None:
+        """Encode the value and append it to a buffer.
+
+        Args:
+            buffer: buffer to append the encoded data to
+
+        """
+        buffer += self.encode_item_header(len(self.data))
+
+        for item in self.data:
+            item.encode_into(buffer)
 
     def decode(self, data, start=0):
         """Decode the secs byte data to the value.
@@ -195,15 +232,13 @@ class Array(Base):
         Returns:
             new start position
         """
-        from .functions import generate  # pylint: disable=import-outside-toplevel,cyclic-import
-
         (text_pos, _, length) = self.decode_item_header(data, start)
 
         # list
         self.data = []
 
         for _ in range(length):
-            new_object = generate(self.item_decriptor)
+            new_object = self._create_item()
             text_pos = new_object.decode(data, text_pos)
             self.data.append(new_object)
 
@@ -42,6 +42,26 @@ class Base:
         """
         raise NotImplementedError("Function set not implemented on " + self.__class__.__name__)
 
+    def clone(self) -> Base:
+        """Create a new variable of the same type and format, without a value.
+
+        Creating a variable tree by cloning a prototype is faster than generating it from the data format.
+
+        Returns:
+            new variable
+
+        """
+        raise NotImplementedError("Function clone not implemented on " + self.__class__.__name__)
+
+    def encode(self) -> bytes:
+        """Encode the value to transmittable bytes.
+
+        Returns:
+            encoded data bytes
+
+        """
+        raise NotImplementedError("Function encode not implemented on " + self.__class__.__name__)
+
     def encode_item_header(self, length):
         """Encode item header depending on the number of length bytes required.
 
@@ -72,11 +92,23 @@ class Base:
         format_byte = (self.format_code << 2) | length_bytes
         return bytes(bytearray((format_byte, (length & 0x0000FF))))
 
+    def encode_into(self, buffer: bytearray) -> None:
+        """Encode the value and append it to a buffer.
+
+        Container variables write their children directly into the same buffer,
+        so a complete variable tree is serialized without intermediate copies.
+
+        Args:
+            buffer: buffer to append the encoded data to
+
+        """
+        buffer += self.encode()
+
     def decode_item_header(self, data, text_pos=0) -> tuple[int, int, int]:
         """Encode item header depending on the number of length bytes required.
 
         Args:
-            data: encoded data
+            data: encoded data (bytes, bytearray or memoryview)
             text_pos: start of item header in data
 
         Returns:
@@ -86,8 +118,8 @@ class Base:
         if len(data) == 0:
             raise ValueError(f"Decoding for {self.__class__.__name__} without any text")
 
-        # parse format byte
-        format_byte = bytearray(data)[text_pos]
+        # parse format byte, indexing reads the byte in place without copying the data
+        format_byte = data[text_pos]
 
         format_code = (format_byte & 0b11111100) >> 2
         length_bytes = format_byte & 0b00000011
@@ -98,7 +130,7 @@ class Base:
         length = 0
         for _ in range(length_bytes):
             length <<= 8
-            length += bytearray(data)[text_pos]
+            length += data[text_pos]
 
             text_pos += 1
 
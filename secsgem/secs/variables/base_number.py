@@ -17,7 +17,7 @@
 
 from __future__ import annotations
 
-import struct
+from secsgem.secs.packet_data import array_struct
 
 from .base import Base
 
@@ -48,6 +48,15 @@ class BaseNumber(Base):
         if value is not None:
             self.set(value)
 
+    def clone(self) -> BaseNumber:
+        """Create a new variable of the same type and count, without a value.
+
+        Returns:
+            new variable
+
+        """
+        return self.__class__(count=self.count)
+
     def __repr__(self):
         """Generate textual representation for an object of this class."""
         if len(self.value) == 0:
@@ -196,12 +205,20 @@ class BaseNumber(Base):
             encoded data bytes
 
         """
-        result = self.encode_item_header(len(self.value) * self._bytes)
+        return self.encode_item_header(len(self.value) * self._bytes) + array_struct(
+            self._struct_code,
+            len(self.value),
+        ).pack(*self.value)
+
+    def encode_into(self, buffer: bytearray) -> None:
+        """Encode the value and append it to a buffer.
 
-        for value in self.value:
-            result += struct.pack(f">{self._struct_code}", value)
+        Args:
+            buffer: buffer to append the encoded data to
 
-        return result
+        """
+        buffer += self.encode_item_header(len(self.value) * self._bytes)
+        buffer += array_struct(self._struct_code, len(self.value)).pack(*self.value)
 
     def decode(self, data, start=0):
         """Decode the secs byte data to the value.
@@ -215,20 +232,22 @@ class BaseNumber(Base):
         """
         (text_pos, _, length) = self.decode_item_header(data, start)
 
-        result = []
-
-        for _ in range(length // self._bytes):
-            result_text = data[text_pos : text_pos + self._bytes]
+        value_struct = array_struct(self._struct_code, length // self._bytes)
 
-            if len(result_text) != self._bytes:
-                raise ValueError(
-                    f"No enough data found for {self.__class__.__name__} with length {length} at position {start} ",
-                )
+        if len(data) < text_pos + value_struct.size:
+            raise ValueError(
+                f"No enough data found for {self.__class__.__name__} with length {length} at position {start} ",
+            )
 
-            result.append(struct.unpack(f">{self._struct_code}", result_text)[0])
+        values = list(value_struct.unpack_from(data, text_pos))
 
-            text_pos += self._bytes
-
-        self.set(result)
+        # unpacked integers are always within the bounds of the type, floats may be out of bounds (inf/nan).
+        # the normal set is only used to raise the error for invalid values.
+        if self._base_type is float and not all(self._min <= value <= self._max for value in values):
+            self.set(values)
+        elif 0 <= self.count < len(values):
+            raise ValueError(f"Value longer than {self.count} chars")
+        else:
+            self.value = values
 
-        return text_pos
+        return text_pos + value_struct.size
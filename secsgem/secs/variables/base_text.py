@@ -15,6 +15,8 @@
 #####################################################################
 """SECS string variable base type."""
 
+from __future__ import annotations
+
 import unicodedata
 
 from .base import Base
@@ -44,6 +46,15 @@ class BaseText(Base):
         if value is not None:
             self.set(value)
 
+    def clone(self) -> BaseText:
+        """Create a new variable of the same type and count, without a value.
+
+        Returns:
+            new variable
+
+        """
+        return self.__class__(count=self.count)
+
     def __repr__(self):
         """Generate textual representation for an object of this class."""
         if len(self.value) == 0:
@@ -212,7 +223,7 @@ class BaseText(Base):
         result = ""
 
         if length > 0:
-            result = data[text_pos : text_pos + length].decode(self.coding)
+            result = bytes(data[text_pos : text_pos + length]).decode(self.coding)
 
         self.set(result)
 
@@ -15,6 +15,8 @@
 #####################################################################
 """SECS binary variable type."""
 
+from __future__ import annotations
+
 from .base import Base
 
 
@@ -40,6 +42,15 @@ class Binary(Base):
         if value is not None:
             self.set(value)
 
+    def clone(self) -> Binary:
+        """Create a new variable of the same type and count, without a value.
+
+        Returns:
+            new variable
+
+        """
+        return self.__class__(count=self.count)
+
     def __repr__(self):
         """Generate textual representation for an object of this class."""
         if len(self.value) == 0:
@@ -201,6 +212,18 @@ class Binary(Base):
 
         return result
 
+    def encode_into(self, buffer: bytearray) -> None:
+        """Encode the value and append it to a buffer.
+
+        Args:
+            buffer: buffer to append the encoded data to
+
+        """
+        buffer += self.encode_item_header(len(self.value) if self.value is not None else 0)
+
+        if self.value is not None:
+            buffer += self.value
+
     def decode(self, data, start=0):
         """Decode the secs byte data to the value.
 
@@ -217,7 +240,7 @@ class Binary(Base):
         result = None
 
         if length > 0:
-            result = data[text_pos : text_pos + length]
+            result = bytes(data[text_pos : text_pos + length])
 
         self.set(result)
 
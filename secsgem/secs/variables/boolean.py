@@ -15,6 +15,8 @@
 #####################################################################
 """SECS boolean variable type."""
 
+from __future__ import annotations
+
 from .base import Base
 
 
@@ -43,6 +45,15 @@ class Boolean(Base):
         if value is not None:
             self.set(value)
 
+    def clone(self) -> Boolean:
+        """Create a new variable of the same type and count, without a value.
+
+        Returns:
+            new variable
+
+        """
+        return self.__class__(count=self.count)
+
     def __repr__(self):
         """Generate textual representation for an object of this class."""
         if len(self.value) == 0:
@@ -212,16 +223,13 @@ class Boolean(Base):
         """
         (text_pos, _, length) = self.decode_item_header(data, start)
 
-        result = []
-
-        for _ in range(length):
-            if bytearray(data)[text_pos] == 0:
-                result.append(False)
-            else:
-                result.append(True)
+        if len(data) < text_pos + length:
+            raise ValueError(
+                f"No enough data found for {self.__class__.__name__} with length {length} at position {start}",
+            )
 
-            text_pos += 1
+        result = [char != 0 for char in data[text_pos : text_pos + length]]
 
         self.set(result)
 
-        return text_pos
+        return text_pos + length
@@ -15,6 +15,8 @@
 #####################################################################
 """SECS dynamic variable type."""
 
+from __future__ import annotations
+
 from .array import Array
 from .base import Base
 from .binary import Binary
@@ -88,6 +90,15 @@ class Dynamic(Base):
             return hash(self.value.value[0])
         return hash(self.value.value)
 
+    def clone(self) -> Dynamic:
+        """Create a new variable of the same type and format, without a value.
+
+        Returns:
+            new variable
+
+        """
+        return Dynamic(self.types, count=self.count)
+
     def __type_supported(self, typ):
         if not self.types:
             return True
@@ -173,6 +184,15 @@ class Dynamic(Base):
         """
         return self.value.encode()
 
+    def encode_into(self, buffer: bytearray) -> None:
+        """Encode the value and append it to a buffer.
+
+        Args:
+            buffer: buffer to append the encoded data to
+
+        """
+        self.value.encode_into(buffer)
+
     def decode(self, data, start=0):
         """Decode the secs byte data to the value.
 
@@ -268,3 +288,12 @@ class ANYVALUE(Dynamic):
         self.name = self.__class__.__name__
 
         super().__init__([Array, Boolean, U1, U2, U4, U8, I1, I2, I4, I8, F4, F8, String, Binary], value=value)
+
+    def clone(self) -> ANYVALUE:
+        """Create a new variable of the same type and format, without a value.
+
+        Returns:
+            new variable
+
+        """
+        return ANYVALUE()
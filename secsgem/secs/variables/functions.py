@@ -17,13 +17,16 @@
 
 from __future__ import annotations
 
+import functools
 import inspect
 import typing
 
 from secsgem.secs import data_items
 from secsgem.secs.functions.sfdl_tokenizer import SFDLTokenizer
 
+from .array import Array
 from .base import Base
+from .list_type import List
 
 if typing.TYPE_CHECKING:
     from secsgem.secs.functions.sfdl_tokenizer import SFDLToken
@@ -81,7 +84,24 @@ def _generate_from_sfdl(tokenizer: SFDLTokenizer, token_name: str | None = None)
         sub_items.append(_generate_from_sfdl(tokenizer, item_key_token.value if item_key_token else None))
 
 
-def generate(data_format: str | list | Base) -> Base:
+@functools.lru_cache(maxsize=1024)
+def parse_sfdl(data_format: str) -> list | type[Base]:
+    """Parse a SFDL data format string to the list based data format.
+
+    The result is cached, so each format string is only tokenized once.
+    The returned format is shared and must not be modified.
+
+    Args:
+        data_format: SFDL text to parse
+
+    Returns:
+        list based data format or data item class
+
+    """
+    return _generate_from_sfdl(SFDLTokenizer(data_format))
+
+
+def generate(data_format: str | list | type[Base]) -> Base:
     """Generate actual variable from data format.
 
     Args:
@@ -91,16 +111,11 @@ def generate(data_format: str | list | Base) -> Base:
         created variable
 
     """
-    from .array import Array  # pylint: disable=import-outside-toplevel,cyclic-import
-    from .list_type import List  # pylint: disable=import-outside-toplevel,cyclic-import
-
     if data_format is None:
         return None
 
     if isinstance(data_format, str):
-        tokenizer = SFDLTokenizer(data_format)
-
-        data_format = _generate_from_sfdl(tokenizer)
+        data_format = parse_sfdl(data_format)
 
     if isinstance(data_format, list):
         if len(data_format) == 1:
@@ -113,7 +128,7 @@ def generate(data_format: str | list | Base) -> Base:
     raise TypeError(f"Can't handle item of class {data_format.__class__.__name__}")
 
 
-def get_format(data_format: str | list | Base, _showname: bool = False) -> str:
+def get_format(data_format: str | list | type[Base], _showname: bool = False) -> str:
     """Get the format of the function.
 
     Args:
@@ -124,16 +139,11 @@ def get_format(data_format: str | list | Base, _showname: bool = False) -> str:
         string representation of the function
 
     """
-    from .array import Array  # pylint: disable=import-outside-toplevel,cyclic-import
-    from .list_type import List  # pylint: disable=import-outside-toplevel,cyclic-import
-
     if data_format is None:
         return None
 
     if isinstance(data_format, str):
-        tokenizer = SFDLTokenizer(data_format)
-
-        data_format = _generate_from_sfdl(tokenizer)
+        data_format = parse_sfdl(data_format)
 
     if isinstance(data_format, list):
         if len(data_format) == 1:
@@ -141,7 +151,7 @@ def get_format(data_format: str | list | Base, _showname: bool = False) -> str:
         return List.get_format(data_format)
 
     if inspect.isclass(data_format):
-        if issubclass(data_format, Base):
+        if issubclass(data_format, data_items.DataItemBase):
             return data_format.get_format()
         raise TypeError(f"Can't generate data_format for class {data_format.__name__}")
 
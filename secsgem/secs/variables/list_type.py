@@ -136,6 +136,25 @@ class List(Base):
         else:
             self.data[index].set(value)
 
+    def clone(self) -> List:
+        """Create a new variable of the same type and format, without a value.
+
+        The fields are cloned from this list, the data format is not processed again.
+
+        Returns:
+            new variable
+
+        """
+        result = self.__class__.__new__(self.__class__)
+        result.__dict__.update(
+            value=None,
+            name=self.name,
+            data=OrderedDict((field_name, field.clone()) for field_name, field in self.data.items()),
+            _object_intitialized=True,
+        )
+
+        return result
+
     def _generate(self, data_format):
         from .array import Array  # pylint: disable=import-outside-toplevel,cyclic-import
         from .functions import generate  # pylint: disable=import-outside-toplevel,cyclic-import
@@ -243,12 +262,22 @@ class List(Base):
             encoded data bytes
 
         """
-        result = self.encode_item_header(len(self.data))
+        buffer = bytearray()
+        self.encode_into(buffer)
 
-        for field_name in self.data:
-            result += self.data[field_name].encode()
+        return bytes(buffer)
 
-        return result
+    def encode_into(self, buffer: bytearray) -> None:
+        """Encode the value and append it to a buffer.
+
+        Args:
+            buffer: buffer to append the encoded data to
+
+        """
+        buffer += self.encode_item_header(len(self.data))
+
+        for field in self.data.values():
+            field.encode_into(buffer)
 
     def decode(self, data, start=0):
         """Decode the secs byte data to the value.
@@ -263,9 +292,11 @@ class List(Base):
         """
         (text_pos, _, length) = self.decode_item_header(data, start)
 
+        if length > len(self.data):
+            raise ValueError(f"Decoding data for {self.__class__.__name__} has too many fields ({length})")
+
         # list
-        for i in range(length):
-            field_name = list(self.data.keys())[i]
-            text_pos = self.data[field_name].decode(data, text_pos)
+        for field, _ in zip(self.data.values(), range(length)):
+            text_pos = field.decode(data, text_pos)
 
         return text_pos
@@ -17,6 +17,7 @@
 
 from __future__ import annotations
 
+import logging
 import typing
 
 import secsgem.common
@@ -132,6 +133,7 @@ class SecsIProtocol(secsgem.common.Protocol[SecsIMessage, SecsIBlock]):
         - source: connection object that triggered the event
 
         """
+        self._send_queue.open()
         self._thread.start()
         self.events.fire("connected", {"connection": self})
         self.events.fire("communicating", {"connection": self})
@@ -149,6 +151,8 @@ class SecsIProtocol(secsgem.common.Protocol[SecsIMessage, SecsIBlock]):
         self._thread.stop()
 
         self._receive_buffer.clear()
+        self._send_queue.close()
+        self._pending_transactions.clear()
 
     def _on_disconnecting(self, _: dict[str, typing.Any]):
         """Handle connection is about to be closed event.
@@ -175,12 +179,20 @@ class SecsIProtocol(secsgem.common.Protocol[SecsIMessage, SecsIBlock]):
             enq_resonse = self._receive_buffer.pop_byte()
 
             block_info = self._send_queue.get()
+            result = False
 
-            self._connection.send_data(block_info.data)
+            try:
+                self._connection.send_data(block_info.data)
 
-            data_response = self._receive_buffer.wait_for_byte()
+                data_response = self._receive_buffer.wait_for_byte()
+                result = data_response == self.ACK
+            finally:
+                # also resolved if the connection was closed while sending, the sender waits for the result
+                block_info.resolve(result)
 
-            block_info.resolve(data_response == self.ACK)
+                # the receiver rejected the message, don't send its remaining blocks
+                if not result:
+                    self._send_queue.discard_message(block_info)
 
     def _process_received_data(self):
         """Process the receive from communication queue."""
@@ -197,7 +209,7 @@ class SecsIProtocol(secsgem.common.Protocol[SecsIMessage, SecsIBlock]):
 
             length = self._receive_buffer.wait_for_byte(peek=True)
 
-            data = self._receive_buffer.wait_for(length + 3)
+            data = self._receive_buffer.wait_for_view(length + 3)
 
             response = SecsIBlock.decode(data)
 
@@ -218,13 +230,15 @@ class SecsIProtocol(secsgem.common.Protocol[SecsIMessage, SecsIBlock]):
             message: received data message
 
         """
-        decoded_message = self._settings.streams_functions.decode(message)
-        self._communication_logger.info("< %s\n%s", message, decoded_message, extra=self._get_log_extra())
+        if self._communication_logger.isEnabledFor(logging.INFO):
+            self._log_communication(
+                "< %s\n%s",
+                message,
+                secsgem.common.LazySml(message, self._settings.streams_functions),
+            )
 
-        # someone is waiting for this message
-        if message.header.system in self._response_queues:
-            self._response_queues[message.header.system].put_nowait(message)
-        else:
+        # pass to the request sender if someone is waiting for this message
+        if not self._resolve_response(message):
             self.events.fire("message_received", {"connection": source, "message": message})
 
     def _get_log_extra(self) -> dict[str, typing.Any]:
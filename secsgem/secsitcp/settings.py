@@ -60,12 +60,15 @@ class SecsITcpSettings(secsgem.common.Settings):
         self._connect_mode = kwargs.get("connect_mode", SecsITcpConnectMode.CLIENT)
         self._address = kwargs.get("address", "127.0.0.1")
         self._port = kwargs.get("port", 5000)
+        self._receive_buffer_size = kwargs.get("receive_buffer_size", 65536)
+        if self._receive_buffer_size < 1:
+            raise ValueError(f"{self.__class__.__name__} receive_buffer_size must be at least 1")
 
         self._validate_args(kwargs)
 
     @classmethod
     def _args(cls) -> list[str]:
-        return [*super()._args(), "connect_mode", "address", "port"]
+        return [*super()._args(), "connect_mode", "address", "port", "receive_buffer_size"]
 
     @property
     def connect_mode(self) -> SecsITcpConnectMode:
@@ -91,6 +94,16 @@ class SecsITcpSettings(secsgem.common.Settings):
         """
         return self._port
 
+    @property
+    def receive_buffer_size(self) -> int:
+        """Number of bytes read from the socket at once.
+
+        Larger buffers reduce the number of system calls for bulk transfers.
+
+        Default: 65536
+        """
+        return self._receive_buffer_size
+
     def create_protocol(self) -> secsgem.common.Protocol:
         """Protocol class for this configuration."""
         from secsgem.secsi.protocol import SecsIProtocol  # pylint: disable=import-outside-toplevel
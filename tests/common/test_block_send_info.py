@@ -28,6 +28,16 @@ class TestBlockSendInfo:
 
         block_send_info = BlockSendInfo(test_data)
         assert block_send_info.data == test_data
+        assert block_send_info.buffers == [test_data]
+        assert len(block_send_info) == 4
+
+    def test_buffers(self) -> None:
+        """Test BlockSendInfo with data passed as list of buffers."""
+        block_send_info = BlockSendInfo([b"ab", b"", b"cd"])
+
+        assert block_send_info.data == b"abcd"
+        assert block_send_info.buffers == [b"ab", b"", b"cd"]
+        assert len(block_send_info) == 4
 
     def test_failure_result(self) -> None:
         """Test BlockSendInfo with a failure as result."""
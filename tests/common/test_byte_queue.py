@@ -18,6 +18,8 @@ from __future__ import annotations
 
 import threading
 
+import pytest
+
 from secsgem.common import ByteQueue
 
 
@@ -97,3 +99,67 @@ class TestByteQueue:
 
         assert result == b"te"
         assert len(queue) == 2
+
+    def test_peek_returns_view(self):
+        """Test peek returns a view without copying the data."""
+        queue = ByteQueue()
+        queue.append(b"test")
+
+        view = queue.peek(4)
+
+        assert isinstance(view, memoryview)
+        assert view == b"test"
+
+    def test_across_chunks(self):
+        """Test peeking and popping data split over multiple appends."""
+        queue = ByteQueue()
+        queue.append(b"te")
+        queue.append(b"st")
+        queue.append(bytearray(b"data"))
+
+        assert len(queue) == 8
+        assert queue.peek_byte(5) == 97
+        assert queue.peek(3) == b"tes"
+        assert queue.pop(5) == b"testd"
+        assert queue.pop_byte() == 97
+        assert queue.pop(10) == b"ta"
+
+        assert len(queue) == 0
+
+    def test_view_survives_append(self):
+        """Test views stay valid while more data is appended and consumed."""
+        queue = ByteQueue()
+        queue.append(b"test")
+
+        view = queue.pop_view(2)
+        queue.append(b"data")
+        queue.pop(4)
+
+        assert view == b"te"
+
+    def test_pop_byte_empty(self):
+        """Test popping a byte from an empty queue."""
+        queue = ByteQueue()
+
+        with pytest.raises(IndexError):
+            queue.pop_byte()
+
+    def test_wait_for_view(self):
+        """Test waiting for a view of bytes using threading."""
+        queue = ByteQueue()
+        result = None
+
+        def _wait_for_queue():
+            nonlocal result
+            result = queue.wait_for_view(6)
+
+        thread = threading.Thread(target=_wait_for_queue, daemon=True)
+        thread.start()
+
+        queue.append(b"test")
+        queue.append(b"data")
+
+        thread.join()
+
+        assert result == b"testda"
+        assert len(queue) == 2
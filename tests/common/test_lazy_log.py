@@ -0,0 +1,72 @@
+#####################################################################
+# test_lazy_log.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Tests for the lazy log arguments."""
+from __future__ import annotations
+
+import logging
+
+import secsgem.common
+import secsgem.hsms
+import secsgem.secs
+
+
+def create_message(stream: int, function: int, data: bytes) -> secsgem.hsms.HsmsMessage:
+    return secsgem.hsms.HsmsMessage(secsgem.hsms.HsmsStreamFunctionHeader(1, stream, function, True, 0), data)
+
+
+def test_hex():
+    assert str(secsgem.common.LazyHex(b"\x01\xff")) == "01:ff"
+    assert str(secsgem.common.LazyHex([b"\x01", memoryview(b"\x02\xff")[1:]])) == "01:ff"
+    assert str(secsgem.common.LazyHex([b"\x01", b"\xff"])) == "01:ff"
+
+
+def test_sml_cached_per_message():
+    streams_functions = secsgem.hsms.HsmsSettings().streams_functions
+    message = create_message(1, 3, secsgem.secs.functions.SecsS01F03([1]).encode())
+
+    text = str(secsgem.common.LazySml(message, streams_functions))
+
+    assert text.startswith("S1F3 W")
+    assert message.sml(streams_functions) is text
+
+
+def test_sml_undecodable_message():
+    streams_functions = secsgem.hsms.HsmsSettings().streams_functions
+    message = create_message(99, 1, b"\x01\x02")
+
+    assert str(secsgem.common.LazySml(message, streams_functions)) == "S99F1 <undecoded 01:02>"
+
+
+def test_sml_rendered_on_emit(caplog):
+    rendered = []
+
+    class Function(secsgem.secs.functions.SecsS01F03):
+        def __repr__(self):
+            rendered.append(self)
+            return super().__repr__()
+
+    logger = logging.getLogger("communication")
+
+    with caplog.at_level(logging.WARNING, logger="communication"):
+        logger.info("%s", secsgem.common.LazySml(Function()))
+
+    assert not rendered
+
+    with caplog.at_level(logging.INFO, logger="communication"):
+        logger.info("%s", secsgem.common.LazySml(Function()))
+
+    assert len(rendered) == 1
+    assert caplog.records[-1].getMessage().startswith("S1F3 W")
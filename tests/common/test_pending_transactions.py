@@ -0,0 +1,95 @@
+#####################################################################
+# test_pending_transactions.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Tests for the pending transaction table."""
+from __future__ import annotations
+
+import secsgem.common
+import secsgem.hsms
+
+
+class CountingSettings(secsgem.hsms.HsmsSettings):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.timers_started = 0
+
+    def call_later(self, interval, function):
+        self.timers_started += 1
+        return super().call_later(interval, function)
+
+
+def test_resolve():
+    transactions = secsgem.common.PendingTransactions(CountingSettings())
+
+    future = transactions.add(1, 10)
+
+    assert 1 in transactions
+    assert transactions.resolve(1, "reply")
+    assert not transactions.resolve(1, "reply")
+    assert future.result(0) == "reply"
+    assert len(transactions) == 0
+
+
+def test_timeout():
+    transactions = secsgem.common.PendingTransactions(CountingSettings())
+
+    future = transactions.add(1, 0.05)
+
+    assert future.result(1) is None
+    assert len(transactions) == 0
+    assert not transactions.resolve(1, "reply")
+
+
+def test_single_timer_for_many_transactions():
+    settings = CountingSettings()
+    transactions = secsgem.common.PendingTransactions(settings)
+
+    futures = [transactions.add(system, 0.1) for system in range(100)]
+    transactions.resolve(50, "reply")
+
+    assert settings.timers_started == 1
+    assert [future.result(1) for future in futures].count(None) == 99
+
+
+def test_shorter_timeout_expires_first():
+    transactions = secsgem.common.PendingTransactions(CountingSettings())
+
+    long_future = transactions.add(1, 10)
+    short_future = transactions.add(2, 0.05)
+
+    assert short_future.result(1) is None
+    assert not long_future.done()
+
+    transactions.clear()
+
+    assert long_future.result(0) is None
+    assert len(transactions) == 0
+
+
+def test_cancelled_transaction():
+    transactions = secsgem.common.PendingTransactions(CountingSettings())
+
+    cancelled_future = transactions.add(1, 0.05)
+    future = transactions.add(2, 0.05)
+    replied_future = transactions.add(3, 10)
+
+    # the reply of a cancelled request is ignored
+    assert replied_future.cancel()
+    assert transactions.resolve(3, "reply")
+
+    # a cancelled future doesn't stop the others from expiring
+    assert cancelled_future.cancel()
+    assert future.result(1) is None
+    assert len(transactions) == 0
@@ -0,0 +1,99 @@
+#####################################################################
+# test_periodic_scheduler.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Tests for the periodic scheduler."""
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+import secsgem.common
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = secsgem.common.PeriodicScheduler()
+    yield scheduler
+    scheduler.stop()
+
+
+def test_periodic_calls(scheduler):
+    called = threading.Semaphore(0)
+
+    task = scheduler.schedule(0.01, called.release)
+
+    assert all(called.acquire(timeout=1) for _ in range(5))
+
+    task.cancel()
+
+    assert task.count >= 5
+    assert task.cancelled
+
+
+def test_cancel(scheduler):
+    calls = []
+
+    task = scheduler.schedule(0.01, calls.append, 1)
+    task.cancel()
+
+    time.sleep(0.05)
+
+    assert calls == []
+
+
+def test_aligned_deadlines(scheduler):
+    event = threading.Event()
+
+    first = scheduler.schedule(3600, event.set)
+    second = scheduler.schedule(3600, event.set)
+
+    assert first.deadline == second.deadline
+
+
+def test_overruns(scheduler):
+    calls = threading.Semaphore(0)
+
+    def slow():
+        calls.release()
+        time.sleep(0.035)
+
+    task = scheduler.schedule(0.01, slow)
+
+    assert all(calls.acquire(timeout=1) for _ in range(3))
+
+    task.cancel()
+
+    assert task.overruns >= 4
+
+
+def test_exception_keeps_task_running(scheduler):
+    calls = threading.Semaphore(0)
+
+    def failing():
+        calls.release()
+        raise RuntimeError("failed")
+
+    task = scheduler.schedule(0.01, failing)
+
+    assert all(calls.acquire(timeout=1) for _ in range(2))
+
+    task.cancel()
+
+
+def test_invalid_period(scheduler):
+    with pytest.raises(ValueError):
+        scheduler.schedule(0, print)
@@ -0,0 +1,202 @@
+#####################################################################
+# test_protocol_dispatcher.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Tests for dispatching received blocks."""
+from __future__ import annotations
+
+import threading
+import time
+
+import secsgem.common
+import secsgem.hsms
+
+
+def create_block(stream: int, function: int, system: int = 1) -> secsgem.hsms.HsmsBlock:
+    return secsgem.hsms.HsmsBlock(secsgem.hsms.HsmsStreamFunctionHeader(system, stream, function, False, 0), b"")
+
+
+class Recorder:
+    def __init__(self, expected: int, slow_function: int | None = None):
+        self.expected = expected
+        self.slow_function = slow_function
+        self.release = threading.Event()
+        self.dispatched: list[secsgem.hsms.HsmsBlock] = []
+        self.done = threading.Event()
+        self.lock = threading.Lock()
+
+    def __call__(self, source, block):
+        if block.header.function == self.slow_function:
+            self.release.wait(5)
+
+        with self.lock:
+            self.dispatched.append(block)
+            if len(self.dispatched) == self.expected:
+                self.done.set()
+
+
+class TestProtocolDispatcher:
+    def _create_dispatcher(self, recorder: Recorder, **kwargs) -> secsgem.common.ProtocolDispatcher:
+        settings = secsgem.hsms.HsmsSettings(**kwargs)
+        dispatcher = secsgem.common.ProtocolDispatcher(lambda: None, recorder, settings)
+        dispatcher.start()
+
+        return dispatcher
+
+    def test_serial(self):
+        recorder = Recorder(20)
+        dispatcher = self._create_dispatcher(recorder)
+        blocks = [create_block(stream, 1) for stream in range(20)]
+
+        for block in blocks:
+            dispatcher.queue_block(self, block)
+
+        assert recorder.done.wait(5)
+        assert recorder.dispatched == blocks
+
+        dispatcher.stop()
+
+    def test_concurrent_streams(self):
+        recorder = Recorder(11, slow_function=3)
+        dispatcher = self._create_dispatcher(recorder, dispatch_workers=4)
+        slow_block = create_block(7, 3)
+        blocks = [create_block(6, 11, system) for system in range(10)]
+
+        dispatcher.queue_block(self, slow_block)
+        for block in blocks:
+            dispatcher.queue_block(self, block)
+
+        # stream 6 blocks are handled while the stream 7 handler is still running, in receive order
+        assert wait_until(lambda: len(recorder.dispatched) == 10)
+        assert recorder.dispatched == blocks
+
+        recorder.release.set()
+        assert recorder.done.wait(5)
+        assert recorder.dispatched[-1] is slow_block
+
+        dispatcher.stop()
+
+    def test_same_stream_ordered(self):
+        recorder = Recorder(2, slow_function=3)
+        dispatcher = self._create_dispatcher(recorder, dispatch_workers=4)
+        blocks = [create_block(7, 3, 1), create_block(7, 5, 2)]
+
+        for block in blocks:
+            dispatcher.queue_block(self, block)
+
+        assert not recorder.done.wait(0.1)
+        recorder.release.set()
+
+        assert recorder.done.wait(5)
+        assert recorder.dispatched == blocks
+
+        dispatcher.stop()
+
+    def test_stop_shuts_down_pool(self):
+        recorder = Recorder(2)
+        dispatcher = self._create_dispatcher(recorder, dispatch_workers=4)
+        pool_threads = lambda: [thread for thread in threading.enumerate() if "protocol_dispatch_pool" in thread.name]
+
+        dispatcher.queue_block(self, create_block(6, 11))
+        assert wait_until(lambda: len(recorder.dispatched) == 1)
+
+        dispatcher.stop()
+        assert wait_until(lambda: not pool_threads())
+
+        # restarting creates a new pool
+        dispatcher.start()
+        dispatcher.queue_block(self, create_block(6, 11, 2))
+        assert recorder.done.wait(5)
+
+        dispatcher.stop()
+
+    def test_transaction_order(self):
+        recorder = Recorder(2, slow_function=3)
+        dispatcher = self._create_dispatcher(
+            recorder,
+            dispatch_workers=4,
+            dispatch_order=secsgem.common.DispatchOrder.TRANSACTION,
+        )
+        slow_block = create_block(7, 3, 1)
+        block = create_block(7, 5, 2)
+
+        dispatcher.queue_block(self, slow_block)
+        dispatcher.queue_block(self, block)
+
+        # different transaction of the same stream is not blocked
+        assert wait_until(lambda: recorder.dispatched == [block])
+
+        recorder.release.set()
+        assert recorder.done.wait(5)
+
+        dispatcher.stop()
+
+    def test_custom_order(self):
+        recorder = Recorder(2, slow_function=3)
+        dispatcher = self._create_dispatcher(
+            recorder,
+            dispatch_workers=4,
+            dispatch_order=lambda block: block.header.device_id,
+        )
+        blocks = [create_block(7, 3, 1), create_block(6, 11, 2)]
+
+        for block in blocks:
+            dispatcher.queue_block(self, block)
+
+        # same device id, so the stream 6 block waits for the stream 7 block
+        assert not recorder.done.wait(0.1)
+        assert recorder.dispatched == []
+
+        recorder.release.set()
+        assert recorder.done.wait(5)
+        assert recorder.dispatched == blocks
+
+        dispatcher.stop()
+
+    def test_metrics(self):
+        recorder = Recorder(3, slow_function=3)
+        dispatcher = self._create_dispatcher(recorder)
+
+        for block in [create_block(7, 3), create_block(1, 1), create_block(1, 1)]:
+            dispatcher.queue_block(self, block)
+
+        assert wait_until(lambda: dispatcher.metrics.queue_depth == 2)
+
+        time.sleep(0.05)
+        recorder.release.set()
+        assert recorder.done.wait(5)
+        assert wait_until(lambda: dispatcher.metrics.dispatched == 3)
+
+        metrics = dispatcher.metrics
+        assert metrics.queue_depth == 0
+        assert metrics.max_queue_depth == 3
+        assert metrics.max_handler_time >= 0.05
+        assert metrics.max_wait_time >= 0.05
+        assert metrics.average_handler_time <= metrics.max_handler_time
+
+        metrics.reset()
+        assert metrics.dispatched == 0
+        assert metrics.average_handler_time == 0.0
+
+        dispatcher.stop()
+
+
+def wait_until(condition, timeout: float = 5.0) -> bool:
+    end = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > end:
+            return False
+        time.sleep(0.005)
+
+    return True
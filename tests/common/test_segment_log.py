@@ -0,0 +1,148 @@
+#####################################################################
+# test_segment_log.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Tests for the segment log."""
+from __future__ import annotations
+
+import pytest
+
+import secsgem.common
+
+
+def payloads(log: secsgem.common.SegmentLog) -> list[bytes]:
+    return [payload for _, payload in log.records()]
+
+
+def test_append_and_consume(tmp_path):
+    log = secsgem.common.SegmentLog(tmp_path, segment_size=64)
+
+    for index in range(10):
+        assert log.append(f"record{index}".encode())
+
+    assert len(log) == 10
+    assert len(list(tmp_path.glob("*.seg"))) > 1
+
+    for position, _ in list(log.records())[:6]:
+        log.consume(position)
+
+    assert payloads(log) == [f"record{index}".encode() for index in range(6, 10)]
+    assert len(log) == 4
+
+    # segments with only consumed records are deleted
+    assert log.size < 10 * 64
+
+    log.close()
+
+
+def test_restore(tmp_path):
+    log = secsgem.common.SegmentLog(tmp_path, segment_size=64)
+
+    for index in range(5):
+        log.append(f"record{index}".encode())
+
+    log.consume(next(log.records())[0])
+    log.close()
+
+    log = secsgem.common.SegmentLog(tmp_path, segment_size=64)
+
+    assert payloads(log) == [f"record{index}".encode() for index in range(1, 5)]
+
+    log.append(b"new")
+
+    assert payloads(log)[-1] == b"new"
+
+    log.close()
+
+
+def test_restore_fully_consumed(tmp_path):
+    log = secsgem.common.SegmentLog(tmp_path, segment_size=64)
+
+    log.append(b"record")
+    log.consume(next(log.records())[0])
+    log.close()
+
+    log = secsgem.common.SegmentLog(tmp_path, segment_size=64)
+
+    assert len(log) == 0
+    assert not list(tmp_path.glob("*.seg"))
+
+    log.close()
+
+
+def test_overwrite(tmp_path):
+    log = secsgem.common.SegmentLog(tmp_path, segment_size=64, max_size=128)
+
+    for index in range(20):
+        assert log.append(f"record{index:02d}".encode())
+
+    assert log.size <= 128
+    assert log.overwritten > 0
+    assert len(log) + log.overwritten == 20
+    assert payloads(log)[-1] == b"record19"
+
+    log.close()
+
+
+def test_drop(tmp_path):
+    log = secsgem.common.SegmentLog(tmp_path, segment_size=64, max_size=128, overwrite=False)
+
+    results = [log.append(f"record{index:02d}".encode()) for index in range(20)]
+
+    assert not all(results)
+    assert log.size <= 128
+    assert log.dropped == results.count(False)
+    assert payloads(log)[0] == b"record00"
+
+    log.close()
+
+
+def test_large_record(tmp_path):
+    log = secsgem.common.SegmentLog(tmp_path, segment_size=64)
+
+    log.append(b"small")
+    log.append(b"x" * 1000)
+
+    assert payloads(log) == [b"small", b"x" * 1000]
+
+    log.close()
+
+
+def test_empty_record(tmp_path):
+    log = secsgem.common.SegmentLog(tmp_path, segment_size=64)
+
+    with pytest.raises(ValueError):
+        log.append(b"")
+
+    assert len(log) == 0
+
+    log.close()
+
+
+def test_clear(tmp_path):
+    log = secsgem.common.SegmentLog(tmp_path, segment_size=64)
+
+    for index in range(10):
+        log.append(f"record{index}".encode())
+
+    log.clear()
+
+    assert len(log) == 0
+    assert not list(tmp_path.glob("*.seg"))
+
+    log.append(b"new")
+
+    assert payloads(log) == [b"new"]
+
+    log.close()
@@ -0,0 +1,257 @@
+#####################################################################
+# test_selector_loop.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Tests for the selector loop and the pooled protocol dispatcher."""
+from __future__ import annotations
+
+import concurrent.futures
+import socket
+import threading
+import time
+
+import secsgem.common
+import secsgem.hsms
+
+
+class TestSelectorLoop:
+    def setup_method(self):
+        self.loop = secsgem.common.SelectorLoop()
+        self.loop.start()
+
+    def teardown_method(self):
+        self.loop.stop()
+
+    def _wait_for_loop(self):
+        done = threading.Event()
+        self.loop.call_soon(done.set)
+        assert done.wait(1)
+
+    def test_call_soon_in_order(self):
+        calls = []
+
+        for index in range(10):
+            self.loop.call_soon(calls.append, index)
+
+        self._wait_for_loop()
+
+        assert calls == list(range(10))
+
+    def test_call_soon_in_loop_thread(self):
+        result = []
+
+        self.loop.call_soon(lambda: result.append(self.loop.in_loop_thread()))
+        self._wait_for_loop()
+
+        assert result == [True]
+        assert not self.loop.in_loop_thread()
+
+    def test_call_later_in_deadline_order(self):
+        calls = []
+        done = threading.Event()
+
+        self.loop.call_later(0.1, done.set)
+        self.loop.call_later(0.05, calls.append, 2)
+        self.loop.call_later(0.01, calls.append, 1)
+
+        assert done.wait(1)
+        assert calls == [1, 2]
+
+    def test_call_later_cancel(self):
+        calls = []
+        done = threading.Event()
+
+        handle = self.loop.call_later(0.01, calls.append, 1)
+        handle.cancel()
+        self.loop.call_later(0.05, done.set)
+
+        assert done.wait(1)
+        assert handle.cancelled
+        assert calls == []
+
+    def test_exception_in_callback_ignored(self):
+        def fail():
+            raise ValueError("failed")
+
+        self.loop.call_soon(fail)
+        self._wait_for_loop()
+
+        assert self.loop.running
+
+    def test_reader(self):
+        local, remote = socket.socketpair()
+        local.setblocking(False)
+        received = []
+        done = threading.Event()
+
+        def on_readable():
+            received.append(local.recv(1024))
+            done.set()
+
+        self.loop.call_soon(self.loop.add_reader, local, on_readable)
+        self._wait_for_loop()
+        remote.send(b"data")
+
+        assert done.wait(1)
+        assert received == [b"data"]
+
+        self.loop.call_soon(self.loop.remove_reader, local)
+        self._wait_for_loop()
+        remote.send(b"more")
+        self._wait_for_loop()
+
+        assert received == [b"data"]
+
+        local.close()
+        remote.close()
+
+    def test_stop_closes_sockets(self):
+        self.loop.stop()
+
+        assert self.loop._wakeup_send.fileno() == -1
+        assert self.loop._wakeup_receive.fileno() == -1
+
+        self.loop.start()
+        self._wait_for_loop()
+
+
+class TestSelectorTcpConnection:
+    def setup_method(self):
+        self.loop = secsgem.common.SelectorLoop()
+        self.loop.start()
+        self.executor = concurrent.futures.ThreadPoolExecutor(2)
+
+        local, self.remote = socket.socketpair()
+        self.connected = threading.Event()
+
+        self.connection = secsgem.common.SelectorTcpAcceptedConnection(
+            secsgem.hsms.HsmsSettings(),
+            local,
+            self.loop,
+            self.executor,
+        )
+        self.connection.write_buffer_limit = 65536
+        self.connection.on_connected.register(lambda _: self.connected.set())
+        self.connection.enable()
+
+        assert self.connected.wait(1)
+
+    def teardown_method(self):
+        self.connection.disable()
+        self.remote.close()
+        self.loop.stop()
+        self.executor.shutdown(wait=True)
+
+    def _receive(self, length):
+        data = bytearray()
+        while len(data) < length:
+            data += self.remote.recv(length - len(data))
+
+        return bytes(data)
+
+    def test_send_does_not_block(self):
+        writable = threading.Event()
+        self.connection.on_writable.register(lambda _: writable.set())
+
+        chunk = bytes(range(256)) * 256
+        count = 64
+
+        start = time.monotonic()
+        for _ in range(count):
+            assert self.connection.send_buffers([chunk])
+
+        # the remote doesn't read, the data is buffered
+        assert time.monotonic() - start < 1
+        assert not self.connection.writable
+
+        assert self._receive(len(chunk) * count) == chunk * count
+        assert writable.wait(1)
+        assert self.connection.writable
+
+    def test_send_after_close_fails(self):
+        self.connection.disconnect()
+
+        assert not self.connection.send_buffers([b"data"])
+
+
+class TestPooledProtocolDispatcher:
+    def setup_method(self):
+        self.executor = concurrent.futures.ThreadPoolExecutor(4)
+        self.receiver_executor = concurrent.futures.ThreadPoolExecutor(2)
+
+    def teardown_method(self):
+        self.executor.shutdown(wait=True)
+        self.receiver_executor.shutdown(wait=True)
+
+    def _create_dispatcher(self, receiver=lambda: None, dispatcher=lambda source, block: None):
+        return secsgem.common.PooledProtocolDispatcher(
+            receiver,
+            dispatcher,
+            secsgem.hsms.HsmsSettings(),
+            self.receiver_executor,
+            self.executor,
+        )
+
+    def test_blocks_dispatched_in_order(self):
+        dispatched = []
+        done = threading.Event()
+
+        def dispatch(source, block):
+            # give other workers the chance to overtake
+            time.sleep(0.001)
+            dispatched.append(block)
+
+            if block == 99:
+                done.set()
+
+        dispatcher = self._create_dispatcher(dispatcher=dispatch)
+
+        for block in range(100):
+            dispatcher.queue_block(self, block)
+
+        assert done.wait(5)
+        assert dispatched == list(range(100))
+
+    def test_trigger_before_start_kept(self):
+        called = threading.Event()
+        dispatcher = self._create_dispatcher(receiver=called.set)
+
+        dispatcher.trigger_receiver()
+        assert not called.wait(0.05)
+
+        dispatcher.start()
+        assert called.wait(1)
+
+        dispatcher.stop()
+
+    def test_receiver_not_concurrent(self):
+        running = []
+        concurrent_calls = []
+
+        def receive():
+            running.append(1)
+            concurrent_calls.append(len(running))
+            time.sleep(0.001)
+            running.pop()
+
+        dispatcher = self._create_dispatcher(receiver=receive)
+        dispatcher.start()
+
+        for _ in range(50):
+            dispatcher.trigger_receiver()
+
+        dispatcher.stop()
+
+        assert concurrent_calls
+        assert max(concurrent_calls) == 1
@@ -0,0 +1,148 @@
+#####################################################################
+# test_send_queue.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Tests for the send queue."""
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+import secsgem.common
+
+
+def test_priority_order():
+    queue = secsgem.common.SendQueue()
+
+    queue.put(secsgem.common.BlockSendInfo(b"primary1"))
+    queue.put(secsgem.common.BlockSendInfo(b"reply"), secsgem.common.SendPriority.REPLY)
+    queue.put(secsgem.common.BlockSendInfo(b"primary2"))
+    queue.put(secsgem.common.BlockSendInfo(b"control"), secsgem.common.SendPriority.CONTROL)
+
+    assert [queue.get().data for _ in range(4)] == [b"control", b"reply", b"primary1", b"primary2"]
+    assert queue.empty()
+
+    with pytest.raises(IndexError):
+        queue.get()
+
+
+def test_drop():
+    queue = secsgem.common.SendQueue(limit=10, back_pressure=secsgem.common.BackPressure.DROP)
+
+    assert queue.put(secsgem.common.BlockSendInfo(b"0123456789abcdef"))
+
+    block_info = secsgem.common.BlockSendInfo(b"data")
+    assert not queue.put(block_info)
+    assert not block_info.wait()
+
+    assert len(queue) == 1
+    assert queue.dropped == 1
+
+
+def test_drop_whole_message():
+    queue = secsgem.common.SendQueue(limit=10, back_pressure=secsgem.common.BackPressure.DROP)
+
+    assert queue.put(secsgem.common.BlockSendInfo(b"0123"))
+
+    # the first block would fit, but not the whole message
+    block_infos = [secsgem.common.BlockSendInfo(b"0123"), secsgem.common.BlockSendInfo(b"4567")]
+    assert not queue.put_all(block_infos)
+    assert not any(block_info.wait() for block_info in block_infos)
+
+    assert len(queue) == 1
+    assert queue.dropped == 2
+
+
+def test_raise_whole_message():
+    queue = secsgem.common.SendQueue(limit=10, back_pressure=secsgem.common.BackPressure.RAISE)
+
+    queue.put(secsgem.common.BlockSendInfo(b"0123"))
+
+    with pytest.raises(secsgem.common.SendQueueFullError):
+        queue.put_all([secsgem.common.BlockSendInfo(b"0123"), secsgem.common.BlockSendInfo(b"4567")])
+
+    assert len(queue) == 1
+    assert queue.queued_bytes == 4
+
+
+def test_raise():
+    queue = secsgem.common.SendQueue(limit=10, back_pressure=secsgem.common.BackPressure.RAISE)
+
+    queue.put(secsgem.common.BlockSendInfo(b"0123456789"))
+
+    with pytest.raises(secsgem.common.SendQueueFullError):
+        queue.put(secsgem.common.BlockSendInfo(b"data"))
+
+    assert queue.put(secsgem.common.BlockSendInfo(b"link"), secsgem.common.SendPriority.CONTROL)
+    assert len(queue) == 2
+
+
+def test_block_until_space():
+    queue = secsgem.common.SendQueue(limit=10)
+
+    queue.put(secsgem.common.BlockSendInfo(b"0123456789"))
+
+    thread = threading.Thread(target=queue.put, args=(secsgem.common.BlockSendInfo(b"data"),))
+    thread.start()
+    thread.join(0.1)
+
+    assert thread.is_alive()
+    assert len(queue) == 1
+
+    assert queue.get().data == b"0123456789"
+    thread.join(1)
+
+    assert not thread.is_alive()
+    assert queue.get().data == b"data"
+    assert queue.blocked == 1
+
+
+def test_metrics():
+    queue = secsgem.common.SendQueue()
+
+    queue.put(secsgem.common.BlockSendInfo(b"0123"))
+    queue.put(secsgem.common.BlockSendInfo([b"01", b"23", b"45"]))
+
+    assert queue.queued_bytes == 10
+
+    queue.get()
+
+    assert queue.queued_bytes == 6
+    assert queue.max_queued_bytes == 10
+
+
+def test_close():
+    queue = secsgem.common.SendQueue(limit=10)
+
+    queued = secsgem.common.BlockSendInfo(b"0123456789")
+    queue.put(queued)
+
+    waiting = secsgem.common.BlockSendInfo(b"data")
+    thread = threading.Thread(target=queue.put, args=(waiting,))
+    thread.start()
+    thread.join(0.1)
+
+    queue.close()
+    thread.join(1)
+
+    assert not queued.wait()
+    assert not waiting.wait()
+    assert queue.empty()
+
+    assert not queue.put(secsgem.common.BlockSendInfo(b"late"))
+
+    queue.open()
+
+    assert queue.put(secsgem.common.BlockSendInfo(b"data"))
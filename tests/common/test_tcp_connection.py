@@ -0,0 +1,75 @@
+#####################################################################
+# test_tcp_connection.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Tests for the tcp_connection module."""
+from __future__ import annotations
+
+import socket
+import threading
+
+import secsgem.common
+import secsgem.hsms
+
+
+class TestTcpConnectionSend:
+    """Tests for sending data with a TcpConnection."""
+
+    def _create_connection(self):
+        connection = secsgem.common.TcpClientConnection(secsgem.hsms.HsmsSettings())
+        local, remote = socket.socketpair()
+        local.setblocking(False)
+        connection._sock = local
+
+        return connection, remote
+
+    def _receive(self, sock: socket.socket, size: int) -> bytes:
+        data = bytearray()
+        while len(data) < size:
+            data += sock.recv(65536)
+
+        return bytes(data)
+
+    def test_send_buffers(self):
+        """Test buffers are sent in sequence."""
+        connection, remote = self._create_connection()
+
+        assert connection.send_buffers([b"ab", b"", memoryview(b"cd"), b"e"])
+        assert self._receive(remote, 5) == b"abcde"
+
+    def test_send_data(self):
+        """Test sending a single buffer."""
+        connection, remote = self._create_connection()
+
+        assert connection.send_data(b"abcd")
+        assert self._receive(remote, 4) == b"abcd"
+
+    def test_partial_writes(self):
+        """Test buffers exceeding the socket buffer are sent completely."""
+        connection, remote = self._create_connection()
+        buffers = [bytes([index]) * (1024 * 1024) for index in range(8)]
+        result = None
+
+        def _receive_all():
+            nonlocal result
+            result = self._receive(remote, 8 * 1024 * 1024)
+
+        thread = threading.Thread(target=_receive_all, daemon=True)
+        thread.start()
+
+        assert connection.send_buffers(buffers)
+
+        thread.join()
+
+        assert result == b"".join(buffers)
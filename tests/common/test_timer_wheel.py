@@ -0,0 +1,138 @@
+#####################################################################
+# test_timer_wheel.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Tests for the timer wheel."""
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+import secsgem.common
+
+
+@pytest.fixture
+def wheel():
+    # few slots, so the tests cross level boundaries
+    wheel = secsgem.common.TimerWheel(resolution=0.001, slots=4, levels=3)
+    yield wheel
+    wheel.stop()
+
+
+def test_order(wheel):
+    fired = []
+    done = threading.Event()
+
+    for delay in (0.08, 0.02, 0.05, 0.0):
+        wheel.call_later(delay, fired.append, delay, blocking=False)
+
+    wheel.call_later(0.1, done.set)
+
+    assert done.wait(2)
+    assert fired == [0.0, 0.02, 0.05, 0.08]
+
+
+def test_never_early(wheel):
+    fired = []
+    done = threading.Event()
+    start = time.monotonic()
+
+    for index in range(100):
+        wheel.call_later(index * 0.003, lambda delay: fired.append(time.monotonic() - start - delay), index * 0.003)
+
+    wheel.call_later(0.35, done.set)
+
+    assert done.wait(2)
+    assert len(fired) == 100
+    assert min(fired) >= 0
+
+
+def test_beyond_range(wheel):
+    # 4 * 4 * 4 ticks are 64 ms
+    fired = threading.Event()
+    start = time.monotonic()
+
+    wheel.call_later(0.15, fired.set)
+
+    assert fired.wait(2)
+    assert time.monotonic() - start >= 0.15
+
+
+def test_cancel(wheel):
+    fired = threading.Event()
+    done = threading.Event()
+
+    wheel.call_later(0.02, fired.set).cancel()
+    wheel.call_later(0.05, done.set)
+
+    assert done.wait(2)
+    assert not fired.is_set()
+
+
+def test_blocking_functions_on_workers(wheel):
+    threads = set()
+    release = threading.Event()
+    started = threading.Barrier(3, timeout=2)
+
+    def blocking():
+        threads.add(threading.current_thread())
+        started.wait()
+        release.wait(2)
+
+    wheel.call_later(0, blocking)
+    wheel.call_later(0, blocking)
+
+    # both run concurrently, the wheel thread keeps going
+    started.wait()
+    release.set()
+
+    assert len(threads) == 2
+    assert all(thread.name.endswith("_worker") for thread in threads)
+
+
+def test_idle_wheel_fast_forwards(wheel):
+    fired = threading.Event()
+
+    time.sleep(0.05)
+    wheel.call_later(0.01, fired.set, blocking=False)
+
+    assert fired.wait(1)
+    assert len(wheel) == 0
+
+
+def test_busy_workers_not_idle(wheel):
+    release = threading.Event()
+    done = threading.Event()
+    started = threading.Barrier(2, timeout=2)
+
+    def blocking():
+        started.wait()
+        release.wait(2)
+
+    # a finished worker picks up the next blocking function, another one runs while it is busy
+    wheel.call_later(0, lambda: None)
+    time.sleep(0.02)
+    wheel.call_later(0, blocking)
+    started.wait()
+    wheel.call_later(0, done.set)
+
+    assert done.wait(1)
+    release.set()
+
+    # idle workers are reused
+    time.sleep(0.02)
+    wheel.call_later(0, done.set)
+    assert len(wheel._workers) == 2
@@ -0,0 +1,55 @@
+#####################################################################
+# test_versioned_dict.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Tests for the versioned dictionary."""
+from __future__ import annotations
+
+import pytest
+
+import secsgem.common
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda items: items.__setitem__(3, "c"),
+        lambda items: items.__setitem__(1, "c"),
+        lambda items: items.__delitem__(1),
+        lambda items: items.update({3: "c"}),
+        lambda items: items.__ior__({3: "c"}),
+        lambda items: items.setdefault(3, "c"),
+        lambda items: items.pop(1),
+        lambda items: items.popitem(),
+        lambda items: items.clear(),
+    ],
+)
+def test_changes_increment_version(change):
+    items = secsgem.common.VersionedDict({1: "a", 2: "b"})
+    version = items.version
+
+    change(items)
+
+    assert items.version > version
+
+
+def test_reads_keep_version():
+    items = secsgem.common.VersionedDict({1: "a", 2: "b"})
+
+    items.get(1)
+    items.setdefault(1, "c")
+    _ = items[2], list(items.items()), 1 in items
+
+    assert items.version == 0
+    assert items == {1: "a", 2: "b"}
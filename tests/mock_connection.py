@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import datetime
+import struct
 
 import secsgem.common
 import secsgem.hsms
@@ -41,13 +42,26 @@ class MockHsmsConnection(secsgem.common.Connection):
     def disable(self):
         """Disable the connection.
 
-        Close port and stop receiver thread.
+        Close port and stop receiver thread, an established connection is closed.
         """
+        if self._connected:
+            self.disconnect()
+
+    def disconnect(self):
+        """Close the connection."""
+        self._connected = False
+        self.on_disconnected({"source": self})
 
     def simulate_connect(self):
         """Simulate connection established."""
+        self._connected = True
         self.on_connected({"source": self})
 
+    def simulate_disconnect(self):
+        """Simulate connection closed."""
+        self._connected = False
+        self.on_disconnected({"source": self})
+
     def expect_block(self, system_id=None, s_type=None, stream=None, function=None, timeout=5):
         end_time = datetime.datetime.now() + datetime.timedelta(seconds=timeout)
 
@@ -88,7 +102,13 @@ class MockHsmsConnection(secsgem.common.Connection):
 
             return False
 
-        self._packets.append(secsgem.hsms.HsmsBlock.decode(data))
+        # data may contain multiple coalesced blocks
+        while data:
+            length = struct.unpack_from(">L", data)[0] + 4
+            self._packets.append(secsgem.hsms.HsmsBlock.decode(data[:length]))
+            data = data[length:]
+
+        return True
 
     def fail_next_send(self):
         self._fail_send = True
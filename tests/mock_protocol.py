@@ -98,6 +98,12 @@ class MockMessage(secsgem.common.Message[MockBlock]):
         """Get the header."""
         return self._function
 
+    def decode_function(self, function_type):
+        """Decode the data, which might be an already encoded function."""
+        function = function_type()
+        function.decode(self._function.encode())
+        return function
+
     @property
     def complete(self) -> bool:
         """Check if the message is complete."""
@@ -251,7 +257,5 @@ class MockProtocol(secsgem.common.Protocol[secsgem.common.Message, secsgem.commo
             message: message to be injected
 
         """
-        if message.header.system in self._response_queues:
-            self._response_queues[message.header.system].put_nowait(message)
-        else:
+        if not self._resolve_response(message):
             self.events.fire("message_received", {"connection": None, "message": message})
\ No newline at end of file
@@ -69,6 +69,8 @@ class MockHsmsSettings(MockSettings):
 
     def __init__(self, *args, **kwargs) -> None:
         """Initialize settings."""
+        self._linktest_interval = kwargs.pop("linktest_interval", 30.0)
+
         super().__init__(*args, **kwargs)
 
         self._connect_mode = kwargs.get("connect_mode", secsgem.hsms.HsmsConnectMode.ACTIVE)
@@ -99,6 +101,14 @@ class MockHsmsSettings(MockSettings):
         """
         return self._port
 
+    @property
+    def linktest_interval(self) -> float:
+        """Seconds between linktest requests on a connection.
+
+        Default: 30.0
+        """
+        return self._linktest_interval
+
     @property
     def is_active(self) -> bool:
         """Check if connection is active."""
@@ -15,6 +15,7 @@
 #####################################################################
 
 import datetime
+import tempfile
 import threading
 import unittest.mock
 
@@ -584,6 +585,32 @@ class TestGemEquipmentHandlerPassiveControlState(unittest.TestCase):
         self.assertIsNotNone(SV10)
         self.assertEqual(SV10.get(), 123)
 
+    def testStatusVariableBulkCallback(self):
+        self.setupTestStatusVariables(True)
+        self.establishCommunication()
+
+        with unittest.mock.patch.object(self.client, "on_sv_values_request", wraps=self.client.on_sv_values_request) as request:
+            function = self.sendSVRequest(["SV2", "asdfg", 10, 1002])
+
+        request.assert_called_once_with([self.client.status_variables["SV2"], self.client.status_variables[10]])
+
+        self.assertEqual(function[0].get(), "sample sv")
+        self.assertEqual(function[1].get(), [])
+        self.assertEqual(function[2].get(), 123)
+        self.assertEqual(function[3].get(), self.client._get_control_state_id())
+
+    def testStatusVariableBulkCallbackMissingValues(self):
+        self.setupTestStatusVariables(True)
+        self.setupTestDataValues(True)
+
+        with unittest.mock.patch.object(self.client, "on_sv_values_request", return_value=[]):
+            with self.assertRaises(ValueError):
+                self.client._get_sv_values([self.client.status_variables["SV2"], self.client.status_variables[10]])
+
+        with unittest.mock.patch.object(self.client, "on_dv_values_request", return_value=[]):
+            with self.assertRaises(ValueError):
+                self.client._get_dv_values([self.client.data_values[30]])
+
     def testStatusVariableInvalid(self):
         self.setupTestStatusVariables()
         self.establishCommunication()
@@ -1208,6 +1235,103 @@ class TestGemEquipmentHandlerPassiveControlState(unittest.TestCase):
         self.assertEqual(function.RPT[0].V[0].get(), 31337)
         self.assertEqual(function.RPT[0].V[1].get(), 123)
 
+    def testCollectionEventRequestReportBulkCallback(self):
+        self.setupTestDataValues(True)
+        self.setupTestCollectionEvents()
+        self.setupTestStatusVariables(True)
+        self.establishCommunication()
+
+        self.sendCEDefineReport(rptid=1000, vid=[30, 10])
+        self.sendCEDefineReport(rptid=1001, vid=["SV2", 10, 30])
+        self.sendCELinkReport(rptid=[1000, 1001])
+        self.sendCEEnableReport()
+
+        with unittest.mock.patch.object(self.client, "on_sv_values_request", wraps=self.client.on_sv_values_request) as sv_request, \
+                unittest.mock.patch.object(self.client, "on_dv_values_request", wraps=self.client.on_dv_values_request) as dv_request:
+            function = self.sendCERequestReport()
+
+        sv_request.assert_called_once_with([self.client.status_variables[10], self.client.status_variables["SV2"]])
+        dv_request.assert_called_once_with([self.client.data_values[30]])
+
+        self.assertEqual(function.RPT[0].V.get(), [31337, 123])
+        self.assertEqual(function.RPT[1].V.get(), ["sample sv", 123, 31337])
+
+    def testCollectionEventReportPlanEncoding(self):
+        self.setupTestDataValues()
+        self.setupTestCollectionEvents()
+        self.setupTestStatusVariables()
+        self.establishCommunication()
+
+        self.sendCEDefineReport(rptid=1000, vid=[30, "SV2"])
+        self.sendCEDefineReport(rptid="RPT2", vid=[10, 1002])
+        self.sendCELinkReport(rptid=[1000, "RPT2"])
+        self.sendCEEnableReport()
+
+        function = self.sendCERequestReport()
+
+        expected = secsgem.secs.functions.SecsS06F16({
+            "DATAID": 1,
+            "CEID": 50,
+            "RPT": [
+                {"RPTID": 1000, "V": [secsgem.secs.variables.U4(31337), secsgem.secs.variables.String("sample sv")]},
+                {"RPTID": "RPT2", "V": [secsgem.secs.variables.U4(123), secsgem.secs.variables.Binary(self.client._get_control_state_id())]},
+            ],
+        })
+
+        self.assertEqual(function.encode(), expected.encode())
+
+    def testCollectionEventReportPlanUpdate(self):
+        self.setupTestDataValues()
+        self.setupTestCollectionEvents()
+        self.setupTestStatusVariables()
+        self.establishCommunication()
+
+        self.sendCEDefineReport(rptid=1000, vid=[30])
+        self.sendCELinkReport(rptid=[1000])
+
+        # linked, but not enabled yet
+        self.assertEqual(self.sendCERequestReport().RPT.get(), [])
+
+        self.sendCEEnableReport()
+
+        self.assertEqual(self.sendCERequestReport().RPT.get(), [{"RPTID": 1000, "V": [31337]}])
+
+        self.sendCEDefineReport(rptid=1000, vid=[])
+        self.sendCEDefineReport(rptid=1000, vid=[10])
+        self.sendCELinkReport(rptid=[1000])
+        self.sendCEEnableReport()
+
+        self.assertEqual(self.sendCERequestReport().RPT.get(), [{"RPTID": 1000, "V": [123]}])
+
+        self.sendCEEnableReport(enable=False)
+
+        self.assertEqual(self.sendCERequestReport().RPT.get(), [])
+
+    def testCollectionEventReportPlanVariablesChanged(self):
+        self.setupTestDataValues()
+        self.setupTestCollectionEvents()
+        self.setupTestStatusVariables()
+        self.establishCommunication()
+
+        self.sendCEDefineReport(rptid=1000, vid=[30, 10])
+        self.sendCELinkReport(rptid=[1000])
+        self.sendCEEnableReport()
+
+        self.assertEqual(self.sendCERequestReport().RPT.get(), [{"RPTID": 1000, "V": [31337, 123]}])
+
+        # the plan is reused while the variables are unchanged
+        plan = self.client._get_report_plan(50)
+        self.client.status_variables[10].value = 124
+        self.assertIs(self.client._get_report_plan(50), plan)
+
+        # variables replaced after the report was linked are reported
+        self.client.data_values[30] = secsgem.gem.DataValue(30, "replaced DV", secsgem.secs.variables.U4)
+        self.client.data_values[30].value = 42
+        self.client.status_variables[10] = secsgem.gem.StatusVariable(10, "replaced SV", "", secsgem.secs.variables.U4)
+        self.client.status_variables[10].value = 43
+
+        self.assertEqual(self.sendCERequestReport().RPT.get(), [{"RPTID": 1000, "V": [42, 43]}])
+
     def testCollectionEventTrigger(self):
         self.setupTestDataValues()
         self.setupTestCollectionEvents()
@@ -1240,6 +1364,417 @@ class TestGemEquipmentHandlerPassiveControlState(unittest.TestCase):
         self.assertEqual(function.RPT[0].RPTID.get(), 1000)
         self.assertEqual(function.RPT[0].V[0].get(), 31337)
 
+    def sendTraceInitialize(self, trid=5, dsper="00000001", totsmp=2, repgsz=2, svid=[10]):
+        system_id = self.settings.protocol.get_next_system_counter()
+        self.settings.protocol.simulate_message(self.settings.protocol.create_message_for_function(secsgem.secs.functions.SecsS02F23(
+            {"TRID": trid, "DSPER": dsper, "TOTSMP": totsmp, "REPGSZ": repgsz, "SVID": svid}), system_id))
+
+        packet = self.settings.protocol.expect_message(system_id=system_id)
+
+        self.assertIsNotNone(packet)
+        self.assertEqual(packet.header.stream, 2)
+        self.assertEqual(packet.header.function, 24)
+
+        return self.client.settings.streams_functions.decode(packet)
+
+    def testTraceDataCollection(self):
+        self.setupTestStatusVariables()
+        self.establishCommunication()
+
+        function = self.sendTraceInitialize(svid=[10, "SV2"])
+
+        self.assertEqual(function.get(), DataItems().TIAACK.OK)
+
+        packet = self.settings.protocol.expect_message(stream=6)
+
+        self.assertIsNotNone(packet)
+        self.assertEqual(packet.header.stream, 6)
+        self.assertEqual(packet.header.function, 1)
+
+        function = secsgem.secs.functions.SecsS06F01()
+        function.decode(packet.data.encode())
+
+        self.assertEqual(function.TRID.get(), 5)
+        self.assertEqual(function.SMPLN.get(), 2)
+        self.assertEqual(function.SV.get(), [123, "sample sv", 123, "sample sv"])
+
+        end_time = datetime.datetime.now() + datetime.timedelta(seconds=5)
+        while self.client.traces and datetime.datetime.now() < end_time:
+            threading.Event().wait(0.01)
+
+        self.assertEqual(self.client.traces, {})
+
+        # the sender thread is shut down with the traces
+        self.client.stop_traces()
+
+        end_time = datetime.datetime.now() + datetime.timedelta(seconds=5)
+        while any("trace_sender" in thread.name for thread in threading.enumerate()) and datetime.datetime.now() < end_time:
+            threading.Event().wait(0.01)
+
+        self.assertFalse(any("trace_sender" in thread.name for thread in threading.enumerate()))
+
+    def testTraceDataCollectionTerminate(self):
+        self.setupTestStatusVariables()
+        self.establishCommunication()
+
+        function = self.sendTraceInitialize(dsper="000100", totsmp=100, repgsz=1)
+
+        self.assertEqual(function.get(), DataItems().TIAACK.OK)
+        self.assertIn(5, self.client.traces)
+
+        function = self.sendTraceInitialize(dsper="000100", totsmp=0, repgsz=0)
+
+        self.assertEqual(function.get(), DataItems().TIAACK.OK)
+        self.assertEqual(self.client.traces, {})
+
+    def testTraceDataCollectionInvalid(self):
+        self.setupTestStatusVariables()
+        self.establishCommunication()
+
+        self.assertEqual(self.sendTraceInitialize(dsper="000000").get(), DataItems().TIAACK.INVALID_PERIOD)
+        self.assertEqual(self.sendTraceInitialize(dsper="1s").get(), DataItems().TIAACK.INVALID_PERIOD)
+        self.assertEqual(self.sendTraceInitialize(totsmp=2, repgsz=3).get(), DataItems().TIAACK.REPGSZ_INVALID)
+        self.assertEqual(self.sendTraceInitialize(svid=[10, 99]).get(), DataItems().TIAACK.SVID_UNKNOWN)
+        self.assertEqual(self.client.traces, {})
+
+    def setupTestMonitoredVariables(self):
+        self.setupTestStatusVariables()
+        self.client.collection_events.update({
+            60: secsgem.gem.CollectionEvent(60, "test limit event", [2001, 2002, 2003]),
+        })
+        self.client.monitored_variables.update({
+            10: secsgem.gem.MonitoredVariable(10, 60, 0, 1000, 4),
+        })
+
+    def sendDefineLimits(self, data):
+        system_id = self.settings.protocol.get_next_system_counter()
+        self.settings.protocol.simulate_message(self.settings.protocol.create_message_for_function(secsgem.secs.functions.SecsS02F45({"DATAID": 1, "DATA": data}), system_id))
+
+        packet = self.settings.protocol.expect_message(system_id=system_id)
+
+        self.assertIsNotNone(packet)
+        self.assertEqual(packet.header.stream, 2)
+        self.assertEqual(packet.header.function, 46)
+
+        return self.client.settings.streams_functions.decode(packet)
+
+    def sendLimitsRequest(self, vids):
+        system_id = self.settings.protocol.get_next_system_counter()
+        self.settings.protocol.simulate_message(self.settings.protocol.create_message_for_function(secsgem.secs.functions.SecsS02F47(vids), system_id))
+
+        packet = self.settings.protocol.expect_message(system_id=system_id)
+
+        self.assertIsNotNone(packet)
+        self.assertEqual(packet.header.stream, 2)
+        self.assertEqual(packet.header.function, 48)
+
+        return self.client.settings.streams_functions.decode(packet)
+
+    def testLimitsDefine(self):
+        self.setupTestMonitoredVariables()
+        self.establishCommunication()
+
+        function = self.sendDefineLimits([{"VID": 10, "DATA": [{"LIMITID": 1, "DATA": [200, 100]}, {"LIMITID": 0, "DATA": [50, 40]}]}])
+
+        self.assertEqual(function.VLAACK.get(), DataItems().VLAACK.ACK)
+        self.assertEqual(self.client.monitored_variables[10].limits, {0: (50, 40), 1: (200, 100)})
+        self.assertTrue(self.client.monitored_variables[10].zone_above(0))
+        self.assertFalse(self.client.monitored_variables[10].zone_above(1))
+
+        function = self.sendLimitsRequest([10, "SV2"])
+
+        self.assertEqual(function[0].VID.get(), 10)
+        self.assertEqual(function[0].DATA.UNITS.get(), "meters")
+        self.assertEqual(function[0].DATA.LIMITMIN.get(), 0)
+        self.assertEqual(function[0].DATA.LIMITMAX.get(), 1000)
+        self.assertEqual(function[0].DATA.DATA.get(), [{"LIMITID": 0, "UPPERDB": 50, "LOWERDB": 40}, {"LIMITID": 1, "UPPERDB": 200, "LOWERDB": 100}])
+        self.assertEqual(function[1].VID.get(), "SV2")
+        self.assertEqual(function[1].DATA.DATA.get(), [])
+
+        function = self.sendDefineLimits([{"VID": 10, "DATA": [{"LIMITID": 1, "DATA": []}]}])
+
+        self.assertEqual(function.VLAACK.get(), DataItems().VLAACK.ACK)
+        self.assertEqual(self.client.monitored_variables[10].limits, {0: (50, 40)})
+
+        function = self.sendDefineLimits([{"VID": 10, "DATA": []}])
+
+        self.assertEqual(function.VLAACK.get(), DataItems().VLAACK.ACK)
+        self.assertEqual(self.client.monitored_variables[10].limits, {})
+
+    def testLimitsDefineRejected(self):
+        self.setupTestMonitoredVariables()
+        self.establishCommunication()
+
+        function = self.sendDefineLimits([
+            {"VID": 10, "DATA": [{"LIMITID": 0, "DATA": [50, 40]}, {"LIMITID": 1, "DATA": [40, 50]}]},
+            {"VID": "SV2", "DATA": []},
+            {"VID": 99, "DATA": []},
+        ])
+
+        self.assertEqual(function.VLAACK.get(), DataItems().VLAACK.LIMIT_DEF_ERROR)
+        self.assertEqual(function.DATA.get(), [
+            {"VID": 10, "LVACK": DataItems().LVACK.LIMIT_ERROR, "DATA": {"LIMITID": 1, "LIMITACK": DataItems().LIMITACK.UPPERDB_LESS_LOWERDB}},
+            {"VID": "SV2", "LVACK": DataItems().LVACK.NO_LIMITS, "DATA": {"LIMITID": 0, "LIMITACK": 0}},
+            {"VID": 99, "LVACK": DataItems().LVACK.VARIABLE_UNKNOWN, "DATA": {"LIMITID": 0, "LIMITACK": 0}},
+        ])
+        self.assertEqual(self.client.monitored_variables[10].limits, {})
+
+        for limits, limitack in [
+            ([{"LIMITID": 4, "DATA": [50, 40]}], DataItems().LIMITACK.LIMITID_UNKNOWN),
+            ([{"LIMITID": 0, "DATA": [2000, 40]}], DataItems().LIMITACK.UPPERDB_MORE_LIMITMAX),
+            ([{"LIMITID": 0, "DATA": [50, -1]}], DataItems().LIMITACK.LOWERDB_LESS_LIMITMIN),
+            ([{"LIMITID": 0, "DATA": ["A", 40]}], DataItems().LIMITACK.ASCII_ILLEGAL),
+            ([{"LIMITID": 0, "DATA": [50, 40]}, {"LIMITID": 0, "DATA": [60, 40]}], DataItems().LIMITACK.DUPLICATE),
+        ]:
+            function = self.sendDefineLimits([{"VID": 10, "DATA": limits}])
+
+            self.assertEqual(function.VLAACK.get(), DataItems().VLAACK.LIMIT_DEF_ERROR)
+            self.assertEqual(function.DATA[0].DATA.LIMITACK.get(), limitack)
+
+        function = self.sendDefineLimits([{"VID": 10, "DATA": []}, {"VID": 10, "DATA": []}])
+
+        self.assertEqual(function.DATA[0].LVACK.get(), DataItems().LVACK.DUPLICATE_VARIABLE)
+
+    def defineTestLimits(self):
+        self.sendDefineLimits([{"VID": 10, "DATA": [{"LIMITID": 0, "DATA": [200, 100]}]}])
+        self.sendCEDefineReport(vid=[2001, 2002, 2003, 10])
+        self.sendCELinkReport(ceid=60)
+        self.sendCEEnableReport(ceid=[60])
+
+    def testLimitsTransition(self):
+        self.setupTestMonitoredVariables()
+        self.establishCommunication()
+        self.defineTestLimits()
+
+        # inside the deadband, no transition
+        self.client.update_status_variables({10: 150, "SV2": "updated"})
+        self.assertEqual(self.client.status_variables["SV2"].value, "updated")
+
+        self.client.update_status_variables({10: 250})
+
+        packet = self.settings.protocol.expect_message(stream=6, function=11)
+
+        self.assertIsNotNone(packet)
+
+        function = secsgem.secs.functions.SecsS06F11()
+        function.decode(packet.data.encode())
+
+        self.assertEqual(function.CEID.get(), 60)
+        self.assertEqual(function.RPT[0].V.get(), [10, 0, secsgem.gem.LimitTransition.LOWER_TO_UPPER.value, 250])
+
+        self.settings.protocol.simulate_message(self.settings.protocol.create_message_for_function(secsgem.secs.functions.SecsS06F12(0), packet.header.system))
+
+        self.client.update_status_variables({10: 50})
+
+        packet = self.settings.protocol.expect_message(stream=6, function=11)
+
+        self.assertIsNotNone(packet)
+
+        function = secsgem.secs.functions.SecsS06F11()
+        function.decode(packet.data.encode())
+
+        self.assertEqual(function.RPT[0].V.get(), [10, 0, secsgem.gem.LimitTransition.UPPER_TO_LOWER.value, 50])
+
+        self.settings.protocol.simulate_message(self.settings.protocol.create_message_for_function(secsgem.secs.functions.SecsS06F12(0), packet.header.system))
+
+        with self.assertRaises(ValueError):
+            self.client.update_status_variables({99: 1})
+
+    def testLimitsTransitionUnknownVariable(self):
+        self.setupTestMonitoredVariables()
+        self.establishCommunication()
+        self.defineTestLimits()
+
+        # nothing is stored if one of the variables is unknown
+        with self.assertRaises(ValueError):
+            self.client.update_status_variables({10: 250, 99: 1})
+
+        self.assertEqual(self.client.status_variables[10].value, 123)
+
+        self.client.update_status_variables({10: 250})
+
+        packet = self.settings.protocol.expect_message(stream=6, function=11)
+
+        function = secsgem.secs.functions.SecsS06F11()
+        function.decode(packet.data.encode())
+
+        self.assertEqual(function.RPT[0].V.get(), [10, 0, secsgem.gem.LimitTransition.LOWER_TO_UPPER.value, 250])
+
+    def testLimitsTransitionOrder(self):
+        self.setupTestMonitoredVariables()
+        self.establishCommunication()
+        self.defineTestLimits()
+
+        self.client.update_status_variables({10: 250})
+        self.client.update_status_variables({10: 50})
+
+        # transitions are sent in the order they happened
+        for transition, value in ((secsgem.gem.LimitTransition.LOWER_TO_UPPER, 250), (secsgem.gem.LimitTransition.UPPER_TO_LOWER, 50)):
+            packet = self.settings.protocol.expect_message(stream=6, function=11)
+
+            function = secsgem.secs.functions.SecsS06F11()
+            function.decode(packet.data.encode())
+
+            self.assertEqual(function.RPT[0].V.get(), [10, 0, transition.value, value])
+
+            self.settings.protocol.simulate_message(self.settings.protocol.create_message_for_function(secsgem.secs.functions.SecsS06F12(0), packet.header.system))
+
+    def sendSpoolingConfiguration(self, data):
+        system_id = self.settings.protocol.get_next_system_counter()
+        self.settings.protocol.simulate_message(self.settings.protocol.create_message_for_function(secsgem.secs.functions.SecsS02F43(data), system_id))
+
+        packet = self.settings.protocol.expect_message(system_id=system_id)
+
+        self.assertIsNotNone(packet)
+        self.assertEqual(packet.header.stream, 2)
+        self.assertEqual(packet.header.function, 44)
+
+        return self.client.settings.streams_functions.decode(packet)
+
+    def sendRequestSpooledData(self, rsdc):
+        system_id = self.settings.protocol.get_next_system_counter()
+        self.settings.protocol.simulate_message(self.settings.protocol.create_message_for_function(secsgem.secs.functions.SecsS06F23(rsdc), system_id))
+
+        packet = self.settings.protocol.expect_message(system_id=system_id)
+
+        self.assertIsNotNone(packet)
+        self.assertEqual(packet.header.stream, 6)
+        self.assertEqual(packet.header.function, 24)
+
+        return self.client.settings.streams_functions.decode(packet)
+
+    def spoolCollectionEvent(self, directory):
+        self.setupTestDataValues()
+        self.setupTestCollectionEvents()
+        self.establishCommunication()
+
+        self.sendCEDefineReport()
+        self.sendCELinkReport()
+        self.sendCEEnableReport()
+
+        self.client.configure_spooling(directory)
+        function = self.sendSpoolingConfiguration([{"STRID": 6, "FCNID": [11]}])
+        self.assertEqual(function.RSPACK.get(), DataItems().RSPACK.ACK)
+
+        self.client.on_connection_closed(None)
+        self.client.trigger_collection_events([50])
+
+        end_time = datetime.datetime.now() + datetime.timedelta(seconds=5)
+        while len(self.client.spool) == 0 and datetime.datetime.now() < end_time:
+            threading.Event().wait(0.01)
+
+        self.assertEqual(len(self.client.spool), 1)
+
+        self.settings.protocol.received_messages.clear()
+        self.establishCommunication()
+
+    def testSpoolingConfiguration(self):
+        self.establishCommunication()
+
+        function = self.sendSpoolingConfiguration([{"STRID": 6, "FCNID": [11]}, {"STRID": 5, "FCNID": []}])
+
+        self.assertEqual(function.RSPACK.get(), DataItems().RSPACK.ACK)
+        self.assertEqual(self.client.spooled_functions, {6: [11], 5: []})
+
+    def testSpoolingConfigurationRejected(self):
+        self.establishCommunication()
+
+        function = self.sendSpoolingConfiguration([{"STRID": 6, "FCNID": [11]}, {"STRID": 1, "FCNID": []}, {"STRID": 5, "FCNID": [2]}])
+
+        self.assertEqual(function.RSPACK.get(), DataItems().RSPACK.REJECTED)
+        self.assertEqual(function.DATA[0].STRID.get(), 1)
+        self.assertEqual(function.DATA[0].STRACK.get(), DataItems().STRACK.NOT_ALLOWED)
+        self.assertEqual(function.DATA[1].STRID.get(), 5)
+        self.assertEqual(function.DATA[1].STRACK.get(), DataItems().STRACK.SECONDARY)
+        self.assertEqual(function.DATA[1].FCNID.get(), [2])
+        self.assertEqual(self.client.spooled_functions, {})
+
+    def testSpooledDataTransmit(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.spoolCollectionEvent(directory)
+
+            function = self.sendRequestSpooledData(DataItems().RSDC.TRANSMIT)
+            self.assertEqual(function.get(), DataItems().RSDA.ACK)
+
+            packet = self.settings.protocol.expect_message(stream=6, function=11)
+
+            self.assertIsNotNone(packet)
+            self.assertEqual(packet.header.stream, 6)
+            self.assertEqual(packet.header.function, 11)
+
+            function = secsgem.secs.functions.SecsS06F11()
+            function.decode(packet.data.encode())
+
+            self.assertEqual(function.CEID.get(), 50)
+            self.assertEqual(function.RPT[0].V[0].get(), 31337)
+
+            self.settings.protocol.simulate_message(self.settings.protocol.create_message_for_function(secsgem.secs.functions.SecsS06F12(0), packet.header.system))
+
+            end_time = datetime.datetime.now() + datetime.timedelta(seconds=5)
+            while len(self.client.spool) > 0 and datetime.datetime.now() < end_time:
+                threading.Event().wait(0.01)
+
+            self.assertEqual(len(self.client.spool), 0)
+
+            self.client.configure_spooling(None)
+
+    def testSpooledDataPurge(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.spoolCollectionEvent(directory)
+
+            function = self.sendRequestSpooledData(DataItems().RSDC.PURGE)
+
+            self.assertEqual(function.get(), DataItems().RSDA.ACK)
+            self.assertEqual(len(self.client.spool), 0)
+
+            function = self.sendRequestSpooledData(DataItems().RSDC.TRANSMIT)
+
+            self.assertEqual(function.get(), DataItems().RSDA.DENIED_NO_DATA)
+
+            self.client.configure_spooling(None)
+
+    def testSpoolingContinuesUntilTransmitted(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.spoolCollectionEvent(directory)
+
+            # communicating again, but the event is spooled behind the older one
+            self.client.trigger_collection_events([50])
+
+            end_time = datetime.datetime.now() + datetime.timedelta(seconds=5)
+            while len(self.client.spool) == 1 and datetime.datetime.now() < end_time:
+                threading.Event().wait(0.01)
+
+            self.assertEqual(len(self.client.spool), 2)
+            self.assertEqual(self.settings.protocol.received_messages, [])
+
+            self.client.configure_spooling(None)
+
+    def testConfigureSpoolingWaitsForTransmit(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.client.configure_spooling(directory)
+
+            # simulate a running transmission
+            self.client._spool_transmit_lock.acquire()
+
+            thread = threading.Thread(target=self.client.configure_spooling, args=(None,))
+            thread.start()
+            thread.join(0.1)
+
+            self.assertTrue(thread.is_alive())
+            self.assertIsNotNone(self.client.spool)
+
+            self.client._spool_transmit_lock.release()
+            thread.join(1)
+
+            self.assertIsNone(self.client.spool)
+
+    def testSpooledDataNotConfigured(self):
+        self.establishCommunication()
+
+        function = self.sendRequestSpooledData(DataItems().RSDC.TRANSMIT)
+
+        self.assertEqual(function.get(), DataItems().RSDA.DENIED_NO_DATA)
+
     def setupTestEquipmentConstants(self, use_callback=False):
         self.client.equipment_constants.update({
             20: secsgem.gem.EquipmentConstant(20, "sample1, numeric ECID, I4", 0, 500, 50, "degrees", secsgem.secs.variables.I4, use_callback),
@@ -1606,6 +2141,26 @@ class TestGemEquipmentHandlerPassiveControlState(unittest.TestCase):
 
         self.assertFalse(self.client.alarms[25].set)
 
+    def testAlarmTriggerOnNotCommunicating(self):
+        self.setupTestAlarms()
+        self.establishCommunication()
+
+        function = self.sendAlarmEnable()
+
+        # spooling is not configured, so the alarm report is discarded instead of waiting for a reply
+        self.client.on_connection_closed(None)
+        self.settings.protocol.received_messages.clear()
+
+        clientCommandThread = threading.Thread(target=self.client.set_alarm, args=(25,), name="TestGemEquipmentHandlerPassiveControlState_testAlarmTriggerOnNotCommunicating")
+        clientCommandThread.daemon = True  # make thread killable on program termination
+        clientCommandThread.start()
+
+        clientCommandThread.join(1)
+        self.assertFalse(clientCommandThread.is_alive())
+
+        self.assertTrue(self.client.alarms[25].set)
+        self.assertEqual(self.settings.protocol.received_messages, [])
+
     def testAlarmTriggerOnDisabled(self):
         self.setupTestAlarms()
         self.establishCommunication()
@@ -103,6 +103,35 @@ class TestGemHostHandlerPassive(unittest.TestCase, GemHandlerPassiveGroup):
         clientCommandThread.join(1)
         self.assertFalse(clientCommandThread.is_alive())
 
+    def testSubscribeCollectionEvents(self):
+        self.establishCommunication()
+
+        clientCommandThread = threading.Thread(target=self.client.subscribe_collection_events, args=({10: [20], 11: [21, 22], 12: []}, 2), name="TestGemHostHandlerPassive_testSubscribeCollectionEvents")
+        clientCommandThread.daemon = True  # make thread killable on program termination
+        clientCommandThread.start()
+
+        for function, reply in ((33, secsgem.secs.functions.SecsS02F34(secsgem.secs.data_items.DRACK.ACK)),
+                                (35, secsgem.secs.functions.SecsS02F36(secsgem.secs.data_items.LRACK.ACK)),
+                                (37, secsgem.secs.functions.SecsS02F38(secsgem.secs.data_items.ERACK.ACCEPTED))):
+            # both chunks are sent before the first reply
+            packets = [self.settings.protocol.expect_message(function=function) for _ in range(2)]
+            functions = [self.client.settings.streams_functions.decode(packet) for packet in packets]
+
+            if function == 33:
+                self.assertEqual([report["VID"].get() for report in functions[0]["DATA"]], [[20], [21, 22]])
+                self.assertEqual([report["VID"].get() for report in functions[1]["DATA"]], [[]])
+            elif function == 37:
+                self.assertEqual(functions[0]["CEID"].get(), [10, 11])
+                self.assertEqual(functions[1]["CEID"].get(), [12])
+
+            for packet in packets:
+                self.settings.protocol.simulate_message(self.settings.protocol.create_message_for_function(reply, packet.header.system))
+
+        clientCommandThread.join(1)
+        self.assertFalse(clientCommandThread.is_alive())
+
+        self.assertEqual(sorted(self.client.report_subscriptions.values()), [[], [20], [21, 22]])
+
     def testSubscribeCollectionEvent(self):
         self.establishCommunication()
 
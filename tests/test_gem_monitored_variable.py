@@ -0,0 +1,89 @@
+#####################################################################
+# test_gem_monitored_variable.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Tests for the limit evaluation of monitored variables."""
+from __future__ import annotations
+
+import random
+
+import secsgem.gem
+
+UP = secsgem.gem.LimitTransition.LOWER_TO_UPPER.value
+DOWN = secsgem.gem.LimitTransition.UPPER_TO_LOWER.value
+
+
+def create_variable(limits):
+    variable = secsgem.gem.MonitoredVariable(1, 10, 0, 100)
+    variable.set_limits(limits)
+    return variable
+
+
+def test_initial_value_without_transitions():
+    variable = create_variable({0: (20, 10), 1: (60, 50)})
+
+    assert variable.evaluate(55) == []
+    assert variable.zone_above(0)
+    assert not variable.zone_above(1)
+
+
+def test_deadband():
+    variable = create_variable({0: (20, 10)})
+    variable.evaluate(5)
+
+    assert variable.evaluate(20) == []
+    assert variable.evaluate(21) == [(0, UP)]
+    assert variable.evaluate(15) == []
+    assert variable.evaluate(10) == []
+    assert variable.evaluate(9) == [(0, DOWN)]
+    assert variable.evaluate(15) == []
+
+
+def test_crossing_multiple_limits():
+    variable = create_variable({0: (20, 10), 1: (60, 50), 2: (40, 30)})
+    variable.evaluate(0)
+
+    assert variable.evaluate(100) == [(0, UP), (2, UP), (1, UP)]
+    assert variable.evaluate(0) == [(1, DOWN), (2, DOWN), (0, DOWN)]
+
+
+def test_no_limits():
+    variable = create_variable({})
+
+    assert variable.evaluate(0) == []
+    assert variable.evaluate(1000) == []
+
+
+def test_matches_full_evaluation():
+    limits = {0: (20, 10), 1: (60, 50), 2: (40, 30), 3: (45, 45)}
+    variable = create_variable(limits)
+    rng = random.Random(1)
+
+    value = 50.0
+    variable.evaluate(value)
+    above = {limitid: value > upper for limitid, (upper, _) in limits.items()}
+
+    for _ in range(10000):
+        value = min(100.0, max(0.0, value + rng.uniform(-5, 5)))
+
+        expected = set()
+        for limitid, (upper, lower) in limits.items():
+            if not above[limitid] and value > upper:
+                above[limitid] = True
+                expected.add((limitid, UP))
+            elif above[limitid] and value < lower:
+                above[limitid] = False
+                expected.add((limitid, DOWN))
+
+        assert set(variable.evaluate(value)) == expected
@@ -0,0 +1,196 @@
+#####################################################################
+# test_hsms_aio.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Tests for the asyncio HSMS protocol."""
+from __future__ import annotations
+
+import asyncio
+
+import secsgem.hsms
+import secsgem.hsms.aio
+from secsgem.secs.functions import SecsS01F01, SecsS01F02, SecsS01F03
+
+
+class AioTestPeer:
+    """Passive server answering S1F1 with S1F2 and ignoring all other functions."""
+
+    def __init__(self):
+        self.protocols: list[secsgem.hsms.aio.HsmsAioProtocol] = []
+        self.server: asyncio.AbstractServer | None = None
+
+    def _on_connection(self, protocol: secsgem.hsms.aio.HsmsAioProtocol):
+        self.protocols.append(protocol)
+        protocol.events.message_received += self._on_message_received
+
+    def _on_message_received(self, data):
+        protocol, message = data["connection"], data["message"]
+
+        if (message.header.stream, message.header.function) == (1, 1):
+            protocol.send_response(SecsS01F02(["MDLN", "SOFTREV"]), message.header.system)
+
+    async def start(self) -> secsgem.hsms.HsmsSettings:
+        settings = secsgem.hsms.HsmsSettings(
+            connect_mode=secsgem.hsms.HsmsConnectMode.PASSIVE,
+            port=0,
+        )
+        self.server = await secsgem.hsms.aio.start_server(settings, self._on_connection)
+
+        port = self.server.sockets[0].getsockname()[1]
+
+        return secsgem.hsms.HsmsSettings(port=port, t3=0.5, t6=0.5)
+
+    async def stop(self):
+        for protocol in self.protocols:
+            await protocol.close()
+
+        self.server.close()
+        await self.server.wait_closed()
+
+
+def run(test):
+    async def _run():
+        peer = AioTestPeer()
+        settings = await peer.start()
+        try:
+            await test(peer, settings)
+        finally:
+            await peer.stop()
+
+    asyncio.run(_run())
+
+
+class TestHsmsAioProtocol:
+    def test_select(self):
+        async def _test(peer, settings):
+            protocol = await secsgem.hsms.aio.open_connection(settings)
+
+            assert await protocol.wait_selected(1)
+            assert protocol.selected
+            assert peer.protocols[0].selected
+
+            await protocol.close()
+
+            assert not protocol.connected
+
+        run(_test)
+
+    def test_linktest(self):
+        async def _test(peer, settings):
+            protocol = await secsgem.hsms.aio.open_connection(settings)
+
+            response = await protocol.send_linktest_req()
+
+            assert response is not None
+            assert response.header.s_type == secsgem.hsms.HsmsSType.LINKTEST_RSP
+
+            await protocol.close()
+
+        run(_test)
+
+    def test_send_and_waitfor_response(self):
+        async def _test(peer, settings):
+            protocol = await secsgem.hsms.aio.open_connection(settings)
+            await protocol.wait_selected(1)
+
+            responses = await asyncio.gather(*[protocol.send_and_waitfor_response(SecsS01F01()) for _ in range(10)])
+
+            for response in responses:
+                function = settings.streams_functions.decode(response)
+                assert isinstance(function, SecsS01F02)
+                assert function.get() == ["MDLN", "SOFTREV"]
+
+            await protocol.close()
+
+        run(_test)
+
+    def test_reply_timeout(self):
+        async def _test(peer, settings):
+            protocol = await secsgem.hsms.aio.open_connection(settings)
+            await protocol.wait_selected(1)
+
+            assert await protocol.send_and_waitfor_response(SecsS01F03()) is None
+
+            await protocol.close()
+
+        run(_test)
+
+    def test_disconnect_resolves_pending(self):
+        async def _test(peer, settings):
+            protocol = await secsgem.hsms.aio.open_connection(settings)
+            await protocol.wait_selected(1)
+
+            request = asyncio.ensure_future(protocol.send_and_waitfor_response(SecsS01F03()))
+            await asyncio.sleep(0.05)
+            await peer.protocols[0].close()
+
+            assert await request is None
+            assert not protocol.selected
+
+        run(_test)
+
+    def test_reject_when_not_selected(self):
+        async def _test(peer, settings):
+            protocol = await secsgem.hsms.aio.open_connection(settings)
+            await protocol.wait_selected(1)
+
+            peer.protocols[0].connection_state.deselect()
+
+            response = await protocol.send_and_waitfor_response(SecsS01F01())
+
+            assert response is not None
+            assert response.header.s_type == secsgem.hsms.HsmsSType.REJECT_REQ
+
+            await protocol.close()
+
+        run(_test)
+
+    def test_not_selected_timeout(self):
+        async def _test():
+            settings = secsgem.hsms.HsmsSettings(connect_mode=secsgem.hsms.HsmsConnectMode.PASSIVE, port=0, t7=0.1)
+            protocols = []
+            server = await secsgem.hsms.aio.start_server(settings, protocols.append)
+
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+            assert await asyncio.wait_for(reader.read(), 1) == b""
+            assert not protocols[0].connected
+
+            writer.close()
+            server.close()
+            await server.wait_closed()
+
+        asyncio.run(_test())
+
+    def test_linktest_failed(self):
+        async def _test():
+            async def _ignore(reader, writer):
+                await reader.read()
+                writer.close()
+
+            server = await asyncio.start_server(_ignore, "127.0.0.1", 0)
+
+            port = server.sockets[0].getsockname()[1]
+            settings = secsgem.hsms.HsmsSettings(port=port, t6=0.1, linktest_interval=0.1)
+            protocol = await secsgem.hsms.aio.open_connection(settings)
+
+            await asyncio.wait_for(protocol._closed, 1)
+
+            assert not protocol.connected
+
+            server.close()
+            await server.wait_closed()
+
+        asyncio.run(_test())
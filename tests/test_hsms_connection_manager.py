@@ -0,0 +1,141 @@
+#####################################################################
+# test_hsms_connection_manager.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Tests for the HSMS connection manager."""
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import secsgem.gem
+import secsgem.hsms
+import secsgem.hsms.aio
+from secsgem.secs.functions import SecsS01F01, SecsS01F02
+
+
+class PeerThread:
+    """Passive asyncio server in a background thread, answering S1F1 with S1F2."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.protocols: list[secsgem.hsms.aio.HsmsAioProtocol] = []
+        self.server: asyncio.AbstractServer | None = None
+        self.port = 0
+
+    def _on_connection(self, protocol: secsgem.hsms.aio.HsmsAioProtocol):
+        self.protocols.append(protocol)
+        protocol.events.message_received += self._on_message_received
+
+    def _on_message_received(self, data):
+        protocol, message = data["connection"], data["message"]
+
+        if (message.header.stream, message.header.function) == (1, 1):
+            protocol.send_response(SecsS01F02(["MDLN", "SOFTREV"]), message.header.system)
+
+    async def _start(self):
+        settings = secsgem.hsms.HsmsSettings(connect_mode=secsgem.hsms.HsmsConnectMode.PASSIVE, port=0)
+        self.server = await secsgem.hsms.aio.start_server(settings, self._on_connection)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def _stop(self):
+        for protocol in self.protocols:
+            await protocol.close()
+
+        self.server.close()
+        await self.server.wait_closed()
+
+    def start(self):
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self.loop).result()
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self._stop(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+class TestHsmsConnectionManager:
+    def setup_method(self):
+        self.peer = PeerThread()
+        self.peer.start()
+
+        self.manager = secsgem.hsms.HsmsConnectionManager(max_workers=2, max_timer_workers=2)
+        self.manager.start()
+
+    def teardown_method(self):
+        self.manager.stop()
+        self.peer.stop()
+
+    def _create_protocol(self) -> tuple[secsgem.hsms.HsmsProtocol, threading.Event]:
+        settings = secsgem.hsms.HsmsSettings(connection_manager=self.manager, port=self.peer.port, t3=2, t5=0.2, t6=2)
+        protocol = settings.create_protocol()
+
+        selected = threading.Event()
+        protocol.events.communicating += lambda _: selected.set()
+
+        return protocol, selected
+
+    def test_many_connections(self):
+        protocols = [self._create_protocol() for _ in range(5)]
+
+        for protocol, _ in protocols:
+            protocol.enable()
+
+        for _, selected in protocols:
+            assert selected.wait(5)
+
+        for protocol, _ in protocols:
+            response = protocol.send_and_waitfor_response(SecsS01F01())
+
+            assert response is not None
+            assert secsgem.hsms.HsmsSettings().streams_functions.decode(response).get() == ["MDLN", "SOFTREV"]
+
+        assert len(self.peer.protocols) == 5
+        assert len(self.manager.connections) == 5
+
+        for protocol, _ in protocols:
+            protocol.disable()
+
+            assert not protocol._connection.connected
+
+    def test_reconnect(self):
+        protocol, selected = self._create_protocol()
+        disconnected = threading.Event()
+        protocol.events.disconnected += lambda _: disconnected.set()
+
+        protocol.enable()
+        assert selected.wait(5)
+
+        selected.clear()
+        asyncio.run_coroutine_threadsafe(self.peer.protocols[0].close(), self.peer.loop).result()
+
+        assert disconnected.wait(5)
+        assert selected.wait(5)
+        assert len(self.peer.protocols) == 2
+
+        protocol.disable()
+
+    def test_create_handler(self):
+        handler = self.manager.create_handler(port=self.peer.port)
+
+        assert isinstance(handler, secsgem.gem.GemHostHandler)
+        assert handler.settings.connection_manager is self.manager
+        assert self.manager.handlers == [handler]
+
+        handler = self.manager.create_handler(secsgem.gem.GemEquipmentHandler, port=self.peer.port)
+
+        assert isinstance(handler, secsgem.gem.GemEquipmentHandler)
@@ -16,8 +16,12 @@
 
 import unittest
 import errno
+import socket
+import threading
+import time
 
 import secsgem.common
+import secsgem.hsms
 
 
 class TestTopLevelFunctions(unittest.TestCase):
@@ -27,3 +31,57 @@ class TestTopLevelFunctions(unittest.TestCase):
         self.assertFalse(secsgem.common.is_errorcode_ewouldblock(errno.EBADF))
         self.assertTrue(secsgem.common.is_errorcode_ewouldblock(errno.EAGAIN))
         self.assertTrue(secsgem.common.is_errorcode_ewouldblock(errno.EWOULDBLOCK))
+
+
+class TestTcpConnectionLifecycle(unittest.TestCase):
+    def testClientDisableWhileConnected(self):
+        listener = socket.create_server(("127.0.0.1", 0))
+        connected = threading.Event()
+        disconnected = threading.Event()
+
+        connection = secsgem.common.TcpClientConnection(secsgem.hsms.HsmsSettings(port=listener.getsockname()[1]))
+        connection.on_connected.register(lambda _: connected.set())
+        connection.on_disconnected.register(lambda _: disconnected.set())
+        connection.enable()
+
+        peer, _ = listener.accept()
+        self.assertTrue(connected.wait(1))
+
+        start = time.monotonic()
+        connection.disable()
+
+        # disable returns after the connection was closed, without polling delays
+        self.assertTrue(disconnected.is_set())
+        self.assertLess(time.monotonic() - start, 0.2)
+        self.assertFalse(connection.connection_thread.is_alive())
+
+        peer.close()
+        listener.close()
+
+    def testClientDisableWhileWaitingToReconnect(self):
+        listener = socket.create_server(("127.0.0.1", 0))
+        port = listener.getsockname()[1]
+        listener.close()
+
+        connection = secsgem.common.TcpClientConnection(secsgem.hsms.HsmsSettings(port=port))
+        connection.enable()
+
+        time.sleep(0.1)
+
+        start = time.monotonic()
+        connection.disable()
+
+        self.assertLess(time.monotonic() - start, 0.2)
+        self.assertFalse(connection.connection_thread.is_alive())
+
+    def testServerDisableWhileListening(self):
+        connection = secsgem.common.TcpServerConnection(secsgem.hsms.HsmsSettings(address="127.0.0.1", port=0))
+        connection.enable()
+
+        time.sleep(0.1)
+
+        start = time.monotonic()
+        connection.disable()
+
+        self.assertLess(time.monotonic() - start, 0.2)
+        self.assertFalse(connection._server_thread.is_alive())
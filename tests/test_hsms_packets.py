@@ -245,6 +245,14 @@ class TestHsmsStreamFunctionHeader(unittest.TestCase):
 
         self.assertEqual(packet.blocks[0].encode(), b"\x00\x00\x00\n\x00d\x81\x01\x00\x00\x00\x00\x00{")
 
+    def testEncodeBuffers(self):
+        packet = secsgem.hsms.HsmsMessage(secsgem.hsms.HsmsStreamFunctionHeader(123, 1, 1, True, 100), b"\x01\x02")
+
+        self.assertEqual(
+            packet.blocks[0].encode_buffers(),
+            [b"\x00\x00\x00\x0c\x00d\x81\x01\x00\x00\x00\x00\x00{", b"\x01\x02"],
+        )
+
     def testDecode(self):
         block = secsgem.hsms.HsmsBlock.decode(b"\x00\x00\x00\n\x00d\x81\x01\x00\x00\x00\x00\x00{")
 
@@ -15,8 +15,10 @@
 #####################################################################
 
 import threading
+import time
 import unittest
 
+import secsgem.common
 import secsgem.hsms
 
 from mock_connection import MockHsmsConnection
@@ -61,6 +63,27 @@ class TestHsmsProtocolHandlerPassive(unittest.TestCase):
         self.assertEqual(packet.header.s_type.value, 0x05)
         self.assertEqual(packet.header.device_id, 0xffff)
 
+    def testLinktestTimerDoesNotWaitForResponse(self):
+        self.settings.connection.simulate_connect()
+        timer = self.client._linktest_timer
+
+        # returns before the response was received
+        self.client._on_linktest_timer()
+
+        packet = self.settings.connection.expect_block(s_type=0x05)
+        self.assertIsNot(packet, None)
+        self.assertIs(self.client._linktest_timer, timer)
+
+        self.settings.connection.simulate_message(secsgem.hsms.HsmsMessage(secsgem.hsms.HsmsLinktestRspHeader(packet.header.system), b""))
+
+        # timer is restarted when the response arrives
+        for _ in range(100):
+            if self.client._linktest_timer is not timer:
+                break
+            time.sleep(0.01)
+
+        self.assertIsNot(self.client._linktest_timer, timer)
+
     def testSelect(self):
         self.settings.connection.simulate_connect()
 
@@ -73,6 +96,60 @@ class TestHsmsProtocolHandlerPassive(unittest.TestCase):
         self.assertEqual(packet.header.s_type.value, 0x02)
         self.assertEqual(packet.header.device_id, 0xffff)
 
+    def testDispatchMetrics(self):
+        self.settings.connection.simulate_connect()
+
+        system_id = self.settings.protocol.get_next_system_counter()
+        self.settings.connection.simulate_message(secsgem.hsms.HsmsMessage(secsgem.hsms.HsmsSelectReqHeader(system_id), b""))
+
+        self.assertIsNot(self.settings.connection.expect_block(system_id=system_id), None)
+
+        # handler finishes after sending the response
+        for _ in range(100):
+            if self.client.dispatch_metrics.dispatched == 1:
+                break
+            time.sleep(0.01)
+
+        self.assertEqual(self.client.dispatch_metrics.dispatched, 1)
+        self.assertEqual(self.client.dispatch_metrics.queue_depth, 0)
+
+
+    def testNotSelectedTimeout(self):
+        self.client._settings.timeouts.t7 = 0.1
+
+        disconnected = threading.Event()
+        self.client.events.disconnected += lambda _: disconnected.set()
+
+        self.settings.connection.simulate_connect()
+
+        self.assertTrue(disconnected.wait(2))
+
+    def testSelectedBeforeNotSelectedTimeout(self):
+        self.client._settings.timeouts.t7 = 0.1
+
+        disconnected = threading.Event()
+        self.client.events.disconnected += lambda _: disconnected.set()
+
+        self.settings.connection.simulate_connect()
+
+        system_id = self.settings.protocol.get_next_system_counter()
+        self.settings.connection.simulate_message(secsgem.hsms.HsmsMessage(secsgem.hsms.HsmsSelectReqHeader(system_id), b""))
+
+        self.assertFalse(disconnected.wait(0.3))
+
+    def testNetworkIntercharacterTimeout(self):
+        self.client._settings.timeouts.t8 = 0.1
+
+        disconnected = threading.Event()
+        self.client.events.disconnected += lambda _: disconnected.set()
+
+        self.settings.connection.simulate_connect()
+
+        # first half of a block, the rest never arrives
+        data = secsgem.hsms.HsmsMessage(secsgem.hsms.HsmsLinktestReqHeader(1), b"").blocks[0].encode()
+        self.settings.connection.on_data({"source": self.settings.connection, "data": data[:7]})
+
+        self.assertTrue(disconnected.wait(2))
 
     def testSelectWhileDisconnecting(self):
         self.settings.connection.simulate_connect()
@@ -166,6 +243,60 @@ class TestHsmsProtocolHandlerPassive(unittest.TestCase):
 
         print(self.client)
 
+    def testSendQueueCoalesced(self):
+        writes = []
+        send_data = self.settings.connection.send_data
+
+        def _send_data(data):
+            writes.append(data)
+            send_data(data)
+            return True
+
+        self.settings.connection.send_data = _send_data
+
+        block_infos = [
+            secsgem.common.BlockSendInfo(secsgem.hsms.HsmsMessage(secsgem.hsms.HsmsLinktestReqHeader(system), b"").blocks[0].encode_buffers())
+            for system in range(3)
+        ]
+        for block_info in block_infos:
+            self.client._send_queue.put(block_info)
+
+        self.client._process_send_queue()
+
+        self.assertEqual(len(writes), 1)
+        self.assertEqual([packet.header.system for packet in self.settings.connection._packets], [0, 1, 2])
+        self.assertTrue(all(block_info.wait() for block_info in block_infos))
+
+    def testSendQueueConnectionClosed(self):
+        def _send_buffers(buffers):
+            raise ConnectionError("closed")
+
+        self.settings.connection.send_buffers = _send_buffers
+
+        block_infos = [
+            secsgem.common.BlockSendInfo(secsgem.hsms.HsmsMessage(secsgem.hsms.HsmsLinktestReqHeader(system), b"").blocks[0].encode_buffers())
+            for system in range(2)
+        ]
+        for block_info in block_infos:
+            self.client._send_queue.put(block_info)
+
+        with self.assertRaises(ConnectionError):
+            self.client._process_send_queue()
+
+        self.assertFalse(any(block_info.wait() for block_info in block_infos))
+
+    def testSendQueueControlFirst(self):
+        data_message = self.client._create_message_for_function(secsgem.secs.functions.SecsS01F03(), 1)
+        control_message = secsgem.hsms.HsmsMessage(secsgem.hsms.HsmsLinktestReqHeader(2), b"")
+
+        for message in [data_message, control_message]:
+            block_info = secsgem.common.BlockSendInfo(message.blocks[0].encode_buffers())
+            self.client._send_queue.put(block_info, self.client._send_priority(message))
+
+        self.client._process_send_queue()
+
+        self.assertEqual([packet.header.system for packet in self.settings.connection._packets], [2, 1])
+
 
 class TestHsmsProtocolActive(unittest.TestCase):
     def setUp(self):
@@ -280,6 +411,37 @@ class TestHsmsProtocolActive(unittest.TestCase):
 
         print(self.client)
 
+    def testSendRequestPipelined(self):
+        self.settings.connection.simulate_connect()
+
+        packet = self.settings.connection.expect_block(s_type=0x01)
+        self.settings.connection.simulate_message(secsgem.hsms.HsmsMessage(secsgem.hsms.HsmsSelectRspHeader(packet.header.system), b""))
+
+        futures = [self.client.send_request(secsgem.secs.functions.SecsS01F01()) for _ in range(3)]
+
+        packets = [self.settings.connection.expect_block(function=1) for _ in futures]
+        self.assertTrue(all(packet.header.system in self.client._pending_transactions for packet in packets))
+
+        # reply out of order
+        for packet in reversed(packets):
+            self.settings.connection.simulate_message(
+                self.generate_stream_function_packet(packet.header.system, secsgem.secs.functions.SecsS01F02())
+            )
+
+        for future, packet in zip(futures, packets):
+            self.assertEqual(future.result(1).header.system, packet.header.system)
+
+        self.assertFalse(any(packet.header.system in self.client._pending_transactions for packet in packets))
+
+    def testSendRequestResolvedOnDisconnect(self):
+        self.settings.connection.simulate_connect()
+
+        future = self.client.send_request(secsgem.secs.functions.SecsS01F01())
+
+        self.settings.connection.simulate_disconnect()
+
+        self.assertIsNone(future.result(1))
+
     def testSecsPacketWithoutSecsDecode(self):
         self.settings.connection.simulate_connect()
 
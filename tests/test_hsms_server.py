@@ -0,0 +1,204 @@
+#####################################################################
+# test_hsms_server.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Tests for the multi-client HSMS server."""
+from __future__ import annotations
+
+import asyncio
+import socket
+import threading
+import time
+
+import secsgem.gem
+import secsgem.hsms
+import secsgem.hsms.aio
+from secsgem.secs.functions import SecsS01F01, SecsS01F13
+
+
+def wait_until(condition, timeout=5.0):
+    end = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > end:
+            return False
+        time.sleep(0.01)
+
+    return True
+
+
+def can_connect(port: int) -> bool:
+    try:
+        socket.create_connection(("127.0.0.1", port), timeout=1).close()
+    except OSError:
+        return False
+
+    return True
+
+
+class TestHsmsServer:
+    def setup_method(self):
+        self.manager = secsgem.hsms.HsmsConnectionManager(max_workers=4)
+        self.manager.start()
+
+    def teardown_method(self):
+        self.manager.stop()
+
+    def _client_settings(self, server: secsgem.hsms.HsmsServer) -> secsgem.hsms.HsmsSettings:
+        return secsgem.hsms.HsmsSettings(port=server.port, t3=2, t6=2)
+
+    def test_many_sessions(self):
+        server = self.manager.create_server(port=0)
+        server.start()
+
+        async def run_clients():
+            settings = self._client_settings(server)
+            clients = await asyncio.gather(*(secsgem.hsms.aio.open_connection(settings) for _ in range(20)))
+
+            for client in clients:
+                assert await client.wait_selected(5)
+
+            # establish communication, the equipment only answers S1F1 when communicating
+            await asyncio.gather(*(client.send_and_waitfor_response(SecsS01F13()) for client in clients))
+
+            responses = await asyncio.gather(*(client.send_and_waitfor_response(SecsS01F01()) for client in clients))
+            assert len(server.sessions) == 20
+
+            for client in clients:
+                await client.close()
+
+            return responses
+
+        responses = asyncio.run(run_clients())
+
+        assert all(response is not None for response in responses)
+        assert all(response.header.function == 2 for response in responses)
+        assert wait_until(lambda: not server.sessions)
+
+    def test_session_events(self):
+        server = self.manager.create_server(port=0)
+        opened = []
+        closed = threading.Event()
+        server.events.session_opened += lambda data: opened.append(data["handler"])
+        server.events.session_closed += lambda _: closed.set()
+        server.start()
+
+        async def run_client():
+            client = await secsgem.hsms.aio.open_connection(self._client_settings(server))
+            assert await client.wait_selected(5)
+            await client.close()
+
+        asyncio.run(run_client())
+
+        assert closed.wait(5)
+        assert len(opened) == 1
+        assert isinstance(opened[0], secsgem.gem.GemEquipmentHandler)
+
+    def test_peer_settings(self):
+        server = self.manager.create_server(
+            secsgem.secs.SecsHandler,
+            port=0,
+            device_id=1,
+            peers={"127.0.0.1": {"device_id": 5}},
+        )
+        server.start()
+
+        async def run_client():
+            client = await secsgem.hsms.aio.open_connection(self._client_settings(server))
+            assert await client.wait_selected(5)
+
+            handler = server.sessions[0]
+            await client.close()
+
+            return handler
+
+        handler = asyncio.run(run_client())
+
+        assert isinstance(handler, secsgem.secs.SecsHandler)
+        assert handler.settings.device_id == 5
+        assert handler.settings.address == "127.0.0.1"
+
+    def test_unknown_peer_rejected(self):
+        server = self.manager.create_server(port=0, accept_unknown_peers=False)
+        server.start()
+
+        async def run_client():
+            client = await secsgem.hsms.aio.open_connection(self._client_settings(server))
+            assert not await client.wait_selected(1)
+            assert not client.connected
+
+        asyncio.run(run_client())
+
+        assert not server.sessions
+
+    def test_invalid_peer_settings_closes_socket(self, caplog):
+        server = self.manager.create_server(port=0, peers={"127.0.0.1": {"invalid_arg": 1}})
+        server.start()
+
+        async def run_client():
+            client = await secsgem.hsms.aio.open_connection(self._client_settings(server))
+            assert not await client.wait_selected(1)
+            assert not client.connected
+
+        asyncio.run(run_client())
+
+        assert not server.sessions
+        assert "creating session for 127.0.0.1" in caplog.text
+
+    def test_stop_closes_sessions(self):
+        server = self.manager.create_server(port=0)
+        server.start()
+
+        async def run_client():
+            client = await secsgem.hsms.aio.open_connection(self._client_settings(server))
+            assert await client.wait_selected(5)
+
+            await asyncio.get_running_loop().run_in_executor(None, server.stop)
+
+            for _ in range(100):
+                if not client.connected:
+                    break
+                await asyncio.sleep(0.05)
+
+            assert not client.connected
+
+        asyncio.run(run_client())
+
+        assert not server.sessions
+
+    def test_stop_from_loop_thread(self):
+        server = self.manager.create_server(port=0)
+        server.start()
+        port = server.port
+
+        stopped = threading.Event()
+
+        def stop():
+            server.stop()
+            stopped.set()
+
+        # like a session_closed handler, called in the loop thread
+        self.manager.loop.call_soon(stop)
+
+        assert stopped.wait(5)
+        assert not can_connect(port)
+
+    def test_stop_without_running_loop(self):
+        server = self.manager.create_server(port=0)
+        server.start()
+        port = server.port
+
+        self.manager.stop()
+        server.stop()
+
+        assert not can_connect(port)
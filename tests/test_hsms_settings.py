@@ -32,6 +32,13 @@ class TestHsmsSettings:
         assert settings.connect_mode == secsgem.hsms.HsmsConnectMode.ACTIVE
         assert settings.address == "127.0.0.1"
         assert settings.port == 5000
+        assert settings.receive_buffer_size == 65536
+        assert settings.linktest_interval == 30.0
+        assert settings.connection_manager is None
+        assert settings.dispatch_workers == 0
+        assert settings.dispatch_order == secsgem.common.DispatchOrder.STREAM
+        assert settings.send_queue_limit == 64 * 1024 * 1024
+        assert settings.send_back_pressure == secsgem.common.BackPressure.BLOCK
 
     def test_with_args(self):
         settings = secsgem.hsms.HsmsSettings(
@@ -41,6 +48,12 @@ class TestHsmsSettings:
             connect_mode=secsgem.hsms.HsmsConnectMode.PASSIVE,
             address="123.123.123.123",
             port=1234,
+            receive_buffer_size=1048576,
+            linktest_interval=10.0,
+            dispatch_workers=4,
+            dispatch_order=secsgem.common.DispatchOrder.TRANSACTION,
+            send_queue_limit=1024,
+            send_back_pressure=secsgem.common.BackPressure.RAISE,
         )
 
         assert settings.device_type == secsgem.common.DeviceType.HOST
@@ -51,6 +64,29 @@ class TestHsmsSettings:
         assert settings.connect_mode == secsgem.hsms.HsmsConnectMode.PASSIVE
         assert settings.address == "123.123.123.123"
         assert settings.port == 1234
+        assert settings.receive_buffer_size == 1048576
+        assert settings.linktest_interval == 10.0
+        assert settings.dispatch_workers == 4
+        assert settings.dispatch_order == secsgem.common.DispatchOrder.TRANSACTION
+        assert settings.send_queue_limit == 1024
+        assert settings.send_back_pressure == secsgem.common.BackPressure.RAISE
+
+    def test_with_invalid_receive_buffer_size(self):
+        with pytest.raises(ValueError) as exc:
+            secsgem.hsms.HsmsSettings(
+                receive_buffer_size=0,
+            )
+        assert str(exc.value) == "HsmsSettings receive_buffer_size must be at least 1"
+
+    def test_with_connection_manager(self):
+        manager = secsgem.hsms.HsmsConnectionManager(max_workers=1, max_io_workers=1, max_timer_workers=1)
+        settings = secsgem.hsms.HsmsSettings(connection_manager=manager)
+
+        assert settings.connection_manager is manager
+        assert isinstance(settings.create_connection(), secsgem.common.SelectorTcpClientConnection)
+        assert isinstance(settings.create_dispatcher(print, print), secsgem.common.PooledProtocolDispatcher)
+
+        manager.stop()
 
     def test_with_invalid(self):
         with pytest.raises(ValueError) as exc:
@@ -19,6 +19,8 @@ import inspect
 import pytest
 
 import secsgem.secs.data_items
+import secsgem.secs.variables
+from secsgem.secs.data_items.data_items import DataItems
 
 
 def find_subclasses(module):
@@ -29,3 +31,33 @@ class TestDataItems:
     @pytest.mark.parametrize("cls", find_subclasses(secsgem.secs.data_items))
     def test_constructor_without_value(self, cls):
         cls()
+
+
+class DummyVID(secsgem.secs.data_items.DataItemBase):
+    name = "VID"
+
+    __type__ = secsgem.secs.variables.U4
+
+
+class TestDataItemsContainer:
+    def test_item(self):
+        data_items = DataItems()
+
+        assert data_items.item("VID") is secsgem.secs.data_items.VID
+        assert data_items.VID is secsgem.secs.data_items.VID
+
+    def test_unknown_item(self):
+        data_items = DataItems()
+
+        assert data_items.item("UNKNOWN") is None
+
+        with pytest.raises(AttributeError):
+            data_items.UNKNOWN
+
+    def test_update(self):
+        data_items = DataItems()
+
+        data_items.update(DummyVID)
+
+        assert data_items.item("VID") is DummyVID
+        assert data_items.VID is DummyVID
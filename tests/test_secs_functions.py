@@ -313,6 +313,21 @@ class testFunctionBase(unittest.TestCase):
     def test_class_repr_header_only(self):
         assert str(SecsS01F01) == "Header only"
 
+    def test_instances_independent(self):
+        function1 = SecsS06F11({"DATAID": 1, "CEID": 2, "RPT": [{"RPTID": 3, "V": [4]}]})
+        function2 = SecsS06F11()
+
+        function1.RPT[0].V.append(5)
+
+        assert function2.get() == {"DATAID": None, "CEID": None, "RPT": []}
+        assert function1.RPT[0].V.get() == [4, 5]
+
+    def test_decode_array_items_independent(self):
+        function = SecsS06F11()
+        function.decode(SecsS06F11({"DATAID": 1, "CEID": 2, "RPT": [{"RPTID": 3, "V": [4]}, {"RPTID": 5, "V": [6, 7]}]}).encode())
+
+        assert function.get() == {"DATAID": 1, "CEID": 2, "RPT": [{"RPTID": 3, "V": [4]}, {"RPTID": 5, "V": [6, 7]}]}
+
 
 def generate_stream_list():
     return [(function.stream, function) for function in secs_streams_functions]
@@ -83,6 +83,13 @@ class TestSecsHandler(unittest.TestCase):
 
         assert str(exc.value) == "'Undefined function requested: S99F01'"
 
+    def testSendRequestsInvalidWindow(self):
+        settings = MockSettings(MockProtocol)
+        client = secsgem.secs.SecsHandler(settings)
+
+        with pytest.raises(ValueError):
+            client.send_requests([secsgem.secs.functions.SecsS01F01()], window=0)
+
     def testStreamFunctionInvalidFunction(self):
         settings = MockSettings(MockProtocol)
         client = secsgem.secs.SecsHandler(settings)
@@ -444,6 +451,32 @@ class TestSecsHandlerPassive(unittest.TestCase):
         clientCommandThread.join(1)
         self.assertFalse(clientCommandThread.is_alive())
 
+    def testRequestECsBatch(self):
+        self.settings.protocol.simulate_connect()
+
+        results = []
+        clientCommandThread = threading.Thread(target=lambda: results.extend(self.client.request_ecs_batch([[1], [2], [3]], window=2)), name="TestSecsHandlerPassive_testRequestECsBatch")
+        clientCommandThread.daemon = True  # make thread killable on program termination
+        clientCommandThread.start()
+
+        # two requests are in flight before the first response
+        first = self.settings.protocol.expect_message(function=13)
+        second = self.settings.protocol.expect_message(function=13)
+
+        self.assertEqual(self.client.settings.streams_functions.decode(first).get(), [1])
+        self.assertEqual(self.client.settings.streams_functions.decode(second).get(), [2])
+
+        self.settings.protocol.simulate_message(self.settings.protocol.create_message_for_function(secsgem.secs.functions.SecsS02F14([20]), second.header.system))
+        self.settings.protocol.simulate_message(self.settings.protocol.create_message_for_function(secsgem.secs.functions.SecsS02F14([10]), first.header.system))
+
+        third = self.settings.protocol.expect_message(function=13)
+        self.settings.protocol.simulate_message(self.settings.protocol.create_message_for_function(secsgem.secs.functions.SecsS02F14([30]), third.header.system))
+
+        clientCommandThread.join(1)
+        self.assertFalse(clientCommandThread.is_alive())
+
+        self.assertEqual([result.get() for result in results], [[10], [20], [30]])
+
     def testSetEC(self):
         self.settings.protocol.simulate_connect()
 
@@ -0,0 +1,56 @@
+#####################################################################
+# test_secs_items.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Tests for the item classes."""
+from __future__ import annotations
+
+import pytest
+
+from secsgem.secs.items import ItemA, ItemB, ItemF4, ItemF8, ItemI4, ItemL, ItemU2
+
+
+class TestItemNumberArray:
+    """Tests for bulk encoding and decoding of numeric items."""
+
+    @pytest.mark.parametrize("item_type", [ItemU2, ItemI4, ItemF8])
+    def test_encode_decode_big_array(self, item_type):
+        """Test a big array survives an encode/decode round trip."""
+        values = [item_type._type(index % 1000) for index in range(100000)]
+
+        assert item_type.decode(item_type(values).encode()).value == values
+
+    def test_decode_out_of_bounds_float(self):
+        """Test decoding a float outside the type bounds raises."""
+        with pytest.raises(ValueError, match="out of bounds"):
+            ItemF4.decode(b"\x91\x04\x7f\x80\x00\x00")
+
+
+class TestItemEncodeInto:
+    """Tests for encoding items into a shared buffer."""
+
+    def test_encode_into_appends(self):
+        """Test encode_into appends to existing buffer content."""
+        item = ItemL([ItemU2([1, 2]), ItemL([ItemA("test"), ItemB(b"\x01")])])
+        buffer = bytearray(b"\xff")
+
+        item.encode_into(buffer)
+
+        assert bytes(buffer) == b"\xff" + item.encode()
+
+    def test_encode_nested(self):
+        """Test encoding of a nested list."""
+        item = ItemL([ItemU2(1), ItemL([ItemA("a")])])
+
+        assert item.encode() == b"\x01\x02\xa9\x02\x00\x01\x01\x01A\x01a"
@@ -0,0 +1,84 @@
+#####################################################################
+# test_secs_packet_data.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Tests for the packet_data module."""
+from __future__ import annotations
+
+import struct
+
+import pytest
+
+from secsgem.secs.items import Item, ItemL, ItemU2
+from secsgem.secs.packet_data import PacketData
+
+
+class TestPacketData:
+    """Tests for PacketData class."""
+
+    def test_get_advances_position(self):
+        """Test reading data moves the cursor."""
+        data = PacketData(b"\x01\x02\x03\x04\x05")
+
+        assert data.get_one() == 1
+        assert data.get(2) == b"\x02\x03"
+        assert data.position == 3
+        assert data.remaining == 2
+
+    def test_get_view_does_not_copy(self):
+        """Test views returned share the underlying buffer."""
+        buffer = bytearray(b"\x01\x02\x03\x04")
+        data = PacketData(buffer)
+
+        data.get_one()
+        view = data.get_view(2)
+
+        buffer[1] = 0xFF
+
+        assert view[0] == 0xFF
+
+    def test_get_past_end(self):
+        """Test reading past the end returns the available data only."""
+        data = PacketData(b"\x01\x02")
+
+        assert data.get(5) == b"\x01\x02"
+        assert data.remaining == 0
+
+    def test_unpack(self):
+        """Test unpacking with a precompiled struct."""
+        data = PacketData(b"\x00\x01\x00\x02\x00")
+
+        assert data.unpack(struct.Struct(">HH")) == (1, 2)
+        assert data.position == 4
+
+    def test_unpack_not_enough_data(self):
+        """Test unpacking with not enough remaining data."""
+        data = PacketData(b"\x00\x01\x00")
+
+        with pytest.raises(ValueError, match="Not enough data"):
+            data.unpack(struct.Struct(">HH"))
+
+    def test_item_decode_from_memoryview(self):
+        """Test items can be decoded from a slice of a bigger buffer."""
+        encoded = ItemL([ItemU2([1, 2]), ItemU2(3)]).encode()
+        buffer = memoryview(b"\xAA" + encoded + b"\xBB")
+
+        item = Item.decode(buffer[1:-1])
+
+        assert item.value == [[1, 2], 3]
+
+    def test_item_decode_incomplete_header(self):
+        """Test decoding an item header with missing length bytes."""
+        with pytest.raises(ValueError, match="Not enough data"):
+            Item.decode(b"\xA6\x00")
@@ -13,7 +13,12 @@
 # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
 # GNU Lesser General Public License for more details.
 #####################################################################
-from secsgem.secs.functions import StreamsFunctions, SecsS01F00
+import pytest
+
+import secsgem.hsms
+import secsgem.secsi
+import secsgem.secsi.message
+from secsgem.secs.functions import StreamsFunctions, SecsS01F00, SecsS01F03
 from secsgem.secs.functions.base import SecsStreamFunction
 
 class DummyS01F00(SecsStreamFunction):
@@ -44,3 +49,44 @@ class TestStreamsFunctions:
 
         assert sf.function(1, 0) != SecsS01F00
         assert sf.function(1, 0) == DummyS01F00
+
+    def test_update_stream(self):
+        sf = StreamsFunctions()
+
+        sf.update(DummyS01F00)
+
+        assert DummyS01F00 in sf.stream(1)
+        assert SecsS01F00 not in sf.stream(1)
+
+    def test_unknown_function(self):
+        sf = StreamsFunctions()
+
+        assert sf.function(99, 1) is None
+        assert sf.stream(99) == []
+
+    def test_duplicate_function(self):
+        sf = StreamsFunctions([SecsS01F00, DummyS01F00])
+
+        with pytest.raises(ValueError):
+            sf.function(1, 0)
+
+    def test_decode_cached_on_message(self):
+        sf = StreamsFunctions()
+        message = secsgem.hsms.HsmsMessage(
+            secsgem.hsms.HsmsStreamFunctionHeader(1, 1, 3, True, 0), SecsS01F03([1, 2]).encode()
+        )
+
+        function = sf.decode(message)
+
+        assert function.get() == [1, 2]
+        assert sf.decode(message) is function
+
+    def test_decode_not_cached_for_incomplete_message(self):
+        sf = StreamsFunctions()
+        message = secsgem.secsi.message.SecsIMessage(
+            secsgem.secsi.SecsIHeader(1, 0, 1, 3, require_response=True, last_block=False),
+            SecsS01F03([1, 2]).encode(),
+            complete=False,
+        )
+
+        assert sf.decode(message) is not sf.decode(message)
@@ -703,6 +703,37 @@ class TestSecsVarList(unittest.TestCase):
         self.assertEqual(secsvar.MDLN, "MDLN1")
         self.assertEqual(secsvar.SOFTREV, "SOFTREV1")
 
+    def testClone(self):
+        secsvar = List([DataItems().MDLN, DataItems().SOFTREV], ["MDLN1", "SOFTREV1"])
+
+        clone = secsvar.clone()
+        clone.MDLN = "MDLN2"
+
+        self.assertEqual(clone.get(), {"MDLN": "MDLN2", "SOFTREV": ""})
+        self.assertEqual(secsvar.get(), {"MDLN": "MDLN1", "SOFTREV": "SOFTREV1"})
+
+    def testEncodeInto(self):
+        secsvar = List([DataItems().MDLN, DataItems().SOFTREV], ["MDLN1", "SOFTREV1"])
+        buffer = bytearray(b"\xff")
+
+        secsvar.encode_into(buffer)
+
+        self.assertEqual(bytes(buffer), b"\xff\x01\x02A\x05MDLN1A\x08SOFTREV1")
+
+    def testDecodeMemoryview(self):
+        secsvar = List([DataItems().MDLN, DataItems().SOFTREV])
+
+        secsvar.decode(memoryview(b"\x01\x02A\x05MDLN1A\x08SOFTREV1"))
+
+        self.assertEqual(secsvar.MDLN, "MDLN1")
+        self.assertEqual(secsvar.SOFTREV, "SOFTREV1")
+
+    def testDecodeTooManyFields(self):
+        secsvar = List([DataItems().MDLN, DataItems().SOFTREV])
+
+        with self.assertRaises(ValueError):
+            secsvar.decode(b"\x01\x03A\x05MDLN1A\x08SOFTREV1A\x00")
+
 
 class TestSecsVarArray(unittest.TestCase):
     def testConstructor(self):
@@ -897,6 +928,13 @@ class TestSecsVarBinary(unittest.TestCase):
 
         self.assertEqual(secsvar.get(), b"\x01\x0b\x19")
 
+    def testDecodeMemoryview(self):
+        secsvar = Binary()
+
+        secsvar.decode(memoryview(b"!\x03\x01\x0b\x19"))
+
+        self.assertEqual(secsvar.get(), b"\x01\x0b\x19")
+
 
 class TestSecsVarBoolean(unittest.TestCase):
     def testHash(self):
@@ -986,6 +1024,12 @@ class TestSecsVarBoolean(unittest.TestCase):
 
         self.assertEqual(secsvar.get(), [True, True, False])
 
+    def testDecodeMissingData(self):
+        secsvar = Boolean()
+
+        with self.assertRaises(ValueError):
+            secsvar.decode(b"%\x03\x01\x01")
+
     def testLen(self):
         secsvar = Boolean([True, False, True])
 
@@ -1014,6 +1058,15 @@ class TestSecsVarString(unittest.TestCase):
         with self.assertRaises(ValueError):
             secsvar.set(None)
 
+    def testClone(self):
+        secsvar = String("Test", count=5)
+
+        clone = secsvar.clone()
+
+        self.assertIsInstance(clone, String)
+        self.assertEqual(clone.count, 5)
+        self.assertEqual(clone.get(), "")
+
     def testSetWithIllegalType(self):
         secsvar = String()
 
@@ -1610,6 +1663,20 @@ class TestSecsVarF4(unittest.TestCase):
 
         self.assertEqual(secsvar.get(), [123, 234, -345])
 
+    def testDecodeOutOfBounds(self):
+        secsvar = F4()
+
+        with self.assertRaises(ValueError):
+            secsvar.decode(b"\x91\x04\x7f\x80\x00\x00")
+
+    def testEncodeDecodeBigArray(self):
+        values = [index / 4 for index in range(100000)]
+
+        secsvar = F4()
+        secsvar.decode(F4(values).encode())
+
+        self.assertEqual(secsvar.get(), values)
+
 
 class TestSecsVarU8(unittest.TestCase):
     def testHash(self):
@@ -0,0 +1,111 @@
+#####################################################################
+# test_secsi_protocol.py
+#
+# (c) Copyright 2024, Benjamin Parzella. All rights reserved.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#####################################################################
+"""Tests for the SECS-I protocol."""
+from __future__ import annotations
+
+import secsgem.common
+import secsgem.secsi
+import secsgem.secsi.message
+import secsgem.secsitcp
+
+
+class MockSecsIConnection(secsgem.common.Connection):
+    """Connection answering ENQ with EOT and blocks with NAK or ACK."""
+
+    def __init__(self, settings: secsgem.common.Settings, rejected_blocks: int = 0) -> None:
+        super().__init__(settings)
+
+        self.blocks: list[bytes] = []
+        self.rejected_blocks = rejected_blocks
+
+    def enable(self):
+        """Enable the connection."""
+
+    def disable(self):
+        """Disable the connection."""
+
+    def simulate_connect(self):
+        """Simulate connection established."""
+        self.on_connected({"source": self})
+
+    def send_data(self, data: bytes) -> bool:
+        """Send data to the remote host."""
+        if data == bytes([secsgem.secsi.SecsIProtocol.ENQ]):
+            self._respond(secsgem.secsi.SecsIProtocol.EOT)
+            return True
+
+        self.blocks.append(data)
+
+        if len(self.blocks) <= self.rejected_blocks:
+            self._respond(secsgem.secsi.SecsIProtocol.NAK)
+        else:
+            self._respond(secsgem.secsi.SecsIProtocol.ACK)
+
+        return True
+
+    def _respond(self, response: int):
+        self.on_data({"source": self, "data": bytes([response])})
+
+
+class MockSecsISettings(secsgem.secsitcp.SecsITcpSettings):
+    """Settings using a mock connection."""
+
+    def __init__(self, rejected_blocks: int = 0, **kwargs) -> None:
+        super().__init__(**kwargs)
+
+        self.connection = MockSecsIConnection(self, rejected_blocks)
+
+    def create_connection(self) -> secsgem.common.Connection:
+        """Connection class for this configuration."""
+        return self.connection
+
+
+def create_message(system: int, length: int) -> secsgem.secsi.message.SecsIMessage:
+    return secsgem.secsi.message.SecsIMessage(secsgem.secsi.SecsIHeader(system, 0, 1, 4), b"\x00" * length)
+
+
+class TestSecsIProtocol:
+    def _create_protocol(self, rejected_blocks: int = 0) -> tuple[secsgem.secsi.SecsIProtocol, MockSecsIConnection]:
+        settings = MockSecsISettings(rejected_blocks)
+        protocol = secsgem.secsi.SecsIProtocol(settings)
+
+        protocol.enable()
+        settings.connection.simulate_connect()
+
+        return protocol, settings.connection
+
+    def test_send_multi_block_message(self):
+        protocol, connection = self._create_protocol()
+        message = create_message(1, 600)
+
+        assert len(message.blocks) == 3
+        assert protocol.send_message(message)
+        assert len(connection.blocks) == 3
+
+        protocol.disable()
+
+    def test_rejected_block_discards_message(self):
+        protocol, connection = self._create_protocol(rejected_blocks=1)
+
+        # the rest of the message isn't sent after the first block was rejected
+        assert not protocol.send_message(create_message(1, 600))
+        assert len(connection.blocks) == 1
+
+        # following messages are sent
+        assert protocol.send_message(create_message(2, 10))
+        assert len(connection.blocks) == 2
+
+        protocol.disable()
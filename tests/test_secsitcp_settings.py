@@ -32,6 +32,7 @@ class TestSecsITcpSettings:
         assert settings.connect_mode == secsgem.secsitcp.SecsITcpConnectMode.CLIENT
         assert settings.address == "127.0.0.1"
         assert settings.port == 5000
+        assert settings.receive_buffer_size == 65536
 
     def test_with_args(self):
         settings = secsgem.secsitcp.SecsITcpSettings(
@@ -41,6 +42,7 @@ class TestSecsITcpSettings:
             connect_mode=secsgem.secsitcp.SecsITcpConnectMode.SERVER,
             address="123.123.123.123",
             port=1234,
+            receive_buffer_size=1048576,
         )
 
         assert settings.device_type == secsgem.common.DeviceType.HOST
@@ -51,6 +53,7 @@ class TestSecsITcpSettings:
         assert settings.connect_mode == secsgem.secsitcp.SecsITcpConnectMode.SERVER
         assert settings.address == "123.123.123.123"
         assert settings.port == 1234
+        assert settings.receive_buffer_size == 1048576
 
     def test_with_invalid(self):
         with pytest.raises(ValueError) as exc:
@@ -58,3 +61,10 @@ class TestSecsITcpSettings:
                 invalid_arg=-1,
             )
         assert str(exc.value) == "SecsITcpSettings initialized with unknown arguments: invalid_arg"
+
+    def test_with_invalid_receive_buffer_size(self):
+        with pytest.raises(ValueError) as exc:
+            secsgem.secsitcp.SecsITcpSettings(
+                receive_buffer_size=0,
+            )
+        assert str(exc.value) == "SecsITcpSettings receive_buffer_size must be at least 1"